@@ -0,0 +1,84 @@
+"""
+Microbenchmark for CacheManager get/set/evict cost.
+
+Fills a CacheManager to capacity at several sizes (100 to 1M entries) and
+measures the per-operation cost of hits and of inserts that force an LRU
+eviction. With O(1) eviction the per-op cost should stay flat as the cache
+grows.
+
+Usage:
+    python -m scripts.benchmarks.cache_manager_benchmark
+    python -m scripts.benchmarks.cache_manager_benchmark --sizes 100 10000 --ops 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.bmad.core.cache_manager import CacheManager
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+def benchmark_size(size: int, ops: int) -> Dict[str, float]:
+    """
+    Measure per-op cost for a cache filled to `size` entries.
+
+    Returns:
+        Dict with get_us and set_evict_us (microseconds per operation)
+    """
+    cache = CacheManager[int](max_size=size, ttl_seconds=3600, name="bench")
+    for i in range(size):
+        cache.set(f"k{i}", i)
+
+    rng = random.Random(42)
+    keys = [f"k{rng.randrange(size)}" for _ in range(ops)]
+
+    start = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    get_us = (time.perf_counter() - start) / ops * 1_000_000
+
+    # Every insert of a new key evicts the LRU entry
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.set(f"n{i}", i)
+    set_evict_us = (time.perf_counter() - start) / ops * 1_000_000
+
+    return {"get_us": get_us, "set_evict_us": set_evict_us}
+
+
+def run(sizes: List[int], ops: int) -> List[Dict[str, float]]:
+    """Run the benchmark for each size and print a table."""
+    print(f"{'entries':>10} {'get (us/op)':>12} {'set+evict (us/op)':>18}")
+    results = []
+    for size in sizes:
+        result = benchmark_size(size, ops)
+        result["size"] = size
+        results.append(result)
+        print(f"{size:>10} {result['get_us']:>12.3f} {result['set_evict_us']:>18.3f}")
+
+    smallest, largest = results[0], results[-1]
+    print(
+        f"\nset+evict cost ratio {largest['size']}/{smallest['size']} entries: "
+        f"{largest['set_evict_us'] / smallest['set_evict_us']:.2f}x"
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CacheManager microbenchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--ops", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.sizes, args.ops)
+
+
+if __name__ == "__main__":
+    main()
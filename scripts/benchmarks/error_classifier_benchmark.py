@@ -0,0 +1,117 @@
+"""
+Benchmark for error-log classification in ErrorPatternExtractor.
+
+Classifies synthetic CI logs (2 MB by default) ending in a traceback and
+compares the legacy approach, one re.search per rule over the whole log,
+with ErrorPatternExtractor.extract (keyword prefilter over the log tail,
+then only the matching rules). Logs whose error is not in the table are
+included, since they make the legacy approach try every rule.
+
+Usage:
+    python -m scripts.benchmarks.error_classifier_benchmark
+    python -m scripts.benchmarks.error_classifier_benchmark --log-mb 8 --logs 20
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.bmad.services.insight_generator import ErrorPatternExtractor
+
+LOG_LINES = [
+    "INFO collecting tests in {path}",
+    "DEBUG connection pool size={n} checked_out={n}",
+    "PASSED tests/unit/test_{name}.py::test_{name}_{n}",
+    "WARNING deprecated call in {path}:{n}",
+    "  File \"{path}\", line {n}, in {name}",
+]
+
+FINAL_ERRORS = [
+    "KeyError: 'tenant_id'",
+    "TypeError: unsupported operand type(s) for +: 'NoneType' and 'int'",
+    "ModuleNotFoundError: No module named 'redis'",
+    "ConnectionError: connection refused by bolt://neo4j:7687",
+    "AssertionError: expected 3 rows, got 2",  # not in the rule table
+]
+
+
+def synthetic_log(size_bytes: int, final_error: str, rng: random.Random) -> str:
+    """Generate a CI log of roughly size_bytes ending in final_error."""
+    lines: List[str] = []
+    total = 0
+    while total < size_bytes:
+        line = rng.choice(LOG_LINES).format(
+            path=f"src/bmad/services/module_{rng.randint(0, 50)}.py",
+            name=rng.choice(["flush", "rank", "decay", "archive", "rollup"]),
+            n=rng.randint(0, 5000)
+        )
+        lines.append(line)
+        total += len(line) + 1
+    lines.append("Traceback (most recent call last):")
+    lines.append(final_error)
+    return "\n".join(lines)
+
+
+def legacy_extract(error_log: str) -> Tuple[str, str]:
+    """Classification as done before: each rule searched over the full log."""
+    for rule in ErrorPatternExtractor.ERROR_PATTERNS:
+        match = re.search(rule.pattern, error_log, re.IGNORECASE)
+        if match:
+            return match.group(1), rule.fix
+    return "Error", "Review error log and add appropriate error handling"
+
+
+def time_ms(func, logs: List[str]) -> List[float]:
+    """Per-log classification times."""
+    samples = []
+    for log in logs:
+        start = time.perf_counter()
+        func(log)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def run(log_mb: float, logs: int) -> Dict[str, float]:
+    """Run the benchmark and print results."""
+    rng = random.Random(42)
+    size = int(log_mb * 1_000_000)
+    samples = [synthetic_log(size, FINAL_ERRORS[i % len(FINAL_ERRORS)], rng) for i in range(logs)]
+
+    ErrorPatternExtractor.extract("warm up the compiled table")
+    legacy_ms = time_ms(legacy_extract, samples)
+    compiled_ms = time_ms(ErrorPatternExtractor.extract, samples)
+
+    results = {
+        "log_mb": log_mb,
+        "legacy_p50_ms": statistics.median(legacy_ms),
+        "compiled_p50_ms": statistics.median(compiled_ms),
+        "legacy_max_ms": max(legacy_ms),
+        "compiled_max_ms": max(compiled_ms),
+    }
+
+    print(f"logs:                {logs} x {log_mb:g} MB")
+    print(f"scan window:         {ErrorPatternExtractor.SCAN_WINDOW_CHARS} chars")
+    print(f"legacy p50 / max:    {results['legacy_p50_ms']:.2f} / {results['legacy_max_ms']:.2f} ms")
+    print(f"compiled p50 / max:  {results['compiled_p50_ms']:.3f} / {results['compiled_max_ms']:.3f} ms")
+    print(f"speedup (p50):       {results['legacy_p50_ms'] / results['compiled_p50_ms']:.0f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Error classifier benchmark")
+    parser.add_argument("--log-mb", type=float, default=2.0)
+    parser.add_argument("--logs", type=int, default=10)
+    args = parser.parse_args()
+    run(args.log_mb, args.logs)
+
+
+if __name__ == "__main__":
+    main()
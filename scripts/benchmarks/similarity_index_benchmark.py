@@ -0,0 +1,136 @@
+"""
+Benchmark for the local pattern similarity index.
+
+Builds a SimilarityIndex over synthetic pattern descriptions (100k by
+default) and measures build time, single and batched top-k search
+latency, incremental add/remove cost, and save / memory-mapped load time.
+
+Usage:
+    python -m scripts.benchmarks.similarity_index_benchmark
+    python -m scripts.benchmarks.similarity_index_benchmark --patterns 10000 --queries 200
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.bmad.services.similarity_index import PATTERN_KIND, SimilarityIndex
+
+GROUPS = ["faith-meats", "diff-driven-saas", "global-coding-skills"]
+
+WORDS = (
+    "retry backoff timeout connection pool cache invalidate query index batch "
+    "stream cursor paginate transaction deadlock lock merge upsert schema "
+    "migration validate sanitize escape token session auth permission tenant "
+    "group archive compress partition rollup aggregate decay confidence insight "
+    "pattern error exception logging metrics latency throughput memory leak "
+    "serialize json csv parse encode decode async await thread process queue"
+).split()
+
+
+def synthetic_items(count: int, rng: random.Random) -> List[Tuple[str, str, str]]:
+    """Generate (pattern_id, description, group_id) tuples."""
+    return [
+        (f"pattern-{i}", " ".join(rng.choices(WORDS, k=rng.randint(8, 20))), rng.choice(GROUPS))
+        for i in range(count)
+    ]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(patterns: int, queries: int, k: int, batch_size: int) -> Dict[str, float]:
+    """Run the benchmark and print results."""
+    rng = random.Random(42)
+    items = synthetic_items(patterns, rng)
+    texts = [" ".join(rng.choices(WORDS, k=4)) for _ in range(queries)]
+    groups = ["faith-meats", "global-coding-skills"]
+
+    index = SimilarityIndex(MagicMock())
+
+    start = time.perf_counter()
+    for offset in range(0, patterns, 5000):
+        index.add_many(items[offset:offset + 5000], PATTERN_KIND)
+    build_s = time.perf_counter() - start
+
+    single_ms = []
+    for text in texts:
+        start = time.perf_counter()
+        index.search(text, groups, k=k, kind=PATTERN_KIND)
+        single_ms.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for offset in range(0, queries, batch_size):
+        index.search_batch(texts[offset:offset + batch_size], groups, k=k, kind=PATTERN_KIND)
+    batched_ms = (time.perf_counter() - start) * 1000 / queries
+
+    start = time.perf_counter()
+    for i in range(1000):
+        index.add(f"new-{i}", texts[i % queries], "faith-meats")
+    for i in range(1000):
+        index.remove(f"new-{i}")
+    update_us = (time.perf_counter() - start) / 2000 * 1_000_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        index.save(tmp)
+        save_s = time.perf_counter() - start
+
+        loaded = SimilarityIndex(MagicMock())
+        start = time.perf_counter()
+        loaded.load(tmp)
+        load_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded.search(texts[0], groups, k=k, kind=PATTERN_KIND)
+        first_mmap_search_ms = (time.perf_counter() - start) * 1000
+        del loaded
+
+    results = {
+        "patterns": patterns,
+        "matrix_mb": index._matrix[:len(index)].nbytes / 1_000_000,
+        "build_s": build_s,
+        "search_p50_ms": statistics.median(single_ms),
+        "search_p95_ms": percentile(single_ms, 95),
+        "batched_ms_per_query": batched_ms,
+        "add_remove_us": update_us,
+        "save_s": save_s,
+        "load_s": load_s,
+        "first_mmap_search_ms": first_mmap_search_ms,
+    }
+
+    print(f"patterns:                 {patterns}")
+    print(f"matrix size:              {results['matrix_mb']:.1f} MB ({index.n_features} features)")
+    print(f"build:                    {build_s:.2f} s")
+    print(f"search p50 / p95 (k={k}):  {results['search_p50_ms']:.2f} / {results['search_p95_ms']:.2f} ms")
+    print(f"batched search ({batch_size}/batch): {batched_ms:.2f} ms/query")
+    print(f"add/remove:               {update_us:.1f} us/op")
+    print(f"save / mmap load:         {save_s:.2f} s / {load_s * 1000:.1f} ms")
+    print(f"first search after load:  {first_mmap_search_ms:.2f} ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Similarity index benchmark")
+    parser.add_argument("--patterns", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+    run(args.patterns, args.queries, args.k, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+PROFILE comparison of group-plus-global tenant filters.
+
+Runs typical pattern reads twice against a live Neo4j: once with the
+legacy `p.group_id = $group_id OR p.group_id = 'global-coding-skills'`
+filter and once with the tenant_filter() form
+`p.group_id IN [$group_id, 'global-coding-skills']`, and prints total db
+hits and the leaf (starting) operator of each plan.
+
+Synthetic patterns are written with a "bench-tf-" pattern_id prefix and
+removed afterwards; pass --no-seed to profile the existing data only.
+Deploy scripts/schema/bmad_schema.cypher first so the composite
+(group_id, category) and (group_id, success_rate) indexes exist.
+
+Usage:
+    python -m scripts.benchmarks.tenant_filter_profile
+    python -m scripts.benchmarks.tenant_filter_profile --patterns 50000 --groups 20
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import GLOBAL_GROUP_ID, tenant_filter
+
+PATTERN_PREFIX = "bench-tf-"
+CATEGORIES = ["testing", "security", "performance", "data", "api", "deployment"]
+
+LEGACY_FILTER = "(p.group_id = $group_id OR p.group_id = 'global-coding-skills')"
+
+# (name, WHERE conditions after the tenant filter, RETURN/ORDER tail)
+QUERIES: List[Tuple[str, str, str]] = [
+    (
+        "category + min success_rate, top 10",
+        "AND p.category = $category AND p.success_rate >= $min_success_rate",
+        "RETURN p ORDER BY p.success_rate DESC, p.times_used DESC LIMIT 10",
+    ),
+    (
+        "min success_rate only, top 10",
+        "AND p.success_rate >= $min_success_rate",
+        "RETURN p ORDER BY p.success_rate DESC, p.times_used DESC LIMIT 10",
+    ),
+    (
+        "count by category",
+        "AND p.category = $category",
+        "RETURN count(p) as total",
+    ),
+]
+
+
+def plan_summary(profile: Dict[str, Any]) -> Tuple[int, str]:
+    """Total db hits of a profiled plan and its leaf operator."""
+    hits = profile.get("dbHits", 0)
+    leaf = profile.get("operatorType", "?")
+    for child in profile.get("children", []):
+        child_hits, child_leaf = plan_summary(child)
+        hits += child_hits
+        leaf = child_leaf
+    return hits, leaf
+
+
+async def seed(client: Neo4jAsyncClient, patterns: int, groups: int) -> None:
+    """Write synthetic patterns spread over project groups and global."""
+    rng = random.Random(42)
+    group_ids = [f"bench-tf-group-{i}" for i in range(groups)] + [GLOBAL_GROUP_ID]
+    rows = [
+        {
+            "pattern_id": f"{PATTERN_PREFIX}{i}",
+            "group_id": rng.choice(group_ids),
+            "category": rng.choice(CATEGORIES),
+            "success_rate": round(rng.random(), 3),
+            "times_used": rng.randint(0, 500),
+        }
+        for i in range(patterns)
+    ]
+    await client.execute_write_batch(
+        """
+        CREATE (p:Pattern {
+            pattern_id: row.pattern_id, group_id: row.group_id, category: row.category,
+            success_rate: row.success_rate, times_used: row.times_used,
+            name: row.pattern_id, description: ''
+        })
+        """,
+        rows,
+        batch_size=5000
+    )
+
+
+async def cleanup(client: Neo4jAsyncClient) -> None:
+    """Remove the synthetic patterns."""
+    await client.execute_write(
+        """
+        MATCH (p:Pattern)
+        WHERE p.pattern_id STARTS WITH $prefix
+        DETACH DELETE p
+        """,
+        {"prefix": PATTERN_PREFIX},
+        validate_group_id=False
+    )
+
+
+async def profile(client: Neo4jAsyncClient, cypher: str, params: Dict[str, Any]) -> Tuple[int, str]:
+    """PROFILE one query and summarize its plan."""
+    async with client.session() as session:
+        result = await session.run("PROFILE " + cypher, params)
+        summary = await result.consume()
+    return plan_summary(summary.profile)
+
+
+async def run(patterns: int, groups: int, group_id: str, no_seed: bool) -> None:
+    """Run the comparison and print results."""
+    async with Neo4jAsyncClient() as client:
+        if not no_seed:
+            await seed(client, patterns, groups)
+            group_id = "bench-tf-group-0"
+
+        params = {"group_id": group_id, "category": "testing", "min_success_rate": 0.5}
+        try:
+            print(f"{'query':<40} {'filter':<8} {'db hits':>10}  leaf operator")
+            for name, conditions, tail in QUERIES:
+                for label, tenant in (("OR", LEGACY_FILTER), ("IN", tenant_filter("p"))):
+                    cypher = f"MATCH (p:Pattern) WHERE {tenant} {conditions} {tail}"
+                    hits, leaf = await profile(client, cypher, params)
+                    print(f"{name:<40} {label:<8} {hits:>10}  {leaf}")
+        finally:
+            if not no_seed:
+                await cleanup(client)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tenant filter PROFILE comparison")
+    parser.add_argument("--patterns", type=int, default=20_000)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--group-id", default="faith-meats", help="Group to query with --no-seed")
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.patterns, args.groups, args.group_id, args.no_seed))
+
+
+if __name__ == "__main__":
+    main()
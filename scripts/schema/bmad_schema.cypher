@@ -37,6 +37,12 @@ FOR (b:Brain) REQUIRE (b.name, b.group_id) IS UNIQUE;
 CREATE CONSTRAINT system_name_unique IF NOT EXISTS 
 FOR (s:System) REQUIRE s.name IS UNIQUE;
 
+CREATE CONSTRAINT pattern_ranking_key_unique IF NOT EXISTS 
+FOR (r:PatternRanking) REQUIRE r.ranking_key IS UNIQUE;
+
+CREATE CONSTRAINT processing_cursor_key_unique IF NOT EXISTS 
+FOR (c:ProcessingCursor) REQUIRE c.cursor_key IS UNIQUE;
+
 // ============================================================================
 // INDEXES - Query Performance Optimization
 // ============================================================================
@@ -70,6 +76,9 @@ FOR (o:Outcome) ON (o.status, o.group_id);
 CREATE INDEX outcome_timestamp IF NOT EXISTS 
 FOR (o:Outcome) ON (o.timestamp);
 
+CREATE INDEX outcome_groupid_timestamp IF NOT EXISTS 
+FOR (o:Outcome) ON (o.group_id, o.timestamp);
+
 // Self-Improvement Layer Indexes
 CREATE INDEX event_type IF NOT EXISTS 
 FOR (e:Event) ON (e.event_type);
@@ -80,12 +89,21 @@ FOR (e:Event) ON (e.timestamp);
 CREATE INDEX event_groupid IF NOT EXISTS 
 FOR (e:Event) ON (e.group_id);
 
+CREATE INDEX event_groupid_timestamp IF NOT EXISTS 
+FOR (e:Event) ON (e.group_id, e.timestamp);
+
+CREATE INDEX event_summary_bucket IF NOT EXISTS 
+FOR (s:EventSummary) ON (s.group_id, s.period, s.bucket_start);
+
 CREATE INDEX insight_confidence IF NOT EXISTS 
 FOR (i:Insight) ON (i.confidence_score);
 
 CREATE INDEX insight_groupid IF NOT EXISTS 
 FOR (i:Insight) ON (i.group_id);
 
+CREATE INDEX insight_groupid_expires_at IF NOT EXISTS 
+FOR (i:Insight) ON (i.group_id, i.expires_at);
+
 CREATE INDEX insight_applies_to IF NOT EXISTS 
 FOR (i:Insight) ON (i.applies_to);
 
@@ -98,6 +116,15 @@ FOR (p:Pattern) ON (p.success_rate);
 CREATE INDEX pattern_groupid IF NOT EXISTS 
 FOR (p:Pattern) ON (p.group_id);
 
+CREATE INDEX pattern_groupid_category IF NOT EXISTS 
+FOR (p:Pattern) ON (p.group_id, p.category);
+
+CREATE INDEX pattern_groupid_success_rate IF NOT EXISTS 
+FOR (p:Pattern) ON (p.group_id, p.success_rate);
+
+CREATE FULLTEXT INDEX pattern_fulltext IF NOT EXISTS 
+FOR (p:Pattern) ON EACH [p.name, p.description, p.tags];
+
 // Knowledge Layer Indexes
 CREATE INDEX knowledge_accessible IF NOT EXISTS 
 FOR (k:KnowledgeItem) ON (k.ai_accessible, k.group_id);
@@ -196,10 +223,10 @@ FOR (d:Domain) ON (d.name);
 // RETURN p.pattern_name as orphaned_pattern
 
 // Query 4: Event Aggregation for Old Data (Run Weekly)
-// Archive events older than 30 days to summary metrics
+// Roll events up into daily/weekly/monthly summaries, then delete old ones
 // MATCH (e:Event) WHERE e.timestamp < datetime() - duration('P30D')
-// WITH e.event_type as type, e.group_id as group, count(e) as event_count
-// MERGE (summary:EventSummary {event_type: type, group_id: group, period: 'archived'})
+// WITH e.event_type as type, e.group_id as group, date(e.timestamp) as day, count(e) as event_count
+// MERGE (summary:EventSummary {event_type: type, group_id: group, period: 'daily', bucket_start: toString(day)})
 // ON CREATE SET summary.count = event_count
 // ON MATCH SET summary.count = summary.count + event_count
 // WITH type, group
@@ -21,6 +21,8 @@ from src.bmad.services.agent_queries import (
     OutcomeStatus
 )
 from src.bmad.core.neo4j_client import Neo4jAsyncClient, SecurityError
+from src.bmad.core.pagination import InvalidCursorError
+from src.bmad.api.dependencies import get_neo4j_client
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +30,10 @@ router = APIRouter(prefix="/api/agents", tags=["agents"])
 
 
 # Dependency to get the query service
-async def get_query_service() -> AgentQueryService:
-    """Get the agent query service instance."""
-    # In production, this would be a shared instance
-    # For now, we'll create a new one per request
-    client = Neo4jAsyncClient()
-    await client.initialize()
+async def get_query_service(
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
+) -> AgentQueryService:
+    """Get the agent query service backed by the shared client."""
     return AgentQueryService(client)
 
 
@@ -86,11 +86,12 @@ class WorkHistoryEntryResponse(BaseModel):
 class WorkHistoryQueryResponse(BaseModel):
     """Response model for work history query."""
     entries: List[WorkHistoryEntryResponse]
-    total_count: int
+    total_count: Optional[int] = None
     latency_ms: float
     page: int
     page_size: int
     query_params: dict
+    next_cursor: Optional[str] = None
 
 
 @router.get("/{agent_name}/history", response_model=WorkHistoryQueryResponse)
@@ -101,13 +102,16 @@ async def get_agent_history(
     status: Optional[str] = Query(None, description="Filter by outcome status (Success/Failed)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Results per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides page)"),
+    include_total: bool = Query(False, description="Include the total entry count"),
     service: AgentQueryService = Depends(get_query_service)
 ):
     """
     Get an agent's work history with filtering options.
 
     Returns Event → Solution → Outcome chains with full context,
-    including applied patterns and generated insights.
+    including applied patterns and generated insights. Follow
+    next_cursor for further pages; it is null on the last page.
     """
     try:
         # Convert status string to enum
@@ -128,7 +132,9 @@ async def get_agent_history(
             page=page,
             page_size=page_size,
             include_patterns=True,
-            include_insights=True
+            include_insights=True,
+            cursor=cursor,
+            include_total=include_total
         )
 
         # Convert to response model
@@ -177,11 +183,14 @@ async def get_agent_history(
             latency_ms=result.latency_ms,
             page=page,
             page_size=page_size,
-            query_params=result.query_params
+            query_params=result.query_params,
+            next_cursor=result.next_cursor
         )
 
     except SecurityError as e:
         raise HTTPException(status_code=403, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error querying agent history: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
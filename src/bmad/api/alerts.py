@@ -16,10 +16,11 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.api.dependencies import get_neo4j_client
 from src.bmad.services.contradiction_detector import (
     ContradictionDetectorService,
     ContradictionDetectionResult
@@ -84,7 +85,7 @@ class DetectResponse(BaseModel):
 # Dependency factory
 
 def get_contradiction_detector_service(
-    client: Neo4jAsyncClient
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
 ) -> ContradictionDetectorService:
     """Factory for ContradictionDetectorService dependency."""
     return ContradictionDetectorService(client)
@@ -97,7 +98,7 @@ async def get_alerts(
     status: str = Query("pending", description="Filter by status (pending/resolved/all)"),
     alert_type: str = Query(None, description="Filter by alert type"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
-    service: ContradictionDetectorService = None
+    service: ContradictionDetectorService = Depends(get_contradiction_detector_service)
 ):
     """
     Get all alerts for review.
@@ -128,7 +129,7 @@ async def get_alerts(
 @router.get("/{alert_id}", response_model=AlertResponse)
 async def get_alert(
     alert_id: str,
-    service: ContradictionDetectorService = None
+    service: ContradictionDetectorService = Depends(get_contradiction_detector_service)
 ):
     """
     Get details of a specific alert.
@@ -182,7 +183,7 @@ async def get_alert(
 async def resolve_alert(
     alert_id: str,
     request: ResolveAlertRequest,
-    service: ContradictionDetectorService = None
+    service: ContradictionDetectorService = Depends(get_contradiction_detector_service)
 ):
     """
     Resolve a pending alert.
@@ -221,7 +222,7 @@ async def resolve_alert(
 @router.post("/detect", response_model=DetectResponse)
 async def trigger_detection(
     request: DetectRequest = None,
-    service: ContradictionDetectorService = None
+    service: ContradictionDetectorService = Depends(get_contradiction_detector_service)
 ):
     """
     Manually trigger contradiction detection.
@@ -250,7 +251,7 @@ async def trigger_detection(
 
 @router.get("/stats/summary")
 async def get_alert_stats(
-    service: ContradictionDetectorService = None
+    service: ContradictionDetectorService = Depends(get_contradiction_detector_service)
 ):
     """
     Get summary statistics for alerts.
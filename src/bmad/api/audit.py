@@ -16,10 +16,11 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.api.dependencies import get_neo4j_client
 from src.bmad.services.audit_logger import (
     AuditLogger,
     AuditLogEntry,
@@ -85,6 +86,15 @@ class CrossGroupResponse(BaseModel):
     timestamp: datetime
 
 
+# Dependency factory
+
+def get_audit_logger(
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
+) -> AuditLogger:
+    """Factory for AuditLogger dependency."""
+    return AuditLogger(client)
+
+
 # Endpoints
 
 @router.get("/logs", response_model=List[AuditLogResponse])
@@ -97,7 +107,7 @@ async def get_audit_logs(
     cross_group_only: bool = Query(False, description="Only show cross-group attempts"),
     failed_only: bool = Query(False, description="Only show failed accesses"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results"),
-    service: AuditLogger = None
+    service: AuditLogger = Depends(get_audit_logger)
 ):
     """
     Query audit logs with filters.
@@ -149,7 +159,7 @@ async def get_audit_summary(
     group_id: Optional[str] = Query(None, description="Filter by group"),
     start_time: Optional[datetime] = Query(None, description="Start of time range"),
     end_time: Optional[datetime] = Query(None, description="End of time range"),
-    service: AuditLogger = None
+    service: AuditLogger = Depends(get_audit_logger)
 ):
     """
     Get audit summary statistics.
@@ -186,7 +196,7 @@ async def get_audit_summary(
 @router.get("/cross-group", response_model=CrossGroupResponse)
 async def get_cross_group_attempts(
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
-    service: AuditLogger = None
+    service: AuditLogger = Depends(get_audit_logger)
 ):
     """
     Get all cross-group access attempts.
@@ -231,7 +241,7 @@ async def get_agent_audit_logs(
     agent_name: str,
     group_id: Optional[str] = Query(None, description="Filter by agent group"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
-    service: AuditLogger = None
+    service: AuditLogger = Depends(get_audit_logger)
 ):
     """
     Get audit logs for a specific agent.
@@ -279,11 +289,3 @@ async def audit_health():
         "service": "audit_logger"
     }
 
-
-# Dependency factory for FastAPI
-
-def get_audit_logger(
-    client: Neo4jAsyncClient
-) -> AuditLogger:
-    """Factory for AuditLogger dependency."""
-    return AuditLogger(client)
\ No newline at end of file
@@ -16,10 +16,11 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.api.dependencies import get_neo4j_client
 from src.bmad.services.brain_manager import BrainManager, Brain, AgentBrains
 
 logger = logging.getLogger(__name__)
@@ -79,13 +80,22 @@ class BrainCountResponse(BaseModel):
     timestamp: datetime
 
 
+# Dependency factory
+
+def get_brain_manager(
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
+) -> BrainManager:
+    """Factory for BrainManager dependency."""
+    return BrainManager(client)
+
+
 # Endpoints
 
 @router.get("/agent/{agent_name}", response_model=AgentBrainsResponse)
 async def get_agent_brains(
     agent_name: str,
     group_id: str = Query(..., description="Project group ID"),
-    service: BrainManager = None
+    service: BrainManager = Depends(get_brain_manager)
 ):
     """
     Get all brains accessible to an agent.
@@ -132,7 +142,7 @@ async def get_agent_brains(
 async def get_brains_by_scope(
     scope: str,
     group_id: str = Query(..., description="Project group ID"),
-    service: BrainManager = None
+    service: BrainManager = Depends(get_brain_manager)
 ):
     """
     Get all brains of a specific scope.
@@ -174,7 +184,7 @@ async def get_brains_by_scope(
 @router.get("/all", response_model=AllBrainsResponse)
 async def get_all_brains(
     group_id: str = Query(..., description="Project group ID"),
-    service: BrainManager = None
+    service: BrainManager = Depends(get_brain_manager)
 ):
     """
     Get all brains organized by scope.
@@ -218,7 +228,7 @@ async def get_all_brains(
 @router.get("/validate/{agent_name}", response_model=BrainValidationResponse)
 async def validate_brain_connectivity(
     agent_name: str,
-    service: BrainManager = None
+    service: BrainManager = Depends(get_brain_manager)
 ):
     """
     Validate that an agent has proper brain connectivity.
@@ -247,7 +257,7 @@ async def validate_brain_connectivity(
 @router.get("/counts", response_model=BrainCountResponse)
 async def get_brain_counts(
     group_id: str = Query(..., description="Project group ID"),
-    service: BrainManager = None
+    service: BrainManager = Depends(get_brain_manager)
 ):
     """
     Get brain counts by scope for a group.
@@ -278,11 +288,3 @@ async def brains_health():
         "scopes": ["agent_specific", "project_specific", "global"]
     }
 
-
-# Dependency factory for FastAPI
-
-def get_brain_manager(
-    client: Neo4jAsyncClient
-) -> BrainManager:
-    """Factory for BrainManager dependency."""
-    return BrainManager(client)
\ No newline at end of file
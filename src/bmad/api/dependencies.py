@@ -0,0 +1,68 @@
+"""
+Shared API Dependencies
+
+This module provides the FastAPI lifespan and dependencies shared by all
+BMAD routers.
+- lifespan - Opens the shared Neo4j client, warms the pattern index and
+  starts the pattern usage flusher at startup; drains pending usage and
+  closes the client at shutdown
+- get_neo4j_client - Dependency returning the process-wide shared client
+
+Usage:
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(agents.router)
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 1-2-async-neo4j-client-implementation
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from src.bmad.core.neo4j_client import (
+    Neo4jAsyncClient,
+    get_shared_client,
+    close_shared_client
+)
+from src.bmad.services.pattern_index import get_pattern_index
+from src.bmad.services.pattern_usage import get_pattern_usage_accumulator
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan managing the shared Neo4j client.
+
+    The driver and its connection pool are created once at startup and
+    closed at shutdown, so requests only pay for their own queries.
+    """
+    client = await get_shared_client()
+    logger.info("Shared Neo4j client ready")
+
+    try:
+        await get_pattern_index(client).refresh()
+    except Exception as e:
+        # Pattern queries fall back to Cypher until a later refresh succeeds
+        logger.warning(f"Pattern index warm-up failed: {e}")
+
+    usage = get_pattern_usage_accumulator(client)
+    await usage.start()
+
+    try:
+        yield
+    finally:
+        # Drain pending pattern usage while the client is still open
+        await usage.stop()
+        await close_shared_client()
+        logger.info("Shared Neo4j client closed")
+
+
+async def get_neo4j_client() -> Neo4jAsyncClient:
+    """Dependency returning the process-wide shared Neo4j client."""
+    return await get_shared_client()
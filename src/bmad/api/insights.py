@@ -15,10 +15,11 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.api.dependencies import get_neo4j_client
 from src.bmad.services.knowledge_transfer import (
     KnowledgeTransferService,
     SharedInsight
@@ -81,7 +82,7 @@ class CycleRunResponse(BaseModel):
 # Dependency factory
 
 def get_knowledge_transfer_service(
-    client: Neo4jAsyncClient
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
 ) -> KnowledgeTransferService:
     """Factory for KnowledgeTransferService dependency."""
     return KnowledgeTransferService(client)
@@ -96,7 +97,7 @@ async def get_shared_insights(
     teacher_name: Optional[str] = Query(None, description="Filter by teacher agent"),
     min_confidence: float = Query(0.8, ge=0.0, le=1.0, description="Minimum confidence score"),
     limit: int = Query(20, ge=1, le=50, description="Maximum results"),
-    service: KnowledgeTransferService = None
+    service: KnowledgeTransferService = Depends(get_knowledge_transfer_service)
 ):
     """
     Get insights that have been shared to an agent from other agents.
@@ -138,7 +139,7 @@ async def get_shared_insights(
 @router.get("/pending/{group_id}", response_model=PendingSharesResponse)
 async def get_pending_shares(
     group_id: str,
-    service: KnowledgeTransferService = None
+    service: KnowledgeTransferService = Depends(get_knowledge_transfer_service)
 ):
     """
     Check how many insights are pending to be shared for a group.
@@ -169,7 +170,7 @@ async def get_pending_shares(
 @router.post("/transfer", response_model=KnowledgeTransferResponse)
 async def trigger_knowledge_transfer(
     request: KnowledgeTransferRequest,
-    service: KnowledgeTransferService = None
+    service: KnowledgeTransferService = Depends(get_knowledge_transfer_service)
 ):
     """
     Manually trigger knowledge transfer for a specific group.
@@ -198,7 +199,7 @@ async def trigger_knowledge_transfer(
 
 @router.post("/cycle/run", response_model=CycleRunResponse)
 async def run_full_cycle(
-    service: KnowledgeTransferService = None
+    service: KnowledgeTransferService = Depends(get_knowledge_transfer_service)
 ):
     """
     Manually trigger a full knowledge transfer cycle.
@@ -237,7 +238,7 @@ async def run_full_cycle(
 async def get_insights_to_share(
     group_id: str,
     teacher_name: Optional[str] = Query(None, description="Filter by teacher agent"),
-    service: KnowledgeTransferService = None
+    service: KnowledgeTransferService = Depends(get_knowledge_transfer_service)
 ):
     """
     Get list of insights that will be shared (high-confidence).
@@ -5,6 +5,7 @@ This module provides REST API endpoints for Prometheus metrics.
 - GET /metrics - Prometheus scraping endpoint
 - GET /api/metrics/summary - Human-readable metrics summary
 - POST /api/metrics/refresh - Force metrics refresh
+- GET /api/metrics/event-trends/{group_id} - Event trends from rollup buckets
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
@@ -13,13 +14,20 @@ Story: 5-1-export-learning-metrics-to-prometheus
 
 import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, FastAPI, Query
 from pydantic import BaseModel
 
-from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.neo4j_client import Neo4jAsyncClient, get_shared_client
+from src.bmad.api.dependencies import get_neo4j_client, lifespan
+from src.bmad.services.event_aggregation import (
+    EventAggregationService,
+    ROLLUP_PERIODS,
+    bucket_start
+)
 from src.bmad.services.metrics_exporter import (
     MetricsExporter,
     MetricsScheduler,
@@ -87,11 +95,29 @@ class HealthResponse(BaseModel):
     last_update: Optional[str]
 
 
+class EventTrendBucket(BaseModel):
+    """Response model for one event rollup bucket."""
+    event_type: str
+    bucket_start: str
+    count: int
+    success_count: int
+    failure_count: int
+    first_event: Optional[str]
+    last_event: Optional[str]
+
+
+class EventTrendsResponse(BaseModel):
+    """Response model for event trends."""
+    group_id: str
+    period: str
+    buckets: List[EventTrendBucket]
+
+
 # Endpoints
 
 @router.get("/summary", response_model=MetricsSummaryResponse)
 async def get_metrics_summary(
-    client: Neo4jAsyncClient
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
 ):
     """
     Get human-readable summary of all metrics.
@@ -120,7 +146,7 @@ async def get_metrics_summary(
 @router.post("/refresh", response_model=RefreshResponse)
 async def refresh_metrics(
     background_tasks: BackgroundTasks,
-    client: Neo4jAsyncClient
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
 ):
     """
     Force refresh all metrics from Neo4j.
@@ -144,7 +170,7 @@ async def refresh_metrics(
 
 @router.get("/health", response_model=HealthResponse)
 async def metrics_health(
-    client: Neo4jAsyncClient
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
 ):
     """
     Check health of the metrics service.
@@ -170,11 +196,62 @@ async def metrics_health(
         )
 
 
+@router.get("/event-trends/{group_id}", response_model=EventTrendsResponse)
+async def get_event_trends(
+    group_id: str,
+    period: str = Query("daily", description=f"Bucket size: {', '.join(ROLLUP_PERIODS)}"),
+    event_type: Optional[str] = Query(None, description="Filter by event type"),
+    days_back: int = Query(90, ge=1, le=3650, description="Number of days to look back"),
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
+):
+    """
+    Get event counts over time for dashboards.
+
+    Reads EventSummary rollup buckets (updated by the event rollup job),
+    never raw Event nodes.
+    """
+    if period not in ROLLUP_PERIODS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"period must be one of {', '.join(ROLLUP_PERIODS)}"
+        )
+
+    try:
+        service = EventAggregationService(client)
+        start = bucket_start(
+            (datetime.now(timezone.utc) - timedelta(days=days_back)).date(), period
+        )
+        summaries = await service.get_event_trends(
+            group_id, period=period, event_type=event_type, start=start
+        )
+
+        return EventTrendsResponse(
+            group_id=group_id,
+            period=period,
+            buckets=[
+                EventTrendBucket(
+                    event_type=s.event_type,
+                    bucket_start=s.bucket_start,
+                    count=s.count,
+                    success_count=s.success_count,
+                    failure_count=s.failure_count,
+                    first_event=str(s.first_event) if s.first_event else None,
+                    last_event=str(s.last_event) if s.last_event else None
+                )
+                for s in summaries
+            ]
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to get event trends for {group_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # Prometheus-compatible endpoint
 
 @router.get("/prometheus")
 async def prometheus_metrics(
-    client: Neo4jAsyncClient
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
 ):
     """
     Prometheus metrics endpoint.
@@ -219,13 +296,12 @@ async def start_metrics_scheduler(
 
     Args:
         interval_seconds: How often to update metrics
-        client: Neo4j client (optional, creates new if not provided)
+        client: Neo4j client (optional, uses the shared client if not provided)
     """
     global _metrics_exporter, _metrics_scheduler
 
     if client is None:
-        client = Neo4jAsyncClient()
-        await client.initialize()
+        client = await get_shared_client()
 
     if _metrics_exporter is None:
         _metrics_exporter = create_metrics_exporter(client)
@@ -244,6 +320,23 @@ def stop_metrics_scheduler() -> None:
         _metrics_scheduler = None
 
 
+@asynccontextmanager
+async def metrics_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan for the metrics API server.
+
+    Wraps the shared lifespan (Neo4j client, pattern index, usage
+    accumulator) and runs the metrics scheduler inside it, so the
+    scheduler stops before the shared client is closed.
+    """
+    async with lifespan(app):
+        await start_metrics_scheduler(interval_seconds=300)
+        try:
+            yield
+        finally:
+            stop_metrics_scheduler()
+
+
 if __name__ == "__main__":
     import uvicorn
     from src.bmad.core.neo4j_client import Neo4jAsyncClient
@@ -252,10 +345,9 @@ if __name__ == "__main__":
 
     async def run_server():
         """Run the metrics API server."""
-        from fastapi import FastAPI
         from fastapi.middleware.cors import CORSMiddleware
 
-        app = FastAPI(title="BMAD Metrics API")
+        app = FastAPI(title="BMAD Metrics API", lifespan=metrics_lifespan)
 
         app.add_middleware(
             CORSMiddleware,
@@ -264,14 +356,6 @@ if __name__ == "__main__":
             allow_headers=["*"],
         )
 
-        @app.on_event("startup")
-        async def startup():
-            await start_metrics_scheduler(interval_seconds=300)
-
-        @app.on_event("shutdown")
-        async def shutdown():
-            stop_metrics_scheduler()
-
         app.include_router(router)
 
         @app.get("/metrics")
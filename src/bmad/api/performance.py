@@ -6,6 +6,7 @@ This module provides REST API endpoints for performance monitoring.
 - GET /api/performance/compliance - NFR compliance check
 - GET /api/performance/cache/stats - Cache statistics
 - GET /api/performance/metrics - Recent query metrics
+- GET /api/performance/slow-queries - Slowest recent Neo4j queries
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
@@ -14,12 +15,13 @@ Story: 3-4-fast-pattern-matching-query-engine
 
 import logging
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query, Depends
+from pydantic import BaseModel
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.api.dependencies import get_neo4j_client
 from src.bmad.services.pattern_query_engine import (
     PatternQueryEngine,
     get_query_engine,
@@ -27,6 +29,7 @@ from src.bmad.services.pattern_query_engine import (
     QueryMetrics
 )
 from src.bmad.core.cache_manager import CacheStats
+from src.bmad.core.query_metrics import get_slow_query_log
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +69,19 @@ class CacheStatsResponse(BaseModel):
     size: int
     max_size: int
     hit_rate: float
+    backend: str
+    timestamp: datetime
+
+
+class SlowQueryResponse(BaseModel):
+    """Response for a slow Neo4j query."""
+    fingerprint: str
+    query: str
+    duration_ms: float
+    rows: int
+    retries: int
+    pool_wait_ms: float
+    mode: str
     timestamp: datetime
 
 
@@ -88,11 +104,20 @@ class HealthResponse(BaseModel):
     cache_enabled: bool
 
 
+# Dependency factory
+
+def get_pattern_query_engine(
+    client: Neo4jAsyncClient = Depends(get_neo4j_client)
+) -> PatternQueryEngine:
+    """Factory for PatternQueryEngine dependency."""
+    return get_query_engine(client)
+
+
 # Endpoints
 
 @router.get("/report", response_model=PerformanceReportResponse)
 async def get_performance_report(
-    engine: PatternQueryEngine = None
+    engine: PatternQueryEngine = Depends(get_pattern_query_engine)
 ):
     """
     Get performance report for pattern queries.
@@ -118,7 +143,12 @@ async def get_performance_report(
                 "evictions": report.cache_stats.evictions,
                 "size": report.cache_stats.size,
                 "max_size": report.cache_stats.max_size,
-                "hit_rate": report.cache_stats.hit_rate
+                "hit_rate": report.cache_stats.hit_rate,
+                "invalidations": report.cache_stats.invalidations,
+                "stale_hits": report.cache_stats.stale_hits,
+                "refreshes": report.cache_stats.refreshes,
+                "errors": report.cache_stats.errors,
+                "backend": report.cache_stats.backend
             },
             timestamp=report.timestamp
         )
@@ -130,7 +160,7 @@ async def get_performance_report(
 
 @router.get("/compliance", response_model=PerformanceComplianceResponse)
 async def check_performance_compliance(
-    engine: PatternQueryEngine = None
+    engine: PatternQueryEngine = Depends(get_pattern_query_engine)
 ):
     """
     Check if the system meets NFR performance targets.
@@ -165,7 +195,7 @@ async def check_performance_compliance(
 
 @router.get("/cache/stats", response_model=CacheStatsResponse)
 async def get_cache_stats(
-    engine: PatternQueryEngine = None
+    engine: PatternQueryEngine = Depends(get_pattern_query_engine)
 ):
     """
     Get cache statistics for pattern queries.
@@ -185,6 +215,7 @@ async def get_cache_stats(
             size=stats.size,
             max_size=stats.max_size,
             hit_rate=stats.hit_rate,
+            backend=stats.backend,
             timestamp=datetime.now(timezone.utc)
         )
 
@@ -195,8 +226,8 @@ async def get_cache_stats(
 
 @router.get("/metrics", response_model=List[QueryMetricsResponse])
 async def get_query_metrics(
-    limit: int = Field(default=20, ge=1, le=100, description="Maximum metrics to return"),
-    engine: PatternQueryEngine = None
+    limit: int = Query(20, ge=1, le=100, description="Maximum metrics to return"),
+    engine: PatternQueryEngine = Depends(get_pattern_query_engine)
 ):
     """
     Get recent query metrics.
@@ -229,20 +260,49 @@ async def get_query_metrics(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/slow-queries", response_model=List[SlowQueryResponse])
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=100, description="Maximum slow queries to return")
+):
+    """
+    Get the most recent slow Neo4j queries, newest first.
+
+    Every query run through Neo4jAsyncClient at or above the slow-query
+    threshold (NEO4J_SLOW_QUERY_MS) is recorded with its normalized Cypher,
+    so the fingerprint can be matched to bmad_neo4j_query_duration_seconds.
+    """
+    return [
+        SlowQueryResponse(
+            fingerprint=q.fingerprint,
+            query=q.query,
+            duration_ms=q.duration_ms,
+            rows=q.rows,
+            retries=q.retries,
+            pool_wait_ms=q.pool_wait_ms,
+            mode=q.mode,
+            timestamp=q.timestamp
+        )
+        for q in get_slow_query_log().recent(limit)
+    ]
+
+
 @router.post("/cache/invalidate")
 async def invalidate_cache(
-    engine: PatternQueryEngine = None
+    pattern_id: Optional[str] = Query(None, description="Evict result sets containing this pattern"),
+    group_id: Optional[str] = Query(None, description="Evict result sets for this group"),
+    engine: PatternQueryEngine = Depends(get_pattern_query_engine)
 ):
     """
     Invalidate the pattern cache.
 
-    Use when patterns are updated to ensure fresh results.
+    Use when patterns are updated to ensure fresh results. With pattern_id
+    or group_id only the affected result sets are evicted.
     """
     if not engine:
         raise HTTPException(status_code=503, detail="Service not available")
 
     try:
-        count = await engine.invalidate_cache()
+        count = await engine.invalidate_cache(pattern_id=pattern_id, group_id=group_id)
         logger.info(f"Cache invalidated, removed {count} entries")
 
         return {
@@ -266,11 +326,3 @@ async def performance_health():
         "cache_enabled": True
     }
 
-
-# Dependency factory for FastAPI
-
-def get_pattern_query_engine(
-    client: Neo4jAsyncClient
-) -> PatternQueryEngine:
-    """Factory for PatternQueryEngine dependency."""
-    return get_query_engine(client)
\ No newline at end of file
@@ -0,0 +1,571 @@
+"""
+Cold-Storage Archive Store
+
+This module stores records removed from the graph (archived insights and
+events) in compressed, partitioned files that can still be looked up.
+- Files are partitioned by group and date:
+  {root}/{kind}/group_id={group}/date={YYYY-MM-DD}/part-{run}.jsonl.gz
+- Records are JSON lines written in blocks; each block is its own gzip
+  member, so a file is plain gzip to other tools (zcat) while any block
+  can be decompressed on its own
+- A sidecar SQLite index ({root}/{kind}/index.sqlite) maps each record ID
+  to its partition, file, block offset/length and row, so a lookup is one
+  index read and one file seek; it also holds the filter columns (type,
+  time, agent, status) that find() queries without opening any file
+- Records are the node's properties plus ARCHIVE_FIELDS; datetimes
+  round-trip as {"__datetime__": iso} (driver temporals included)
+
+Usage:
+    with ArchiveWriter(archive_dir, "events") as writer:
+        for event in events:
+            writer.write(event["event_id"], event["group_id"], event["timestamp"], event)
+
+    reader = ArchiveReader(archive_dir, "events")
+    event = reader.get("evt-123", group_id="faith-meats")
+    await reader.restore("evt-123", client, group_id="faith-meats")
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 4-3-aggregate-old-events
+"""
+
+import gzip
+import json
+import logging
+import sqlite3
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+logger = logging.getLogger(__name__)
+
+# Archive kind -> (node label, ID property) used to restore records
+ARCHIVE_KINDS: Dict[str, Tuple[str, str]] = {
+    "insights": ("Insight", "insight_id"),
+    "events": ("Event", "event_id"),
+}
+
+# Archival metadata and context added next to the node properties
+# (dropped on restore)
+ARCHIVE_FIELDS = (
+    "archived_at",
+    "archive_reason",
+    "archived_confidence",
+    "archived_agent",
+    "archived_outcome",
+    "archived_patterns",
+)
+
+INDEX_FILE = "index.sqlite"
+_DATETIME_KEY = "__datetime__"
+
+
+def _encode(obj: Any) -> Any:
+    """json.dumps default hook for datetimes (including driver temporals)."""
+    if hasattr(obj, "to_native"):
+        obj = obj.to_native()
+    if isinstance(obj, (datetime, date)):
+        return {_DATETIME_KEY: obj.isoformat()}
+    return str(obj)
+
+
+def _decode(data: Dict[str, Any]) -> Any:
+    """json.loads object hook reversing _encode()."""
+    if _DATETIME_KEY in data and len(data) == 1:
+        return datetime.fromisoformat(data[_DATETIME_KEY])
+    return data
+
+
+def time_key(value: Any) -> Optional[str]:
+    """Sortable UTC time string of a datetime, date, driver temporal or ISO string."""
+    if not value:
+        return None
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return str(value)
+
+
+def partition_date(value: Any) -> str:
+    """UTC YYYY-MM-DD partition of a time (today if there is none)."""
+    key = time_key(value)
+    return key[:10] if key else datetime.now(timezone.utc).date().isoformat()
+
+
+def _partition_dir(group_id: str, day: str) -> Path:
+    return Path(f"group_id={group_id.replace('/', '_')}") / f"date={day}"
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Location of one archived record."""
+    record_id: str
+    group_id: str
+    partition_date: str
+    file: str  # relative to the kind directory
+    block_offset: int
+    block_length: int
+    row: int
+    record_type: Optional[str] = None
+    record_time: Optional[str] = None  # time_key() of the record's time
+    agent_name: Optional[str] = None
+    status: Optional[str] = None
+
+
+def _connect_index(path: Path, read_only: bool = False) -> sqlite3.Connection:
+    if read_only:
+        # Readers are shared by worker threads (asyncio.to_thread)
+        return sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS records (
+            record_id TEXT PRIMARY KEY,
+            group_id TEXT NOT NULL,
+            partition_date TEXT NOT NULL,
+            file TEXT NOT NULL,
+            block_offset INTEGER NOT NULL,
+            block_length INTEGER NOT NULL,
+            row INTEGER NOT NULL,
+            record_type TEXT,
+            record_time TEXT,
+            agent_name TEXT,
+            status TEXT
+        )
+        """
+    )
+    # Indexes written before the filter columns existed
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(records)")}
+    for column in ("record_type", "record_time", "agent_name", "status"):
+        if column not in columns:
+            conn.execute(f"ALTER TABLE records ADD COLUMN {column} TEXT")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS records_partition ON records (group_id, partition_date)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS records_time ON records (group_id, record_time)"
+    )
+    return conn
+
+
+class ArchiveWriter:
+    """
+    Streams records into partitioned, block-compressed archive files.
+
+    Records are buffered per partition and written a block at a time, so
+    memory is bounded by block_records per open partition. Index rows are
+    committed on close(); abort() (or an exception inside a with block)
+    deletes this run's files and leaves the index untouched.
+    """
+
+    BLOCK_RECORDS = 256
+
+    def __init__(self, root: str, kind: str, block_records: int = BLOCK_RECORDS):
+        """
+        Initialize the writer.
+
+        Args:
+            root: Archive root directory
+            kind: Archive kind (a key of ARCHIVE_KINDS)
+            block_records: Records per compressed block
+        """
+        if kind not in ARCHIVE_KINDS:
+            raise ValueError(f"Unknown archive kind: {kind}")
+
+        self._dir = Path(root) / kind
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._block_records = block_records
+        self._run_id = (
+            f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        )
+        self._index = _connect_index(self._dir / INDEX_FILE)
+        # (group_id, date) -> [(record_id, json line, filter columns)]
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, str, Tuple]]] = {}
+        self._files: Dict[Tuple[str, str], Path] = {}
+        self._count = 0
+        self._closed = False
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding this kind's partitions and index."""
+        return self._dir
+
+    @property
+    def files(self) -> List[Path]:
+        """Files written by this run."""
+        return list(self._files.values())
+
+    @property
+    def record_count(self) -> int:
+        """Records written by this run."""
+        return self._count
+
+    def write(
+        self,
+        record_id: str,
+        group_id: str,
+        timestamp: Any,
+        record: Dict[str, Any],
+        record_type: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> None:
+        """
+        Add a record.
+
+        Args:
+            record_id: Unique record ID (re-archiving an ID replaces its entry)
+            group_id: Owning group
+            timestamp: Record time (datetime, driver temporal or ISO string),
+                indexed and used as the partition date
+            record: JSON-serializable record (datetimes allowed)
+            record_type: Indexed type (event_type, insight category)
+            agent_name: Indexed agent that produced the record
+            status: Indexed status (e.g. outcome status)
+        """
+        key = (group_id, partition_date(timestamp))
+        columns = (record_type, time_key(timestamp), agent_name, status)
+        pending = self._pending.setdefault(key, [])
+        pending.append((record_id, json.dumps(record, default=_encode), columns))
+        self._count += 1
+        if len(pending) >= self._block_records:
+            self._flush_block(key)
+
+    def _flush_block(self, key: Tuple[str, str]) -> None:
+        """Compress a partition's pending records as one block."""
+        pending = self._pending.pop(key, [])
+        if not pending:
+            return
+
+        path = self._files.get(key)
+        if path is None:
+            path = self._dir / _partition_dir(*key) / f"part-{self._run_id}.jsonl.gz"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._files[key] = path
+
+        block = gzip.compress("".join(f"{line}\n" for _, line, _ in pending).encode("utf-8"))
+        with open(path, "ab") as f:
+            offset = f.tell()
+            f.write(block)
+
+        relative = str(path.relative_to(self._dir))
+        self._index.executemany(
+            "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (record_id, key[0], key[1], relative, offset, len(block), row, *columns)
+                for row, (record_id, _, columns) in enumerate(pending)
+            ]
+        )
+
+    def close(self) -> None:
+        """Write remaining blocks and commit the index."""
+        if self._closed:
+            return
+        for key in list(self._pending):
+            self._flush_block(key)
+        self._index.commit()
+        self._index.close()
+        self._closed = True
+
+    def abort(self) -> None:
+        """Discard this run's files and index rows."""
+        if self._closed:
+            return
+        self._index.rollback()
+        self._index.close()
+        for path in self._files.values():
+            path.unlink(missing_ok=True)
+        self._pending.clear()
+        self._closed = True
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class ArchiveReader:
+    """
+    Looks up, scans and restores archived records of one kind.
+
+    get() costs one index lookup, one seek and one block decompression,
+    regardless of archive size.
+    """
+
+    def __init__(self, root: str, kind: str):
+        """
+        Initialize the reader.
+
+        Args:
+            root: Archive root directory
+            kind: Archive kind (a key of ARCHIVE_KINDS)
+        """
+        if kind not in ARCHIVE_KINDS:
+            raise ValueError(f"Unknown archive kind: {kind}")
+
+        self._kind = kind
+        self._dir = Path(root) / kind
+        self._index: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Read-only index connection (None while nothing is archived)."""
+        if self._index is None:
+            path = self._dir / INDEX_FILE
+            if not path.exists():
+                return None
+            self._index = _connect_index(path, read_only=True)
+        return self._index
+
+    def locate(self, record_id: str) -> Optional[ArchiveEntry]:
+        """Index entry of a record, or None if it was never archived."""
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT * FROM records WHERE record_id = ?", (record_id,)
+        ).fetchone()
+        return ArchiveEntry(*row) if row else None
+
+    def _read_block(self, entry: ArchiveEntry) -> List[str]:
+        with open(self._dir / entry.file, "rb") as f:
+            f.seek(entry.block_offset)
+            block = f.read(entry.block_length)
+        return gzip.decompress(block).decode("utf-8").split("\n")
+
+    def get(self, record_id: str, group_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch an archived record.
+
+        Args:
+            record_id: Record ID
+            group_id: Only return the record if it belongs to this group
+
+        Returns:
+            The record, or None if not archived (or in another group)
+        """
+        entry = self.locate(record_id)
+        if entry is None or (group_id and entry.group_id != group_id):
+            return None
+        return json.loads(self._read_block(entry)[entry.row], object_hook=_decode)
+
+    def get_many(
+        self,
+        record_ids: Iterable[str],
+        group_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch several records, decompressing each block once."""
+        entries = [e for e in (self.locate(r) for r in record_ids) if e]
+        if group_id:
+            entries = [e for e in entries if e.group_id == group_id]
+        return dict(zip((e.record_id for e in entries), self.read(entries)))
+
+    def read(self, entries: List[ArchiveEntry]) -> List[Dict[str, Any]]:
+        """Records of index entries, in order, decompressing each block once."""
+        blocks: Dict[Tuple[str, int], List[str]] = {}
+        records = []
+        for entry in entries:
+            block_key = (entry.file, entry.block_offset)
+            if block_key not in blocks:
+                blocks[block_key] = self._read_block(entry)
+            records.append(json.loads(blocks[block_key][entry.row], object_hook=_decode))
+        return records
+
+    def _filters(
+        self,
+        group_id: str,
+        record_type: Optional[str],
+        agent_name: Optional[str],
+        status: Optional[str],
+        start: Any,
+        end: Any,
+        before: Optional[Tuple[Any, str]],
+        require_status: bool = False
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause over the index; start/end also prune date partitions."""
+        clauses = ["group_id = ?"]
+        params: List[Any] = [group_id]
+        for column, value in (
+            ("record_type", record_type),
+            ("agent_name", agent_name),
+            ("status", status),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if require_status:
+            clauses.append("status IS NOT NULL")
+        if start:
+            clauses.append("partition_date >= ? AND record_time >= ?")
+            params += [partition_date(start), time_key(start)]
+        if end:
+            clauses.append("partition_date <= ? AND record_time < ?")
+            params += [partition_date(end), time_key(end)]
+        if before:
+            # Keyset: strictly after (time, id) in descending order
+            clauses.append("(record_time < ? OR (record_time = ? AND record_id < ?))")
+            params += [time_key(before[0]), time_key(before[0]), before[1]]
+        return " AND ".join(clauses), params
+
+    def find(
+        self,
+        group_id: str,
+        record_type: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        status: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        before: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None,
+        require_status: bool = False
+    ) -> List[ArchiveEntry]:
+        """
+        Index entries matching filters, newest first.
+
+        Filters run on the index alone; no archive file is opened.
+
+        Args:
+            group_id: Group to search (required for tenant isolation)
+            record_type: Exact type (event_type, insight category)
+            agent_name: Exact agent name
+            status: Exact status
+            start: Inclusive lower time bound
+            end: Exclusive upper time bound
+            before: (time, record_id) keyset to resume after
+            limit: Maximum entries
+            require_status: Only entries that have a status
+
+        Returns:
+            Entries ordered by (record_time, record_id) descending
+        """
+        conn = self._connection()
+        if conn is None:
+            return []
+
+        where, params = self._filters(
+            group_id, record_type, agent_name, status, start, end, before, require_status
+        )
+        query = f"SELECT * FROM records WHERE {where} ORDER BY record_time DESC, record_id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [ArchiveEntry(*row) for row in conn.execute(query, params)]
+
+    def count(
+        self,
+        group_id: str,
+        record_type: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        status: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        require_status: bool = False
+    ) -> int:
+        """Number of records matching find() filters."""
+        conn = self._connection()
+        if conn is None:
+            return 0
+
+        where, params = self._filters(
+            group_id, record_type, agent_name, status, start, end, None, require_status
+        )
+        return conn.execute(f"SELECT count(*) FROM records WHERE {where}", params).fetchone()[0]
+
+    def partitions(
+        self,
+        group_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Tuple[str, str, List[str]]]:
+        """
+        Partitions overlapping a group and inclusive date range.
+
+        Returns:
+            (group_id, date, files) tuples ordered by group and date
+        """
+        conn = self._connection()
+        if conn is None:
+            return []
+
+        query = "SELECT DISTINCT group_id, partition_date, file FROM records WHERE 1 = 1"
+        params: List[Any] = []
+        if group_id:
+            query += " AND group_id = ?"
+            params.append(group_id)
+        if start_date:
+            query += " AND partition_date >= ?"
+            params.append(partition_date(start_date))
+        if end_date:
+            query += " AND partition_date <= ?"
+            params.append(partition_date(end_date))
+        query += " ORDER BY group_id, partition_date, file"
+
+        partitions: Dict[Tuple[str, str], List[str]] = {}
+        for group, day, file in conn.execute(query, params):
+            partitions.setdefault((group, day), []).append(file)
+        return [(group, day, files) for (group, day), files in partitions.items()]
+
+    def iter_file(self, file: str) -> Iterator[Dict[str, Any]]:
+        """Stream every record of one archive file (including replaced ones)."""
+        with gzip.open(self._dir / file, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line, object_hook=_decode)
+
+    async def restore(
+        self,
+        record_id: str,
+        client: Neo4jAsyncClient,
+        group_id: Optional[str] = None
+    ) -> bool:
+        """
+        Write an archived record back into the graph.
+
+        Restoring is idempotent: the node is merged on its ID property and
+        given its archived properties (without ARCHIVE_FIELDS).
+
+        Args:
+            record_id: Record ID
+            client: Neo4j async client
+            group_id: Only restore the record if it belongs to this group
+
+        Returns:
+            True if the record was found and restored
+        """
+        record = self.get(record_id, group_id=group_id)
+        if record is None:
+            return False
+
+        label, id_field = ARCHIVE_KINDS[self._kind]
+        properties = {k: v for k, v in record.items() if k not in ARCHIVE_FIELDS}
+        await client.execute_write(
+            f"""
+            MERGE (n:{label} {{{id_field}: $record_id}})
+            SET n += $properties
+            """,
+            {"record_id": record_id, "properties": properties, "group_id": record.get("group_id")}
+        )
+        logger.info(f"Restored {label} {record_id} from archive")
+        return True
+
+    def close(self) -> None:
+        """Close the index connection."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
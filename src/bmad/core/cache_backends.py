@@ -0,0 +1,268 @@
+"""
+Shared Cache Backends
+
+This module provides cache backends that are shared between processes, so
+several API workers warm and hit one cache instead of one each.
+- RedisCacheBackend - CacheBackend over any Redis-protocol async client
+- JSON value serialization with registered dataclass types (e.g. Pattern)
+- Tag reverse index kept in Redis sets for targeted invalidation
+- Per-backend hit/miss/error statistics
+
+Values are stored as JSON, never pickled, so a shared cache cannot be used
+to inject code. Dataclasses must be registered with register_cache_type()
+to round-trip.
+
+The redis package is optional and only imported by create_redis_backend().
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 3-4-fast-pattern-matching-query-engine
+"""
+
+import dataclasses
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.bmad.core.cache_manager import CacheStats
+
+logger = logging.getLogger(__name__)
+
+_TYPE_KEY = "__type__"
+_DATETIME_KEY = "__datetime__"
+
+# Dataclass types that may be stored in shared caches, by class name
+_cache_types: Dict[str, type] = {}
+
+
+def register_cache_type(cls: type) -> type:
+    """
+    Register a dataclass so it can be serialized into shared caches.
+
+    Can be used as a decorator or called after the class definition.
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+    _cache_types[cls.__name__] = cls
+    return cls
+
+
+def _encode(obj: Any) -> Any:
+    """json.dumps default hook for registered dataclasses and datetimes."""
+    if isinstance(obj, datetime):
+        return {_DATETIME_KEY: obj.isoformat()}
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        name = type(obj).__name__
+        if _cache_types.get(name) is not type(obj):
+            raise TypeError(f"{name} is not registered with register_cache_type()")
+        fields = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+        return {_TYPE_KEY: name, "fields": fields}
+    raise TypeError(f"Object of type {type(obj).__name__} is not cacheable")
+
+
+def _decode(data: Dict[str, Any]) -> Any:
+    """json.loads object hook reversing _encode()."""
+    if _DATETIME_KEY in data:
+        return datetime.fromisoformat(data[_DATETIME_KEY])
+    if _TYPE_KEY in data:
+        cls = _cache_types.get(data[_TYPE_KEY])
+        if cls is None:
+            raise ValueError(f"Unknown cached type: {data[_TYPE_KEY]}")
+        return cls(**data["fields"])
+    return data
+
+
+def serialize_value(value: Any) -> str:
+    """Serialize a cache value to JSON."""
+    return json.dumps(value, default=_encode)
+
+
+def deserialize_value(data: Any) -> Any:
+    """Deserialize a cache value produced by serialize_value()."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data, object_hook=_decode)
+
+
+class RedisCacheBackend:
+    """
+    CacheBackend storing entries in Redis (or any Redis-protocol server).
+
+    Layout under the namespace:
+    - {namespace}:entry:{key} - JSON envelope {created_at, value}, EX = hard TTL
+    - {namespace}:tag:{tag}   - set of keys carrying the tag, EX = hard TTL
+
+    Staleness uses wall-clock time because entries are shared between
+    processes. Capacity is left to the server's maxmemory policy. Redis
+    errors are logged and treated as misses so the cache never fails a
+    request.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: Any,
+        ttl_seconds: int = 3600,
+        soft_ttl_seconds: Optional[int] = None,
+        namespace: str = "bmad:cache",
+        dumps: Callable[[Any], str] = serialize_value,
+        loads: Callable[[Any], Any] = deserialize_value
+    ):
+        """
+        Initialize the Redis backend.
+
+        Args:
+            client: Async Redis-protocol client (e.g. redis.asyncio.Redis)
+            ttl_seconds: Hard time-to-live in seconds
+            soft_ttl_seconds: Optional soft TTL for stale-while-revalidate
+            namespace: Key prefix isolating this cache
+            dumps: Value serializer
+            loads: Value deserializer
+        """
+        if soft_ttl_seconds is not None and soft_ttl_seconds > ttl_seconds:
+            raise ValueError("soft_ttl_seconds must not exceed ttl_seconds")
+
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._soft_ttl_seconds = soft_ttl_seconds
+        self._namespace = namespace
+        self._dumps = dumps
+        self._loads = loads
+        self._lock = threading.Lock()
+        self._stats = CacheStats(backend=self.name)
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self._namespace}:entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._namespace}:tag:{tag}"
+
+    def _count(self, **increments: int) -> None:
+        """Increment statistics counters."""
+        with self._lock:
+            for name, amount in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + amount)
+
+    async def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Return (value or None, is_stale)."""
+        try:
+            raw = await self._client.get(self._entry_key(key))
+            if raw is None:
+                self._count(misses=1)
+                return None, False
+            envelope = self._loads(raw)
+        except Exception as e:
+            logger.warning(f"Redis cache lookup failed for {key}: {e}")
+            self._count(misses=1, errors=1)
+            return None, False
+
+        age = time.time() - envelope["created_at"]
+        stale = self._soft_ttl_seconds is not None and age > self._soft_ttl_seconds
+        self._count(hits=1, stale_hits=int(stale))
+        return envelope["value"], stale
+
+    async def set(self, key: str, value: Any, tags: Optional[Iterable[str]] = None) -> None:
+        """Store a value with optional invalidation tags."""
+        entry_key = self._entry_key(key)
+        try:
+            payload = self._dumps({"created_at": time.time(), "value": value})
+            await self._client.set(entry_key, payload, ex=self._ttl_seconds)
+            for tag in set(tags or ()):
+                tag_key = self._tag_key(tag)
+                await self._client.sadd(tag_key, key)
+                await self._client.expire(tag_key, self._ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Redis cache set failed for {key}: {e}")
+            self._count(errors=1)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key; True if it existed."""
+        try:
+            return await self._client.delete(self._entry_key(key)) > 0
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed for {key}: {e}")
+            self._count(errors=1)
+            return False
+
+    async def clear(self) -> None:
+        """Remove every entry and tag set in the namespace."""
+        try:
+            keys = [k async for k in self._client.scan_iter(match=f"{self._namespace}:*")]
+            if keys:
+                await self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+            self._count(errors=1)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags."""
+        try:
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            keys: set = set()
+            for tag_key in tag_keys:
+                members = await self._client.smembers(tag_key)
+                keys.update(m.decode("utf-8") if isinstance(m, bytes) else m for m in members)
+
+            removed = 0
+            if keys:
+                removed = await self._client.delete(*[self._entry_key(k) for k in keys])
+            if tag_keys:
+                await self._client.delete(*tag_keys)
+        except Exception as e:
+            logger.warning(f"Redis cache invalidation failed: {e}")
+            self._count(errors=1)
+            return 0
+
+        self._count(invalidations=removed)
+        return removed
+
+    async def invalidate_expired(self) -> int:
+        """Redis expires entries itself; nothing to sweep."""
+        return 0
+
+    async def get_stats(self) -> CacheStats:
+        """Get statistics for this process's use of the backend."""
+        return self.stats_snapshot()
+
+    def stats_snapshot(self) -> CacheStats:
+        """Get statistics without I/O (size is not tracked for Redis)."""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def record_refresh(self) -> None:
+        """Count a completed background refresh."""
+        self._count(refreshes=1)
+
+
+def create_redis_backend(
+    url: str,
+    ttl_seconds: int = 3600,
+    soft_ttl_seconds: Optional[int] = None,
+    namespace: str = "bmad:cache"
+) -> RedisCacheBackend:
+    """
+    Create a RedisCacheBackend connected to the given URL.
+
+    Raises:
+        ImportError: If the optional redis package is not installed
+    """
+    try:
+        import redis.asyncio as redis_asyncio
+    except ImportError as e:
+        raise ImportError(
+            "The redis package is required for PATTERN_CACHE_BACKEND=redis "
+            "(pip install redis)"
+        ) from e
+
+    client = redis_asyncio.from_url(url)
+    logger.info(f"Using Redis cache backend: {namespace}")
+    return RedisCacheBackend(
+        client,
+        ttl_seconds=ttl_seconds,
+        soft_ttl_seconds=soft_ttl_seconds,
+        namespace=namespace
+    )
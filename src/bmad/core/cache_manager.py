@@ -2,22 +2,35 @@
 Cache Manager
 
 This module provides a thread-safe LRU cache with TTL support.
-- LRU eviction with configurable capacity
-- Time-to-live (TTL) for cached entries
+- O(1) LRU eviction with configurable capacity (OrderedDict recency order)
+- Time-to-live (TTL) for cached entries, tracked on the monotonic clock
 - Thread-safe for concurrent access
 - Cache hit/miss statistics
+- Single-flight loading: concurrent async misses on one key share one load
+- Tag-based invalidation via a reverse index (e.g. pattern_id/group_id -> keys)
+- Optional stale-while-revalidate: past a soft TTL the stale value is served
+  while one background task refreshes it; the hard TTL still bounds staleness
+- Pluggable storage backends (in-memory by default, shared Redis via
+  src.bmad.core.cache_backends) with per-backend statistics
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
 Story: 3-4-fast-pattern-matching-query-engine
 """
 
+import asyncio
 import logging
+import os
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import (
+    Any, Awaitable, Callable, Dict, FrozenSet, Generic, Iterable, Optional,
+    Protocol, Set, Tuple, TypeVar
+)
+
+from src.bmad.core.tenant_filter import GLOBAL_GROUP_ID
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +45,11 @@ class CacheStats:
     evictions: int = 0
     size: int = 0
     max_size: int = 0
+    invalidations: int = 0
+    stale_hits: int = 0
+    refreshes: int = 0
+    errors: int = 0
+    backend: str = "memory"
 
     @property
     def hit_rate(self) -> float:
@@ -42,18 +60,27 @@ class CacheStats:
 
 @dataclass
 class CacheEntry(Generic[T]):
-    """A single cache entry with TTL tracking."""
+    """A single cache entry with TTL tracking (monotonic-clock seconds)."""
     key: str
     value: T
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_accessed: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: float = field(default_factory=time.monotonic)
+    last_accessed: float = field(default_factory=time.monotonic)
     access_count: int = 0
+    tags: FrozenSet[str] = frozenset()
 
-    def is_expired(self, ttl_seconds: int) -> bool:
+    def is_expired(self, ttl_seconds: int, now: Optional[float] = None) -> bool:
         """Check if the entry has expired."""
-        now = datetime.now(timezone.utc)
-        elapsed = (now - self.created_at).total_seconds()
-        return elapsed > ttl_seconds
+        if now is None:
+            now = time.monotonic()
+        return now - self.created_at > ttl_seconds
+
+    def is_stale(self, soft_ttl_seconds: Optional[int], now: Optional[float] = None) -> bool:
+        """Check if the entry is past its soft TTL (still servable, needs refresh)."""
+        if soft_ttl_seconds is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return now - self.created_at > soft_ttl_seconds
 
 
 class CacheManager(Generic[T]):
@@ -61,36 +88,49 @@ class CacheManager(Generic[T]):
     Thread-safe LRU cache with TTL support.
 
     Features:
-    - Least Recently Used eviction policy
-    - Configurable TTL (time-to-live)
+    - Least Recently Used eviction policy (O(1) get/set/evict)
+    - Configurable TTL (time-to-live), with an optional soft TTL after
+      which entries are reported stale but still served
     - Maximum capacity limit
     - Thread-safe for concurrent access
     - Statistics tracking
+    - Tag-based invalidation (reverse index from tag to keys)
 
     Usage:
         cache = CacheManager[str](max_size=100, ttl_seconds=3600)
-        cache.set("key", "value")
+        cache.set("key", "value", tags=["pattern:p1"])
         value = cache.get("key")
+        cache.invalidate_tags(["pattern:p1"])
     """
 
     def __init__(
         self,
         max_size: int = 100,
         ttl_seconds: int = 3600,  # 1 hour default
-        name: str = "cache"
+        name: str = "cache",
+        soft_ttl_seconds: Optional[int] = None
     ):
         """
         Initialize the cache manager.
 
         Args:
             max_size: Maximum number of entries (LRU limit)
-            ttl_seconds: Time-to-live in seconds (default: 1 hour)
+            ttl_seconds: Time-to-live in seconds (default: 1 hour); entries
+                         older than this are never served
             name: Optional name for logging/debugging
+            soft_ttl_seconds: Optional soft TTL; entries older than this are
+                              served but flagged stale by lookup()
         """
+        if soft_ttl_seconds is not None and soft_ttl_seconds > ttl_seconds:
+            raise ValueError("soft_ttl_seconds must not exceed ttl_seconds")
+
         self._max_size = max_size
         self._ttl_seconds = ttl_seconds
+        self._soft_ttl_seconds = soft_ttl_seconds
         self._name = name
-        self._data: Dict[str, CacheEntry[T]] = {}
+        # Ordered from least to most recently used
+        self._data: "OrderedDict[str, CacheEntry[T]]" = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = {}
         self._lock = threading.RLock()
         self._stats = CacheStats(max_size=max_size)
 
@@ -104,47 +144,74 @@ class CacheManager(Generic[T]):
         Returns:
             The cached value, or None if not found/expired
         """
+        return self.lookup(key)[0]
+
+    def lookup(self, key: str) -> Tuple[Optional[T], bool]:
+        """
+        Get a value from the cache along with its staleness.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Tuple of (value or None if not found/expired, whether the value
+            is past the soft TTL)
+        """
         with self._lock:
             entry = self._data.get(key)
 
             if entry is None:
                 self._stats.misses += 1
-                return None
+                return None, False
 
-            if entry.is_expired(self._ttl_seconds):
-                del self._data[key]
+            now = time.monotonic()
+            if entry.is_expired(self._ttl_seconds, now):
+                self._remove(key)
                 self._stats.misses += 1
                 self._stats.size = len(self._data)
-                return None
+                return None, False
 
             # Update access metadata (LRU)
-            entry.last_accessed = datetime.now(timezone.utc)
+            entry.last_accessed = now
             entry.access_count += 1
+            self._data.move_to_end(key)
 
             self._stats.hits += 1
-            return entry.value
+            stale = entry.is_stale(self._soft_ttl_seconds, now)
+            if stale:
+                self._stats.stale_hits += 1
+            return entry.value, stale
 
-    def set(self, key: str, value: T) -> None:
+    def set(self, key: str, value: T, tags: Optional[Iterable[str]] = None) -> None:
         """
         Set a value in the cache.
 
         Args:
             key: The cache key
             value: The value to cache
+            tags: Optional tags used for targeted invalidation
         """
+        entry_tags = frozenset(tags) if tags else frozenset()
+
         with self._lock:
             # Check if key already exists
-            if key in self._data:
+            entry = self._data.get(key)
+            if entry is not None:
                 # Update existing entry
-                entry = self._data[key]
+                now = time.monotonic()
                 entry.value = value
-                entry.created_at = datetime.now(timezone.utc)
-                entry.last_accessed = datetime.now(timezone.utc)
+                entry.created_at = now
+                entry.last_accessed = now
                 entry.access_count += 1
+                self._data.move_to_end(key)
+                self._unindex(key, entry.tags)
+                entry.tags = entry_tags
+                self._index(key, entry_tags)
                 return
 
             # Create new entry
-            self._data[key] = CacheEntry(key=key, value=value)
+            self._data[key] = CacheEntry(key=key, value=value, tags=entry_tags)
+            self._index(key, entry_tags)
 
             # Evict if over capacity (LRU)
             while len(self._data) > self._max_size:
@@ -164,7 +231,7 @@ class CacheManager(Generic[T]):
         """
         with self._lock:
             if key in self._data:
-                del self._data[key]
+                self._remove(key)
                 self._stats.size = len(self._data)
                 return True
             return False
@@ -173,8 +240,31 @@ class CacheManager(Generic[T]):
         """Clear all entries from the cache."""
         with self._lock:
             self._data.clear()
+            self._tag_index.clear()
             self._stats.size = 0
 
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of the given tags.
+
+        Args:
+            tags: Tags to invalidate (e.g. "pattern:<id>", "group:<id>")
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys: Set[str] = set()
+            for tag in tags:
+                keys.update(self._tag_index.get(tag, ()))
+
+            for key in keys:
+                self._remove(key)
+
+            self._stats.invalidations += len(keys)
+            self._stats.size = len(self._data)
+            return len(keys)
+
     def invalidate_expired(self) -> int:
         """
         Remove all expired entries.
@@ -183,13 +273,14 @@ class CacheManager(Generic[T]):
             Number of entries removed
         """
         with self._lock:
+            now = time.monotonic()
             expired_keys = [
                 key for key, entry in self._data.items()
-                if entry.is_expired(self._ttl_seconds)
+                if entry.is_expired(self._ttl_seconds, now)
             ]
 
             for key in expired_keys:
-                del self._data[key]
+                self._remove(key)
                 self._stats.evictions += 1
 
             self._stats.size = len(self._data)
@@ -203,9 +294,19 @@ class CacheManager(Generic[T]):
                 misses=self._stats.misses,
                 evictions=self._stats.evictions,
                 size=self._stats.size,
-                max_size=self._stats.max_size
+                max_size=self._stats.max_size,
+                invalidations=self._stats.invalidations,
+                stale_hits=self._stats.stale_hits,
+                refreshes=self._stats.refreshes,
+                errors=self._stats.errors,
+                backend=self._stats.backend
             )
 
+    def record_refresh(self) -> None:
+        """Count a completed background refresh of a stale entry."""
+        with self._lock:
+            self._stats.refreshes += 1
+
     def get_hit_rate(self) -> float:
         """Get the current cache hit rate."""
         with self._lock:
@@ -218,7 +319,7 @@ class CacheManager(Generic[T]):
             if entry is None:
                 return False
             if entry.is_expired(self._ttl_seconds):
-                del self._data[key]
+                self._remove(key)
                 return False
             return True
 
@@ -232,15 +333,30 @@ class CacheManager(Generic[T]):
         if not self._data:
             return
 
-        # Find entry with oldest last_accessed time
-        lru_key = min(
-            self._data.keys(),
-            key=lambda k: self._data[k].last_accessed
-        )
-
-        del self._data[lru_key]
+        # Front of the OrderedDict is the least recently used entry
+        key, entry = self._data.popitem(last=False)
+        self._unindex(key, entry.tags)
         self._stats.evictions += 1
 
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its reverse-index references (lock held)."""
+        entry = self._data.pop(key)
+        self._unindex(key, entry.tags)
+
+    def _index(self, key: str, tags: FrozenSet[str]) -> None:
+        """Add a key to the reverse index for each of its tags."""
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+    def _unindex(self, key: str, tags: FrozenSet[str]) -> None:
+        """Drop a key from the reverse index for each of its tags."""
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
     def get_or_set(self, key: str, factory: callable) -> T:
         """
         Get from cache or compute and set.
@@ -266,64 +382,318 @@ class CacheManager(Generic[T]):
         return value
 
 
-class AsyncCacheManager(Generic[T]):
+class CacheBackend(Protocol):
     """
-    Async-safe wrapper around CacheManager for use with async code.
+    Storage backend behind AsyncCacheManager.
 
-    Provides the same interface but is safe to use with asyncio.
+    Backends store values with a hard TTL, report staleness against an
+    optional soft TTL, maintain the tag reverse index and keep their own
+    statistics. Single-flight and background refresh stay in
+    AsyncCacheManager and are per process.
+    """
+
+    name: str
+
+    async def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Return (value or None, is_stale)."""
+        ...
+
+    async def set(self, key: str, value: Any, tags: Optional[Iterable[str]] = None) -> None:
+        """Store a value with optional invalidation tags."""
+        ...
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key; True if it existed."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Remove every entry carrying any of the tags."""
+        ...
+
+    async def invalidate_expired(self) -> int:
+        """Remove expired entries."""
+        ...
+
+    async def get_stats(self) -> CacheStats:
+        """Get backend statistics."""
+        ...
+
+    def stats_snapshot(self) -> CacheStats:
+        """Get backend statistics without I/O."""
+        ...
+
+    def record_refresh(self) -> None:
+        """Count a completed background refresh."""
+        ...
+
+
+class InMemoryCacheBackend:
+    """In-process CacheBackend backed by a CacheManager (per worker)."""
+
+    name = "memory"
+
+    def __init__(self, cache: CacheManager):
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            cache: The CacheManager holding the entries
+        """
+        self._cache = cache
+
+    async def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        return self._cache.lookup(key)
+
+    async def set(self, key: str, value: Any, tags: Optional[Iterable[str]] = None) -> None:
+        self._cache.set(key, value, tags=tags)
+
+    async def delete(self, key: str) -> bool:
+        return self._cache.delete(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        return self._cache.invalidate_tags(tags)
+
+    async def invalidate_expired(self) -> int:
+        return self._cache.invalidate_expired()
+
+    async def get_stats(self) -> CacheStats:
+        return self._cache.get_stats()
+
+    def stats_snapshot(self) -> CacheStats:
+        return self._cache.get_stats()
+
+    def record_refresh(self) -> None:
+        self._cache.record_refresh()
+
+
+class AsyncCacheManager(Generic[T]):
+    """
+    Async-safe cache front end over a pluggable CacheBackend.
+
+    Uses an in-memory CacheManager by default; pass a shared backend (e.g.
+    RedisCacheBackend) so several API workers share one cache. Adds
+    get_or_compute() which coalesces concurrent misses on the same key
+    into a single in-flight load (single-flight). With a soft TTL,
+    get_or_compute() serves stale values immediately and refreshes them
+    in the background (stale-while-revalidate).
     """
 
     def __init__(
         self,
         max_size: int = 100,
         ttl_seconds: int = 3600,
-        name: str = "async_cache"
+        name: str = "async_cache",
+        soft_ttl_seconds: Optional[int] = None,
+        backend: Optional[CacheBackend] = None
     ):
         """
         Initialize the async cache manager.
 
         Args:
-            max_size: Maximum number of entries
-            ttl_seconds: Time-to-live in seconds
+            max_size: Maximum number of entries (in-memory backend)
+            ttl_seconds: Hard time-to-live in seconds (in-memory backend)
             name: Optional name for logging
+            soft_ttl_seconds: Optional soft TTL enabling stale-while-revalidate
+                              (in-memory backend)
+            backend: Optional storage backend; the TTL and size arguments
+                     are ignored when one is given
         """
-        self._cache = CacheManager[T](
-            max_size=max_size,
-            ttl_seconds=ttl_seconds,
-            name=name
+        self._name = name
+        self._backend: CacheBackend = backend or InMemoryCacheBackend(
+            CacheManager[T](
+                max_size=max_size,
+                ttl_seconds=ttl_seconds,
+                name=name,
+                soft_ttl_seconds=soft_ttl_seconds
+            )
         )
+        self._inflight: Dict[str, "asyncio.Task[T]"] = {}
+        # Strong references to background refreshes until they finish
+        self._refreshes: Set["asyncio.Task[T]"] = set()
+        # Bumped on invalidation so loads started earlier are not cached
+        self._epoch = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        """The storage backend."""
+        return self._backend
 
     async def get(self, key: str) -> Optional[T]:
-        """Get from cache (async wrapper)."""
-        return self._cache.get(key)
+        """Get from cache."""
+        value, _ = await self._backend.lookup(key)
+        return value
 
-    async def set(self, key: str, value: T) -> None:
-        """Set in cache (async wrapper)."""
-        self._cache.set(key, value)
+    async def set(self, key: str, value: T, tags: Optional[Iterable[str]] = None) -> None:
+        """Set in cache."""
+        await self._backend.set(key, value, tags=tags)
 
     async def delete(self, key: str) -> bool:
-        """Delete from cache (async wrapper)."""
-        return self._cache.delete(key)
+        """Delete from cache."""
+        return await self._backend.delete(key)
 
     async def clear(self) -> None:
-        """Clear cache (async wrapper)."""
-        self._cache.clear()
+        """Clear cache."""
+        self._epoch += 1
+        self._inflight.clear()
+        await self._backend.clear()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Remove every entry carrying any of the given tags.
+
+        Loads already in flight are detached so that they cannot write a
+        value read before the invalidating change.
+        """
+        self._epoch += 1
+        self._inflight.clear()
+        return await self._backend.invalidate_tags(tags)
 
     async def get_stats(self) -> CacheStats:
-        """Get statistics (async wrapper)."""
-        return self._cache.get_stats()
+        """Get backend statistics."""
+        return await self._backend.get_stats()
+
+    def stats_snapshot(self) -> CacheStats:
+        """Get backend statistics without I/O."""
+        return self._backend.stats_snapshot()
 
     async def invalidate_expired(self) -> int:
-        """Invalidate expired entries (async wrapper)."""
-        return self._cache.invalidate_expired()
+        """Invalidate expired entries."""
+        return await self._backend.invalidate_expired()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        tags_for: Optional[Callable[[T], Iterable[str]]] = None
+    ) -> T:
+        """
+        Get from cache or compute with single-flight coalescing.
+
+        On a miss, the first caller starts the load; concurrent callers
+        for the same key await that load instead of starting their own.
+        The load runs as its own task, so a cancelled caller does not
+        cancel it for the others. Failures propagate to every waiter and
+        are not cached.
+
+        If the cached value is past the soft TTL it is returned at once and
+        a single background refresh is started; a failed refresh is logged
+        and the stale value keeps being served until the hard TTL.
+
+        Args:
+            key: The cache key
+            factory: Coroutine function producing the value on a miss
+            tags_for: Optional function deriving invalidation tags from the value
+
+        Returns:
+            The cached or newly computed value
+        """
+        value, stale = await self._backend.lookup(key)
+        if value is not None:
+            if stale and key not in self._inflight:
+                task = self._start_load(key, factory, tags_for)
+                self._refreshes.add(task)
+                task.add_done_callback(self._refresh_finished)
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_load(key, factory, tags_for)
+
+        return await asyncio.shield(task)
+
+    def inflight_count(self) -> int:
+        """Get the number of loads currently in flight."""
+        return len(self._inflight)
+
+    def _start_load(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        tags_for: Optional[Callable[[T], Iterable[str]]]
+    ) -> "asyncio.Task[T]":
+        """Start a single-flight load task for a key."""
+        task = asyncio.ensure_future(
+            self._load(key, factory, tags_for, self._epoch)
+        )
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._load_finished(key, done))
+        return task
+
+    def _refresh_finished(self, task: "asyncio.Task[T]") -> None:
+        """Record the outcome of a background refresh."""
+        self._refreshes.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning(f"Background refresh failed for {self._name}: {task.exception()}")
+        else:
+            self._backend.record_refresh()
+
+    async def _load(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        tags_for: Optional[Callable[[T], Iterable[str]]],
+        epoch: int
+    ) -> T:
+        """Run the factory and cache its result unless invalidated meanwhile."""
+        value = await factory()
+        if epoch == self._epoch:
+            await self._backend.set(key, value, tags=tags_for(value) if tags_for else None)
+        return value
+
+    def _load_finished(self, key: str, task: "asyncio.Task[T]") -> None:
+        """Drop a finished load from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+PATTERN_CACHE_TTL_SECONDS = 3600  # 1 hour
+PATTERN_CACHE_SOFT_TTL_SECONDS = 3000  # Refresh in the background after 50 minutes
+
+
+def _create_pattern_cache() -> AsyncCacheManager:
+    """
+    Create the pattern cache with the backend selected by environment.
+
+    PATTERN_CACHE_BACKEND=redis shares the cache between API workers via
+    PATTERN_CACHE_REDIS_URL; anything else keeps it in process.
+    """
+    backend_name = os.getenv("PATTERN_CACHE_BACKEND", "memory").lower()
+
+    backend = None
+    if backend_name == "redis":
+        from src.bmad.core.cache_backends import create_redis_backend
+        backend = create_redis_backend(
+            os.getenv("PATTERN_CACHE_REDIS_URL", "redis://localhost:6379/0"),
+            ttl_seconds=PATTERN_CACHE_TTL_SECONDS,
+            soft_ttl_seconds=PATTERN_CACHE_SOFT_TTL_SECONDS,
+            namespace="bmad:pattern_cache"
+        )
+    elif backend_name != "memory":
+        logger.warning(f"Unknown PATTERN_CACHE_BACKEND '{backend_name}', using memory")
+
+    return AsyncCacheManager(
+        max_size=100,
+        ttl_seconds=PATTERN_CACHE_TTL_SECONDS,
+        name="pattern_cache",
+        soft_ttl_seconds=PATTERN_CACHE_SOFT_TTL_SECONDS,
+        backend=backend
+    )
 
 
 # Pattern-specific cache instance
-_pattern_cache = AsyncCacheManager(
-    max_size=100,
-    ttl_seconds=3600,  # 1 hour
-    name="pattern_cache"
-)
+_pattern_cache = _create_pattern_cache()
 
 
 def get_pattern_cache() -> AsyncCacheManager:
@@ -331,6 +701,39 @@ def get_pattern_cache() -> AsyncCacheManager:
     return _pattern_cache
 
 
+def pattern_tag(pattern_id: str) -> str:
+    """Cache tag for result sets containing a pattern."""
+    return f"pattern:{pattern_id}"
+
+
+def group_tag(group_id: str) -> str:
+    """Cache tag for result sets that read a group's patterns."""
+    return f"group:{group_id}"
+
+
+def pattern_invalidation_tags(
+    pattern_ids: Iterable[str] = (),
+    group_ids: Iterable[str] = (),
+    include_global: bool = True
+) -> Set[str]:
+    """
+    Tags to invalidate after patterns change.
+
+    Every pattern result set reads its own group plus the global group, so
+    group_tag(GLOBAL_GROUP_ID) evicts all of them. It is kept whenever the
+    global group is named (explicit invalidation, promotion, success-rate
+    updates that can move a pattern across a min_success_rate filter).
+    The pattern-level path (usage counters) passes include_global=False so
+    a busy global pattern only evicts the result sets that contain it.
+    """
+    tags = {pattern_tag(pattern_id) for pattern_id in pattern_ids if pattern_id}
+    tags.update(
+        group_tag(group_id) for group_id in group_ids
+        if group_id and (include_global or group_id != GLOBAL_GROUP_ID)
+    )
+    return tags
+
+
 async def main():
     """Quick test of the cache manager."""
     cache = AsyncCacheManager[str](max_size=3, ttl_seconds=60, name="test")
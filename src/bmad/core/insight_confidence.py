@@ -0,0 +1,169 @@
+"""
+Effective Insight Confidence
+
+This module holds the temporal decay model for insight confidence and the
+helpers that evaluate it, so readers and the decay job agree on one model.
+- An insight not applied for STALE_DAYS loses DECAY_RATE of its confidence
+  once per DECAY_INTERVAL_DAYS (the nightly decay cycle) from then on
+- Eager mode (default): the decay job rewrites confidence_score nightly
+  and readers use it as stored
+- Lazy mode (CONFIDENCE_DECAY_MODE=lazy): confidence_score stays the base
+  value and readers compute the effective value in closed form from
+  coalesce(last_applied, created_at); insights carry an expires_at time at
+  which the effective value drops below ARCHIVE_THRESHOLD, so archival is
+  an index range scan instead of a nightly rewrite
+
+Switching an existing graph from eager to lazy mode applies the decay from
+last_applied again on top of what the eager job already wrote.
+
+Usage:
+    cypher = f'''
+    MATCH (i:Insight)
+    WHERE {effective_confidence("i")} >= $threshold
+    RETURN {effective_confidence("i")} as confidence_score
+    '''
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 4-1-apply-temporal-decay-to-stale-insights
+"""
+
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+STALE_DAYS = 90
+DECAY_RATE = 0.10  # 10% decay
+DECAY_INTERVAL_DAYS = 1
+ARCHIVE_THRESHOLD = 0.1
+
+
+def lazy_decay_enabled() -> bool:
+    """Whether confidence decays at read time (CONFIDENCE_DECAY_MODE=lazy)."""
+    return os.getenv("CONFIDENCE_DECAY_MODE", "eager").lower() == "lazy"
+
+
+def _native(value: Any) -> Optional[datetime]:
+    """Timezone-aware datetime from a driver value, datetime or ISO string."""
+    if value is None:
+        return None
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def decay_periods(reference: Any, now: Optional[datetime] = None) -> int:
+    """Decay steps applied by now to an insight last applied at reference."""
+    reference = _native(reference)
+    if reference is None:
+        return 0
+
+    days = ((now or datetime.now(timezone.utc)) - reference).days
+    if days < STALE_DAYS:
+        return 0
+    return (days - STALE_DAYS) // DECAY_INTERVAL_DAYS + 1
+
+
+def compute_effective_confidence(
+    base: Optional[float],
+    reference: Any,
+    now: Optional[datetime] = None
+) -> float:
+    """
+    Effective confidence of a base score decayed since reference.
+
+    Args:
+        base: Stored confidence_score
+        reference: last_applied, or created_at if never applied
+        now: Evaluation time (default: now)
+
+    Returns:
+        base * (1 - DECAY_RATE) ** periods
+    """
+    return (base or 0.0) * (1 - DECAY_RATE) ** decay_periods(reference, now)
+
+
+def insight_confidence(properties: Dict[str, Any], now: Optional[datetime] = None) -> float:
+    """
+    Confidence of an insight node to present to readers.
+
+    Args:
+        properties: Insight node properties
+
+    Returns:
+        Stored confidence_score in eager mode, effective value in lazy mode
+    """
+    base = properties.get("confidence_score", 0.0)
+    if not lazy_decay_enabled():
+        return base
+    reference = properties.get("last_applied") or properties.get("created_at")
+    return round(compute_effective_confidence(base, reference, now), 4)
+
+
+def compute_expires_at(base: Optional[float], reference: Any) -> Optional[datetime]:
+    """
+    Time at which an insight's effective confidence drops below ARCHIVE_THRESHOLD.
+
+    Args:
+        base: Stored confidence_score
+        reference: last_applied, or created_at if never applied
+
+    Returns:
+        Expiry time, or None if the insight has no reference time
+    """
+    reference = _native(reference)
+    if reference is None:
+        return None
+
+    base = base or 0.0
+    if base < ARCHIVE_THRESHOLD:
+        return reference
+
+    # Decay steps that still leave the confidence at or above the threshold
+    periods_kept = math.floor(math.log(ARCHIVE_THRESHOLD / base) / math.log(1 - DECAY_RATE))
+    return reference + timedelta(days=STALE_DAYS + periods_kept * DECAY_INTERVAL_DAYS)
+
+
+def _reference_expr(alias: str) -> str:
+    return f"coalesce({alias}.last_applied, {alias}.created_at)"
+
+
+def effective_confidence(alias: str) -> str:
+    """
+    Cypher expression for an insight's confidence as readers should see it.
+
+    Args:
+        alias: Cypher variable of the Insight node
+
+    Returns:
+        `alias.confidence_score` in eager mode, the closed-form decayed
+        value in lazy mode
+    """
+    if not lazy_decay_enabled():
+        return f"{alias}.confidence_score"
+
+    days = f"duration.inDays({_reference_expr(alias)}, datetime()).days"
+    periods = (
+        f"CASE WHEN {days} >= {STALE_DAYS} "
+        f"THEN ({days} - {STALE_DAYS}) / {DECAY_INTERVAL_DAYS} + 1 ELSE 0 END"
+    )
+    return f"(coalesce({alias}.confidence_score, 0.0) * ({1 - DECAY_RATE} ^ ({periods})))"
+
+
+def expires_at_expr(alias: str) -> str:
+    """Cypher expression computing an insight's expires_at (see compute_expires_at)."""
+    reference = _reference_expr(alias)
+    periods_kept = (
+        f"toInteger(floor(log({ARCHIVE_THRESHOLD} / {alias}.confidence_score) "
+        f"/ log({1 - DECAY_RATE})))"
+    )
+    return (
+        f"CASE WHEN {reference} IS NULL THEN null "
+        f"WHEN coalesce({alias}.confidence_score, 0.0) < {ARCHIVE_THRESHOLD} THEN {reference} "
+        f"ELSE {reference} + duration({{days: {STALE_DAYS} + {periods_kept} * {DECAY_INTERVAL_DAYS}}}) END"
+    )
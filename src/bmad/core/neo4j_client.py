@@ -17,14 +17,27 @@ Story: 1-2-async-neo4j-client-implementation
 import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession, READ_ACCESS, WRITE_ACCESS
 from neo4j.exceptions import ServiceUnavailable, SessionExpired
 
+from src.bmad.core.query_metrics import record_query, record_query_error
+
 logger = logging.getLogger(__name__)
 
+# Clauses that make a query a write; such queries are never routed to readers
+_WRITE_CLAUSE = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH)\b", re.IGNORECASE)
+
+
+def is_write_query(query: str) -> bool:
+    """Return True if the Cypher query contains a write clause."""
+    return bool(_WRITE_CLAUSE.search(query))
+
 
 class SecurityError(Exception):
     """Raised when security requirements are violated (e.g., missing group_id)"""
@@ -37,7 +50,9 @@ class Neo4jAsyncClient:
     
     Features:
     - Async connection pool with configurable size
-    - Automatic reconnection with exponential backoff
+    - Managed transactions with read/write routing
+    - Automatic reconnection with jittered exponential backoff
+    - Per-query latency metrics and slow-query log (see query_metrics)
     - Mandatory group_id filtering for multi-tenant isolation
     - Thread-safe for concurrent access
     - Health check support
@@ -72,8 +87,10 @@ class Neo4jAsyncClient:
             user: Neo4j username (default: from NEO4J_USER env var)
             password: Neo4j password (default: from NEO4J_PASSWORD env var)
             pool_size: Connection pool size (default: from NEO4J_POOL_SIZE or 10)
-            max_retries: Maximum retry attempts for transient failures (default: 3)
-            retry_delay: Initial retry delay in seconds (default: 1.0)
+            max_retries: Maximum attempts to obtain a session (default: 3)
+            retry_delay: Initial retry delay in seconds (default: 1.0); the
+                driver's managed-transaction retry window is
+                retry_delay * (2 ** max_retries - 1)
         """
         self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.user = user or os.getenv("NEO4J_USER", "neo4j")
@@ -106,7 +123,7 @@ class Neo4jAsyncClient:
             auth=(self.user, self.password),
             max_connection_pool_size=self.pool_size,
             connection_acquisition_timeout=30.0,
-            max_transaction_retry_time=30.0
+            max_transaction_retry_time=self.transaction_retry_time
         )
         
         # Verify connection with health check
@@ -115,6 +132,16 @@ class Neo4jAsyncClient:
         self._initialized = True
         logger.info(f"Neo4j async client initialized (pool_size={self.pool_size})")
     
+    @property
+    def transaction_retry_time(self) -> float:
+        """
+        Seconds the driver may spend retrying one managed transaction.
+
+        The same budget the exponential backoff of max_retries attempts
+        spans, so driver retries and client retries are not stacked.
+        """
+        return self.retry_delay * (2 ** self.max_retries - 1)
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check by querying Neo4j components.
@@ -184,6 +211,9 @@ class Neo4jAsyncClient:
     ) -> List[Dict[str, Any]]:
         """
         Execute a read query asynchronously.
+
+        Read queries are routed to readers (secondaries in a cluster).
+        Queries containing a write clause are sent to the writer instead.
         
         Args:
             query: Cypher query string
@@ -205,7 +235,10 @@ class Neo4jAsyncClient:
         if validate_group_id:
             self._validate_group_id(query, parameters)
         
-        return await self._execute_with_retry(query, parameters, read_only=True)
+        # Many callers write through execute_query; keep those on the writer
+        read_only = not is_write_query(query)
+
+        return await self._execute_with_retry(query, parameters, read_only=read_only)
     
     async def execute_write(
         self,
@@ -237,60 +270,372 @@ class Neo4jAsyncClient:
             self._validate_group_id(query, parameters)
         
         return await self._execute_with_retry(query, parameters, read_only=False)
-    
+
+    async def execute_write_batch(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 500,
+        parameters: Optional[Dict[str, Any]] = None,
+        validate_group_id: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a write query once per row, batching rows with UNWIND.
+
+        The query is run as "UNWIND $rows AS row <query>", so it refers to
+        the current row as `row`. Rows are sent in chunks of batch_size,
+        each chunk in its own transaction, turning N round trips into
+        N / batch_size.
+
+        Usage:
+            await client.execute_write_batch(
+                "MERGE (s:EventSummary {group_id: row.group_id, event_type: row.event_type}) "
+                "SET s.count = row.count",
+                [{"group_id": "faith-meats", "event_type": "review", "count": 3}]
+            )
+
+        Args:
+            query: Cypher query body referring to `row`
+            rows: Parameter maps, one per row (each must include group_id)
+            batch_size: Maximum rows per transaction (default: 500)
+            parameters: Extra parameters shared by every row
+            validate_group_id: Whether to enforce group_id validation per row (default: True)
+
+        Returns:
+            Result records of all chunks, in row order
+
+        Raises:
+            SecurityError: If a row is missing group_id
+            ValueError: If batch_size is not positive or parameters define `rows`
+            ServiceUnavailable: If connection fails after retries
+        """
+        if not self._driver:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        parameters = dict(parameters or {})
+        if "rows" in parameters:
+            raise ValueError("'rows' is reserved for the batch rows")
+
+        if validate_group_id:
+            for index, row in enumerate(rows):
+                if not row.get("group_id"):
+                    logger.warning(f"Batch row {index} missing group_id: {query[:100]}")
+                    raise SecurityError(
+                        "Multi-tenant isolation violation: every batch row requires group_id"
+                    )
+
+        batch_query = f"UNWIND $rows AS row\n{query}"
+        records: List[Dict[str, Any]] = []
+
+        for start in range(0, len(rows), batch_size):
+            chunk_parameters = {**parameters, "rows": rows[start:start + batch_size]}
+            records.extend(
+                await self._execute_with_retry(batch_query, chunk_parameters, read_only=False)
+            )
+
+        return records
+
+    async def execute_write_transaction(
+        self,
+        statements: List[Tuple[str, Dict[str, Any]]],
+        validate_group_id: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several write statements in one transaction.
+
+        Either every statement commits or none does, e.g. for data writes
+        that must land together with the checkpoint recording them.
+
+        Args:
+            statements: (query, parameters) pairs, run in order
+            validate_group_id: Whether to enforce group_id validation per statement (default: True)
+
+        Returns:
+            Result records of each statement, in statement order
+
+        Raises:
+            SecurityError: If a statement's parameters are missing group_id
+            ServiceUnavailable: If connection fails after retries
+        """
+        if not self._driver:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+
+        if validate_group_id:
+            for query, parameters in statements:
+                self._validate_group_id(query, parameters)
+
+        if not statements:
+            return []
+
+        return await self._execute_with_retry(
+            "\n;\n".join(query for query, _ in statements),
+            {},
+            read_only=False,
+            statements=statements
+        )
+
+    async def execute_auto_commit(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        validate_group_id: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a query in an auto-commit (implicit) transaction.
+
+        Needed for `CALL { ... } IN TRANSACTIONS`, which commits its own
+        batches and cannot run inside a managed transaction. The query is
+        not retried: a failure can leave earlier batches committed, so
+        callers must be able to re-run it.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (must include group_id for tenant isolation)
+            validate_group_id: Whether to enforce group_id validation (default: True)
+
+        Returns:
+            List of result records as dictionaries
+
+        Raises:
+            SecurityError: If group_id validation fails
+        """
+        if not self._driver:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+
+        parameters = parameters or {}
+
+        if validate_group_id:
+            self._validate_group_id(query, parameters)
+
+        start_time = time.perf_counter()
+        try:
+            async with self._driver.session(default_access_mode=WRITE_ACCESS) as session:
+                result = await session.run(query, parameters)
+                records = await result.data()
+        except Exception as e:
+            record_query_error(query, e)
+            raise
+
+        record_query(query, time.perf_counter() - start_time, rows=len(records), read_only=False)
+        return records
+
+    async def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        validate_group_id: bool = True,
+        fetch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream query results one record at a time with bounded memory.
+
+        Records are pulled from the server fetch_size at a time as the
+        caller iterates, instead of being materialized as one list. Use
+        this for queries that can touch very large numbers of nodes.
+
+        Usage:
+            async for record in client.stream_query(
+                "MATCH (e:Event) WHERE e.group_id = $group_id RETURN e.event_id as event_id",
+                {"group_id": "faith-meats"}
+            ):
+                writer.writerow(record)
+
+        The query runs in an auto-commit transaction that stays open until
+        iteration finishes, so it is not retried: connection errors
+        propagate to the caller.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (must include group_id for tenant isolation)
+            validate_group_id: Whether to enforce group_id validation (default: True)
+            fetch_size: Records fetched from the server per round trip (default: 1000)
+
+        Yields:
+            Result records as dictionaries
+
+        Raises:
+            SecurityError: If group_id validation fails
+        """
+        if not self._driver:
+            raise RuntimeError("Client not initialized. Call initialize() first.")
+
+        parameters = parameters or {}
+
+        if validate_group_id:
+            self._validate_group_id(query, parameters)
+
+        access_mode = WRITE_ACCESS if is_write_query(query) else READ_ACCESS
+
+        start_time = time.perf_counter()
+        rows = 0
+
+        async with self._driver.session(
+            default_access_mode=access_mode,
+            fetch_size=fetch_size
+        ) as session:
+            result = await session.run(query, parameters)
+            async for record in result:
+                rows += 1
+                yield record.data()
+
+        record_query(
+            query,
+            time.perf_counter() - start_time,
+            rows=rows,
+            read_only=access_mode == READ_ACCESS
+        )
+
+    async def stream_query_batches(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        validate_group_id: bool = True
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream query results as lists of at most batch_size records.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (must include group_id for tenant isolation)
+            batch_size: Maximum records per yielded batch (default: 1000)
+            validate_group_id: Whether to enforce group_id validation (default: True)
+
+        Yields:
+            Lists of result records as dictionaries
+        """
+        batch: List[Dict[str, Any]] = []
+
+        async for record in self.stream_query(
+            query, parameters, validate_group_id=validate_group_id, fetch_size=batch_size
+        ):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
     async def _execute_with_retry(
         self,
         query: str,
         parameters: Dict[str, Any],
-        read_only: bool = True
-    ) -> List[Dict[str, Any]]:
+        read_only: bool = True,
+        statements: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+    ) -> List[Any]:
         """
-        Execute query with exponential backoff retry logic.
-        
+        Execute query in a managed transaction.
+
+        Reads run through session.execute_read and writes through
+        session.execute_write, so with a routing (neo4j://) URI reads are
+        spread across secondaries and writes go to the leader. The driver
+        retries transient errors (deadlocks, leader switches, dropped
+        connections) inside each managed transaction for up to
+        transaction_retry_time. Only failures before the transaction
+        function ever ran (no session or connection could be obtained)
+        are retried here, with exponential backoff and full jitter.
+
         Args:
             query: Cypher query string
             parameters: Query parameters
             read_only: Whether this is a read-only query
-            
+            statements: Run these (query, parameters) pairs in the transaction
+                        instead; query then only labels the metrics
+
         Returns:
-            List of result records as dictionaries
-            
+            List of result records as dictionaries (with statements: one
+            such list per statement)
+
         Raises:
-            ServiceUnavailable: If all retries exhausted
+            ServiceUnavailable: If no session could be obtained after all
+                                retries, or the driver's retries ran out
+            TransientError: If a transient error outlasts the driver's retries
         """
+        transaction_started: Optional[float] = None
+        transaction_attempts = 0
+
+        async def work(tx) -> List[Any]:
+            nonlocal transaction_started, transaction_attempts
+            transaction_attempts += 1
+            if transaction_started is None:
+                transaction_started = time.perf_counter()
+            if statements is None:
+                result = await tx.run(query, parameters)
+                return await result.data()
+
+            results = []
+            for statement, statement_parameters in statements:
+                result = await tx.run(statement, statement_parameters)
+                results.append(await result.data())
+            return results
+
+        access_mode = READ_ACCESS if read_only else WRITE_ACCESS
         last_exception = None
-        
+        start_time = time.perf_counter()
+
         for attempt in range(self.max_retries):
+            attempt_started = time.perf_counter()
+            transaction_started = None
+            transaction_attempts = 0
             try:
-                async with self._driver.session() as session:
+                async with self._driver.session(default_access_mode=access_mode) as session:
                     if read_only:
-                        result = await session.run(query, parameters)
+                        records = await session.execute_read(work)
                     else:
-                        # Use explicit transaction for writes (neo4j 6.x API)
-                        tx = await session.begin_transaction()
-                        async with tx:
-                            result = await tx.run(query, parameters)
-                            await tx.commit()
-                    
-                    # Convert to list of dicts
-                    records = await result.data()
-                    return records
-                    
+                        records = await session.execute_write(work)
+
+                record_query(
+                    query,
+                    time.perf_counter() - start_time,
+                    rows=len(records) if statements is None else sum(map(len, records)),
+                    retries=attempt + max(transaction_attempts - 1, 0),
+                    pool_wait_seconds=(
+                        transaction_started - attempt_started
+                        if transaction_started is not None else None
+                    ),
+                    read_only=read_only
+                )
+                return records
+
             except (ServiceUnavailable, SessionExpired) as e:
+                if transaction_started is not None:
+                    # The driver already retried this transaction
+                    record_query_error(query, e, retries=attempt + transaction_attempts - 1)
+                    raise
                 last_exception = e
-                
+
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                    delay = self._retry_backoff(attempt)
                     logger.warning(
-                        f"Query failed (attempt {attempt + 1}/{self.max_retries}), "
-                        f"retrying in {delay}s: {e}"
+                        f"No Neo4j session (attempt {attempt + 1}/{self.max_retries}), "
+                        f"retrying in {delay:.2f}s: {e}"
                     )
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"Query failed after {self.max_retries} attempts: {e}")
-        
+                    logger.error(f"No Neo4j session after {self.max_retries} attempts: {e}")
+
+            except Exception as e:
+                record_query_error(
+                    query, e, retries=attempt + max(transaction_attempts - 1, 0)
+                )
+                raise
+
+        record_query_error(query, last_exception, retries=self.max_retries - 1)
         raise ServiceUnavailable(f"Query failed after {self.max_retries} retries: {last_exception}")
-    
+
+    def _retry_backoff(self, attempt: int) -> float:
+        """
+        Delay before retry number attempt + 1 (exponential, full jitter).
+
+        Jitter keeps clients that failed together (e.g. on a leader switch)
+        from retrying in lockstep.
+        """
+        return random.uniform(0, self.retry_delay * (2 ** attempt))
+
     @asynccontextmanager
     async def session(self) -> AsyncSession:
         """
@@ -325,3 +670,68 @@ class Neo4jAsyncClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.close()
+
+
+# Process-wide shared client (one pooled driver per process)
+_shared_client: Optional[Neo4jAsyncClient] = None
+_shared_client_lock: Optional[asyncio.Lock] = None
+
+
+def _get_shared_client_lock() -> asyncio.Lock:
+    """
+    Get the shared-client lock, creating it inside the running loop.
+
+    On Python 3.9 a Lock binds to the event loop current at construction,
+    so it must not be built at import time.
+    """
+    global _shared_client_lock
+
+    if _shared_client_lock is None:
+        _shared_client_lock = asyncio.Lock()
+    return _shared_client_lock
+
+
+async def get_shared_client() -> Neo4jAsyncClient:
+    """
+    Get the process-wide shared client, initializing it on first use.
+
+    All API routers and long-lived services should use this instead of
+    constructing their own client, so that they share a single driver and
+    connection pool. The health check runs once, at initialization.
+
+    Returns:
+        The initialized shared Neo4jAsyncClient
+    """
+    global _shared_client
+
+    if _shared_client is not None and _shared_client._initialized:
+        return _shared_client
+
+    async with _get_shared_client_lock():
+        if _shared_client is None or not _shared_client._initialized:
+            client = Neo4jAsyncClient()
+            await client.initialize()
+            _shared_client = client
+
+    return _shared_client
+
+
+def set_shared_client(client: Optional[Neo4jAsyncClient]) -> None:
+    """
+    Register an already-initialized client as the process-wide shared client.
+
+    Useful for tests and for applications that configure the client
+    explicitly rather than from environment variables.
+    """
+    global _shared_client
+    _shared_client = client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide shared client, if one was created."""
+    global _shared_client
+
+    async with _get_shared_client_lock():
+        if _shared_client is not None:
+            await _shared_client.close()
+            _shared_client = None
@@ -0,0 +1,68 @@
+"""
+Keyset Pagination Cursors
+
+This module encodes the sort-column values of the last row on a page into
+an opaque cursor, so the next page is fetched with a WHERE clause on those
+columns instead of SKIP. Deep pages then cost the same as the first one.
+- Cursors are URL-safe base64 JSON; datetimes round-trip
+- Each cursor carries the kind of listing it belongs to, so a cursor from
+  one endpoint is rejected by another
+
+Cursors are not signed: they only position a query that still applies
+the caller's group_id filter, so a forged cursor cannot widen access.
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 1-3-query-and-review-agent-work-history
+"""
+
+import base64
+import binascii
+from typing import Any, List, Sequence
+
+from src.bmad.core.cache_backends import deserialize_value, serialize_value
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """
+    Encode the sort values of the last row of a page.
+
+    Args:
+        kind: Listing the cursor belongs to (e.g. "patterns")
+        values: Sort-column values, in ORDER BY order
+
+    Returns:
+        Opaque cursor string
+    """
+    payload = serialize_value({"k": kind, "v": list(values)})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+        kind: Listing the cursor must belong to
+
+    Returns:
+        Sort-column values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or for another listing
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = deserialize_value(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Malformed pagination cursor: {e}") from e
+
+    if not isinstance(payload, dict) or payload.get("k") != kind or not isinstance(payload.get("v"), list):
+        raise InvalidCursorError(f"Cursor is not a {kind} cursor")
+    return payload["v"]
@@ -0,0 +1,219 @@
+"""
+Neo4j Query Metrics
+
+This module records timing for every query run through Neo4jAsyncClient so
+slow Cypher can be found without instrumenting each service.
+- Query fingerprints - hash of the Cypher with literals and whitespace normalized
+- Prometheus histograms/counters per fingerprint in the global REGISTRY
+  (served alongside the MetricsExporter metrics)
+- Bounded slow-query ring buffer exposed via /api/performance/slow-queries
+
+Metrics:
+- bmad_neo4j_query_duration_seconds{fingerprint, mode}: Query latency
+- bmad_neo4j_query_rows_total{fingerprint}: Rows returned
+- bmad_neo4j_query_retries_total{fingerprint}: Retries after transient errors
+- bmad_neo4j_query_errors_total{fingerprint, error}: Failed queries
+- bmad_neo4j_pool_wait_seconds{mode}: Time from session open until the
+  transaction starts (connection acquisition plus BEGIN)
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 1-2-async-neo4j-client-implementation
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Deque, List, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+QUERY_DURATION = Histogram(
+    'bmad_neo4j_query_duration_seconds',
+    'Neo4j query latency in seconds by query fingerprint',
+    ['fingerprint', 'mode'],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+)
+QUERY_ROWS = Counter(
+    'bmad_neo4j_query_rows_total',
+    'Rows returned by Neo4j queries by query fingerprint',
+    ['fingerprint']
+)
+QUERY_RETRIES = Counter(
+    'bmad_neo4j_query_retries_total',
+    'Neo4j query retries after transient failures by query fingerprint',
+    ['fingerprint']
+)
+QUERY_ERRORS = Counter(
+    'bmad_neo4j_query_errors_total',
+    'Failed Neo4j queries by query fingerprint and error type',
+    ['fingerprint', 'error']
+)
+POOL_WAIT = Histogram(
+    'bmad_neo4j_pool_wait_seconds',
+    'Time from session open until the transaction function starts',
+    ['mode'],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0]
+)
+
+
+@lru_cache(maxsize=1024)
+def fingerprint_query(query: str) -> Tuple[str, str]:
+    """
+    Normalize a Cypher query and hash it.
+
+    String and number literals become '?' and whitespace is collapsed, so
+    queries differing only in inlined values share a fingerprint.
+
+    Returns:
+        Tuple of (fingerprint, normalized query)
+    """
+    normalized = _STRING_LITERAL.sub("?", query)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    fingerprint = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    return fingerprint, normalized
+
+
+@dataclass
+class SlowQuery:
+    """A query that exceeded the slow-query threshold."""
+    fingerprint: str
+    query: str
+    duration_ms: float
+    rows: int
+    retries: int
+    pool_wait_ms: float
+    mode: str
+    timestamp: datetime
+
+
+class SlowQueryLog:
+    """
+    Thread-safe ring buffer of the most recent slow queries.
+
+    Keeps at most `capacity` entries; older entries are dropped.
+    """
+
+    QUERY_PREVIEW_CHARS = 500
+
+    def __init__(self, capacity: int = 100, threshold_ms: float = 100.0):
+        """
+        Initialize the slow-query log.
+
+        Args:
+            capacity: Maximum entries kept
+            threshold_ms: Queries at or above this latency are recorded
+        """
+        self._entries: Deque[SlowQuery] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.threshold_ms = threshold_ms
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of entries kept."""
+        return self._entries.maxlen
+
+    def record(
+        self,
+        query: str,
+        duration_ms: float,
+        rows: int = 0,
+        retries: int = 0,
+        pool_wait_ms: float = 0.0,
+        mode: str = "read"
+    ) -> Optional[SlowQuery]:
+        """Record the query if it is slow; returns the entry if recorded."""
+        if duration_ms < self.threshold_ms:
+            return None
+
+        fingerprint, normalized = fingerprint_query(query)
+        entry = SlowQuery(
+            fingerprint=fingerprint,
+            query=normalized[:self.QUERY_PREVIEW_CHARS],
+            duration_ms=round(duration_ms, 2),
+            rows=rows,
+            retries=retries,
+            pool_wait_ms=round(pool_wait_ms, 2),
+            mode=mode,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+        with self._lock:
+            self._entries.append(entry)
+
+        logger.debug(f"Slow query {fingerprint} took {duration_ms:.1f}ms")
+        return entry
+
+    def recent(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """Get recorded slow queries, newest first."""
+        with self._lock:
+            entries = list(self._entries)
+        entries.reverse()
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_slow_query_log = SlowQueryLog(
+    capacity=int(os.getenv("NEO4J_SLOW_QUERY_LOG_SIZE", "100")),
+    threshold_ms=float(os.getenv("NEO4J_SLOW_QUERY_MS", "100"))
+)
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Get the process-wide slow-query log."""
+    return _slow_query_log
+
+
+def record_query(
+    query: str,
+    duration_seconds: float,
+    rows: int,
+    retries: int = 0,
+    pool_wait_seconds: Optional[float] = None,
+    read_only: bool = True
+) -> None:
+    """Record a completed query in Prometheus and the slow-query log."""
+    fingerprint, _ = fingerprint_query(query)
+    mode = "read" if read_only else "write"
+
+    QUERY_DURATION.labels(fingerprint=fingerprint, mode=mode).observe(duration_seconds)
+    if rows:
+        QUERY_ROWS.labels(fingerprint=fingerprint).inc(rows)
+    if retries:
+        QUERY_RETRIES.labels(fingerprint=fingerprint).inc(retries)
+    if pool_wait_seconds is not None:
+        POOL_WAIT.labels(mode=mode).observe(pool_wait_seconds)
+
+    _slow_query_log.record(
+        query,
+        duration_seconds * 1000,
+        rows=rows,
+        retries=retries,
+        pool_wait_ms=(pool_wait_seconds or 0.0) * 1000,
+        mode=mode
+    )
+
+
+def record_query_error(query: str, error: BaseException, retries: int = 0) -> None:
+    """Record a failed query in Prometheus."""
+    fingerprint, _ = fingerprint_query(query)
+    QUERY_ERRORS.labels(fingerprint=fingerprint, error=type(error).__name__).inc()
+    if retries:
+        QUERY_RETRIES.labels(fingerprint=fingerprint).inc(retries)
@@ -0,0 +1,59 @@
+"""
+Tenant Filters for Cypher Queries
+
+This module builds the group_id predicates every tenant-scoped read uses,
+so they are written one way across services.
+- Group-plus-global reads are emitted as
+  `x.group_id IN [$group_id, 'global-coding-skills']`, which the planner
+  answers with one index seek per group (on group_id or a composite
+  (group_id, ...) index) instead of a label scan filtered by an OR
+- The filter is always parenthesized ahead of the other conditions, so an
+  unparenthesized `OR` can no longer bind looser than the `AND`s after it
+
+Usage:
+    cypher = f'''
+    MATCH (p:Pattern)
+    WHERE {tenant_filter("p")}
+      AND p.category = $category
+    RETURN p
+    '''
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 1-2-async-neo4j-client-implementation
+"""
+
+from typing import List
+
+# Group whose data every project may read
+GLOBAL_GROUP_ID = "global-coding-skills"
+
+
+def visible_groups(group_id: str) -> List[str]:
+    """Groups whose data a caller in group_id may read."""
+    if group_id == GLOBAL_GROUP_ID:
+        return [GLOBAL_GROUP_ID]
+    return [group_id, GLOBAL_GROUP_ID]
+
+
+def tenant_filter(
+    alias: str,
+    group_expr: str = "$group_id",
+    include_global: bool = True
+) -> str:
+    """
+    Predicate restricting a node (or relationship) to the caller's group.
+
+    Args:
+        alias: Cypher variable to filter (e.g. "p")
+        group_expr: Expression holding the caller's group
+                    (a parameter, or e.g. "row.group_id" inside UNWIND)
+        include_global: Also admit the global-coding-skills group
+
+    Returns:
+        Parenthesized predicate
+    """
+    if include_global:
+        return f"({alias}.group_id IN [{group_expr}, '{GLOBAL_GROUP_ID}'])"
+    return f"({alias}.group_id = {group_expr})"
+
@@ -4,6 +4,15 @@ Agent Work History Query Service
 This module provides query methods for agents to retrieve their work history,
 enabling self-reflection and learning from past outcomes.
 
+History pages use keyset (cursor) pagination on (e.timestamp, event_id,
+outcome_id), one entry per event outcome: each page is limited before
+patterns and insights are joined, so page N costs the same as page 1.
+Total counts are optional and cached briefly.
+
+When days_back reaches past the hot window (events older than that are
+aggregated and archived), archived events from the cold tier are merged
+into the same order, without restoring them.
+
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
 Story: 1-3-query-and-review-agent-work-history
@@ -11,15 +20,30 @@ Story: 1-3-query-and-review-agent-work-history
 
 import logging
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.bmad.core.archive_store import time_key
+from src.bmad.core.cache_manager import AsyncCacheManager
+from src.bmad.core.insight_confidence import insight_confidence
 from src.bmad.core.neo4j_client import Neo4jAsyncClient, SecurityError
+from src.bmad.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.bmad.services.cold_tier import ColdTierService, get_cold_tier
+from src.bmad.services.event_aggregation import EventAggregationService
 
 logger = logging.getLogger(__name__)
 
+HISTORY_CURSOR_KIND = "work_history"
+
+# History totals change with every event; short TTL, shared across requests
+_history_count_cache: AsyncCacheManager[int] = AsyncCacheManager(
+    max_size=1000,
+    ttl_seconds=60,
+    name="history_counts"
+)
+
 
 class OutcomeStatus(str, Enum):
     """Outcome status enumeration."""
@@ -82,9 +106,10 @@ class WorkHistoryEntry:
 class WorkHistoryQueryResult:
     """Result of a work history query."""
     entries: List[WorkHistoryEntry]
-    total_count: int
+    total_count: Optional[int]  # Only computed when include_total is set
     latency_ms: float
     query_params: Dict[str, Any]
+    next_cursor: Optional[str] = None
 
 
 class AgentQueryService:
@@ -97,20 +122,28 @@ class AgentQueryService:
     - Multi-tenant isolation with group_id enforcement
     - Pattern and insight inclusion in results
     - Performance optimization for <100ms latency
+    - Archived (cold tier) events beyond the hot window
     """
 
     DEFAULT_PAGE_SIZE = 50
     MAX_PAGE_SIZE = 200
     DEFAULT_DAYS_BACK = 30
+    HOT_WINDOW_DAYS = EventAggregationService.EVENT_AGE_DAYS
 
-    def __init__(self, client: Neo4jAsyncClient):
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        cold_tier: Optional[ColdTierService] = None
+    ):
         """
         Initialize the query service.
 
         Args:
             client: Neo4j async client for database operations
+            cold_tier: Archive query engine (uses global cold tier if not provided)
         """
         self._client = client
+        self._cold_tier = cold_tier or get_cold_tier()
 
     async def query_work_history(
         self,
@@ -121,11 +154,17 @@ class AgentQueryService:
         page: int = 1,
         page_size: int = DEFAULT_PAGE_SIZE,
         include_patterns: bool = True,
-        include_insights: bool = True
+        include_insights: bool = True,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> WorkHistoryQueryResult:
         """
         Query an agent's work history with filtering options.
 
+        Pass the previous result's next_cursor to get the next page; the
+        cursor takes precedence over page. A days_back beyond
+        HOT_WINDOW_DAYS also returns archived events.
+
         Args:
             agent_name: Name of the agent querying their history
             group_id: Project group ID for multi-tenant isolation
@@ -135,42 +174,64 @@ class AgentQueryService:
             page_size: Results per page (default: 50, max: 200)
             include_patterns: Include applied patterns in results
             include_insights: Include generated insights in results
+            cursor: Opaque next_cursor from the previous page
+            include_total: Also return the (cached) total number of entries
 
         Returns:
             WorkHistoryQueryResult with entries and metadata
 
         Raises:
             SecurityError: If group_id validation fails
+            InvalidCursorError: If the cursor is malformed
         """
         # Validate and cap page_size
         page_size = min(page_size, self.MAX_PAGE_SIZE)
-        skip = (page - 1) * page_size
+        after = decode_history_cursor(cursor) if cursor else None
+        skip = 0 if after else (page - 1) * page_size
 
         start_time = time.perf_counter()
+        use_cold = days_back > self.HOT_WINDOW_DAYS
 
-        # Build the query based on filters
+        # Build the query based on filters; merging with the cold tier
+        # needs the hot rows before the offset too
         query, params = self._build_history_query(
             agent_name=agent_name,
             group_id=group_id,
             days_back=days_back,
             outcome_status=outcome_status,
-            skip=skip,
-            limit=page_size,
+            skip=0 if use_cold else skip,
+            limit=skip + page_size if use_cold else page_size,
             include_patterns=include_patterns,
-            include_insights=include_insights
+            include_insights=include_insights,
+            after=after
         )
 
         # Execute query
         records = await self._client.execute_query(query, params)
 
-        # Parse results
+        # Parse results; the query fetches one row past the page
         entries = self._parse_history_results(records)
+        if use_cold:
+            entries = await self._merge_cold_history(
+                entries, agent_name, group_id, days_back, outcome_status,
+                skip, page_size, include_patterns, include_insights, after
+            )
+        next_cursor = None
+        if len(entries) > page_size:
+            entries = entries[:page_size]
+            next_cursor = encode_history_cursor(entries[-1])
+
+        total_count = None
+        if include_total:
+            total_count = await self.count_work_history(
+                agent_name, group_id, days_back, outcome_status
+            )
 
         latency_ms = (time.perf_counter() - start_time) * 1000
 
         return WorkHistoryQueryResult(
             entries=entries,
-            total_count=len(entries),  # For now, return count of returned items
+            total_count=total_count,
             latency_ms=round(latency_ms, 2),
             query_params={
                 "agent_name": agent_name,
@@ -179,8 +240,159 @@ class AgentQueryService:
                 "outcome_status": outcome_status.value,
                 "page": page,
                 "page_size": page_size
+            },
+            next_cursor=next_cursor
+        )
+
+    async def count_work_history(
+        self,
+        agent_name: str,
+        group_id: str,
+        days_back: int = DEFAULT_DAYS_BACK,
+        outcome_status: OutcomeStatus = OutcomeStatus.ALL
+    ) -> int:
+        """
+        Count history entries matching the filters.
+
+        Counts are cached for a minute per filter combination, so paging
+        through a listing does not recount on every page.
+
+        Returns:
+            Number of (event, outcome) entries
+        """
+        key = f"{group_id}|{agent_name}|{days_back}|{outcome_status.value}"
+
+        async def load() -> int:
+            query = """
+            MATCH (agent:AIAgent {name: $agent_name})-[:PERFORMED]->(e:Event)
+            WHERE e.group_id = $group_id
+              AND e.timestamp > datetime() - duration({days: $days_back})
+            MATCH (e)-[:HAS_OUTCOME]->(o:Outcome)
+            WHERE $outcome_status IS NULL OR o.status = $outcome_status
+            RETURN count(*) as total
+            """
+            records = await self._client.execute_query(query, {
+                "agent_name": agent_name,
+                "group_id": group_id,
+                "days_back": days_back,
+                "outcome_status": (
+                    None if outcome_status == OutcomeStatus.ALL else outcome_status.value
+                )
+            })
+            total = records[0]['total'] if records else 0
+            if days_back > self.HOT_WINDOW_DAYS:
+                total += await self._cold_tier.count_events(
+                    group_id,
+                    agent_name=agent_name,
+                    outcome_status=(
+                        None if outcome_status == OutcomeStatus.ALL else outcome_status.value
+                    ),
+                    start=datetime.now(timezone.utc) - timedelta(days=days_back),
+                    with_outcome=True
+                )
+            return total
+
+        return await _history_count_cache.get_or_compute(key, load)
+
+    async def _merge_cold_history(
+        self,
+        hot_entries: List[WorkHistoryEntry],
+        agent_name: str,
+        group_id: str,
+        days_back: int,
+        outcome_status: OutcomeStatus,
+        skip: int,
+        page_size: int,
+        include_patterns: bool,
+        include_insights: bool,
+        after: Optional[Tuple[datetime, str, str]]
+    ) -> List[WorkHistoryEntry]:
+        """
+        Merge archived events into hot history entries.
+
+        Both lists are the first skip + page_size + 1 entries of their tier
+        in (timestamp, event_id, outcome_id) descending order, so the merged
+        slice is exact. Insights of archived events are read from the graph, where
+        their outcomes still live.
+
+        Returns:
+            Entries from skip, including one past the page
+        """
+        fetch = skip + page_size + 1
+        archived = await self._cold_tier.query_events(
+            group_id,
+            agent_name=agent_name,
+            outcome_status=(
+                None if outcome_status == OutcomeStatus.ALL else outcome_status.value
+            ),
+            start=datetime.now(timezone.utc) - timedelta(days=days_back),
+            # Archived events carry a single outcome
+            before=after[:2] if after else None,
+            limit=fetch,
+            with_outcome=True
+        )
+        if not archived:
+            return hot_entries[skip:]
+
+        # A restored event is in both tiers; the graph copy wins
+        hot_ids = {entry.event.event_id for entry in hot_entries}
+        cold_entries = self._parse_history_results([
+            {
+                'e': record,
+                'o': record.get('archived_outcome'),
+                'patterns': record.get('archived_patterns', []) if include_patterns else [],
+                'insights': []
+            }
+            for record in archived
+            if record.get('event_id') not in hot_ids
+        ])
+
+        entries = sorted(
+            hot_entries + cold_entries,
+            key=lambda entry: (
+                time_key(entry.event.timestamp),
+                entry.event.event_id,
+                entry.outcome.outcome_id if entry.outcome else ""
+            ),
+            reverse=True
+        )[skip:skip + fetch]
+
+        cold_ids = {entry.event.event_id for entry in cold_entries}
+        cold_page = [
+            entry for entry in entries
+            if entry.event.event_id in cold_ids and entry.outcome
+        ]
+        if include_insights and cold_page:
+            await self._attach_insights(cold_page, group_id)
+
+        return entries
+
+    async def _attach_insights(self, entries: List[WorkHistoryEntry], group_id: str) -> None:
+        """Attach graph insights generated from the outcomes of archived events."""
+        records = await self._client.execute_query(
+            """
+            MATCH (o:Outcome)-[:GENERATED]->(i:Insight)
+            WHERE o.outcome_id IN $outcome_ids AND o.group_id = $group_id
+            RETURN o.outcome_id as outcome_id, collect(DISTINCT i) as insights
+            """,
+            {
+                "outcome_ids": [entry.outcome.outcome_id for entry in entries],
+                "group_id": group_id
             }
         )
+        insights = {r['outcome_id']: r['insights'] for r in records}
+
+        for entry in entries:
+            entry.insights = [
+                GeneratedInsight(
+                    insight_id=i.get('insight_id', ''),
+                    rule=i.get('rule', ''),
+                    confidence_score=insight_confidence(i),
+                    category=i.get('category', '')
+                )
+                for i in insights.get(entry.outcome.outcome_id, [])
+                if i
+            ]
 
     async def query_failures(
         self,
@@ -257,9 +469,10 @@ class AgentQueryService:
         skip: int,
         limit: int,
         include_patterns: bool,
-        include_insights: bool
+        include_insights: bool,
+        after: Optional[Tuple[datetime, str, str]] = None
     ) -> tuple[str, Dict[str, Any]]:
-        """Build the Cypher query for work history."""
+        """Build the Cypher query for work history (one row past the page)."""
 
         # Base match clause
         query = """
@@ -274,6 +487,17 @@ class AgentQueryService:
             "days_back": days_back
         }
 
+        # Keyset: skip events after the last entry of the previous page
+        if after:
+            query += """
+          AND e.timestamp <= $after_timestamp
+            """
+            (
+                params["after_timestamp"],
+                params["after_event_id"],
+                params["after_outcome_id"]
+            ) = after
+
         # Add outcome filter
         if outcome_status != OutcomeStatus.ALL:
             query += """
@@ -285,6 +509,25 @@ class AgentQueryService:
             MATCH (e)-[:HAS_OUTCOME]->(o:Outcome)
             """
 
+        # Resume strictly after that entry; an event's other outcomes may
+        # still be on this page
+        if after:
+            query += """
+            WHERE e.timestamp < $after_timestamp
+               OR (e.timestamp = $after_timestamp
+                   AND (e.event_id < $after_event_id
+                        OR (e.event_id = $after_event_id
+                            AND o.outcome_id < $after_outcome_id)))
+            """
+
+        # Page before joining patterns and insights
+        query += """
+        WITH e, o
+        ORDER BY e.timestamp DESC, e.event_id DESC, o.outcome_id DESC
+        SKIP $skip
+        LIMIT $limit + 1
+        """
+
         # Add optional pattern matching
         if include_patterns:
             query += """
@@ -310,9 +553,7 @@ class AgentQueryService:
         # Return clause
         query += """
         RETURN e, o, collect(DISTINCT p) as patterns, collect(DISTINCT i) as insights
-        ORDER BY e.timestamp DESC
-        SKIP $skip
-        LIMIT $limit
+        ORDER BY e.timestamp DESC, e.event_id DESC, o.outcome_id DESC
         """
 
         params["skip"] = skip
@@ -371,7 +612,7 @@ class AgentQueryService:
                     generated_insights.append(GeneratedInsight(
                         insight_id=i.get('insight_id', ''),
                         rule=i.get('rule', ''),
-                        confidence_score=i.get('confidence_score', 0.0),
+                        confidence_score=insight_confidence(i),
                         category=i.get('category', '')
                     ))
 
@@ -405,6 +646,30 @@ class AgentQueryService:
         return datetime.now(timezone.utc)
 
 
+def encode_history_cursor(entry: WorkHistoryEntry) -> str:
+    """Cursor positioned after entry in (timestamp, event_id, outcome_id) descending order."""
+    return encode_cursor(HISTORY_CURSOR_KIND, [
+        entry.event.timestamp,
+        entry.event.event_id,
+        entry.outcome.outcome_id if entry.outcome else ""
+    ])
+
+
+def decode_history_cursor(cursor: str) -> Tuple[datetime, str, str]:
+    """
+    Decode a cursor from encode_history_cursor().
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    values = decode_cursor(cursor, HISTORY_CURSOR_KIND)
+    if len(values) != 3 or not isinstance(values[0], datetime):
+        raise InvalidCursorError(
+            "History cursor must hold a timestamp, an event_id and an outcome_id"
+        )
+    return values[0], values[1], values[2]
+
+
 async def main():
     """Quick test of the query service."""
     import os
@@ -18,6 +18,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import tenant_filter
 
 logger = logging.getLogger(__name__)
 
@@ -87,11 +88,10 @@ class BrainManager:
         Returns:
             AgentBrains with all accessible brains
         """
-        cypher = """
+        cypher = f"""
         // Get agent's brains in priority order
-        MATCH (agent:AIAgent {name: $agent_name})-[:HAS_MEMORY_IN]->(brain:Brain)
-        WHERE brain.group_id = $group_id
-           OR brain.group_id = 'global-coding-skills'
+        MATCH (agent:AIAgent {{name: $agent_name}})-[:HAS_MEMORY_IN]->(brain:Brain)
+        WHERE {tenant_filter("brain")}
         RETURN brain.brain_id as brain_id,
                brain.name as name,
                brain.scope as scope,
@@ -155,10 +155,10 @@ class BrainManager:
         Returns:
             Brain if found and accessible, None otherwise
         """
-        cypher = """
+        cypher = f"""
         MATCH (b:Brain)
         WHERE b.name = $name
-          AND (b.group_id = $group_id OR b.group_id = 'global-coding-skills')
+          AND {tenant_filter("b")}
         RETURN b.brain_id as brain_id,
                b.name as name,
                b.scope as scope,
@@ -193,10 +193,10 @@ class BrainManager:
         Returns:
             List of matching brains
         """
-        cypher = """
+        cypher = f"""
         MATCH (b:Brain)
         WHERE b.scope = $scope
-          AND (b.group_id = $group_id OR b.group_id = 'global-coding-skills')
+          AND {tenant_filter("b")}
         RETURN b.brain_id as brain_id,
                b.name as name,
                b.scope as scope,
@@ -227,9 +227,9 @@ class BrainManager:
         Returns:
             Dictionary with keys: agent_specific, project_specific, global
         """
-        cypher = """
+        cypher = f"""
         MATCH (b:Brain)
-        WHERE b.group_id = $group_id OR b.group_id = 'global-coding-skills'
+        WHERE {tenant_filter("b")}
         RETURN b.brain_id as brain_id,
                b.name as name,
                b.scope as scope,
@@ -318,9 +318,9 @@ class BrainManager:
         Returns:
             Dictionary with counts by scope
         """
-        cypher = """
+        cypher = f"""
         MATCH (b:Brain)
-        WHERE b.group_id = $group_id OR b.group_id = 'global-coding-skills'
+        WHERE {tenant_filter("b")}
         RETURN b.scope as scope, count(*) as count
         """
 
@@ -0,0 +1,194 @@
+"""
+Cold Tier Query Service
+
+This module answers read-only queries over archived insights and events,
+so content deleted from the graph by decay or aggregation stays queryable
+without restoring it into Neo4j.
+- Filters (group_id, event_type/category, agent, outcome status, time
+  range) run on the archive's SQLite index, pruned to (group, date)
+  partitions; only blocks holding matching records are decompressed
+- Results are ordered newest first on (time, ID) and support the same
+  keyset cursors as hot queries, so the two tiers can be merged
+- Archive reads are blocking file I/O and run in a worker thread
+
+Usage:
+    cold = get_cold_tier()
+    events = await cold.query_events("faith-meats", event_type="code_review",
+                                     start=datetime(2025, 1, 1), limit=100)
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 4-3-aggregate-old-events
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.bmad.core.archive_store import ArchiveReader
+from src.bmad.services.confidence_decay import ConfidenceDecayService
+from src.bmad.services.event_aggregation import EventAggregationService
+
+logger = logging.getLogger(__name__)
+
+
+class ColdTierService:
+    """
+    Read-only query engine over the insight and event archives.
+
+    Features:
+    - Indexed filtering by group, type, agent, status and time range
+    - Partition pruning by (group_id, date)
+    - Keyset pagination compatible with hot-tier history cursors
+    - Multi-tenant isolation: every query is scoped to one group_id
+    """
+
+    def __init__(
+        self,
+        insight_archive_dir: Optional[str] = None,
+        event_archive_dir: Optional[str] = None
+    ):
+        """
+        Initialize the cold tier service.
+
+        Args:
+            insight_archive_dir: Insight archive root (default: the decay
+                service's CONFIDENCE_DECAY_ARCHIVE_DIR)
+            event_archive_dir: Event archive root (default: the aggregation
+                service's EVENT_ARCHIVE_DIR)
+        """
+        self._insights = ArchiveReader(
+            insight_archive_dir or os.environ.get(
+                'CONFIDENCE_DECAY_ARCHIVE_DIR', ConfidenceDecayService.ARCHIVE_DIR
+            ),
+            "insights"
+        )
+        self._events = ArchiveReader(
+            event_archive_dir or os.environ.get(
+                'EVENT_ARCHIVE_DIR', EventAggregationService.ARCHIVE_DIR
+            ),
+            "events"
+        )
+
+    async def query_events(
+        self,
+        group_id: str,
+        event_type: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        outcome_status: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        before: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None,
+        with_outcome: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Query archived events, newest first.
+
+        Args:
+            group_id: Project group ID for multi-tenant isolation
+            event_type: Filter by event type
+            agent_name: Filter by the agent that performed the event
+            outcome_status: Filter by outcome status (e.g. "Failed")
+            start: Inclusive lower bound on the event timestamp
+            end: Exclusive upper bound on the event timestamp
+            before: (timestamp, event_id) keyset to resume after
+            limit: Maximum events to return
+            with_outcome: Only events archived with an outcome
+
+        Returns:
+            Archived event records (properties plus archived_* context)
+        """
+        return await asyncio.to_thread(
+            self._query,
+            self._events,
+            group_id,
+            dict(
+                record_type=event_type,
+                agent_name=agent_name,
+                status=outcome_status,
+                start=start,
+                end=end,
+                before=before,
+                limit=limit,
+                require_status=with_outcome
+            )
+        )
+
+    async def count_events(
+        self,
+        group_id: str,
+        event_type: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        outcome_status: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        with_outcome: bool = False
+    ) -> int:
+        """Count archived events matching query_events() filters."""
+        return await asyncio.to_thread(
+            self._events.count,
+            group_id,
+            record_type=event_type,
+            agent_name=agent_name,
+            status=outcome_status,
+            start=start,
+            end=end,
+            require_status=with_outcome
+        )
+
+    async def query_insights(
+        self,
+        group_id: str,
+        category: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        before: Optional[Tuple[Any, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query archived insights, newest first.
+
+        Args:
+            group_id: Project group ID for multi-tenant isolation
+            category: Filter by insight category
+            start: Inclusive lower bound on created_at
+            end: Exclusive upper bound on created_at
+            before: (created_at, insight_id) keyset to resume after
+            limit: Maximum insights to return
+
+        Returns:
+            Archived insight records (properties plus archived_* context)
+        """
+        return await asyncio.to_thread(
+            self._query,
+            self._insights,
+            group_id,
+            dict(record_type=category, start=start, end=end, before=before, limit=limit)
+        )
+
+    def _query(
+        self,
+        reader: ArchiveReader,
+        group_id: str,
+        filters: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Find matching index entries, then read only their blocks."""
+        entries = reader.find(group_id, **filters)
+        if not entries:
+            return []
+        logger.debug(f"Cold tier matched {len(entries)} records for {group_id}")
+        return reader.read(entries)
+
+
+# Singleton instance
+_cold_tier: Optional[ColdTierService] = None
+
+
+def get_cold_tier() -> ColdTierService:
+    """Get or create the global cold tier instance."""
+    global _cold_tier
+    if _cold_tier is None:
+        _cold_tier = ColdTierService()
+    return _cold_tier
@@ -4,22 +4,36 @@ Confidence Decay Service
 This module applies temporal decay to stale insights.
 - Insights not applied in 90+ days have confidence reduced by 10%
 - Insights with confidence < 0.1 are archived to cold storage
-- Batch processing with metrics tracking
+- Decay is one set-based statement per group, run server-side in
+  batched transactions, with metrics returned by the same statement
+- In lazy mode (CONFIDENCE_DECAY_MODE=lazy) nothing is rewritten: readers
+  decay confidence at read time and only archival runs, from expires_at
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
 Story: 4-1-apply-temporal-decay-to-stale-insights
 """
 
-import csv
 import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.bmad.core import insight_confidence
+from src.bmad.core.archive_store import ArchiveWriter
+from src.bmad.core.insight_confidence import (
+    effective_confidence,
+    expires_at_expr,
+    lazy_decay_enabled
+)
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.services.similarity_index import (
+    INSIGHT_KIND,
+    SimilarityIndex,
+    get_similarity_index
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,20 +70,30 @@ class ConfidenceDecayService:
 
     Features:
     - Apply 10% decay to insights inactive for 90+ days
-    - Archive insights with confidence < 0.1 to CSV
+    - Archive insights with confidence < 0.1 to the cold-storage archive
     - Multi-tenant isolation via group_id
     - Metrics collection for monitoring
     """
 
     # Configuration constants
-    STALE_DAYS = 90
-    DECAY_RATE = 0.10  # 10% decay
-    ARCHIVE_THRESHOLD = 0.1
+    STALE_DAYS = insight_confidence.STALE_DAYS
+    DECAY_RATE = insight_confidence.DECAY_RATE
+    ARCHIVE_THRESHOLD = insight_confidence.ARCHIVE_THRESHOLD
+    DECAY_BATCH_SIZE = 10_000  # rows per server-side transaction
+    ARCHIVE_DIR = "/home/ronin/development/Neo4j/data/archived_insights"
+
+    STALE_MATCH = """
+    MATCH (i:Insight)
+    WHERE i.group_id = $group_id
+      AND (i.last_applied IS NULL OR i.last_applied < $cutoff_date)
+      AND i.confidence_score > 0.0
+    """
 
     def __init__(
         self,
         client: Neo4jAsyncClient,
-        archive_dir: Optional[str] = None
+        archive_dir: Optional[str] = None,
+        similarity: Optional[SimilarityIndex] = None
     ):
         """
         Initialize the confidence decay service.
@@ -77,12 +101,12 @@ class ConfidenceDecayService:
         Args:
             client: Neo4j async client
             archive_dir: Optional custom archive directory
+            similarity: Similarity index to drop archived insights from
+                        (uses global similarity index if not provided)
         """
         self._client = client
-        default_dir = os.environ.get(
-            'CONFIDENCE_DECAY_ARCHIVE_DIR',
-            '/home/ronin/development/Neo4j/data/archived_insights'
-        )
+        self._similarity = similarity or get_similarity_index(client)
+        default_dir = os.environ.get('CONFIDENCE_DECAY_ARCHIVE_DIR', self.ARCHIVE_DIR)
         self._archive_dir = Path(archive_dir or default_dir)
         self._archive_dir.mkdir(parents=True, exist_ok=True)
 
@@ -95,6 +119,14 @@ class ConfidenceDecayService:
         """
         Apply confidence decay to stale insights.
 
+        Each group is decayed by one set-based statement that Neo4j runs
+        in batches of DECAY_BATCH_SIZE rows and that returns the count and
+        average new confidence, so no insight is sent to the client.
+
+        In lazy mode confidence is not rewritten: the metrics report the
+        stale insights' effective confidence, and insights whose expires_at
+        has passed are archived.
+
         Args:
             group_id: Optional specific group to process (None for all)
             stale_days: Days of inactivity before decay applies
@@ -105,36 +137,36 @@ class ConfidenceDecayService:
         """
         start_time = datetime.now(timezone.utc)
 
-        logger.info(f"Starting confidence decay (dry_run={dry_run})")
+        lazy = lazy_decay_enabled()
+        logger.info(f"Starting confidence decay (dry_run={dry_run}, lazy={lazy})")
 
-        # Find insights requiring decay
-        stale_insights = await self._find_stale_insights(group_id, stale_days)
+        cutoff_date = start_time - timedelta(days=stale_days)
+        # Marks insights decayed by this run, which archival skips
+        decay_stamp = start_time.isoformat()
 
         insights_decayed = 0
         confidence_sum = 0.0
-        decayed_ids = []
-
-        for insight in stale_insights:
-            if dry_run:
-                new_confidence = insight['confidence_score'] * (1 - self.DECAY_RATE)
-                confidence_sum += new_confidence
-                insights_decayed += 1
-                decayed_ids.append(insight['insight_id'])
-            else:
-                result = await self._decay_insight(insight)
-                if result:
-                    insights_decayed += 1
-                    confidence_sum += result
-                    decayed_ids.append(insight['insight_id'])
-
-        # Archive low-confidence insights (skip during dry run)
-        if dry_run:
-            archived_count = 0
-            archive_path = None
-        else:
-            archived_count, archive_path = await self._archive_low_confidence_insights(
-                group_id, decayed_ids
+        archived_count = 0
+        archive_paths = []
+
+        groups = [group_id] if group_id else await self._get_insight_groups()
+        for group in groups:
+            decayed, avg_confidence = await self._decay_group(
+                group, cutoff_date, decay_stamp, dry_run or lazy, lazy
             )
+            insights_decayed += decayed
+            confidence_sum += decayed * avg_confidence
+
+            # Archive low-confidence insights (skip during dry run)
+            if not dry_run:
+                if lazy:
+                    await self._refresh_expires_at(group)
+                archived, archive_path = await self._archive_low_confidence_insights(
+                    group, None if lazy else decay_stamp, lazy=lazy
+                )
+                archived_count += archived
+                if archive_path and str(archive_path) not in archive_paths:
+                    archive_paths.append(str(archive_path))
 
         processing_time_ms = (
             datetime.now(timezone.utc) - start_time
@@ -148,7 +180,7 @@ class ConfidenceDecayService:
             insights_decayed=insights_decayed,
             avg_new_confidence=round(avg_confidence, 4),
             insights_archived=archived_count,
-            archived_to=str(archive_path) if archive_path else "",
+            archived_to=", ".join(archive_paths),
             processing_time_ms=round(processing_time_ms, 2),
             group_id=group_id or "all",
             timestamp=datetime.now(timezone.utc)
@@ -162,154 +194,187 @@ class ConfidenceDecayService:
 
         return metrics
 
-    async def _find_stale_insights(
-        self,
-        group_id: Optional[str],
-        stale_days: int
-    ) -> List[Dict[str, Any]]:
-        """Find insights that need decay applied."""
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=stale_days)
-
-        if group_id:
-            query = """
-            MATCH (i:Insight)
-            WHERE i.group_id = $group_id
-              AND (i.last_applied IS NULL OR i.last_applied < $cutoff_date)
-              AND i.confidence_score > 0.0
-            RETURN i.insight_id as insight_id, i.rule as rule,
-                   i.category as category, i.confidence_score as confidence_score,
-                   i.group_id as group_id, i.created_at as created_at,
-                   i.last_applied as last_applied
+    async def _get_insight_groups(self) -> List[str]:
+        """Groups that have insights."""
+        records = await self._client.execute_query(
             """
-            params = {"group_id": group_id, "cutoff_date": cutoff_date}
-        else:
-            query = """
             MATCH (i:Insight)
-            WHERE (i.last_applied IS NULL OR i.last_applied < $cutoff_date)
-              AND i.confidence_score > 0.0
-            RETURN i.insight_id as insight_id, i.rule as rule,
-                   i.category as category, i.confidence_score as confidence_score,
-                   i.group_id as group_id, i.created_at as created_at,
-                   i.last_applied as last_applied
-            """
-            params = {"cutoff_date": cutoff_date}
+            RETURN DISTINCT i.group_id as group_id
+            """,
+            {},
+            validate_group_id=False
+        )
+        return [r['group_id'] for r in records if r.get('group_id')]
 
-        results = await self._client.execute_query(query, params)
-        return results
+    async def _decay_group(
+        self,
+        group_id: str,
+        cutoff_date: datetime,
+        decay_stamp: str,
+        dry_run: bool,
+        lazy: bool = False
+    ) -> Tuple[int, float]:
+        """
+        Decay one group's stale insights server-side.
 
-    async def _decay_insight(self, insight: Dict[str, Any]) -> Optional[float]:
-        """Apply decay to a single insight."""
-        current_confidence = insight['confidence_score']
-        new_confidence = current_confidence * (1 - self.DECAY_RATE)
+        Args:
+            dry_run: Only aggregate what the decay would produce
+            lazy: Aggregate the current effective confidence instead
 
-        query = """
-        MATCH (i:Insight {insight_id: $insight_id})
-        SET i.confidence_score = $new_confidence,
-            i.last_decay_applied = $timestamp
-        RETURN i.confidence_score as new_confidence
+        Returns:
+            (insights decayed, average new confidence)
         """
+        params = {
+            "group_id": group_id,
+            "cutoff_date": cutoff_date,
+            "retain": 1 - self.DECAY_RATE
+        }
 
-        result = await self._client.execute_query(query, {
-            "insight_id": insight['insight_id'],
-            "new_confidence": round(new_confidence, 4),
-            "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        if dry_run:
+            new_confidence = (
+                effective_confidence("i") if lazy else "i.confidence_score * $retain"
+            )
+            records = await self._client.execute_query(
+                f"""
+                {self.STALE_MATCH}
+                RETURN count(i) as decayed,
+                       avg(round({new_confidence}, 4)) as avg_confidence
+                """,
+                params
+            )
+        else:
+            records = await self._client.execute_auto_commit(
+                f"""
+                {self.STALE_MATCH}
+                CALL {{
+                    WITH i
+                    SET i.confidence_score = round(i.confidence_score * $retain, 4),
+                        i.last_decay_applied = $decay_stamp
+                    RETURN i.confidence_score as new_confidence
+                }} IN TRANSACTIONS OF $batch_size ROWS
+                RETURN count(new_confidence) as decayed,
+                       avg(new_confidence) as avg_confidence
+                """,
+                {**params, "decay_stamp": decay_stamp, "batch_size": self.DECAY_BATCH_SIZE}
+            )
+
+        record = records[0] if records else {}
+        return int(record.get('decayed') or 0), float(record.get('avg_confidence') or 0.0)
+
+    async def _refresh_expires_at(self, group_id: str) -> None:
+        """
+        Set expires_at where it is missing or has passed (lazy mode).
 
-        if result:
-            return float(result[0].get('new_confidence', new_confidence))
-        return None
+        Covers insights written before lazy mode and insights applied
+        again since their expires_at was computed.
+        """
+        await self._client.execute_auto_commit(
+            f"""
+            MATCH (i:Insight)
+            WHERE i.group_id = $group_id
+              AND (i.expires_at IS NULL OR i.expires_at <= datetime())
+            CALL {{
+                WITH i
+                SET i.expires_at = {expires_at_expr("i")}
+            }} IN TRANSACTIONS OF $batch_size ROWS
+            """,
+            {"group_id": group_id, "batch_size": self.DECAY_BATCH_SIZE}
+        )
 
     async def _archive_low_confidence_insights(
         self,
-        group_id: Optional[str],
-        exclude_ids: List[str]
+        group_id: str,
+        decay_stamp: Optional[str] = None,
+        lazy: bool = False
     ) -> tuple[int, Optional[Path]]:
         """
-        Archive insights with confidence < 0.1 to CSV.
+        Archive insights with confidence < 0.1 to the cold-storage archive.
 
-        Returns:
-            Tuple of (archived_count, archive_path)
-        """
-        query = """
-        MATCH (i:Insight)
-        WHERE i.confidence_score < $threshold
-        """
+        Full node properties are archived (partitioned by group and
+        creation date) so ArchiveReader can fetch or restore an insight.
 
-        params = {"threshold": self.ARCHIVE_THRESHOLD}
+        Insights decayed by the current run (last_decay_applied equal to
+        decay_stamp) are kept until a later run. In lazy mode insights are
+        selected by expires_at, through the (group_id, expires_at) index.
 
-        if group_id:
-            query += " AND i.group_id = $group_id"
-            params["group_id"] = group_id
-
-        if exclude_ids:
-            query += " AND NOT i.insight_id IN $exclude_ids"
-            params["exclude_ids"] = exclude_ids
-
-        query += """
-        RETURN i.insight_id as insight_id, i.rule as rule,
-               i.category as category, i.confidence_score as confidence_score,
-               i.group_id as group_id, i.created_at as created_at,
-               i.last_applied as last_applied
+        Returns:
+            Tuple of (archived_count, insights archive directory)
         """
+        if lazy:
+            query = """
+            MATCH (i:Insight)
+            WHERE i.expires_at <= datetime()
+            """
+        else:
+            query = """
+            MATCH (i:Insight)
+            WHERE i.confidence_score < $threshold
+            """
 
-        results = await self._client.execute_query(query, params)
-
-        if not results:
-            return 0, None
+        query += " AND i.group_id = $group_id"
+        params = {"threshold": self.ARCHIVE_THRESHOLD, "group_id": group_id}
 
-        # Create archive file
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        archive_name = f"archived_insights_{timestamp}.csv"
-        archive_path = self._archive_dir / archive_name
+        if decay_stamp:
+            query += " AND coalesce(i.last_decay_applied, '') <> $decay_stamp"
+            params["decay_stamp"] = decay_stamp
 
-        archived_count = 0
-        archived_records = []
-
-        for record in results:
-            archived_record = {
-                'insight_id': record.get('insight_id'),
-                'rule': record.get('rule', ''),
-                'category': record.get('category', ''),
-                'confidence_score': record.get('confidence_score'),
-                'group_id': record.get('group_id'),
-                'original_created_at': record.get('created_at'),
-                'last_applied': record.get('last_applied'),
-                'archived_at': datetime.now(timezone.utc).isoformat(),
-                'archived_reason': f"confidence_below_{self.ARCHIVE_THRESHOLD}"
-            }
-            archived_records.append(archived_record)
-            archived_count += 1
+        query += f"""
+        RETURN i {{.*}} as properties, {effective_confidence("i")} as confidence_score
+        """
 
-        # Write to CSV
-        if archived_records:
-            with open(archive_path, 'w', newline='', encoding='utf-8') as f:
-                if archived_records:
-                    writer = csv.DictWriter(f, fieldnames=archived_records[0].keys())
-                    writer.writeheader()
-                    writer.writerows(archived_records)
+        archived_at = datetime.now(timezone.utc)
+        ids_to_delete = []
+
+        with ArchiveWriter(self._archive_dir, "insights") as writer:
+            async for record in self._client.stream_query(query, params):
+                properties = record.get('properties') or {}
+                insight_id = properties.get('insight_id')
+                if not insight_id:
+                    continue
+
+                writer.write(
+                    insight_id,
+                    properties.get('group_id'),
+                    properties.get('created_at'),
+                    {
+                        **properties,
+                        'archived_at': archived_at,
+                        'archive_reason': f"confidence_below_{self.ARCHIVE_THRESHOLD}",
+                        'archived_confidence': record.get('confidence_score')
+                    },
+                    record_type=properties.get('category')
+                )
+                ids_to_delete.append(insight_id)
+
+        if not ids_to_delete:
+            return 0, None
 
-            logger.info(f"Archived {archived_count} insights to {archive_path}")
+        archived_count = len(ids_to_delete)
+        logger.info(f"Archived {archived_count} insights to {writer.directory}")
 
-            # Delete archived insights from graph
-            ids_to_delete = [r['insight_id'] for r in archived_records]
-            await self._delete_insights(ids_to_delete)
+        # Delete archived insights from graph
+        await self._delete_insights(ids_to_delete, group_id)
 
-        return archived_count, archive_path
+        return archived_count, writer.directory
 
-    async def _delete_insights(self, insight_ids: List[str]) -> int:
-        """Delete archived insights from the graph."""
+    async def _delete_insights(self, insight_ids: List[str], group_id: str) -> int:
+        """Delete archived insights of one group from the graph."""
         if not insight_ids:
             return 0
 
         query = """
         MATCH (i:Insight)
         WHERE i.insight_id IN $ids
+          AND i.group_id = $group_id
         DETACH DELETE i
         """
 
-        result = await self._client.execute_query(query, {"ids": insight_ids})
+        await self._client.execute_query(query, {"ids": insight_ids, "group_id": group_id})
         logger.info(f"Deleted {len(insight_ids)} archived insights from graph")
 
+        for insight_id in insight_ids:
+            self._similarity.remove(insight_id, kind=INSIGHT_KIND)
+
         return len(insight_ids)
 
     async def get_stale_insights_count(self, group_id: Optional[str] = None) -> Dict[str, int]:
@@ -2,37 +2,58 @@
 Event Aggregation Service
 
 This module aggregates old events into summary nodes for performance.
-- Events older than 30 days are aggregated by type and group_id
-- Original events are archived to CSV and deleted
-- Aggregation preserves metrics while reducing graph size
+- Events are rolled up into daily, weekly and monthly EventSummary buckets
+  per (event_type, group_id), with success/failure counts; each run adds
+  the events since the group's rollup cursor in one batched UNWIND
+- Events older than 30 days are archived to cold storage and deleted
+- Dashboards read trends from the buckets instead of scanning Event nodes
+
+Events written with a timestamp before a group's rollup cursor are not
+rolled up (they are still archived).
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
 Story: 4-3-aggregate-old-events
 """
 
-import csv
+import asyncio
 import logging
 import os
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+from src.bmad.core.archive_store import ArchiveWriter
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
 
 logger = logging.getLogger(__name__)
 
 
+ROLLUP_PERIODS = ("daily", "weekly", "monthly")
+
+
+def bucket_start(day: date, period: str) -> date:
+    """First day of the daily, weekly (ISO, Monday) or monthly bucket holding day."""
+    if period == "weekly":
+        return day - timedelta(days=day.weekday())
+    if period == "monthly":
+        return day.replace(day=1)
+    return day
+
+
 @dataclass
 class EventSummary:
-    """Summary of aggregated events."""
+    """Rollup bucket of events of one type in one group."""
     event_type: str
     group_id: str
     count: int
-    period: str
+    period: str  # daily, weekly or monthly
     first_event: datetime
     last_event: datetime
+    bucket_start: str = ""  # YYYY-MM-DD
+    success_count: int = 0
+    failure_count: int = 0
 
 
 @dataclass
@@ -57,6 +78,10 @@ class ArchivedEvent:
     description: str
     archived_at: str
     archive_reason: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+    agent_name: Optional[str] = None
+    outcome: Optional[Dict[str, Any]] = None
+    patterns: List[Dict[str, Any]] = field(default_factory=list)
 
 
 class EventAggregationService:
@@ -64,16 +89,67 @@ class EventAggregationService:
     Service for aggregating old events into summaries.
 
     Features:
-    - Aggregate events by type and group_id
-    - Archive original events to CSV
+    - Roll events up into daily/weekly/monthly buckets by type and group_id
+    - Trend queries over the buckets
+    - Archive original events to the cold-storage archive
     - Delete archived events from graph
     - Multi-tenant isolation via group_id
     """
 
     # Configuration constants
     EVENT_AGE_DAYS = 30
+    DELETE_BATCH_SIZE = 1000
     ARCHIVE_DIR = "/home/ronin/development/Neo4j/data/archived_events"
 
+    ROLLUP_QUERY = """
+    OPTIONAL MATCH (c:ProcessingCursor {cursor_key: $cursor_key})
+    WITH c.last_timestamp as since
+    MATCH (e:Event)
+    WHERE e.group_id = $group_id
+      AND e.timestamp < $until
+      AND (since IS NULL OR e.timestamp >= since)
+    OPTIONAL MATCH (e)-[:HAS_OUTCOME]->(o:Outcome)
+    WITH e, head(collect(o.status)) as status
+    RETURN e.event_type as event_type,
+           substring(toString(e.timestamp), 0, 10) as day,
+           count(e) as count,
+           sum(CASE WHEN status = 'Success' THEN 1 ELSE 0 END) as success_count,
+           sum(CASE WHEN status = 'Failed' THEN 1 ELSE 0 END) as failure_count,
+           min(e.timestamp) as first_event,
+           max(e.timestamp) as last_event
+    """
+
+    SUMMARY_UPSERT_QUERY = """
+    UNWIND $rows AS row
+    MERGE (s:EventSummary {
+        group_id: $group_id,
+        event_type: row.event_type,
+        period: row.period,
+        bucket_start: row.bucket_start
+    })
+    ON CREATE SET s.count = 0,
+                  s.success_count = 0,
+                  s.failure_count = 0,
+                  s.first_event = row.first_event,
+                  s.last_event = row.last_event,
+                  s.created_at = datetime()
+    SET s.count = s.count + row.count,
+        s.success_count = s.success_count + row.success_count,
+        s.failure_count = s.failure_count + row.failure_count,
+        s.first_event = CASE WHEN row.first_event < s.first_event
+                             THEN row.first_event ELSE s.first_event END,
+        s.last_event = CASE WHEN row.last_event > s.last_event
+                            THEN row.last_event ELSE s.last_event END,
+        s.updated_at = datetime()
+    """
+
+    CURSOR_ADVANCE_QUERY = """
+    MERGE (c:ProcessingCursor {cursor_key: $cursor_key})
+    SET c.group_id = $group_id,
+        c.last_timestamp = $until,
+        c.updated_at = datetime()
+    """
+
     def __init__(
         self,
         client: Neo4jAsyncClient,
@@ -93,6 +169,8 @@ class EventAggregationService:
         )
         self._archive_dir = Path(default_dir)
         self._archive_dir.mkdir(parents=True, exist_ok=True)
+        # Overlapping rollups would both add the events after the cursor
+        self._rollup_lock = asyncio.Lock()
 
     async def aggregate_events(
         self,
@@ -101,7 +179,10 @@ class EventAggregationService:
         dry_run: bool = False
     ) -> AggregationMetrics:
         """
-        Aggregate old events into EventSummary nodes.
+        Roll up events, then archive and delete the old ones.
+
+        Events are rolled up to now before any are deleted, so every
+        archived event is counted in the EventSummary buckets.
 
         Args:
             group_id: Optional specific group to process (None for all)
@@ -116,41 +197,30 @@ class EventAggregationService:
 
         logger.info(f"Starting event aggregation (dry_run={dry_run})")
 
-        # Get event IDs for archival first (before aggregation)
         # Find summary metrics for aggregation
         events_to_aggregate = await self._find_old_events(group_id, cutoff_date)
 
         logger.info(f"Found {len(events_to_aggregate)} aggregation groups")
 
-        # Find specific event IDs for archival and deletion
-        event_ids = []
-        if events_to_aggregate:
-            event_ids = await self._find_event_ids(group_id, cutoff_date)
-            logger.info(f"Found {len(event_ids)} individual events to archive/delete")
-
-        # Fetch full event details for archival
-        if event_ids and not dry_run:
-            archived_events = await self._fetch_events_for_archival(event_ids)
-        else:
-            archived_events = []
-
-        # Create summaries (dry run simulates)
-        summaries = await self._create_summaries(
-            events_to_aggregate,
-            dry_run
-        )
+        # Stream old events straight to the archive (skip on dry run)
+        event_ids_by_group: Dict[str, List[str]] = {}
+        archive_path = ""
+        if events_to_aggregate and not dry_run:
+            archive_path, event_ids_by_group = await self._archive_events(
+                self._stream_old_events(group_id, cutoff_date),
+                group_id
+            )
+        events_archived = sum(len(ids) for ids in event_ids_by_group.values())
+        if events_archived:
+            logger.info(f"Archived {events_archived} individual events")
 
-        # Delete original events (skip on dry run)
-        if event_ids and not dry_run:
-            deleted_count = await self._delete_events(event_ids)
-        else:
-            deleted_count = 0
+        # Roll up before deleting (dry run only computes the buckets)
+        summaries = await self.rollup_events(group_id, dry_run=dry_run)
 
-        # Archive to CSV
-        if archived_events and not dry_run:
-            archive_path = await self._archive_to_csv(archived_events, group_id)
-        else:
-            archive_path = ""
+        # Delete original events only once they are safely archived
+        if not dry_run:
+            for group, event_ids in event_ids_by_group.items():
+                await self._delete_events(event_ids, group)
 
         processing_time_ms = (
             datetime.now(timezone.utc) - start_time
@@ -159,7 +229,7 @@ class EventAggregationService:
         metrics = AggregationMetrics(
             events_aggregated=len(events_to_aggregate), # groups aggregated
             summaries_created=len(summaries),
-            events_archived=len(archived_events),
+            events_archived=events_archived,
             archive_path=archive_path,
             processing_time_ms=round(processing_time_ms, 2),
             group_id=group_id or "all",
@@ -195,28 +265,6 @@ class EventAggregationService:
         results = await self._client.execute_query(query, params)
         return [r['event_id'] for r in results if r.get('event_id')]
 
-    async def _find_event_ids(
-        self,
-        group_id: Optional[str],
-        cutoff_date: datetime
-    ) -> List[str]:
-        """Find IDs of events older than cutoff."""
-        query = """
-        MATCH (e:Event)
-        WHERE e.timestamp < $cutoff_date
-        """
-        
-        params = {"cutoff_date": cutoff_date.isoformat()}
-        
-        if group_id:
-            query += " AND e.group_id = $group_id"
-            params["group_id"] = group_id
-            
-        query += " RETURN e.event_id as event_id"
-        
-        results = await self._client.execute_query(query, params)
-        return [r['event_id'] for r in results if r.get('event_id')]
-
     async def _find_old_events(
         self,
         group_id: Optional[str],
@@ -246,141 +294,308 @@ class EventAggregationService:
         results = await self._client.execute_query(query, params)
         return results
 
-    async def _fetch_events_for_archival(
+    async def _stream_old_events(
         self,
-        event_ids: List[str]
-    ) -> List[ArchivedEvent]:
-        """Fetch full event details for archival."""
-        if not event_ids:
-            return []
-
+        group_id: Optional[str],
+        cutoff_date: datetime
+    ) -> AsyncIterator[ArchivedEvent]:
+        """Stream full details of events older than cutoff for archival."""
         query = """
         MATCH (e:Event)
-        WHERE e.event_id IN $event_ids
+        WHERE e.timestamp < $cutoff_date
+        """
+
+        params = {"cutoff_date": cutoff_date.isoformat()}
+
+        if group_id:
+            query += " AND e.group_id = $group_id"
+            params["group_id"] = group_id
+
+        # Relationships are lost with the event; archive what history needs
+        query += """
+        OPTIONAL MATCH (agent:AIAgent)-[:PERFORMED]->(e)
+        OPTIONAL MATCH (e)-[:HAS_OUTCOME]->(o:Outcome)
+        OPTIONAL MATCH (e)-[:USED_PATTERN]->(p:Pattern)
         RETURN e.event_id as event_id, e.event_type as event_type,
                e.timestamp as timestamp, e.group_id as group_id,
-               e.description as description
+               e.description as description, e {.*} as properties,
+               head(collect(DISTINCT agent.name)) as agent_name,
+               head(collect(DISTINCT o {.*})) as outcome,
+               collect(DISTINCT p {.pattern_id, .name, .category, .confidence_score}) as patterns
         """
 
-        results = await self._client.execute_query(query, {"event_ids": event_ids})
+        archived_at = datetime.now(timezone.utc).isoformat()
 
-        return [
-            ArchivedEvent(
+        async for r in self._client.stream_query(query, params):
+            if not r.get('event_id'):
+                continue
+            yield ArchivedEvent(
                 event_id=r.get('event_id', ''),
                 event_type=r.get('event_type', ''),
                 timestamp=r.get('timestamp', ''),
                 group_id=r.get('group_id', ''),
                 description=r.get('description', ''),
-                archived_at=datetime.now(timezone.utc).isoformat(),
-                archive_reason="event_aggregation"
+                archived_at=archived_at,
+                archive_reason="event_aggregation",
+                properties=r.get('properties') or {},
+                agent_name=r.get('agent_name'),
+                outcome=r.get('outcome'),
+                patterns=r.get('patterns') or []
             )
-            for r in results
-        ]
 
-    async def _create_summaries(
+    async def rollup_events(
         self,
-        event_groups: List[Dict[str, Any]],
+        group_id: Optional[str] = None,
+        until: Optional[datetime] = None,
+        dry_run: bool = False
+    ) -> List[EventSummary]:
+        """
+        Add events since each group's rollup cursor to EventSummary buckets.
+
+        Each group's events in [cursor, until) are counted per day in one
+        read, rolled up to weekly and monthly buckets, and written with the
+        cursor advance in one transaction, so a failed run can be retried
+        without double counting.
+
+        Args:
+            group_id: Optional specific group to process (None for all)
+            until: Exclusive upper bound on event timestamps (default: now)
+            dry_run: If True, compute the buckets without writing them
+
+        Returns:
+            Bucket increments (daily, weekly and monthly) that were added
+        """
+        async with self._rollup_lock:
+            return await self._rollup_groups(group_id, until, dry_run)
+
+    async def _rollup_groups(
+        self,
+        group_id: Optional[str],
+        until: Optional[datetime],
         dry_run: bool
     ) -> List[EventSummary]:
-        """Create EventSummary nodes from event groups."""
-        if not event_groups:
-            return []
-
-        summaries = []
-        for group in event_groups:
-            summary = EventSummary(
-                event_type=group.get('event_type', ''),
-                group_id=group.get('group_id', ''),
-                count=group.get('count', 0),
-                period="archived",
-                first_event=group.get('first_event', datetime.now(timezone.utc)),
-                last_event=group.get('last_event', datetime.now(timezone.utc))
-            )
-            summaries.append(summary)
+        """Roll up each group; see rollup_events()."""
+        until_iso = (until or datetime.now(timezone.utc)).isoformat()
+        groups = [group_id] if group_id else await self._get_event_groups()
+
+        summaries: List[EventSummary] = []
+        for group in groups:
+            params = {
+                "group_id": group,
+                "cursor_key": self._cursor_key(group),
+                "until": until_iso
+            }
+            daily = await self._client.execute_query(self.ROLLUP_QUERY, params)
+            group_summaries = self._rollup(group, daily)
 
             if not dry_run:
-                await self._upsert_summary(summary)
-
+                rows = [
+                    {
+                        "event_type": summary.event_type,
+                        "period": summary.period,
+                        "bucket_start": summary.bucket_start,
+                        "count": summary.count,
+                        "success_count": summary.success_count,
+                        "failure_count": summary.failure_count,
+                        "first_event": summary.first_event,
+                        "last_event": summary.last_event
+                    }
+                    for summary in group_summaries
+                ]
+                statements = []
+                if rows:
+                    statements.append((self.SUMMARY_UPSERT_QUERY, {"group_id": group, "rows": rows}))
+                statements.append((self.CURSOR_ADVANCE_QUERY, params))
+                await self._client.execute_write_transaction(statements)
+
+            summaries.extend(group_summaries)
+
+        logger.info(f"Rolled up events into {len(summaries)} summary buckets")
         return summaries
 
-    async def _upsert_summary(self, summary: EventSummary) -> None:
-        """Upsert an EventSummary node."""
+    @staticmethod
+    def _rollup(group_id: str, daily: List[Dict[str, Any]]) -> List[EventSummary]:
+        """Fold per-day counts into daily, weekly and monthly buckets."""
+        buckets: Dict[Tuple[str, str, date], EventSummary] = {}
+        for row in daily:
+            day = date.fromisoformat(row['day'])
+            for period in ROLLUP_PERIODS:
+                start = bucket_start(day, period)
+                key = (row.get('event_type') or '', period, start)
+                summary = buckets.get(key)
+                if summary is None:
+                    buckets[key] = EventSummary(
+                        event_type=key[0],
+                        group_id=group_id,
+                        count=row['count'],
+                        period=period,
+                        first_event=row['first_event'],
+                        last_event=row['last_event'],
+                        bucket_start=start.isoformat(),
+                        success_count=row['success_count'],
+                        failure_count=row['failure_count']
+                    )
+                    continue
+                summary.count += row['count']
+                summary.success_count += row['success_count']
+                summary.failure_count += row['failure_count']
+                summary.first_event = min(summary.first_event, row['first_event'])
+                summary.last_event = max(summary.last_event, row['last_event'])
+        return list(buckets.values())
+
+    async def _get_event_groups(self) -> List[str]:
+        """Groups that have events."""
+        records = await self._client.execute_query(
+            """
+            MATCH (e:Event)
+            RETURN DISTINCT e.group_id as group_id
+            """,
+            {},
+            validate_group_id=False
+        )
+        return [r['group_id'] for r in records if r.get('group_id')]
+
+    @staticmethod
+    def _cursor_key(group_id: str) -> str:
+        """ProcessingCursor key of a group's event rollup."""
+        return f"event_rollup|{group_id}"
+
+    async def get_event_trends(
+        self,
+        group_id: str,
+        period: str = "daily",
+        event_type: Optional[str] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> List[EventSummary]:
+        """
+        Read event trends from the rollup buckets.
+
+        Args:
+            group_id: Project group ID for isolation
+            period: Bucket size (daily, weekly or monthly)
+            event_type: Optional event type filter
+            start: Inclusive lower bound on bucket start
+            end: Exclusive upper bound on bucket start
+
+        Returns:
+            Buckets ordered by bucket start, then event type
+
+        Raises:
+            ValueError: If period is not a rollup period
+        """
+        if period not in ROLLUP_PERIODS:
+            raise ValueError(f"period must be one of {', '.join(ROLLUP_PERIODS)}")
+
         query = """
-        MERGE (s:EventSummary {
-            event_type: $event_type,
-            group_id: $group_id,
-            period: $period
-        })
-        ON CREATE SET s.count = $count,
-                      s.first_event = $first_event,
-                      s.last_event = $last_event,
-                      s.created_at = $created_at
-        ON MATCH SET s.count = s.count + $count,
-                     s.last_event = $last_event
+        MATCH (s:EventSummary)
+        WHERE s.group_id = $group_id
+          AND s.period = $period
+          AND s.bucket_start >= $start
+          AND s.bucket_start < $end
+          AND ($event_type IS NULL OR s.event_type = $event_type)
+        RETURN s.event_type as event_type, s.bucket_start as bucket_start,
+               s.count as count, s.success_count as success_count,
+               s.failure_count as failure_count,
+               s.first_event as first_event, s.last_event as last_event
+        ORDER BY s.bucket_start, s.event_type
         """
 
-        await self._client.execute_query(query, {
-            "event_type": summary.event_type,
-            "group_id": summary.group_id,
-            "period": summary.period,
-            "count": summary.count,
-            "first_event": summary.first_event.isoformat() if isinstance(summary.first_event, datetime) else summary.first_event,
-            "last_event": summary.last_event.isoformat() if isinstance(summary.last_event, datetime) else summary.last_event,
-            "created_at": datetime.now(timezone.utc).isoformat()
+        records = await self._client.execute_query(query, {
+            "group_id": group_id,
+            "period": period,
+            "event_type": event_type,
+            "start": start.isoformat() if start else "",
+            "end": end.isoformat() if end else "9999-12-31"
         })
 
-    async def _delete_events(self, event_ids: List[str]) -> int:
-        """Delete archived events from the graph."""
+        return [
+            EventSummary(
+                event_type=r.get('event_type', ''),
+                group_id=group_id,
+                count=r.get('count', 0),
+                period=period,
+                first_event=r.get('first_event'),
+                last_event=r.get('last_event'),
+                bucket_start=r.get('bucket_start', ''),
+                success_count=r.get('success_count') or 0,
+                failure_count=r.get('failure_count') or 0
+            )
+            for r in records
+        ]
+
+    async def _delete_events(self, event_ids: List[str], group_id: str) -> int:
+        """Delete archived events of one group from the graph."""
         if not event_ids:
             return 0
 
         query = """
         MATCH (e:Event)
-        WHERE e.event_id IN $event_ids
+        WHERE e.group_id = $group_id AND e.event_id IN $event_ids
         DETACH DELETE e
         """
 
-        await self._client.execute_query(query, {"event_ids": event_ids})
-        logger.info(f"Deleted {len(event_ids)} archived events from graph")
+        for start in range(0, len(event_ids), self.DELETE_BATCH_SIZE):
+            chunk = event_ids[start:start + self.DELETE_BATCH_SIZE]
+            await self._client.execute_query(query, {
+                "group_id": group_id,
+                "event_ids": chunk
+            })
+        logger.info(f"Deleted {len(event_ids)} archived events of {group_id} from graph")
 
         return len(event_ids)
 
-    async def _archive_to_csv(
+    async def _archive_events(
         self,
-        events: List[ArchivedEvent],
+        events: AsyncIterator[ArchivedEvent],
         group_id: Optional[str]
-    ) -> str:
-        """Archive events to CSV file."""
-        if not events:
-            return ""
-
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        suffix = f"_{group_id}" if group_id else ""
-        archive_name = f"archived_events{suffix}_{timestamp}.csv"
-        archive_path = self._archive_dir / archive_name
-
-        # Get field names from first event
-        field_names = ['event_id', 'event_type', 'timestamp', 'group_id',
-                      'description', 'archived_at', 'archive_reason']
-
-        with open(archive_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=field_names)
-            writer.writeheader()
-            writer.writerows([
-                {
-                    'event_id': e.event_id,
-                    'event_type': e.event_type,
-                    'timestamp': e.timestamp,
-                    'group_id': e.group_id,
-                    'description': e.description[:500] if e.description else '',  # Truncate long descriptions
-                    'archived_at': e.archived_at,
-                    'archive_reason': e.archive_reason
-                }
-                for e in events
-            ])
-
-        logger.info(f"Archived {len(events)} events to {archive_path}")
-        return str(archive_path)
+    ) -> Tuple[str, Dict[str, List[str]]]:
+        """
+        Archive events to the cold-storage archive as they arrive.
+
+        Events keep all their properties (descriptions are not truncated)
+        plus their agent, outcome and patterns, and are partitioned by group
+        and event date. Only event IDs are kept in memory, keyed by group,
+        for the follow-up delete.
+
+        Returns:
+            Tuple of (events archive directory, archived event IDs by
+            group_id); ("", {}) if no events
+        """
+        event_ids: Dict[str, List[str]] = {}
+
+        with ArchiveWriter(self._archive_dir, "events") as writer:
+            async for e in events:
+                writer.write(
+                    e.event_id,
+                    e.group_id,
+                    e.timestamp,
+                    {
+                        **e.properties,
+                        'event_id': e.event_id,
+                        'event_type': e.event_type,
+                        'timestamp': e.timestamp,
+                        'group_id': e.group_id,
+                        'description': e.description,
+                        'archived_at': e.archived_at,
+                        'archive_reason': e.archive_reason,
+                        'archived_agent': e.agent_name,
+                        'archived_outcome': e.outcome,
+                        'archived_patterns': e.patterns
+                    },
+                    record_type=e.event_type,
+                    agent_name=e.agent_name,
+                    status=(e.outcome or {}).get('status')
+                )
+                event_ids.setdefault(e.group_id, []).append(e.event_id)
+
+        if not event_ids:
+            return "", {}
+
+        count = sum(len(ids) for ids in event_ids.values())
+        scope = f" for {group_id}" if group_id else ""
+        logger.info(f"Archived {count} events{scope} to {writer.directory}")
+        return str(writer.directory), event_ids
 
     async def get_event_counts(
         self,
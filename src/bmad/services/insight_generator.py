@@ -5,20 +5,41 @@ This module automatically generates insights from outcomes to enable learning.
 - Failed outcomes generate tentative insights with low confidence
 - Successful outcomes reinforce existing patterns
 - Confidence scores increase with repeated success
+- Error logs are classified from their tail with precompiled rules behind
+  a keyword prefilter; the rule table can be loaded from config
+- Batches are processed in chunks: one UNWIND write creates a chunk's
+  insights and GENERATED edges, chunks run concurrently (bounded)
+- New outcomes are found from a per-group ProcessingCursor watermark and
+  processed page by page through the concurrent batch path; each chunk
+  marks the outcomes it wrote, so a retried page never double counts
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
 Story: 2-1-generate-insights-from-outcomes
 """
 
+import asyncio
+import json
 import logging
+import os
 import re
 import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import yaml
+
+from src.bmad.core.insight_confidence import compute_expires_at, lazy_decay_enabled
 from src.bmad.core.neo4j_client import Neo4jAsyncClient, SecurityError
+from src.bmad.core.tenant_filter import visible_groups
+from src.bmad.services.similarity_index import (
+    INSIGHT_KIND,
+    SimilarityIndex,
+    get_similarity_index
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +57,14 @@ class ProcessedOutcome:
     timestamp: datetime
     used_pattern_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    used_pattern_ids: List[str] = field(default_factory=list)  # when the event used several
+
+    @property
+    def pattern_ids(self) -> List[str]:
+        """Every pattern the outcome's event used."""
+        if self.used_pattern_ids:
+            return self.used_pattern_ids
+        return [self.used_pattern_id] if self.used_pattern_id else []
 
 
 @dataclass
@@ -79,35 +108,162 @@ class BatchGenerationResult:
     total_time_ms: float
     avg_time_per_outcome_ms: float
     errors: List[str] = field(default_factory=list)
+    outcomes_per_second: float = 0.0
+    failed_outcome_ids: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ErrorRule:
+    """
+    One error classification rule.
+
+    The pattern's first group captures the error type. The fix is a
+    str.format template over the match: {0} is the whole match, {1}, {2}...
+    the (stripped) groups.
+    """
+    error_types: Tuple[str, ...]
+    pattern: str
+    fix: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ErrorRule":
+        """Build from a config entry with error_types, pattern and fix."""
+        return cls(
+            error_types=tuple(data['error_types']),
+            pattern=data['pattern'],
+            fix=data['fix']
+        )
 
 
 class ErrorPatternExtractor:
-    """Extracts patterns and fixes from error logs."""
+    """
+    Extracts patterns and fixes from error logs.
+
+    Only the last SCAN_WINDOW_CHARS of a log are scanned, where the final
+    exception of a traceback is. Rules are tried in table order, but a
+    rule's precompiled pattern only runs if one of its error type names
+    occurs in the window (a plain substring check), and only from the
+    first such occurrence.
+
+    The rule table can be replaced from a YAML or JSON file (a list of
+    {error_types, pattern, fix} entries) named by ERROR_RULES_PATH, or
+    with configure().
+    """
 
     # Common error patterns with suggested fixes
     ERROR_PATTERNS = [
-        (r"(NameError|ReferenceError):\s*name ['\"](\w+)['\"] is not defined",
-         lambda m: f"Define variable '{m.group(2)}' before use or check for typos"),
-        (r"(TypeError):\s*([^'\n]+)",
-         lambda m: f"Fix type mismatch: {m.group(2).strip()}"),
-        (r"(ValueError):\s*(.+)",
-         lambda m: f"Validate input: {m.group(2).strip()}"),
-        (r"(AttributeError):\s*(?:NoneType has no attribute|'(\w+)' object has no attribute)",
-         lambda m: f"Check if object is None before accessing '{m.group(2)}'"),
-        (r"(ImportError|ModuleNotFoundError):\s*No module named ['\"]?(\w+)['\"]?",
-         lambda m: f"Install or import module '{m.group(2)}'"),
-        (r"(KeyError):\s*['\"](\w+)['\"]",
-         lambda m: f"Add key '{m.group(2)}' to dictionary or check for case sensitivity"),
-        (r"(IndexError):\s*(?:list index out of range|)",
-         lambda m: "Check list length before accessing index"),
-        (r"(SyntaxError):\s*(.+)",
-         lambda m: f"Fix syntax: {m.group(2).strip()}"),
-        (r"(PermissionError):\s*(.+)",
-         lambda m: f"Check file permissions: {m.group(2).strip()}"),
-        (r"(ConnectionError|TimeoutError):\s*(.+)",
-         lambda m: f"Handle connection issue: {m.group(2).strip()}"),
+        ErrorRule(("NameError", "ReferenceError"),
+                  r"(NameError|ReferenceError):\s*name ['\"](\w+)['\"] is not defined",
+                  "Define variable '{2}' before use or check for typos"),
+        ErrorRule(("TypeError",),
+                  r"(TypeError):\s*([^'\n]+)",
+                  "Fix type mismatch: {2}"),
+        ErrorRule(("ValueError",),
+                  r"(ValueError):\s*(.+)",
+                  "Validate input: {2}"),
+        ErrorRule(("AttributeError",),
+                  r"(AttributeError):\s*(?:NoneType has no attribute|'(\w+)' object has no attribute)",
+                  "Check if object is None before accessing '{2}'"),
+        ErrorRule(("ImportError", "ModuleNotFoundError"),
+                  r"(ImportError|ModuleNotFoundError):\s*No module named ['\"]?(\w+)['\"]?",
+                  "Install or import module '{2}'"),
+        ErrorRule(("KeyError",),
+                  r"(KeyError):\s*['\"](\w+)['\"]",
+                  "Add key '{2}' to dictionary or check for case sensitivity"),
+        ErrorRule(("IndexError",),
+                  r"(IndexError):\s*(?:list index out of range|)",
+                  "Check list length before accessing index"),
+        ErrorRule(("SyntaxError",),
+                  r"(SyntaxError):\s*(.+)",
+                  "Fix syntax: {2}"),
+        ErrorRule(("PermissionError",),
+                  r"(PermissionError):\s*(.+)",
+                  "Check file permissions: {2}"),
+        ErrorRule(("ConnectionError", "TimeoutError"),
+                  r"(ConnectionError|TimeoutError):\s*(.+)",
+                  "Handle connection issue: {2}"),
     ]
 
+    # Tail of the log that is classified
+    SCAN_WINDOW_CHARS = 64 * 1024
+
+    _compiled: Optional[List[Tuple[Any, str, Tuple[str, ...]]]] = None
+
+    @classmethod
+    def configure(
+        cls,
+        rules: Optional[List[ErrorRule]] = None,
+        scan_window_chars: Optional[int] = None
+    ) -> None:
+        """
+        Replace the rule table and/or scan window.
+
+        Rules whose pattern does not compile or whose fix template does not
+        format against the pattern's groups are skipped with a warning.
+
+        Args:
+            rules: Rules in priority order (None keeps the current table)
+            scan_window_chars: Characters scanned from the end of a log
+        """
+        if rules is not None:
+            cls.ERROR_PATTERNS = list(rules)
+        if scan_window_chars is not None:
+            cls.SCAN_WINDOW_CHARS = scan_window_chars
+        cls._compiled = cls._compile(cls.ERROR_PATTERNS)
+
+    @staticmethod
+    def load_rules(path: str) -> List[ErrorRule]:
+        """
+        Load a rule table from a YAML or JSON file.
+
+        Args:
+            path: File holding a list of {error_types, pattern, fix} entries
+
+        Returns:
+            Rules in file order
+        """
+        text = Path(path).read_text()
+        if path.endswith(".json"):
+            entries = json.loads(text)
+        else:
+            entries = yaml.safe_load(text)
+        return [ErrorRule.from_dict(entry) for entry in entries or []]
+
+    @staticmethod
+    def _compile(rules: List[ErrorRule]) -> List[Tuple[Any, str, Tuple[str, ...]]]:
+        """
+        Compile every rule pattern alongside its lowercased type keywords.
+
+        Each fix template is dry-run with as many arguments as a match
+        yields, so a bad rule is skipped here (with a warning) instead of
+        raising inside extract().
+        """
+        compiled = []
+        for rule in rules:
+            try:
+                pattern = re.compile(rule.pattern, re.IGNORECASE)
+                rule.fix.format(*[""] * (pattern.groups + 1))
+            except (re.error, IndexError, KeyError, ValueError, AttributeError, TypeError) as e:
+                logger.warning(f"Skipping invalid error rule {rule.pattern!r}: {e}")
+                continue
+            compiled.append((
+                pattern,
+                rule.fix,
+                tuple(error_type.lower() for error_type in rule.error_types)
+            ))
+        return compiled
+
+    @classmethod
+    def _get_compiled(cls) -> List[Tuple[Any, str, Tuple[str, ...]]]:
+        """Compiled rule table, loading ERROR_RULES_PATH on first use."""
+        if cls._compiled is None:
+            rules_path = os.getenv("ERROR_RULES_PATH")
+            if rules_path:
+                cls.ERROR_PATTERNS = cls.load_rules(rules_path)
+                logger.info(f"Loaded {len(cls.ERROR_PATTERNS)} error rules from {rules_path}")
+            cls._compiled = cls._compile(cls.ERROR_PATTERNS)
+        return cls._compiled
+
     @classmethod
     def extract(cls, error_log: str) -> Tuple[str, str]:
         """
@@ -122,12 +278,25 @@ class ErrorPatternExtractor:
         if not error_log:
             return "Unknown Error", "Review the error log for details"
 
-        for pattern, fix_func in cls.ERROR_PATTERNS:
-            match = re.search(pattern, error_log, re.IGNORECASE)
+        window = error_log[-cls.SCAN_WINDOW_CHARS:]
+        lowered = window.lower()
+        # Lowercasing a few non-ASCII characters changes the length
+        same_offsets = len(lowered) == len(window)
+
+        for pattern, fix, keywords in cls._get_compiled():
+            starts = [i for i in (lowered.find(k) for k in keywords) if i >= 0]
+            if not starts:
+                continue
+
+            # A match starts at one of the rule's error type names
+            match = pattern.search(window, min(starts) if same_offsets else 0)
             if match:
                 error_type = match.group(1) if match.groups() else "Error"
-                suggested_fix = fix_func(match)
-                return error_type, suggested_fix
+                groups = [
+                    group.strip() if group is not None else None
+                    for group in (match.group(0),) + match.groups()
+                ]
+                return error_type, fix.format(*groups)
 
         # Generic fallback
         return "Error", "Review error log and add appropriate error handling"
@@ -206,14 +375,65 @@ class InsightGenerator:
     - Confidence scoring algorithm
     """
 
-    def __init__(self, client: Neo4jAsyncClient):
+    # Batch processing
+    BATCH_CHUNK_SIZE = 500
+    MAX_CONCURRENT_CHUNKS = 4
+
+    INSIGHT_BATCH_QUERY = """
+    CREATE (i:Insight {
+        insight_id: row.insight_id,
+        rule: row.rule,
+        confidence_score: row.confidence_score,
+        learned_from: row.learned_from,
+        group_id: row.group_id,
+        category: row.category,
+        created_at: datetime(),
+        expires_at: row.expires_at,
+        status: 'active'
+    })
+    WITH i, row
+    OPTIONAL MATCH (o:Outcome {outcome_id: row.learned_from, group_id: row.group_id})
+    FOREACH (_ IN CASE WHEN o IS NULL THEN [] ELSE [1] END |
+        CREATE (o)-[:GENERATED]->(i)
+        SET o.insights_processed_at = datetime())
+    RETURN i.insight_id as insight_id
+    """
+
+    # times_used is incremented in place: usage flushes write it concurrently
+    PATTERN_BATCH_UPDATE_QUERY = """
+    MATCH (p:Pattern {pattern_id: row.pattern_id, group_id: row.group_id})
+    SET p.confidence_score = row.confidence_score,
+        p.times_used = coalesce(p.times_used, 0) + size(row.outcomes),
+        p.last_updated = datetime()
+    WITH row
+    UNWIND row.outcomes AS ref
+    MATCH (o:Outcome {outcome_id: ref.outcome_id, group_id: ref.group_id})
+    SET o.insights_processed_at = datetime()
+    """
+
+    CURSOR_ADVANCE_QUERY = """
+    MERGE (c:ProcessingCursor {cursor_key: $cursor_key})
+    SET c.group_id = $group_id,
+        c.last_timestamp = $last_timestamp,
+        c.last_outcome_id = $last_outcome_id,
+        c.updated_at = datetime()
+    """
+
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        similarity: Optional[SimilarityIndex] = None
+    ):
         """
         Initialize the insight generator.
 
         Args:
             client: Neo4j async client for database operations
+            similarity: Similarity index kept current with new insights
+                        (uses global similarity index if not provided)
         """
         self._client = client
+        self._similarity = similarity or get_similarity_index(client)
 
     async def generate_insight_from_outcome(
         self,
@@ -343,8 +563,6 @@ class InsightGenerator:
         category: str
     ) -> str:
         """Create an Insight node in the database."""
-        import uuid
-
         insight_id = f"insight-{uuid.uuid4().hex[:12]}"
 
         query = """
@@ -356,6 +574,7 @@ class InsightGenerator:
             group_id: $group_id,
             category: $category,
             created_at: datetime(),
+            expires_at: $expires_at,
             status: 'active'
         })
         RETURN elementId(i) as id
@@ -369,10 +588,15 @@ class InsightGenerator:
                 "confidence_score": confidence_score,
                 "learned_from": learned_from,
                 "group_id": group_id,
-                "category": category
+                "category": category,
+                "expires_at": self._expires_at(confidence_score)
             }
         )
 
+        # A cold index picks the insight up when it is first loaded
+        if self._similarity.is_loaded:
+            self._similarity.add(insight_id, rule, group_id, kind=INSIGHT_KIND)
+
         return insight_id
 
     async def _get_pattern_data(self, pattern_id: str) -> Optional[Dict[str, float]]:
@@ -421,85 +645,373 @@ class InsightGenerator:
 
     async def process_outcomes_batch(
         self,
-        outcomes: List[ProcessedOutcome]
+        outcomes: List[ProcessedOutcome],
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None
     ) -> BatchGenerationResult:
         """
         Process a batch of outcomes for insight generation.
 
+        Rules for all failed outcomes are extracted in process first. Each
+        chunk of insights is then created, with its GENERATED edges, in one
+        UNWIND write, and each chunk of reinforced patterns is read and
+        written once. Chunks run concurrently, at most max_concurrency at
+        a time; a failed chunk only fails its own outcomes.
+
         Args:
             outcomes: List of outcomes to process
+            chunk_size: Rows per write (default: BATCH_CHUNK_SIZE)
+            max_concurrency: Chunks in flight (default: MAX_CONCURRENT_CHUNKS)
 
         Returns:
             BatchGenerationResult with processing summary
         """
         start_time = time.perf_counter()
+        chunk_size = chunk_size or self.BATCH_CHUNK_SIZE
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_CHUNKS)
+
+        insight_rows, successes = self._partition(outcomes)
+
+        async def bounded(chunk_work):
+            async with semaphore:
+                return await chunk_work
+
+        pattern_ids = list(successes)
+        insight_results, pattern_results = await asyncio.gather(
+            asyncio.gather(*(
+                bounded(self._create_insight_chunk(insight_rows[i:i + chunk_size]))
+                for i in range(0, len(insight_rows), chunk_size)
+            )),
+            asyncio.gather(*(
+                bounded(self._reinforce_pattern_chunk(
+                    {pid: successes[pid] for pid in pattern_ids[i:i + chunk_size]}
+                ))
+                for i in range(0, len(pattern_ids), chunk_size)
+            ))
+        )
 
+        failures: Dict[str, str] = {}
         insights_generated = 0
+        for created, chunk_failures in insight_results:
+            insights_generated += created
+            failures.update(chunk_failures)
+
         patterns_updated = 0
-        errors = []
+        for updated, chunk_failures in pattern_results:
+            patterns_updated += updated
+            failures.update(chunk_failures)
+
+        total_time = (time.perf_counter() - start_time) * 1000
+
+        return BatchGenerationResult(
+            processed_count=len(outcomes),
+            insights_generated=insights_generated,
+            patterns_updated=patterns_updated,
+            total_time_ms=total_time,
+            avg_time_per_outcome_ms=total_time / len(outcomes) if outcomes else 0,
+            errors=[f"Outcome {outcome_id}: {error}" for outcome_id, error in failures.items()],
+            outcomes_per_second=len(outcomes) / (total_time / 1000) if total_time > 0 else 0.0,
+            failed_outcome_ids=list(failures)
+        )
 
+    def _partition(
+        self,
+        outcomes: List[ProcessedOutcome]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[ProcessedOutcome]]]:
+        """Split outcomes into insight rows (failures) and successes by pattern."""
+        insight_rows: List[Dict[str, Any]] = []
+        successes: Dict[str, List[ProcessedOutcome]] = {}
         for outcome in outcomes:
-            result = await self.generate_insight_from_outcome(outcome)
+            if outcome.status == "Failed":
+                insight_rows.append(self._insight_row(outcome))
+            else:
+                for pattern_id in outcome.pattern_ids:
+                    successes.setdefault(pattern_id, []).append(outcome)
+        return insight_rows, successes
+
+    def _insight_row(self, outcome: ProcessedOutcome) -> Dict[str, Any]:
+        """Extract the tentative insight for a failed outcome."""
+        confidence = ConfidenceScorer.get_initial_confidence("Failed")
+        return {
+            "insight_id": f"insight-{uuid.uuid4().hex[:12]}",
+            "rule": ErrorPatternExtractor.generate_rule(outcome.error_log or "", outcome.event_type),
+            "confidence_score": confidence,
+            "learned_from": outcome.outcome_id,
+            "group_id": outcome.group_id,
+            "category": outcome.event_type,
+            "expires_at": self._expires_at(confidence)
+        }
+
+    @staticmethod
+    def _expires_at(confidence: float) -> Optional[datetime]:
+        """Archival time of a new insight in lazy decay mode (None otherwise)."""
+        if not lazy_decay_enabled():
+            return None
+        return compute_expires_at(confidence, datetime.now(timezone.utc))
+
+    async def _create_insight_chunk(
+        self,
+        rows: List[Dict[str, Any]]
+    ) -> Tuple[int, Dict[str, str]]:
+        """
+        Create a chunk of insights and their GENERATED edges in one write.
 
-            if result.insight:
-                insights_generated += 1
-            elif result.pattern_update:
-                patterns_updated += 1
+        Returns:
+            (insights created, error by failed outcome ID)
+        """
+        try:
+            await self._client.execute_write_batch(
+                self.INSIGHT_BATCH_QUERY, rows, batch_size=len(rows)
+            )
+        except Exception as e:
+            logger.error(f"Error creating {len(rows)} insights: {e}")
+            return 0, {row['learned_from']: str(e) for row in rows}
+
+        # A cold index picks the insights up when it is first loaded
+        if self._similarity.is_loaded:
+            self._similarity.add_many(
+                ((row['insight_id'], row['rule'], row['group_id']) for row in rows),
+                kind=INSIGHT_KIND
+            )
 
-            if result.error:
-                errors.append(f"Outcome {result.outcome_id}: {result.error}")
+        return len(rows), {}
+
+    async def _reinforce_pattern_chunk(
+        self,
+        successes: Dict[str, List[ProcessedOutcome]]
+    ) -> Tuple[int, Dict[str, str]]:
+        """
+        Reinforce a chunk of patterns with one read and one write.
+
+        Returns:
+            (outcomes that updated a pattern, error by failed outcome ID)
+        """
+        try:
+            rows, updated = await self._fold_pattern_successes(successes)
+            if rows:
+                await self._client.execute_write_batch(
+                    self.PATTERN_BATCH_UPDATE_QUERY, rows, batch_size=len(rows)
+                )
+        except Exception as e:
+            logger.error(f"Error reinforcing {len(successes)} patterns: {e}")
+            return 0, {
+                outcome.outcome_id: str(e)
+                for outcomes in successes.values()
+                for outcome in outcomes
+            }
+
+        return updated, {}
+
+    async def _fold_pattern_successes(
+        self,
+        successes: Dict[str, List[ProcessedOutcome]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Compute pattern updates for successful outcomes with one read.
+
+        Several successes of the same pattern are applied in order, as if
+        each had been processed on its own.
+
+        Returns:
+            (PATTERN_BATCH_UPDATE_QUERY rows, outcomes that updated a pattern)
+        """
+        # Each outcome's group is checked against the pattern's below
+        records = await self._client.execute_query(
+            """
+            UNWIND $pattern_ids AS pattern_id
+            MATCH (p:Pattern {pattern_id: pattern_id})
+            RETURN p.pattern_id as pattern_id,
+                   p.group_id as group_id,
+                   coalesce(p.confidence_score, 0.5) as confidence_score,
+                   coalesce(p.success_rate, 0.0) as success_rate,
+                   coalesce(p.times_used, 0) as times_used
+            """,
+            {"pattern_ids": list(successes)},
+            validate_group_id=False
+        )
+
+        rows = []
+        updated = 0
+        for record in records:
+            confidence = record['confidence_score']
+            times_used = record['times_used']
+            applied = []
+            for outcome in successes[record['pattern_id']]:
+                if record['group_id'] not in visible_groups(outcome.group_id):
+                    continue
+                confidence = ConfidenceScorer.calculate_pattern_confidence(
+                    current_confidence=confidence,
+                    success_rate=record['success_rate'],
+                    times_used=times_used
+                )
+                times_used += 1
+                applied.append({"outcome_id": outcome.outcome_id, "group_id": outcome.group_id})
+
+            if applied:
+                updated += len(applied)
+                rows.append({
+                    "pattern_id": record['pattern_id'],
+                    "group_id": record['group_id'],
+                    "confidence_score": confidence,
+                    "outcomes": applied
+                })
+
+        return rows, updated
+
+    async def process_new_outcomes(
+        self,
+        group_id: str,
+        hours_back: int = 24,
+        page_size: Optional[int] = None
+    ) -> BatchGenerationResult:
+        """
+        Process every outcome of a group after its processing cursor.
+
+        Outcomes are read in (timestamp, outcome_id) order one page at a
+        time, and each page goes through process_outcomes_batch(), so its
+        chunks are written concurrently. Every chunk marks the outcomes it
+        wrote in the same statement; the cursor then advances past the
+        outcomes before the first failed one. A failed chunk stops the run
+        and its page is retried from the cursor on the next run, where
+        already-marked outcomes are skipped, so nothing is processed twice.
+
+        Args:
+            group_id: Project group ID for isolation
+            hours_back: Look-back window while the group has no cursor yet
+            page_size: Outcomes per page
+                       (default: BATCH_CHUNK_SIZE * MAX_CONCURRENT_CHUNKS)
+
+        Returns:
+            BatchGenerationResult summed over all pages
+        """
+        start_time = time.perf_counter()
+        page_size = page_size or self.BATCH_CHUNK_SIZE * self.MAX_CONCURRENT_CHUNKS
+
+        processed = insights_generated = patterns_updated = 0
+        errors: List[str] = []
+        failed_outcome_ids: List[str] = []
+
+        while True:
+            outcomes = await self.get_unprocessed_outcomes(group_id, hours_back, limit=page_size)
+            if not outcomes:
+                break
+
+            result = await self.process_outcomes_batch(outcomes)
+            processed += len(outcomes) - len(result.failed_outcome_ids)
+            insights_generated += result.insights_generated
+            patterns_updated += result.patterns_updated
+            errors.extend(result.errors)
+            failed_outcome_ids.extend(result.failed_outcome_ids)
+
+            failed = set(result.failed_outcome_ids)
+            done = next(
+                (i for i, outcome in enumerate(outcomes) if outcome.outcome_id in failed),
+                len(outcomes)
+            )
+            if done:
+                try:
+                    await self._advance_cursor(group_id, outcomes[done - 1])
+                except Exception as e:
+                    # The outcomes are marked, so the next run skips them
+                    logger.error(f"Error advancing the outcome cursor of {group_id}: {e}")
+                    errors.append(f"Group {group_id}: {e}")
+                    break
+
+            if failed or len(outcomes) < page_size:
+                break
 
         total_time = (time.perf_counter() - start_time) * 1000
 
         return BatchGenerationResult(
-            processed_count=len(outcomes),
+            processed_count=processed,
             insights_generated=insights_generated,
             patterns_updated=patterns_updated,
             total_time_ms=total_time,
-            avg_time_per_outcome_ms=total_time / len(outcomes) if outcomes else 0,
-            errors=errors
+            avg_time_per_outcome_ms=total_time / processed if processed else 0,
+            errors=errors,
+            outcomes_per_second=processed / (total_time / 1000) if total_time > 0 else 0.0,
+            failed_outcome_ids=failed_outcome_ids
         )
 
+    async def _advance_cursor(self, group_id: str, last: ProcessedOutcome) -> None:
+        """Move the group's processing cursor past an outcome."""
+        await self._client.execute_write(
+            self.CURSOR_ADVANCE_QUERY,
+            {
+                "cursor_key": self._cursor_key(group_id),
+                "group_id": group_id,
+                "last_timestamp": last.timestamp,
+                "last_outcome_id": last.outcome_id
+            }
+        )
+
+    @staticmethod
+    def _cursor_key(group_id: str) -> str:
+        """ProcessingCursor key of a group's insight generation."""
+        return f"insight_generation|{group_id}"
+
     async def get_unprocessed_outcomes(
         self,
         group_id: str,
-        hours_back: int = 24
+        hours_back: int = 24,
+        limit: Optional[int] = None
     ) -> List[ProcessedOutcome]:
         """
-        Get outcomes that haven't been processed for insights.
+        Get outcomes after the group's processing cursor.
+
+        Outcomes are returned oldest first by (timestamp, outcome_id), the
+        order the cursor advances in. The read is a range seek on the
+        (group_id, timestamp) index starting at the cursor; outcomes a
+        partly failed earlier run already wrote are skipped. Each outcome
+        is one row, with all the patterns its event used, so a page never
+        ends partway through an outcome.
 
         Args:
             group_id: Project group ID for isolation
-            hours_back: How many hours back to look
+            hours_back: Look-back window while the group has no cursor yet
+            limit: Maximum outcomes to return (None for all)
 
         Returns:
             List of unprocessed outcomes
         """
         query = """
+        OPTIONAL MATCH (c:ProcessingCursor {cursor_key: $cursor_key})
+        WITH coalesce(c.last_timestamp, datetime() - duration({hours: $hours_back})) as since,
+             coalesce(c.last_outcome_id, '') as after_outcome_id
         MATCH (o:Outcome)
         WHERE o.group_id = $group_id
+          AND o.timestamp >= since
+          AND (o.timestamp > since OR o.outcome_id > after_outcome_id)
           AND o.status IN ['Success', 'Failed']
-          AND NOT exists((o)-[:GENERATED]->(:Insight))
-          AND o.timestamp > datetime() - duration({hours: $hours_back})
+          AND o.insights_processed_at IS NULL
         MATCH (e:Event)-[:HAS_OUTCOME]->(o)
         MATCH (agent:AIAgent)-[:PERFORMED]->(e)
         OPTIONAL MATCH (e)-[:USED_PATTERN]->(p:Pattern)
+        WITH o,
+             head(collect(e.event_type)) as event_type,
+             head(collect(agent.name)) as agent_name,
+             collect(DISTINCT p.pattern_id) as pattern_ids
         RETURN o.outcome_id as outcome_id,
                o.status as status,
                o.result_summary as result_summary,
                o.error_log as error_log,
-               e.event_type as event_type,
+               event_type,
                o.group_id as group_id,
-               agent.name as agent_name,
+               agent_name,
                o.timestamp as timestamp,
-               p.pattern_id as pattern_id
-        ORDER BY o.timestamp DESC
+               pattern_ids
+        ORDER BY o.timestamp, o.outcome_id
         """
+        params: Dict[str, Any] = {
+            "group_id": group_id,
+            "cursor_key": self._cursor_key(group_id),
+            "hours_back": hours_back
+        }
+        if limit is not None:
+            query += " LIMIT $limit"
+            params["limit"] = limit
 
-        results = await self._client.execute_query(
-            query,
-            {"group_id": group_id, "hours_back": hours_back}
-        )
+        results = await self._client.execute_query(query, params)
 
         return [
             ProcessedOutcome(
@@ -511,7 +1023,8 @@ class InsightGenerator:
                 group_id=r.get('group_id', ''),
                 agent_name=r.get('agent_name', ''),
                 timestamp=r.get('timestamp', datetime.now(timezone.utc)),
-                used_pattern_id=r.get('pattern_id')
+                used_pattern_id=(r.get('pattern_ids') or [None])[0],
+                used_pattern_ids=r.get('pattern_ids') or []
             )
             for r in results
         ]
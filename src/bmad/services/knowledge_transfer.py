@@ -5,6 +5,8 @@ This module provides cross-agent knowledge sharing for collective learning.
 - Share high-confidence insights (confidence_score > 0.8) across agents
 - Create CAN_APPLY relationships from recipient agents to shared insights
 - Multi-tenant isolation via group_id
+- Confidence is read through effective_confidence(), so thresholds see
+  read-time decay in lazy decay mode
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
@@ -17,7 +19,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from src.bmad.core.insight_confidence import effective_confidence
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import tenant_filter
 
 logger = logging.getLogger(__name__)
 
@@ -99,11 +103,11 @@ class KnowledgeTransferService:
         start_time = time.perf_counter()
 
         # Share insights from global group as well
-        cypher = """
+        cypher = f"""
         // Find high-confidence insights not yet shared with all agents
         MATCH (teacher:AIAgent)-[:LEARNED]->(i:Insight)
-        WHERE (i.group_id = $group_id OR i.group_id = 'global-coding-skills')
-          AND i.confidence_score >= $threshold
+        WHERE {tenant_filter("i")}
+          AND {effective_confidence("i")} >= $threshold
           AND i.success_rate >= 0.8
 
         // Find recipient agents in the same group
@@ -115,7 +119,7 @@ class KnowledgeTransferService:
         AND NOT exists((learner)-[:CAN_APPLY]->(i))
 
         // Create the CAN_APPLY relationship
-        MERGE (learner)-[:CAN_APPLY {shared_at: datetime()}]->(i)
+        MERGE (learner)-[:CAN_APPLY {{shared_at: datetime()}}]->(i)
 
         // Return transfer details
         RETURN teacher.name as teacher,
@@ -194,11 +198,11 @@ class KnowledgeTransferService:
         # Enforce max limit
         limit = min(limit, 50)
 
-        cypher = """
-        MATCH (learner:AIAgent {name: $agent_name, group_id: $group_id})
+        cypher = f"""
+        MATCH (learner:AIAgent {{name: $agent_name, group_id: $group_id}})
               -[:CAN_APPLY]->(i:Insight)
         MATCH (teacher:AIAgent)-[:LEARNED]->(i)
-        WHERE i.confidence_score >= $min_confidence
+        WHERE {effective_confidence("i")} >= $min_confidence
         """
 
         params = {
@@ -211,15 +215,15 @@ class KnowledgeTransferService:
             cypher += " AND teacher.name = $teacher_name"
             params["teacher_name"] = teacher_name
 
-        cypher += """
+        cypher += f"""
         RETURN i.insight_id as insight_id,
                i.rule as rule,
                i.category as category,
-               i.confidence_score as confidence_score,
+               {effective_confidence("i")} as confidence_score,
                i.success_rate as success_rate,
                i.learned_at as learned_at,
                teacher.name as teacher_agent
-        ORDER BY i.confidence_score DESC, i.success_rate DESC
+        ORDER BY confidence_score DESC, i.success_rate DESC
         LIMIT $limit
         """
 
@@ -261,10 +265,10 @@ class KnowledgeTransferService:
         Returns:
             List of Insight objects ready to share
         """
-        cypher = """
+        cypher = f"""
         MATCH (teacher:AIAgent)-[:LEARNED]->(i:Insight)
-        WHERE (i.group_id = $group_id OR i.group_id = 'global-coding-skills')
-          AND i.confidence_score >= $threshold
+        WHERE {tenant_filter("i")}
+          AND {effective_confidence("i")} >= $threshold
           AND i.success_rate >= 0.8
         """
 
@@ -277,18 +281,18 @@ class KnowledgeTransferService:
             cypher += " AND teacher.name = $teacher_name"
             params["teacher_name"] = teacher_name
 
-        cypher += """
+        cypher += f"""
         RETURN i.insight_id as insight_id,
                i.rule as rule,
                i.category as category,
-               i.confidence_score as confidence_score,
+               {effective_confidence("i")} as confidence_score,
                i.success_rate as success_rate,
                i.group_id as group_id,
                teacher.name as learned_by,
                i.learned_at as learned_at,
                i.applies_to as applies_to,
                i.metadata as metadata
-        ORDER BY i.confidence_score DESC, i.success_rate DESC
+        ORDER BY confidence_score DESC, i.success_rate DESC
         """
 
         records = await self._client.execute_query(cypher, params)
@@ -327,10 +331,10 @@ class KnowledgeTransferService:
         Returns:
             Dictionary with pending counts
         """
-        cypher = """
+        cypher = f"""
         MATCH (teacher:AIAgent)-[:LEARNED]->(i:Insight)
-        WHERE (i.group_id = $group_id OR i.group_id = 'global-coding-skills')
-          AND i.confidence_score >= $threshold
+        WHERE {tenant_filter("i")}
+          AND {effective_confidence("i")} >= $threshold
           AND i.success_rate >= 0.8
 
         MATCH (learner:AIAgent)
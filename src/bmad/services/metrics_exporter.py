@@ -18,6 +18,7 @@ from typing import Any, Dict, Optional
 
 from prometheus_client import Gauge, Counter, Histogram, Enum, REGISTRY, generate_latest, CONTENT_TYPE_LATEST
 
+from src.bmad.core.insight_confidence import effective_confidence
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
 
 logger = logging.getLogger(__name__)
@@ -214,10 +215,10 @@ class MetricsExporter:
 
     async def _update_confidence_score(self) -> None:
         """Update average confidence score metric."""
-        query = """
+        query = f"""
         MATCH (i:Insight)
         WHERE i.confidence_score IS NOT NULL
-        RETURN avg(i.confidence_score) as avg_confidence
+        RETURN avg({effective_confidence("i")}) as avg_confidence
         """
 
         try:
@@ -314,9 +315,9 @@ class MetricsExporter:
                 self._active_patterns.labels(group_id=group_id).set(r.get('count', 0))
 
             # Decayed insights (confidence < 0.3)
-            decayed_query = """
+            decayed_query = f"""
             MATCH (i:Insight)
-            WHERE i.confidence_score < 0.3
+            WHERE {effective_confidence("i")} < 0.3
             RETURN count(i) as count
             """
 
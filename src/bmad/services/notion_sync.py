@@ -23,6 +23,7 @@ from urllib.parse import urlparse
 import httpx
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import tenant_filter
 
 logger = logging.getLogger(__name__)
 
@@ -425,7 +426,7 @@ class NotionSyncService:
             List of matching KnowledgeItem nodes
         """
         limit = min(limit, 100)
-        conditions = ["k.group_id = $group_id OR k.group_id = 'global-coding-skills'"]
+        conditions = [tenant_filter("k")]
         params = {"group_id": group_id, "limit": limit}
 
         if category:
@@ -509,10 +510,10 @@ class NotionSyncService:
         Returns:
             True if linked successfully
         """
-        cypher = """
-        MATCH (k:KnowledgeItem {source: $source})
-        MATCH (b:Brain {name: $brain_name})
-        WHERE b.group_id = $group_id OR b.group_id = 'global-coding-skills'
+        cypher = f"""
+        MATCH (k:KnowledgeItem {{source: $source}})
+        MATCH (b:Brain {{name: $brain_name}})
+        WHERE {tenant_filter("b")}
         MERGE (b)-[:CONTAINS_KNOWLEDGE]->(k)
         RETURN count(*) as count
         """
@@ -530,9 +531,9 @@ class NotionSyncService:
 
     async def count_knowledge_items(self, group_id: str) -> Dict[str, int]:
         """Count knowledge items by type."""
-        cypher = """
+        cypher = f"""
         MATCH (k:KnowledgeItem)
-        WHERE k.group_id = $group_id OR k.group_id = 'global-coding-skills'
+        WHERE {tenant_filter("k")}
         RETURN k.category as category, count(*) as count
         """
 
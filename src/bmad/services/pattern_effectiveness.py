@@ -5,6 +5,7 @@ This module tracks and updates pattern effectiveness metrics daily.
 - Recalculate success_rate from outcome history
 - Update times_used counter
 - Alert on patterns with success_rate < 0.6
+- Rebuild the materialized top-pattern rankings
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
@@ -17,6 +18,13 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.cache_manager import (
+    AsyncCacheManager,
+    get_pattern_cache,
+    pattern_invalidation_tags
+)
+from src.bmad.services.pattern_index import PatternIndex, get_pattern_index
+from src.bmad.services.pattern_ranking import PatternRankings, get_pattern_rankings
 
 logger = logging.getLogger(__name__)
 
@@ -70,14 +78,29 @@ class PatternEffectivenessService:
     # Configuration constants
     LOW_EFFECTIVENESS_THRESHOLD = 0.6
 
-    def __init__(self, client: Neo4jAsyncClient):
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        cache: Optional[AsyncCacheManager] = None,
+        index: Optional[PatternIndex] = None,
+        rankings: Optional[PatternRankings] = None
+    ):
         """
         Initialize the pattern effectiveness service.
 
         Args:
             client: Neo4j async client
+            cache: Pattern query cache to invalidate after updates
+                   (uses global pattern cache if not provided)
+            index: In-memory pattern index to refresh after updates
+                   (uses global pattern index if not provided)
+            rankings: Materialized top-pattern rankings to rebuild after updates
+                      (uses global rankings if not provided)
         """
         self._client = client
+        self._cache = cache or get_pattern_cache()
+        self._index = index or get_pattern_index(client)
+        self._rankings = rankings or get_pattern_rankings(client)
 
     async def update_effectiveness(
         self,
@@ -99,6 +122,18 @@ class PatternEffectivenessService:
         # Update all patterns with outcome metrics
         update_results = await self._update_pattern_metrics(group_id)
 
+        # Success rates moved: evict result sets containing or filtering these groups
+        if update_results:
+            self._index.invalidate()
+        await self._cache.invalidate_tags(pattern_invalidation_tags(
+            [p.pattern_id for p in update_results],
+            [p.group_id for p in update_results]
+        ))
+
+        # Every success_rate may have moved: re-rank from scratch
+        if update_results:
+            await self._rankings.rebuild(group_id)
+
         # Get patterns that need alerting
         low_patterns = await self._get_low_effectiveness_patterns(group_id)
 
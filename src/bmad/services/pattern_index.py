@@ -0,0 +1,370 @@
+"""
+In-Memory Pattern Index
+
+This module keeps the (small, read-heavy) pattern library in process so
+PatternQuery filters are answered without a Neo4j round trip.
+- Posting lists per group_id and per (group_id, category), pre-sorted by
+  (success_rate, times_used) descending
+- Tag posting sets for any-of tag filters
+- Top-k merge of the group and global posting lists with early exit
+- Keyset cursors resume by binary search into each posting list
+- Periodic and change-driven refresh; callers fall back to Cypher while
+  the index is cold or invalidated
+- Usage-statistic changes are applied in place, re-sorting only the
+  posting lists of the changed patterns
+- Free-text queries are left to the Neo4j pattern_fulltext index, which
+  ranks by relevance
+
+Usage:
+    index = get_pattern_index(client)
+    await index.refresh()
+    patterns = index.query(PatternQuery(group_id="faith-meats", category="testing"))
+    if patterns is None:
+        ...  # cold: run the Cypher query instead
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 3-4-fast-pattern-matching-query-engine
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import GLOBAL_GROUP_ID
+from src.bmad.services.pattern_matcher import (
+    Pattern,
+    PatternQuery,
+    decode_pattern_cursor,
+    parse_pattern
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _rank_key(pattern: Pattern) -> Tuple[float, int, str]:
+    """Sort key matching ORDER BY success_rate DESC, times_used DESC."""
+    return (-(pattern.success_rate or 0.0), -(pattern.times_used or 0), pattern.pattern_id)
+
+
+def _tail(posting: List[Pattern], start: int) -> Iterator[Pattern]:
+    """Iterate a posting list from start without copying it."""
+    return (posting[i] for i in range(start, len(posting)))
+
+
+def _bisect_after(posting: List[Pattern], key: Tuple[float, int, str]) -> int:
+    """Index of the first pattern ranked after key (bisect_right on _rank_key)."""
+    lo, hi = 0, len(posting)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key < _rank_key(posting[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+@dataclass
+class _IndexSnapshot:
+    """Immutable view of the index; replaced wholesale on refresh."""
+    patterns: Dict[str, Pattern] = field(default_factory=dict)
+    by_group: Dict[str, List[Pattern]] = field(default_factory=dict)
+    by_group_category: Dict[Tuple[str, str], List[Pattern]] = field(default_factory=dict)
+    by_tag: Dict[str, Set[str]] = field(default_factory=dict)
+    loaded_at: float = 0.0
+
+    @classmethod
+    def build(cls, patterns: Iterable[Pattern]) -> "_IndexSnapshot":
+        """Build posting lists from a full pattern load."""
+        snapshot = cls(loaded_at=time.monotonic())
+
+        for pattern in sorted(patterns, key=_rank_key):
+            snapshot.patterns[pattern.pattern_id] = pattern
+            snapshot.by_group.setdefault(pattern.group_id, []).append(pattern)
+            snapshot.by_group_category.setdefault(
+                (pattern.group_id, pattern.category), []
+            ).append(pattern)
+            for tag in pattern.tags or ():
+                snapshot.by_tag.setdefault(tag, set()).add(pattern.pattern_id)
+
+        return snapshot
+
+    def with_updates(
+        self,
+        records: Iterable[Dict[str, Any]]
+    ) -> Tuple["_IndexSnapshot", bool]:
+        """
+        Copy the snapshot with new success_rate/times_used values.
+
+        Only the posting lists holding a changed pattern are re-sorted;
+        the others are shared with this snapshot.
+
+        Returns:
+            Tuple of (updated snapshot, whether a record named a pattern
+            not indexed under its group)
+        """
+        changed: Dict[str, Pattern] = {}
+        unknown = False
+        for record in records:
+            current = self.patterns.get(record['pattern_id'])
+            if current is None or current.group_id != record.get('group_id'):
+                unknown = True
+                continue
+            changed[current.pattern_id] = replace(
+                current,
+                success_rate=record.get('success_rate') or 0.0,
+                times_used=record.get('times_used') or 0
+            )
+
+        if not changed:
+            return self, unknown
+
+        def resort(posting: List[Pattern]) -> List[Pattern]:
+            return sorted((changed.get(p.pattern_id, p) for p in posting), key=_rank_key)
+
+        by_group = dict(self.by_group)
+        for group_id in {p.group_id for p in changed.values()}:
+            by_group[group_id] = resort(self.by_group[group_id])
+
+        by_group_category = dict(self.by_group_category)
+        for key in {(p.group_id, p.category) for p in changed.values()}:
+            by_group_category[key] = resort(self.by_group_category[key])
+
+        return replace(
+            self,
+            patterns={**self.patterns, **changed},
+            by_group=by_group,
+            by_group_category=by_group_category
+        ), unknown
+
+
+class PatternIndex:
+    """
+    In-process inverted index over the pattern library.
+
+    Queries never touch Neo4j. query() returns None while the index is
+    cold (never loaded) or invalidated by a pattern write, and the caller
+    runs its Cypher query instead. Snapshots older than the refresh
+    interval keep being served while a background refresh runs.
+    """
+
+    REFRESH_INTERVAL_SECONDS = 300
+
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        refresh_interval_seconds: float = REFRESH_INTERVAL_SECONDS
+    ):
+        """
+        Initialize the pattern index (cold until refresh() is called).
+
+        Args:
+            client: Neo4j async client used to load patterns
+            refresh_interval_seconds: Age after which a background refresh starts
+        """
+        self._client = client
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._snapshot: Optional[_IndexSnapshot] = None
+        self._stale = False
+        self._generation = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._updates_during_load: List[Dict[str, Any]] = []
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether queries are currently answered from memory."""
+        return self._snapshot is not None and not self._stale
+
+    @property
+    def size(self) -> int:
+        """Number of indexed patterns."""
+        return len(self._snapshot.patterns) if self._snapshot else 0
+
+    def query(self, query: PatternQuery) -> Optional[List[Pattern]]:
+        """
+        Answer a PatternQuery from memory.
+
+        Args:
+            query: PatternQuery with filter parameters
+
+        Returns:
+            Matching patterns in rank order, or None if the index is cold
+            or the query needs fulltext search
+        """
+        snapshot = self._snapshot
+        if snapshot is None or self._stale or query.search_text:
+            return None
+
+        if time.monotonic() - snapshot.loaded_at > self._refresh_interval_seconds:
+            self._schedule_refresh()
+
+        groups = [query.group_id]
+        if query.group_id != GLOBAL_GROUP_ID:
+            groups.append(GLOBAL_GROUP_ID)
+
+        if query.category:
+            postings = [snapshot.by_group_category.get((g, query.category), []) for g in groups]
+        else:
+            postings = [snapshot.by_group.get(g, []) for g in groups]
+
+        tag_ids: Optional[Set[str]] = None
+        if query.tags:
+            tag_ids = set().union(*(snapshot.by_tag.get(tag, ()) for tag in query.tags))
+            if not tag_ids:
+                return []
+
+            # Few tagged patterns: intersect from the tag side instead
+            if len(tag_ids) < sum(len(p) for p in postings):
+                candidates = [
+                    snapshot.patterns[pid] for pid in tag_ids
+                    if snapshot.patterns[pid].group_id in groups
+                    and (not query.category or snapshot.patterns[pid].category == query.category)
+                ]
+                postings = [sorted(candidates, key=_rank_key)]
+                tag_ids = None
+
+        # Resume after the cursor position without walking earlier pages
+        if query.cursor:
+            rate, used, pattern_id = decode_pattern_cursor(query.cursor)
+            after = (-(rate or 0.0), -(used or 0), pattern_id)
+            postings = [
+                _tail(posting, _bisect_after(posting, after))
+                for posting in postings
+            ]
+
+        to_skip = query.offset
+        results: List[Pattern] = []
+
+        for pattern in heapq.merge(*postings, key=_rank_key):
+            # Postings are sorted by success_rate, so nothing later can match
+            if (pattern.success_rate or 0.0) < query.min_success_rate:
+                break
+            if tag_ids is not None and pattern.pattern_id not in tag_ids:
+                continue
+            if to_skip:
+                to_skip -= 1
+                continue
+
+            results.append(pattern)
+            if len(results) >= query.limit:
+                break
+
+        return results
+
+    async def refresh(self) -> int:
+        """
+        Reload all patterns from Neo4j and swap in a new snapshot.
+
+        Concurrent callers share one load.
+
+        Returns:
+            Number of patterns indexed
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._load())
+            self._refresh_task.add_done_callback(self._refresh_finished)
+        return await asyncio.shield(self._refresh_task)
+
+    def invalidate(self) -> None:
+        """
+        Mark the index stale after a pattern write.
+
+        Queries fall back to Cypher until a refresh started after the
+        write completes. A cold index stays cold.
+        """
+        self._generation += 1
+        if self._snapshot is None:
+            return
+        self._stale = True
+        self._schedule_refresh()
+
+    def update_patterns(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Apply usage-statistic changes without reloading the index.
+
+        Records carry pattern_id, group_id, success_rate and times_used
+        (as returned by the usage flush). A record for a pattern not
+        indexed under its group means the library changed shape, so the
+        index is invalidated instead; use invalidate() for such writes.
+
+        Args:
+            records: Current values of changed patterns
+
+        Returns:
+            Number of records applied (0 while the index is cold)
+        """
+        records = list(records)
+        if not records:
+            return 0
+
+        # A load in flight may have read the old values; re-apply after it
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._updates_during_load.extend(records)
+
+        if self._snapshot is None:
+            return 0
+
+        self._snapshot, unknown = self._snapshot.with_updates(records)
+        if unknown:
+            self.invalidate()
+        return len(records)
+
+    async def _load(self) -> int:
+        """Load every pattern and build a new snapshot."""
+        generation = self._generation
+
+        # The index spans tenants; query() applies the group_id filter
+        records = await self._client.execute_query(
+            "MATCH (p:Pattern) RETURN p",
+            {},
+            validate_group_id=False
+        )
+        patterns = [p for p in (parse_pattern(r.get('p', {})) for r in records) if p]
+
+        snapshot = _IndexSnapshot.build(patterns)
+        if self._updates_during_load:
+            snapshot, _ = snapshot.with_updates(self._updates_during_load)
+            self._updates_during_load = []
+        self._snapshot = snapshot
+        if generation == self._generation:
+            self._stale = False
+
+        logger.info(f"Pattern index refreshed: {len(patterns)} patterns")
+        return len(patterns)
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh if none is running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_task = loop.create_task(self._load())
+        self._refresh_task.add_done_callback(self._refresh_finished)
+
+    def _refresh_finished(self, task: asyncio.Task) -> None:
+        """Log failures and catch up on writes made during the load."""
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning(f"Pattern index refresh failed: {task.exception()}")
+            return
+        if self._stale:
+            self._schedule_refresh()
+
+
+# Singleton instance
+_pattern_index: Optional[PatternIndex] = None
+
+
+def get_pattern_index(client: Neo4jAsyncClient) -> PatternIndex:
+    """Get or create the global pattern index instance."""
+    global _pattern_index
+    if _pattern_index is None:
+        _pattern_index = PatternIndex(client)
+    return _pattern_index
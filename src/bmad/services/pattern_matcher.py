@@ -3,8 +3,14 @@ Pattern Library Query Service
 
 This module provides methods for querying and managing the pattern library.
 - Query patterns by category, tags, and success rate
-- Rank patterns by success_rate and times_used
+- Rank patterns by success_rate and times_used; top patterns come from
+  materialized PatternRanking nodes when the in-memory index is cold
 - Promote patterns to global scope
+- Keyset (cursor) pagination on (success_rate, times_used, pattern_id)
+  with an optional cached total count
+- Text search via the pattern_fulltext index with prefix/fuzzy terms,
+  ranked by relevance blended with success_rate
+- Similar-pattern lookup from the local hashed n-gram similarity index
 - Multi-tenant isolation via group_id
 
 Author: Brooks (BMAD Dev Agent)
@@ -13,16 +19,47 @@ Story: 2-2-manage-pattern-library
 """
 
 import logging
+import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient, SecurityError
+from src.bmad.core.cache_backends import register_cache_type
+from src.bmad.core.cache_manager import (
+    AsyncCacheManager,
+    get_pattern_cache,
+    group_tag,
+    pattern_invalidation_tags
+)
+from src.bmad.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.bmad.core.tenant_filter import GLOBAL_GROUP_ID, tenant_filter
+from src.bmad.services.pattern_usage import (
+    PatternUsageAccumulator,
+    get_pattern_usage_accumulator
+)
+from src.bmad.services.similarity_index import (
+    PATTERN_KIND,
+    SimilarityIndex,
+    get_similarity_index
+)
+
+if TYPE_CHECKING:
+    from src.bmad.services.pattern_index import PatternIndex
+    from src.bmad.services.pattern_ranking import PatternRankings
 
 logger = logging.getLogger(__name__)
 
+FULLTEXT_INDEX = "pattern_fulltext"
+PATTERN_CURSOR_KIND = "patterns"
 
+# Fuzzy matching on very short terms matches nearly everything
+_FUZZY_MIN_TERM_LENGTH = 4
+_SEARCH_TERM = re.compile(r"\w+")
+
+
+@register_cache_type
 @dataclass
 class Pattern:
     """Represents a reusable solution pattern."""
@@ -51,15 +88,25 @@ class PatternQuery:
     search_text: Optional[str] = None
     limit: int = 10
     offset: int = 0
+    cursor: Optional[str] = None  # next_cursor of the previous page
+    include_total: bool = False
 
 
 @dataclass
 class PatternQueryResult:
     """Result of a pattern query."""
     patterns: List[Pattern]
-    total_count: int
+    total_count: Optional[int]  # Only computed when include_total is set
     latency_ms: float
     query: PatternQuery
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class SimilarPattern:
+    """A pattern returned by similarity search."""
+    pattern: Pattern
+    similarity: float
 
 
 @dataclass
@@ -88,15 +135,43 @@ class PatternMatcher:
     MAX_LIMIT = 50
     PROMOTION_MIN_USES = 3
     PROMOTION_MIN_SUCCESS_RATE = 0.8
+    SEARCH_RELEVANCE_WEIGHT = 0.7  # vs. success_rate when ranking search hits
 
-    def __init__(self, client: Neo4jAsyncClient):
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        cache: Optional[AsyncCacheManager] = None,
+        index: Optional["PatternIndex"] = None,
+        similarity: Optional[SimilarityIndex] = None,
+        usage: Optional[PatternUsageAccumulator] = None,
+        rankings: Optional["PatternRankings"] = None
+    ):
         """
         Initialize the pattern matcher.
 
         Args:
             client: Neo4j async client for database operations
+            cache: Pattern query cache to invalidate on writes
+                   (uses global pattern cache if not provided)
+            index: In-memory pattern index answering queries when warm
+                   (uses global pattern index if not provided)
+            similarity: Local text similarity index
+                        (uses global similarity index if not provided)
+            usage: Write-behind accumulator for usage statistics
+                   (uses global accumulator if not provided)
+            rankings: Materialized top-pattern rankings
+                      (uses global rankings if not provided)
         """
+        # Imported here: these modules depend on the Pattern types above
+        from src.bmad.services.pattern_index import get_pattern_index
+        from src.bmad.services.pattern_ranking import get_pattern_rankings
+
         self._client = client
+        self._cache = cache or get_pattern_cache()
+        self._index = index or get_pattern_index(client)
+        self._similarity = similarity or get_similarity_index(client)
+        self._usage = usage or get_pattern_usage_accumulator(client)
+        self._rankings = rankings or get_pattern_rankings(client)
 
     async def query_patterns(
         self,
@@ -105,33 +180,103 @@ class PatternMatcher:
         """
         Query patterns with filtering and ranking.
 
+        Pass the previous result's next_cursor as query.cursor to get the
+        next page; each page costs the same as the first. Text searches
+        are ranked by relevance and paginate with offset only.
+
         Args:
             query: PatternQuery with filter parameters
 
         Returns:
             PatternQueryResult with matching patterns
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+            ValueError: If a cursor is combined with search_text
         """
         start_time = time.perf_counter()
 
         # Enforce max limit
         query.limit = min(query.limit, self.MAX_LIMIT)
 
-        # Build the Cypher query
-        cypher, params = self._build_query(query)
+        if query.cursor and query.search_text:
+            raise ValueError("Cursor pagination is not supported for text search; use offset")
+
+        # Text with no searchable terms (e.g. only punctuation) matches nothing
+        if query.search_text and not has_search_terms(query.search_text):
+            return PatternQueryResult(
+                patterns=[],
+                total_count=0 if query.include_total else None,
+                latency_ms=round((time.perf_counter() - start_time) * 1000, 2),
+                query=query
+            )
+
+        # One extra row tells whether another page exists
+        page_query = replace(query, limit=query.limit + 1)
+
+        # Answer from the in-memory index; fall back to Cypher while it is cold
+        patterns = self._index.query(page_query)
 
-        # Execute query
-        records = await self._client.execute_query(cypher, params)
+        if patterns is None:
+            cypher, params = self._build_query(query)
+            records = await self._client.execute_query(cypher, params)
+            patterns = self._parse_pattern_results(records)
 
-        # Parse results
-        patterns = self._parse_pattern_results(records)
+        next_cursor = None
+        if len(patterns) > query.limit:
+            patterns = patterns[:query.limit]
+            if not query.search_text:
+                next_cursor = encode_pattern_cursor(patterns[-1])
+
+        total_count = await self.count_patterns(query) if query.include_total else None
 
         latency_ms = (time.perf_counter() - start_time) * 1000
 
         return PatternQueryResult(
             patterns=patterns,
-            total_count=len(patterns),  # For now, return matched count
+            total_count=total_count,
             latency_ms=round(latency_ms, 2),
-            query=query
+            query=query,
+            next_cursor=next_cursor
+        )
+
+    async def count_patterns(self, query: PatternQuery) -> int:
+        """
+        Count all patterns matching the query filters (ignoring pagination).
+
+        Counts are cached in the pattern cache and evicted with the
+        group's other result sets, so repeated page requests do not
+        recount.
+
+        Args:
+            query: PatternQuery with filter parameters
+
+        Returns:
+            Number of matching patterns
+        """
+        if query.search_text and not has_search_terms(query.search_text):
+            return 0
+
+        key = "count:" + "|".join([
+            query.group_id,
+            query.category or "",
+            ",".join(sorted(query.tags or [])),
+            str(query.min_success_rate),
+            query.search_text or ""
+        ])
+
+        async def load() -> int:
+            cypher, params = self._build_match(query)
+            cypher += """
+        RETURN count(p) as total
+        """
+            records = await self._client.execute_query(cypher, params)
+            return records[0]['total'] if records else 0
+
+        return await self._cache.get_or_compute(
+            key,
+            load,
+            tags_for=lambda _: [group_tag(query.group_id), group_tag(GLOBAL_GROUP_ID)]
         )
 
     async def get_pattern_by_id(
@@ -149,10 +294,10 @@ class PatternMatcher:
         Returns:
             Pattern if found and accessible, None otherwise
         """
-        query = """
+        query = f"""
         MATCH (p:Pattern)
         WHERE p.pattern_id = $pattern_id
-          AND (p.group_id = $group_id OR p.group_id = 'global-coding-skills')
+          AND {tenant_filter("p")}
         RETURN p
         """
 
@@ -175,6 +320,10 @@ class PatternMatcher:
         """
         Get top patterns ranked by success_rate and times_used.
 
+        Served from the in-memory index when warm, else from the
+        materialized PatternRanking nodes; the full ranking query only
+        runs when neither is available.
+
         Args:
             group_id: Project group for access control
             category: Optional category filter
@@ -190,6 +339,19 @@ class PatternMatcher:
             limit=min(limit, self.MAX_LIMIT)
         )
 
+        patterns = self._index.query(query_obj)
+        if patterns is not None:
+            return patterns
+
+        patterns = await self._rankings.top_patterns(
+            group_id,
+            category=category,
+            min_success_rate=query_obj.min_success_rate,
+            limit=query_obj.limit
+        )
+        if patterns is not None:
+            return patterns
+
         result = await self.query_patterns(query_obj)
         return result.patterns
 
@@ -200,7 +362,11 @@ class PatternMatcher:
         limit: int = 10
     ) -> List[Pattern]:
         """
-        Search patterns by text in name or description.
+        Search patterns by text in name, description or tags.
+
+        Each search term matches exactly, as a prefix, or (for longer
+        terms) within one edit; hits are ranked by fulltext relevance
+        blended with success_rate.
 
         Args:
             group_id: Project group for access control
@@ -219,6 +385,56 @@ class PatternMatcher:
         result = await self.query_patterns(query_obj)
         return result.patterns
 
+    async def find_similar_patterns(
+        self,
+        text: str,
+        group_id: str,
+        k: int = 10
+    ) -> List[SimilarPattern]:
+        """
+        Find the patterns whose name and description read most like text.
+
+        Similarity is cosine over locally computed hashed n-gram vectors,
+        so near-paraphrases match without sharing an exact category, tag
+        or substring.
+
+        Args:
+            text: Free text (e.g. an error message or task description)
+            group_id: Project group for access control
+            k: Maximum results
+
+        Returns:
+            Similar patterns, most similar first
+        """
+        await self._similarity.ensure_loaded()
+
+        hits = self._similarity.search(
+            text,
+            [group_id, GLOBAL_GROUP_ID],
+            k=min(k, self.MAX_LIMIT),
+            kind=PATTERN_KIND
+        )
+        if not hits:
+            return []
+
+        records = await self._client.execute_query(
+            f"""
+            MATCH (p:Pattern)
+            WHERE p.pattern_id IN $pattern_ids
+              AND {tenant_filter("p")}
+            RETURN p
+            """,
+            {"pattern_ids": [pattern_id for pattern_id, _ in hits], "group_id": group_id}
+        )
+        patterns = {p.pattern_id: p for p in self._parse_pattern_results(records)}
+
+        # Patterns deleted since the index was built are skipped
+        return [
+            SimilarPattern(pattern=patterns[pattern_id], similarity=score)
+            for pattern_id, score in hits
+            if pattern_id in patterns
+        ]
+
     async def promote_to_global(
         self,
         pattern_id: str,
@@ -240,7 +456,7 @@ class PatternMatcher:
         check_query = """
         MATCH (p:Pattern {pattern_id: $pattern_id, group_id: $group_id})
         RETURN p.times_used as times_used, p.success_rate as success_rate,
-               p.scope as scope, p.name as name
+               p.scope as scope, p.name as name, p.category as category
         """
 
         results = await self._client.execute_query(
@@ -313,6 +529,14 @@ class PatternMatcher:
 
         logger.info(f"Pattern {pattern_data['name']} promoted to global scope")
 
+        # The pattern is now visible to every group's result sets
+        self._index.invalidate()
+        self._similarity.set_group(pattern_id, GLOBAL_GROUP_ID)
+        await self._cache.invalidate_tags(pattern_invalidation_tags(
+            [pattern_id], [group_id, GLOBAL_GROUP_ID]
+        ))
+        await self._update_rankings_after_promotion(pattern_id, group_id, pattern_data)
+
         return PatternPromotionResult(
             pattern_id=pattern_id,
             old_scope=old_scope,
@@ -326,71 +550,85 @@ class PatternMatcher:
         pattern_id: str,
         group_id: str,
         successful: bool
-    ) -> Optional[Pattern]:
+    ) -> None:
         """
-        Record that a pattern was used and update statistics.
+        Record that a pattern was used.
+
+        The use is tallied in process and written with other pending uses
+        by the usage accumulator (times_used, success/failure counts,
+        last_used), so hot patterns are not written once per use.
+        success_rate is recomputed by the effectiveness job. Cached
+        results for the pattern are invalidated when the tally is flushed.
+
+        Outside the API (whose lifespan runs the flush loop), await
+        close() before exiting so pending uses are written.
 
         Args:
             pattern_id: ID of the pattern used
             group_id: Project group
             successful: Whether the use was successful
-
-        Returns:
-            Updated pattern or None if not found
-        """
-        query = """
-        MATCH (p:Pattern)
-        WHERE p.pattern_id = $pattern_id
-          AND (p.group_id = $group_id OR p.group_id = 'global-coding-skills')
-        SET p.times_used = coalesce(p.times_used, 0) + 1,
-            p.last_used = datetime()
-        WITH p
-        CALL {
-            WITH p
-            MATCH (p)-[:HAS_OUTCOME*1..2]->(o:Outcome)
-            WHERE o.status = 'Success'
-            RETURN count(o) as success_count
-            UNION
-            WITH p
-            MATCH (p)-[:HAS_OUTCOME*1..2]->(o:Outcome)
-            RETURN count(o) as success_count
-        }
-        WITH p, success_count
-        SET p.success_rate = case
-            when p.times_used > 0 then (success_count * 1.0 / p.times_used)
-            else p.success_rate
-        end
-        RETURN p
         """
+        self._usage.record(pattern_id, group_id, successful)
 
-        # Simplified success rate update
-        simple_query = """
-        MATCH (p:Pattern)
-        WHERE p.pattern_id = $pattern_id
-          AND (p.group_id = $group_id OR p.group_id = 'global-coding-skills')
-        SET p.times_used = coalesce(p.times_used, 0) + 1,
-            p.last_used = datetime()
-        RETURN p
+    async def close(self) -> None:
         """
+        Write pattern uses still pending in process.
 
-        await self._client.execute_write(
-            simple_query,
-            {"pattern_id": pattern_id, "group_id": group_id}
-        )
+        When the accumulator's flush loop is not running (CLI and batch
+        processes), it is drained with stop(), which spills tallies that
+        cannot be written; otherwise pending tallies are flushed now.
+        """
+        if self._usage.is_running:
+            await self._usage.flush()
+        else:
+            await self._usage.stop()
 
-        return await self.get_pattern_by_id(pattern_id, group_id)
+    async def _update_rankings_after_promotion(
+        self,
+        pattern_id: str,
+        group_id: str,
+        pattern_data: Dict[str, Any]
+    ) -> None:
+        """Move a promoted pattern from its group's rankings to the global ones."""
+        from src.bmad.services.pattern_ranking import RankingEntry
+
+        values = {
+            "pattern_id": pattern_id,
+            "category": pattern_data.get('category'),
+            "success_rate": pattern_data.get('success_rate'),
+            "times_used": pattern_data.get('times_used')
+        }
+        try:
+            await self._rankings.update_patterns(
+                [RankingEntry.from_record({**values, "group_id": GLOBAL_GROUP_ID})],
+                removed=[RankingEntry.from_record({**values, "group_id": group_id})]
+            )
+        except Exception as e:
+            # The next effectiveness rebuild repairs the rankings
+            logger.warning(f"Pattern ranking update after promotion failed: {e}")
 
-    def _build_query(self, query: PatternQuery) -> tuple[str, Dict[str, Any]]:
-        """Build the Cypher query from PatternQuery."""
+    def _build_match(self, query: PatternQuery) -> tuple[str, Dict[str, Any]]:
+        """Build the MATCH/WHERE part shared by the page and count queries."""
+        params: Dict[str, Any] = {"group_id": query.group_id}
 
-        # Base match with group access
-        cypher = """
+        # Text search starts from the fulltext index instead of a label scan
+        if query.search_text:
+            search_query = build_fulltext_query(query.search_text)
+            if search_query is None:
+                raise ValueError("search_text has no searchable terms")
+            cypher = f"""
+        CALL db.index.fulltext.queryNodes('{FULLTEXT_INDEX}', $search_text)
+        YIELD node AS p, score
+        WHERE {tenant_filter("p")}
+        """
+            params["search_text"] = search_query
+        else:
+            # Base match with group access
+            cypher = f"""
         MATCH (p:Pattern)
-        WHERE p.group_id = $group_id OR p.group_id = 'global-coding-skills'
+        WHERE {tenant_filter("p")}
         """
 
-        params = {"group_id": query.group_id}
-
         # Category filter
         if query.category:
             cypher += """
@@ -412,20 +650,44 @@ class PatternMatcher:
             """
             params["tags"] = query.tags
 
-        # Full-text search
-        if query.search_text:
+        return cypher, params
+
+    def _build_query(self, query: PatternQuery) -> tuple[str, Dict[str, Any]]:
+        """Build the Cypher query from PatternQuery (one row past the page)."""
+        cypher, params = self._build_match(query)
+
+        # Ordering and pagination
+        if "search_text" in params:
+            # Lucene scores are unbounded; score / (score + 1) maps them to [0, 1)
             cypher += """
-            AND (toLower(p.name) CONTAINS toLower($search_text)
-                 OR toLower(p.description) CONTAINS toLower($search_text))
+        RETURN p, score
+        ORDER BY $relevance_weight * score / (score + 1.0)
+                 + (1 - $relevance_weight) * coalesce(p.success_rate, 0.0) DESC,
+                 p.times_used DESC
+        SKIP $offset
+        LIMIT $limit + 1
+        """
+            params["relevance_weight"] = self.SEARCH_RELEVANCE_WEIGHT
+        else:
+            # Keyset: resume strictly after the last row of the previous page
+            if query.cursor:
+                after_rate, after_used, after_id = decode_pattern_cursor(query.cursor)
+                cypher += """
+            AND (p.success_rate < $after_success_rate
+                 OR (p.success_rate = $after_success_rate
+                     AND (p.times_used < $after_times_used
+                          OR (p.times_used = $after_times_used
+                              AND p.pattern_id > $after_pattern_id))))
             """
-            params["search_text"] = query.search_text
+                params["after_success_rate"] = after_rate
+                params["after_times_used"] = after_used
+                params["after_pattern_id"] = after_id
 
-        # Ordering and pagination
-        cypher += """
+            cypher += """
         RETURN p
-        ORDER BY p.success_rate DESC, p.times_used DESC
+        ORDER BY p.success_rate DESC, p.times_used DESC, p.pattern_id
         SKIP $offset
-        LIMIT $limit
+        LIMIT $limit + 1
         """
         params["offset"] = query.offset
         params["limit"] = query.limit
@@ -444,22 +706,75 @@ class PatternMatcher:
 
     def _parse_single_pattern(self, p: Dict[str, Any]) -> Optional[Pattern]:
         """Parse a single pattern from Neo4j result."""
-        if not p:
-            return None
+        return parse_pattern(p)
 
-        return Pattern(
-            pattern_id=p.get('pattern_id', ''),
-            name=p.get('name', ''),
-            description=p.get('description', ''),
-            category=p.get('category', ''),
-            tags=p.get('tags', []),
-            success_rate=p.get('success_rate', 0.0),
-            times_used=p.get('times_used', 0),
-            group_id=p.get('group_id', 'global-coding-skills'),
-            scope=p.get('scope', 'global'),
-            confidence_score=p.get('confidence_score', 0.5),
-            metadata=p.get('metadata', {})
-        )
+
+def encode_pattern_cursor(pattern: Pattern) -> str:
+    """Cursor positioned after pattern in (success_rate, times_used, pattern_id) order."""
+    return encode_cursor(
+        PATTERN_CURSOR_KIND,
+        [pattern.success_rate, pattern.times_used, pattern.pattern_id]
+    )
+
+
+def decode_pattern_cursor(cursor: str) -> Tuple[float, int, str]:
+    """
+    Decode a cursor from encode_pattern_cursor().
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    values = decode_cursor(cursor, PATTERN_CURSOR_KIND)
+    if len(values) != 3:
+        raise InvalidCursorError("Pattern cursor must have three sort values")
+    success_rate, times_used, pattern_id = values
+    return success_rate, times_used, pattern_id
+
+
+def build_fulltext_query(search_text: str) -> Optional[str]:
+    """
+    Build a Lucene query for the pattern fulltext index.
+
+    Every term must match, either exactly (boosted), as a prefix, or for
+    terms of _FUZZY_MIN_TERM_LENGTH or more characters within one edit.
+    Lucene syntax in the input is dropped, only word characters are kept.
+
+    Returns:
+        Lucene query string, or None if the text has no searchable terms
+    """
+    clauses = []
+    for term in _SEARCH_TERM.findall(search_text.lower()):
+        options = [f"{term}^2", f"{term}*"]
+        if len(term) >= _FUZZY_MIN_TERM_LENGTH:
+            options.append(f"{term}~1")
+        clauses.append(f"({' OR '.join(options)})")
+
+    return " AND ".join(clauses) or None
+
+
+def has_search_terms(search_text: str) -> bool:
+    """Whether build_fulltext_query() finds any searchable term in the text."""
+    return _SEARCH_TERM.search(search_text) is not None
+
+
+def parse_pattern(p: Dict[str, Any]) -> Optional[Pattern]:
+    """Parse a Pattern from a Neo4j node property map."""
+    if not p:
+        return None
+
+    return Pattern(
+        pattern_id=p.get('pattern_id', ''),
+        name=p.get('name', ''),
+        description=p.get('description', ''),
+        category=p.get('category', ''),
+        tags=p.get('tags', []),
+        success_rate=p.get('success_rate', 0.0),
+        times_used=p.get('times_used', 0),
+        group_id=p.get('group_id', 'global-coding-skills'),
+        scope=p.get('scope', 'global'),
+        confidence_score=p.get('confidence_score', 0.5),
+        metadata=p.get('metadata', {})
+    )
 
 
 async def main():
@@ -20,8 +20,17 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
-from src.bmad.core.cache_manager import AsyncCacheManager, get_pattern_cache, CacheStats
+from src.bmad.core.tenant_filter import GLOBAL_GROUP_ID, tenant_filter
+from src.bmad.core.cache_manager import (
+    AsyncCacheManager,
+    CacheStats,
+    get_pattern_cache,
+    group_tag,
+    pattern_invalidation_tags,
+    pattern_tag
+)
 from src.bmad.services.pattern_matcher import Pattern, PatternQuery
+from src.bmad.services.pattern_index import PatternIndex, get_pattern_index
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +67,7 @@ class PatternQueryEngine:
 
     Features:
     - Sub-100ms queries via LRU caching
+    - In-memory pattern index with Cypher fallback while cold
     - 1-hour TTL for cached patterns
     - Performance metrics tracking
     - Support for category, tags, and success_rate filtering
@@ -71,7 +81,8 @@ class PatternQueryEngine:
     def __init__(
         self,
         client: Neo4jAsyncClient,
-        cache: Optional[AsyncCacheManager] = None
+        cache: Optional[AsyncCacheManager] = None,
+        index: Optional[PatternIndex] = None
     ):
         """
         Initialize the pattern query engine.
@@ -79,9 +90,11 @@ class PatternQueryEngine:
         Args:
             client: Neo4j async client
             cache: Optional cache manager (uses global pattern cache if not provided)
+            index: Optional in-memory pattern index (uses global pattern index if not provided)
         """
         self._client = client
         self._cache = cache or get_pattern_cache()
+        self._index = index or get_pattern_index(client)
         self._query_history: List[QueryMetrics] = []
         self._history_lock = threading.RLock()
         self._slow_query_count = 0
@@ -128,17 +141,23 @@ class PatternQueryEngine:
             group_id, category, tags, min_success_rate, limit
         )
 
-        # Try cache first
+        # Try cache first; concurrent misses on one key share a single load
         if use_cache:
-            cached_result = await self._cache.get(query_hash)
-            if cached_result is not None:
-                cache_hit = True
-                result = cached_result
-            else:
-                result = await self._execute_query(
+            loaded = False
+
+            async def load() -> List[Pattern]:
+                nonlocal loaded
+                loaded = True
+                return await self._execute_query(
                     group_id, category, tags, min_success_rate, limit
                 )
-                await self._cache.set(query_hash, result)
+
+            result = await self._cache.get_or_compute(
+                query_hash,
+                load,
+                tags_for=lambda patterns: self._result_tags(group_id, patterns)
+            )
+            cache_hit = not loaded
         else:
             result = await self._execute_query(
                 group_id, category, tags, min_success_rate, limit
@@ -182,14 +201,24 @@ class PatternQueryEngine:
         min_success_rate: float,
         limit: int
     ) -> List[Pattern]:
-        """Execute the actual Neo4j query."""
+        """Execute the query against the pattern index, or Neo4j if it is cold."""
         # Enforce max limit
         limit = min(limit, 50)
 
+        indexed = self._index.query(PatternQuery(
+            group_id=group_id,
+            category=category,
+            tags=tags,
+            min_success_rate=min_success_rate,
+            limit=limit
+        ))
+        if indexed is not None:
+            return indexed
+
         # Build optimized Cypher query
-        cypher = """
+        cypher = f"""
         MATCH (p:Pattern)
-        WHERE p.group_id = $group_id OR p.group_id = 'global-coding-skills'
+        WHERE {tenant_filter("p")}
         """
 
         params = {"group_id": group_id}
@@ -219,6 +248,12 @@ class PatternQueryEngine:
 
         return self._parse_pattern_results(records)
 
+    def _result_tags(self, group_id: str, patterns: List[Pattern]) -> List[str]:
+        """Invalidation tags for a cached result set."""
+        tags = [group_tag(group_id), group_tag(GLOBAL_GROUP_ID)]
+        tags.extend(pattern_tag(p.pattern_id) for p in patterns)
+        return tags
+
     def _parse_pattern_results(self, records: List[Dict[str, Any]]) -> List[Pattern]:
         """Parse Neo4j records to Pattern objects."""
         patterns = []
@@ -291,27 +326,42 @@ class PatternQueryEngine:
 
         return report
 
-    async def invalidate_cache(self, pattern_id: Optional[str] = None) -> int:
+    async def invalidate_cache(
+        self,
+        pattern_id: Optional[str] = None,
+        group_id: Optional[str] = None
+    ) -> int:
         """
         Invalidate cached pattern queries.
 
+        With a pattern_id and/or group_id, only the result sets containing
+        that pattern or reading that group are evicted. Without either,
+        expired entries are dropped and query history is reset.
+
         Args:
             pattern_id: Optional specific pattern to invalidate
+            group_id: Optional project group to invalidate
 
         Returns:
             Number of entries invalidated
         """
+        if pattern_id or group_id:
+            count = await self._cache.invalidate_tags(pattern_invalidation_tags(
+                [pattern_id] if pattern_id else [],
+                [group_id] if group_id else []
+            ))
+            logger.info(f"Cache invalidated for pattern update: {count} entries")
+            return count
+
         count = await self._cache.invalidate_expired()
         with self._history_lock:
             self._query_history.clear()
         self._slow_query_count = 0
-        if pattern_id:
-            logger.info(f"Cache invalidated for pattern update")
         return count
 
     def get_cache_stats(self) -> CacheStats:
         """Get current cache statistics."""
-        return self._cache._cache.get_stats()
+        return self._cache.stats_snapshot()
 
     async def check_performance_compliance(self) -> Dict[str, Any]:
         """
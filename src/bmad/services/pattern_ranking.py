@@ -0,0 +1,364 @@
+"""
+Materialized Pattern Rankings
+
+This module keeps the top patterns per (group_id, category) precomputed in
+PatternRanking nodes, so "top patterns" is a keyed lookup instead of an
+ORDER BY over every group and global pattern.
+- One ranking per group across all categories and one per (group, category)
+- Each ranking holds the RANKING_SIZE best pattern IDs by
+  (success_rate, times_used) with the scores they were ranked on
+- Full rebuild after the daily effectiveness update
+- Incremental updates for single-pattern changes (usage flushes, promotion);
+  a ranking whose tail becomes uncertain is recomputed from Neo4j alone
+
+Rankings only choose the candidates: top_patterns() reads the live Pattern
+nodes and orders them by their current values.
+
+Usage:
+    rankings = get_pattern_rankings(client)
+    await rankings.rebuild()
+    patterns = await rankings.top_patterns("faith-meats", category="testing", limit=10)
+    if patterns is None:
+        ...  # not materialized: run the ranking query instead
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 4-2-track-pattern-effectiveness-daily
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import GLOBAL_GROUP_ID, tenant_filter
+from src.bmad.services.pattern_matcher import Pattern, parse_pattern
+
+logger = logging.getLogger(__name__)
+
+ALL_CATEGORIES = "*"
+
+
+def ranking_key(group_id: str, category: Optional[str] = None) -> str:
+    """Key of the ranking for a group, optionally narrowed to one category."""
+    return f"{group_id}|{category or ALL_CATEGORIES}"
+
+
+@dataclass(frozen=True)
+class RankingEntry:
+    """A pattern's position-determining values."""
+    pattern_id: str
+    group_id: str
+    category: Optional[str]
+    success_rate: float
+    times_used: int
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "RankingEntry":
+        """Build from a record with pattern_id, group_id, category, success_rate, times_used."""
+        return cls(
+            pattern_id=record['pattern_id'],
+            group_id=record['group_id'],
+            category=record.get('category'),
+            success_rate=float(record.get('success_rate') or 0.0),
+            times_used=int(record.get('times_used') or 0)
+        )
+
+    @property
+    def rank(self) -> Tuple[float, int, str]:
+        """Sort key matching ORDER BY success_rate DESC, times_used DESC, pattern_id."""
+        return (-self.success_rate, -self.times_used, self.pattern_id)
+
+    @property
+    def ranking_keys(self) -> List[str]:
+        """Rankings this pattern belongs to."""
+        keys = [ranking_key(self.group_id)]
+        if self.category:
+            keys.append(ranking_key(self.group_id, self.category))
+        return keys
+
+
+class PatternRankings:
+    """
+    Precomputed top-K pattern rankings stored in Neo4j.
+
+    Rankings are shared by every process using the database. Concurrent
+    incremental updates to the same ranking are last-writer-wins; the
+    next rebuild corrects any drift.
+    """
+
+    RANKING_SIZE = 50
+
+    TOP_PATTERNS_QUERY = f"""
+    MATCH (r:PatternRanking)
+    WHERE r.ranking_key IN $ranking_keys
+    WITH collect(r) as rankings
+    WHERE size(rankings) = size($ranking_keys)
+    UNWIND rankings as r
+    UNWIND r.pattern_ids as pattern_id
+    MATCH (p:Pattern {{pattern_id: pattern_id}})
+    WHERE {tenant_filter("p")}
+      AND coalesce(p.success_rate, 0.0) >= $min_success_rate
+    RETURN p
+    ORDER BY coalesce(p.success_rate, 0.0) DESC, coalesce(p.times_used, 0) DESC, p.pattern_id
+    LIMIT $limit
+    """
+
+    WRITE_QUERY = """
+    MERGE (r:PatternRanking {ranking_key: row.ranking_key})
+    SET r.group_id = row.group_id,
+        r.category = row.category,
+        r.pattern_ids = row.pattern_ids,
+        r.success_rates = row.success_rates,
+        r.times_used = row.times_used,
+        r.updated_at = datetime()
+    """
+
+    def __init__(self, client: Neo4jAsyncClient, ranking_size: int = RANKING_SIZE):
+        """
+        Initialize the ranking store.
+
+        Args:
+            client: Neo4j async client
+            ranking_size: Patterns kept per ranking (largest servable limit)
+        """
+        self._client = client
+        self._size = ranking_size
+
+    @property
+    def size(self) -> int:
+        """Patterns kept per ranking."""
+        return self._size
+
+    async def top_patterns(
+        self,
+        group_id: str,
+        category: Optional[str] = None,
+        min_success_rate: float = 0.0,
+        limit: int = 10
+    ) -> Optional[List[Pattern]]:
+        """
+        Get the best patterns visible to a group from the materialized rankings.
+
+        Args:
+            group_id: Project group for access control
+            category: Optional category filter
+            min_success_rate: Minimum success rate
+            limit: Maximum patterns to return (at most the ranking size)
+
+        Returns:
+            Patterns in rank order, or None if the rankings are missing
+            (or hold no qualifying pattern) and the caller should query
+            Neo4j directly
+        """
+        if limit > self._size:
+            return None
+
+        keys = [ranking_key(group_id, category)]
+        if group_id != GLOBAL_GROUP_ID:
+            keys.append(ranking_key(GLOBAL_GROUP_ID, category))
+
+        records = await self._client.execute_query(
+            self.TOP_PATTERNS_QUERY,
+            {
+                "ranking_keys": keys,
+                "group_id": group_id,
+                "min_success_rate": min_success_rate,
+                "limit": limit
+            }
+        )
+
+        patterns = [p for p in (parse_pattern(r.get('p', {})) for r in records) if p]
+        return patterns or None
+
+    async def rebuild(self, group_id: Optional[str] = None) -> int:
+        """
+        Recompute every ranking, or every ranking of one group.
+
+        Args:
+            group_id: Group to rebuild (None for all groups)
+
+        Returns:
+            Number of rankings written
+        """
+        params: Dict[str, Any] = {}
+        query = "MATCH (p:Pattern)"
+        if group_id:
+            query += " WHERE p.group_id = $group_id"
+            params["group_id"] = group_id
+        query += """
+        RETURN p.pattern_id as pattern_id, p.group_id as group_id, p.category as category,
+               p.success_rate as success_rate, p.times_used as times_used
+        """
+
+        by_key: Dict[str, List[RankingEntry]] = {}
+        # A full rebuild spans tenants; each ranking holds one group only
+        async for batch in self._client.stream_query_batches(
+            query, params, validate_group_id=False
+        ):
+            for record in batch:
+                entry = RankingEntry.from_record(record)
+                for key in entry.ranking_keys:
+                    by_key.setdefault(key, []).append(entry)
+
+        rankings = {
+            key: heapq.nsmallest(self._size, entries, key=lambda e: e.rank)
+            for key, entries in by_key.items()
+        }
+        await self._write(rankings)
+
+        # Drop rankings of categories (or groups) that no longer have patterns
+        await self._client.execute_write(
+            """
+            MATCH (r:PatternRanking)
+            WHERE ($group_id IS NULL OR r.group_id = $group_id)
+              AND NOT r.ranking_key IN $ranking_keys
+            DETACH DELETE r
+            """,
+            {"group_id": group_id, "ranking_keys": list(rankings)}
+        )
+
+        logger.info(f"Pattern rankings rebuilt: {len(rankings)} rankings")
+        return len(rankings)
+
+    async def update_patterns(
+        self,
+        entries: Iterable[RankingEntry],
+        removed: Iterable[RankingEntry] = ()
+    ) -> int:
+        """
+        Apply single-pattern changes to the affected rankings.
+
+        A ranking that was full is only certain down to its previous last
+        entry: patterns outside it may outrank an entry that moved down.
+        Such rankings, and rankings never built, are recomputed from Neo4j.
+
+        Args:
+            entries: Current values of changed patterns
+            removed: Previous positions of patterns that left a group
+                     (e.g. promoted to global)
+
+        Returns:
+            Number of rankings written
+        """
+        entries = list(entries)
+        removed = list(removed)
+        touched_by_key: Dict[str, Set[str]] = {}
+        for entry in entries + removed:
+            for key in entry.ranking_keys:
+                touched_by_key.setdefault(key, set()).add(entry.pattern_id)
+        if not touched_by_key:
+            return 0
+
+        # Ranking keys are derived from the patterns' own group_ids
+        records = await self._client.execute_query(
+            """
+            MATCH (r:PatternRanking)
+            WHERE r.ranking_key IN $ranking_keys
+            RETURN r.ranking_key as ranking_key, r.group_id as group_id,
+                   r.category as category, r.pattern_ids as pattern_ids,
+                   r.success_rates as success_rates, r.times_used as times_used
+            """,
+            {"ranking_keys": sorted(touched_by_key)},
+            validate_group_id=False
+        )
+        current = {r['ranking_key']: self._entries(r) for r in records}
+
+        updated: Dict[str, List[RankingEntry]] = {}
+        to_recompute = [key for key in touched_by_key if key not in current]
+
+        for key, ranked in current.items():
+            touched = touched_by_key[key]
+            kept = [e for e in ranked if e.pattern_id not in touched]
+            merged = sorted(
+                kept + [e for e in entries if key in e.ranking_keys],
+                key=lambda e: e.rank
+            )
+
+            if len(ranked) >= self._size:
+                # Unranked patterns all rank below the previous last entry
+                boundary = ranked[-1].rank
+                merged = [e for e in merged if e.rank <= boundary]
+                if len(merged) < self._size:
+                    to_recompute.append(key)
+                    continue
+
+            updated[key] = merged[:self._size]
+
+        for key in to_recompute:
+            updated[key] = await self._load_ranking(key)
+
+        await self._write(updated)
+        return len(updated)
+
+    async def _load_ranking(self, key: str) -> List[RankingEntry]:
+        """Compute one ranking from Neo4j."""
+        group_id, category = key.split("|", 1)
+
+        query = """
+        MATCH (p:Pattern)
+        WHERE p.group_id = $group_id
+        """
+        params: Dict[str, Any] = {"group_id": group_id, "limit": self._size}
+        if category != ALL_CATEGORIES:
+            query += " AND p.category = $category"
+            params["category"] = category
+        query += """
+        RETURN p.pattern_id as pattern_id, p.group_id as group_id, p.category as category,
+               p.success_rate as success_rate, p.times_used as times_used
+        ORDER BY coalesce(p.success_rate, 0.0) DESC, coalesce(p.times_used, 0) DESC, p.pattern_id
+        LIMIT $limit
+        """
+
+        records = await self._client.execute_query(query, params)
+        return [RankingEntry.from_record(r) for r in records]
+
+    async def _write(self, rankings: Dict[str, List[RankingEntry]]) -> None:
+        """Upsert ranking nodes."""
+        if not rankings:
+            return
+
+        rows = []
+        for key, ranked in rankings.items():
+            group_id, category = key.split("|", 1)
+            rows.append({
+                "ranking_key": key,
+                "group_id": group_id,
+                "category": None if category == ALL_CATEGORIES else category,
+                "pattern_ids": [e.pattern_id for e in ranked],
+                "success_rates": [e.success_rate for e in ranked],
+                "times_used": [e.times_used for e in ranked]
+            })
+
+        await self._client.execute_write_batch(self.WRITE_QUERY, rows)
+
+    @staticmethod
+    def _entries(record: Dict[str, Any]) -> List[RankingEntry]:
+        """Ranking entries stored on a PatternRanking node."""
+        return [
+            RankingEntry(
+                pattern_id=pattern_id,
+                group_id=record['group_id'],
+                category=record.get('category'),
+                success_rate=float(rate),
+                times_used=int(used)
+            )
+            for pattern_id, rate, used in zip(
+                record.get('pattern_ids') or [],
+                record.get('success_rates') or [],
+                record.get('times_used') or []
+            )
+        ]
+
+
+# Singleton instance
+_pattern_rankings: Optional[PatternRankings] = None
+
+
+def get_pattern_rankings(client: Neo4jAsyncClient) -> PatternRankings:
+    """Get or create the global pattern rankings instance."""
+    global _pattern_rankings
+    if _pattern_rankings is None:
+        _pattern_rankings = PatternRankings(client)
+    return _pattern_rankings
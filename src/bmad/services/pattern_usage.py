@@ -0,0 +1,413 @@
+"""
+Write-Behind Pattern Usage Counters
+
+This module coalesces pattern usage updates in process so popular patterns
+are not written (and locked) once per use.
+- Per-pattern tallies of uses, successes and failures
+- Flushed in one UNWIND write every FLUSH_INTERVAL_SECONDS or once
+  MAX_PENDING_EVENTS uses are pending, whichever comes first
+- Failed flushes are merged back and retried; nothing is double counted
+- Draining on shutdown, with an optional spill file for tallies that could
+  not be written (re-read on the next start)
+
+Metrics:
+- bmad_pattern_usage_flush_lag_seconds: Age of the oldest use in each flush
+- bmad_pattern_usage_pending_events: Uses recorded but not yet written
+- bmad_pattern_usage_flush_failures_total: Failed flushes
+
+Usage:
+    usage = get_pattern_usage_accumulator(client)
+    await usage.start()
+    usage.record("pattern-1", "faith-meats", successful=True)
+    ...
+    await usage.stop()  # drains pending tallies
+
+Tallies are only written by flush(). Short-lived processes (CLI, batch
+jobs) that record fewer than MAX_PENDING_EVENTS uses and never start()
+the loop must await stop() (or PatternMatcher.close()) before exiting,
+or their uses are lost.
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 2-2-manage-pattern-library
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.bmad.core.cache_manager import (
+    AsyncCacheManager,
+    get_pattern_cache,
+    pattern_invalidation_tags
+)
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import tenant_filter
+
+if TYPE_CHECKING:
+    from src.bmad.services.pattern_index import PatternIndex
+    from src.bmad.services.pattern_ranking import PatternRankings
+
+logger = logging.getLogger(__name__)
+
+FLUSH_LAG = Histogram(
+    'bmad_pattern_usage_flush_lag_seconds',
+    'Age of the oldest pattern use written by a usage flush',
+    buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0]
+)
+PENDING_EVENTS = Gauge(
+    'bmad_pattern_usage_pending_events',
+    'Pattern uses recorded in process but not yet written to Neo4j'
+)
+FLUSH_FAILURES = Counter(
+    'bmad_pattern_usage_flush_failures_total',
+    'Pattern usage flushes that failed and were retried later'
+)
+
+
+@dataclass
+class UsageTally:
+    """Coalesced usage of one pattern since the last flush."""
+    pattern_id: str
+    group_id: str
+    uses: int = 0
+    successes: int = 0
+    failures: int = 0
+    last_used: Optional[datetime] = None
+    first_recorded: float = 0.0  # monotonic; for flush lag
+
+    def merge(self, other: "UsageTally") -> None:
+        """Add another tally for the same pattern."""
+        self.uses += other.uses
+        self.successes += other.successes
+        self.failures += other.failures
+        if other.last_used and (self.last_used is None or other.last_used > self.last_used):
+            self.last_used = other.last_used
+        self.first_recorded = min(self.first_recorded, other.first_recorded)
+
+
+class PatternUsageAccumulator:
+    """
+    In-process accumulator for pattern usage statistics.
+
+    record() never touches Neo4j. Tallies are keyed by (pattern_id,
+    group_id) and written by flush(), which runs periodically once
+    start() is called, and early when enough uses are pending.
+    """
+
+    FLUSH_INTERVAL_SECONDS = 5.0
+    MAX_PENDING_EVENTS = 1000
+    FLUSH_BATCH_SIZE = 500
+
+    # success_rate is owned by the daily effectiveness job (from outcomes);
+    # use outcomes are only counted here
+    FLUSH_QUERY = f"""
+    MATCH (p:Pattern {{pattern_id: row.pattern_id}})
+    WHERE {tenant_filter("p", group_expr="row.group_id")}
+    SET p.times_used = coalesce(p.times_used, 0) + row.uses,
+        p.success_count = coalesce(p.success_count, 0) + row.successes,
+        p.failure_count = coalesce(p.failure_count, 0) + row.failures,
+        p.last_used = row.last_used
+    RETURN p.pattern_id as pattern_id, p.group_id as group_id, p.category as category,
+           p.success_rate as success_rate, p.times_used as times_used
+    """
+
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        flush_interval_seconds: float = FLUSH_INTERVAL_SECONDS,
+        max_pending_events: int = MAX_PENDING_EVENTS,
+        spill_path: Optional[str] = None,
+        cache: Optional[AsyncCacheManager] = None,
+        index: Optional["PatternIndex"] = None,
+        rankings: Optional["PatternRankings"] = None
+    ):
+        """
+        Initialize the accumulator (call start() to flush periodically).
+
+        Args:
+            client: Neo4j async client used for flushes
+            flush_interval_seconds: Maximum time a use waits before being written
+            max_pending_events: Pending uses that trigger an early flush
+            spill_path: File receiving tallies that could not be written at
+                        shutdown (no spill if None)
+            cache: Pattern query cache to invalidate after a flush
+                   (uses global pattern cache if not provided)
+            index: In-memory pattern index to update after a flush
+                   (uses global pattern index if not provided)
+            rankings: Materialized rankings to update after a flush
+                      (uses global rankings if not provided)
+        """
+        # Imported here: these import pattern_matcher, which imports us
+        from src.bmad.services.pattern_index import get_pattern_index
+        from src.bmad.services.pattern_ranking import get_pattern_rankings
+
+        self._client = client
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending_events = max_pending_events
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._cache = cache or get_pattern_cache()
+        self._index = index or get_pattern_index(client)
+        self._rankings = rankings or get_pattern_rankings(client)
+
+        self._pending: Dict[Tuple[str, str], UsageTally] = {}
+        self._pending_events = 0
+        self._flush_lock: Optional[asyncio.Lock] = None  # created in the running loop
+        self._flush_task: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    @property
+    def pending_events(self) -> int:
+        """Uses recorded but not yet written."""
+        return self._pending_events
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the periodic flush loop is running."""
+        return self._loop_task is not None and not self._loop_task.done()
+
+    def record(self, pattern_id: str, group_id: str, successful: bool) -> None:
+        """
+        Record one use of a pattern.
+
+        Args:
+            pattern_id: ID of the pattern used
+            group_id: Project group the use happened in
+            successful: Whether the use was successful
+        """
+        key = (pattern_id, group_id)
+        tally = self._pending.get(key)
+        if tally is None:
+            tally = self._pending[key] = UsageTally(
+                pattern_id=pattern_id,
+                group_id=group_id,
+                first_recorded=time.monotonic()
+            )
+
+        tally.uses += 1
+        if successful:
+            tally.successes += 1
+        else:
+            tally.failures += 1
+        tally.last_used = datetime.now(timezone.utc)
+
+        self._pending_events += 1
+        PENDING_EVENTS.inc()
+
+        if self._pending_events >= self._max_pending_events:
+            self._schedule_flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending tallies.
+
+        Tallies are written in chunks of FLUSH_BATCH_SIZE, one transaction
+        each; chunks that fail (or are interrupted by cancellation) are
+        merged back into the pending tallies and the error is raised.
+
+        Returns:
+            Number of patterns written
+        """
+        if self._flush_lock is None:
+            # Created here: on Python 3.9 a Lock binds to the loop current at construction
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            events = self._pending_events
+            self._pending_events = 0
+            PENDING_EVENTS.dec(events)
+            if not pending:
+                return 0
+
+            tallies = list(pending.values())
+            FLUSH_LAG.observe(time.monotonic() - min(t.first_recorded for t in tallies))
+
+            written: List[dict] = []
+            for start in range(0, len(tallies), self.FLUSH_BATCH_SIZE):
+                chunk = tallies[start:start + self.FLUSH_BATCH_SIZE]
+                try:
+                    written.extend(await self._client.execute_write_batch(
+                        self.FLUSH_QUERY,
+                        [self._row(t) for t in chunk],
+                        batch_size=len(chunk)
+                    ))
+                except BaseException as e:
+                    if isinstance(e, Exception):
+                        FLUSH_FAILURES.inc()
+                    self._restore(tallies[start:])
+                    await self._invalidate(written)
+                    raise
+
+            await self._invalidate(written)
+            logger.debug(f"Flushed usage for {len(tallies)} patterns ({events} uses)")
+            return len(tallies)
+
+    async def start(self) -> None:
+        """Reload spilled tallies and start the periodic flush loop."""
+        self._load_spill()
+        if not self.is_running:
+            self._stopping = asyncio.Event()
+            self._loop_task = asyncio.get_running_loop().create_task(self._run(self._stopping))
+
+    async def stop(self) -> None:
+        """
+        Stop the flush loop and drain pending tallies.
+
+        The loop is signalled rather than cancelled, so a flush already in
+        progress finishes its write. Tallies that still cannot be written
+        are spilled to spill_path (when configured) instead of being lost.
+        """
+        if self._loop_task is not None:
+            self._stopping.set()
+            await self._loop_task
+            self._loop_task = None
+
+        if self._flush_task is not None:
+            try:
+                await self._flush_task
+            except Exception:
+                pass
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final pattern usage flush failed: {e}")
+            self._write_spill()
+
+    async def _run(self, stopping: asyncio.Event) -> None:
+        """Flush every flush_interval_seconds until stopping is set."""
+        while True:
+            try:
+                await asyncio.wait_for(stopping.wait(), self._flush_interval_seconds)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Pattern usage flush failed, will retry: {e}")
+
+    def _schedule_flush(self) -> None:
+        """Start an early flush unless one is already running."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self.flush())
+        self._flush_task.add_done_callback(self._flush_finished)
+
+    def _flush_finished(self, task: asyncio.Task) -> None:
+        """Log early-flush failures (the tallies were already restored)."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Pattern usage flush failed, will retry: {task.exception()}")
+
+    def _restore(self, tallies: List[UsageTally]) -> None:
+        """Merge unwritten tallies back into the pending set."""
+        for tally in tallies:
+            key = (tally.pattern_id, tally.group_id)
+            if key in self._pending:
+                self._pending[key].merge(tally)
+            else:
+                self._pending[key] = tally
+            self._pending_events += tally.uses
+            PENDING_EVENTS.inc(tally.uses)
+
+    async def _invalidate(self, written: List[dict]) -> None:
+        """Evict cached result sets and re-rank and re-index the written patterns."""
+        if not written:
+            return
+        self._index.update_patterns(written)
+        await self._cache.invalidate_tags(pattern_invalidation_tags(
+            [r['pattern_id'] for r in written],
+            {r['group_id'] for r in written},
+            include_global=False
+        ))
+
+        from src.bmad.services.pattern_ranking import RankingEntry
+        try:
+            await self._rankings.update_patterns([RankingEntry.from_record(r) for r in written])
+        except Exception as e:
+            # The counters are committed; the next rebuild repairs the rankings
+            logger.warning(f"Pattern ranking update after usage flush failed: {e}")
+
+    @staticmethod
+    def _row(tally: UsageTally) -> dict:
+        """UNWIND row for a tally."""
+        return {
+            "pattern_id": tally.pattern_id,
+            "group_id": tally.group_id,
+            "uses": tally.uses,
+            "successes": tally.successes,
+            "failures": tally.failures,
+            "last_used": tally.last_used
+        }
+
+    def _write_spill(self) -> None:
+        """Persist pending tallies so the next start() can write them."""
+        if self._spill_path is None or not self._pending:
+            return
+
+        existing = self._read_spill()
+        records = [
+            {**asdict(t), "last_used": t.last_used.isoformat() if t.last_used else None}
+            for t in existing + list(self._pending.values())
+        ]
+        self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._spill_path.with_suffix(self._spill_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(records))
+        os.replace(tmp_path, self._spill_path)
+
+        logger.warning(f"Spilled {self._pending_events} pattern uses to {self._spill_path}")
+
+    def _load_spill(self) -> None:
+        """Merge tallies spilled by a previous shutdown."""
+        tallies = self._read_spill()
+        if not tallies:
+            return
+        now = time.monotonic()
+        for tally in tallies:
+            tally.first_recorded = now
+        self._restore(tallies)
+        self._spill_path.unlink()
+        logger.info(f"Recovered {len(tallies)} spilled pattern usage tallies")
+
+    def _read_spill(self) -> List[UsageTally]:
+        """Read the spill file, if any."""
+        if self._spill_path is None or not self._spill_path.exists():
+            return []
+        tallies = []
+        for record in json.loads(self._spill_path.read_text()):
+            last_used = record.get("last_used")
+            tallies.append(UsageTally(
+                **{**record, "last_used": datetime.fromisoformat(last_used) if last_used else None}
+            ))
+        return tallies
+
+
+# Singleton instance
+_usage_accumulator: Optional[PatternUsageAccumulator] = None
+
+
+def get_pattern_usage_accumulator(client: Neo4jAsyncClient) -> PatternUsageAccumulator:
+    """Get or create the global pattern usage accumulator."""
+    global _usage_accumulator
+    if _usage_accumulator is None:
+        _usage_accumulator = PatternUsageAccumulator(
+            client,
+            flush_interval_seconds=float(os.getenv("PATTERN_USAGE_FLUSH_SECONDS", "5")),
+            max_pending_events=int(os.getenv("PATTERN_USAGE_MAX_PENDING", "1000")),
+            spill_path=os.getenv("PATTERN_USAGE_SPILL_PATH") or None
+        )
+    return _usage_accumulator
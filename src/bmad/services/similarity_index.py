@@ -0,0 +1,566 @@
+"""
+Local Similarity Index
+
+This module finds patterns and insights that read like a piece of text,
+computed entirely in process (no embedding service or network model).
+- Hashed n-gram vectors: word unigrams plus character trigrams, hashed
+  into a fixed number of signed features, sublinear tf, L2-normalized
+- One float32 NumPy matrix for all items; cosine similarity is a
+  blocked matrix product with a per-block top-k
+- Incremental add/remove (rows are swap-deleted, so the matrix stays dense)
+- Persistence as a .npy matrix memory-mapped on load, plus an item sidecar
+- Snapshots older than max_snapshot_age_seconds are rebuilt in the
+  background while the old one keeps serving; updates made during the
+  rebuild are replayed onto the new snapshot
+
+Indexed text is Pattern name + description and Insight rule.
+
+Usage:
+    index = get_similarity_index(client)
+    await index.ensure_loaded()
+    hits = index.search("retry on timeout", ["faith-meats", "global-coding-skills"],
+                        k=5, kind=PATTERN_KIND)
+
+Author: Brooks (BMAD Dev Agent)
+Created: 2026-01-26
+Story: 3-4-fast-pattern-matching-query-engine
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import re
+import time
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+logger = logging.getLogger(__name__)
+
+PATTERN_KIND = "pattern"
+INSIGHT_KIND = "insight"
+_KIND_CODES = {PATTERN_KIND: 0, INSIGHT_KIND: 1}
+
+_TOKEN = re.compile(r"\w+")
+
+# The top hash bit picks the feature sign, the low bits pick its index
+_SIGN_BIT = 1 << 31
+
+
+@lru_cache(maxsize=65536)
+def _token_features(token: str, n_features: int) -> Tuple[Tuple[int, float], ...]:
+    """Hashed feature indices and signs for one token."""
+    padded = f" {token} "
+    grams = [f"w:{token}"] + [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+    features = []
+    for gram in grams:
+        h = zlib.crc32(gram.encode("utf-8"))
+        features.append((h % n_features, -1.0 if h & _SIGN_BIT else 1.0))
+    return tuple(features)
+
+
+class HashedNGramVectorizer:
+    """
+    Stateless text vectorizer using the hashing trick.
+
+    No vocabulary is fitted, so vectors for new items never require
+    re-encoding existing rows.
+    """
+
+    def __init__(self, n_features: int = 1024):
+        """
+        Initialize the vectorizer.
+
+        Args:
+            n_features: Vector dimensionality
+        """
+        self.n_features = n_features
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Vectorize texts into L2-normalized rows.
+
+        Returns:
+            float32 array of shape (len(texts), n_features); rows for
+            texts without tokens are all zero
+        """
+        vectors = np.zeros((len(texts), self.n_features), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            counts: Dict[int, float] = {}
+            for token in _TOKEN.findall((text or "").lower()):
+                for index, sign in _token_features(token, self.n_features):
+                    counts[index] = counts.get(index, 0.0) + sign
+            if not counts:
+                continue
+
+            vector = vectors[row]
+            for index, value in counts.items():
+                # Sublinear tf keeps repeated words from dominating
+                vector[index] = math.copysign(1.0 + math.log(abs(value)), value) if value else 0.0
+            norm = float(np.linalg.norm(vector))
+            if norm:
+                vector /= norm
+
+        return vectors
+
+
+class SimilarityIndex:
+    """
+    In-process cosine similarity index over pattern and insight text.
+
+    search() only considers rows whose group_id is in the given groups,
+    so tenant isolation matches the Cypher queries.
+    """
+
+    DEFAULT_N_FEATURES = 1024
+    SEARCH_BLOCK_ROWS = 32768
+    MATRIX_FILE = "vectors.npy"
+    ITEMS_FILE = "items.json"
+
+    def __init__(
+        self,
+        client: Neo4jAsyncClient,
+        n_features: int = DEFAULT_N_FEATURES,
+        storage_dir: Optional[str] = None,
+        max_snapshot_age_seconds: float = 86400
+    ):
+        """
+        Initialize an empty similarity index.
+
+        Args:
+            client: Neo4j async client used to load items
+            n_features: Vector dimensionality
+            storage_dir: Directory for the persisted matrix (no persistence if None)
+            max_snapshot_age_seconds: Snapshots (persisted or in memory) older
+                than this are rebuilt from Neo4j by ensure_loaded()
+        """
+        self._client = client
+        self._vectorizer = HashedNGramVectorizer(n_features)
+        self._storage_dir = Path(storage_dir) if storage_dir else None
+        self._max_snapshot_age_seconds = max_snapshot_age_seconds
+        self._loaded = False
+        self._built_at = 0.0  # wall clock; persisted snapshots use the file mtime
+        self._load_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        # Updates made while a rebuild streams, replayed onto its result
+        self._journal: Optional[List[Tuple[Any, ...]]] = None
+        self._reset(capacity=0)
+
+    @property
+    def n_features(self) -> int:
+        """Vector dimensionality."""
+        return self._vectorizer.n_features
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index has been built or read from disk."""
+        return self._loaded
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, item_id: str, text: str, group_id: str, kind: str = PATTERN_KIND) -> None:
+        """Add an item, replacing its vector and group if already indexed."""
+        self.add_many([(item_id, text, group_id)], kind=kind)
+
+    def add_many(self, items: Iterable[Tuple[str, str, str]], kind: str = PATTERN_KIND) -> int:
+        """
+        Add or replace items in one vectorization pass.
+
+        Args:
+            items: (item_id, text, group_id) tuples
+            kind: PATTERN_KIND or INSIGHT_KIND
+
+        Returns:
+            Number of items written
+        """
+        items = list(items)
+        if not items:
+            return 0
+        if self._journal is not None:
+            self._journal.append(("add", items, kind))
+
+        kind_code = _KIND_CODES[kind]
+        vectors = self._vectorizer.transform([text for _, text, _ in items])
+        self._ensure_capacity(self._count + len(items))
+
+        for (item_id, _, group_id), vector in zip(items, vectors):
+            key = (kind, item_id)
+            row = self._rows.get(key)
+            if row is None:
+                row = self._count
+                self._count += 1
+                self._rows[key] = row
+                self._keys.append(key)
+            self._matrix[row] = vector
+            self._groups[row] = self._group_code(group_id)
+            self._kinds[row] = kind_code
+
+        return len(items)
+
+    def remove(self, item_id: str, kind: str = PATTERN_KIND) -> bool:
+        """
+        Remove an item by moving the last row into its slot.
+
+        Returns:
+            True if the item was indexed
+        """
+        if self._journal is not None:
+            self._journal.append(("remove", item_id, kind))
+        row = self._rows.pop((kind, item_id), None)
+        if row is None:
+            return False
+
+        last = self._count - 1
+        if row != last:
+            moved = self._keys[last]
+            self._matrix[row] = self._matrix[last]
+            self._groups[row] = self._groups[last]
+            self._kinds[row] = self._kinds[last]
+            self._keys[row] = moved
+            self._rows[moved] = row
+
+        self._keys.pop()
+        self._count = last
+        return True
+
+    def set_group(self, item_id: str, group_id: str, kind: str = PATTERN_KIND) -> bool:
+        """Move an item to another group (e.g. after promotion to global)."""
+        if self._journal is not None:
+            self._journal.append(("group", item_id, group_id, kind))
+        row = self._rows.get((kind, item_id))
+        if row is None:
+            return False
+        self._groups[row] = self._group_code(group_id)
+        return True
+
+    def search(
+        self,
+        text: str,
+        group_ids: Sequence[str],
+        k: int = 10,
+        kind: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the k items most similar to text.
+
+        Args:
+            text: Query text
+            group_ids: Groups whose items may be returned
+            k: Maximum results
+            kind: Restrict to PATTERN_KIND or INSIGHT_KIND (any if None)
+
+        Returns:
+            (item_id, cosine similarity) pairs, best first; items sharing no
+            features with the text are omitted
+        """
+        return self.search_batch([text], group_ids, k=k, kind=kind)[0]
+
+    def search_batch(
+        self,
+        texts: Sequence[str],
+        group_ids: Sequence[str],
+        k: int = 10,
+        kind: Optional[str] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Find the top-k similar items for several texts with one matrix pass.
+
+        The matrix is scanned in SEARCH_BLOCK_ROWS blocks so the score
+        buffer stays bounded regardless of index size.
+
+        Returns:
+            One result list per text, as returned by search()
+        """
+        if not texts:
+            return []
+
+        codes = [self._group_ids[g] for g in group_ids if g in self._group_ids]
+        if k <= 0 or not self._count or not codes:
+            return [[] for _ in texts]
+
+        queries = self._vectorizer.transform(texts)
+        best_scores = np.empty((len(texts), 0), dtype=np.float32)
+        best_rows = np.empty((len(texts), 0), dtype=np.int64)
+
+        for start in range(0, self._count, self.SEARCH_BLOCK_ROWS):
+            end = min(start + self.SEARCH_BLOCK_ROWS, self._count)
+
+            allowed = np.isin(self._groups[start:end], codes)
+            if kind is not None:
+                allowed &= self._kinds[start:end] == _KIND_CODES[kind]
+            if not allowed.any():
+                continue
+
+            # Score the whole block (a view, no copy) and mask other groups
+            scores = queries @ self._matrix[start:end].T
+            scores[:, ~allowed] = -np.inf
+            rows = np.broadcast_to(np.arange(start, end), scores.shape)
+
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_rows = np.concatenate([best_rows, rows], axis=1)
+            if best_scores.shape[1] > k:
+                top = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, top, axis=1)
+                best_rows = np.take_along_axis(best_rows, top, axis=1)
+
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        results = []
+        for scores, rows in zip(
+            np.take_along_axis(best_scores, order, axis=1),
+            np.take_along_axis(best_rows, order, axis=1)
+        ):
+            results.append([
+                (self._keys[row][1], round(float(score), 4))
+                for score, row in zip(scores, rows)
+                if score > 0
+            ])
+        return results
+
+    async def ensure_loaded(self) -> None:
+        """
+        Load the persisted snapshot if it is fresh, else rebuild from Neo4j.
+
+        Once loaded, a snapshot older than max_snapshot_age_seconds keeps
+        serving while a background refresh rebuilds it.
+        """
+        if self._loaded:
+            if time.time() - self._built_at > self._max_snapshot_age_seconds:
+                self._schedule_refresh()
+            return
+        if self._load_task is None or self._load_task.done():
+            self._load_task = asyncio.ensure_future(self._initial_load())
+        await asyncio.shield(self._load_task)
+
+    async def refresh(self) -> int:
+        """
+        Rebuild the index from every Pattern and Insight in Neo4j.
+
+        Concurrent callers share one rebuild. Items added, removed or
+        regrouped while it streams are replayed onto the rebuilt index.
+        The rebuilt matrix is persisted when a storage directory is set.
+
+        Returns:
+            Number of items indexed
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._rebuild())
+        return await asyncio.shield(self._refresh_task)
+
+    async def _rebuild(self) -> int:
+        """Stream every item from Neo4j into a new index and swap it in."""
+        fresh = SimilarityIndex(self._client, n_features=self.n_features)
+        built_at = time.time()
+        self._journal = []
+        try:
+            await self._stream_items(fresh)
+            self._replay(fresh)
+        finally:
+            self._journal = None
+
+        self._adopt(fresh)
+        self._built_at = built_at
+        self._loaded = True
+        logger.info(f"Similarity index rebuilt: {self._count} items")
+
+        if self._storage_dir is not None:
+            self.save()
+        return self._count
+
+    def _replay(self, fresh: "SimilarityIndex") -> None:
+        """Apply the updates journaled during a rebuild to its result."""
+        for entry in self._journal:
+            if entry[0] == "add":
+                fresh.add_many(entry[1], kind=entry[2])
+            elif entry[0] == "remove":
+                fresh.remove(entry[1], kind=entry[2])
+            else:
+                fresh.set_group(entry[1], entry[2], kind=entry[3])
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh if none is running."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_task = loop.create_task(self._rebuild())
+        self._refresh_task.add_done_callback(self._refresh_finished)
+
+    @staticmethod
+    def _refresh_finished(task: asyncio.Task) -> None:
+        """Log background refresh failures (the old snapshot keeps serving)."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Similarity index refresh failed: {task.exception()}")
+
+    async def _stream_items(self, fresh: "SimilarityIndex") -> None:
+        """Add every Pattern and Insight in Neo4j to fresh."""
+
+        # The index spans tenants; search() applies the group filter
+        async for batch in self._client.stream_query_batches(
+            """
+            MATCH (p:Pattern)
+            RETURN p.pattern_id as id, p.group_id as group_id,
+                   coalesce(p.name, '') + ' ' + coalesce(p.description, '') as text
+            """,
+            {},
+            validate_group_id=False
+        ):
+            fresh.add_many(((r['id'], r['text'], r['group_id']) for r in batch), PATTERN_KIND)
+
+        async for batch in self._client.stream_query_batches(
+            """
+            MATCH (i:Insight)
+            RETURN i.insight_id as id, i.group_id as group_id, i.rule as text
+            """,
+            {},
+            validate_group_id=False
+        ):
+            fresh.add_many(((r['id'], r['text'], r['group_id']) for r in batch), INSIGHT_KIND)
+
+    def save(self, directory: Optional[str] = None) -> Path:
+        """
+        Persist the matrix and item table.
+
+        Files are written under temporary names and renamed into place,
+        so a concurrent load never sees a partial snapshot.
+
+        Returns:
+            Directory written
+        """
+        target = Path(directory) if directory else self._storage_dir
+        if target is None:
+            raise ValueError("No storage directory configured for the similarity index")
+        target.mkdir(parents=True, exist_ok=True)
+
+        matrix_tmp = target / f"{self.MATRIX_FILE}.tmp"
+        with open(matrix_tmp, "wb") as f:
+            np.save(f, self._matrix[:self._count])
+
+        group_names = {code: name for name, code in self._group_ids.items()}
+        items_tmp = target / f"{self.ITEMS_FILE}.tmp"
+        items_tmp.write_text(json.dumps({
+            "n_features": self.n_features,
+            "keys": [list(key) for key in self._keys],
+            "groups": [group_names[code] for code in self._groups[:self._count].tolist()]
+        }))
+
+        os.replace(matrix_tmp, target / self.MATRIX_FILE)
+        os.replace(items_tmp, target / self.ITEMS_FILE)
+        return target
+
+    def load(self, directory: Optional[str] = None) -> int:
+        """
+        Load a persisted snapshot, memory-mapping the matrix.
+
+        The mapping is copy-on-write: searches read pages on demand and
+        incremental updates never modify the file.
+
+        Returns:
+            Number of items loaded
+        """
+        source = Path(directory) if directory else self._storage_dir
+        if source is None:
+            raise ValueError("No storage directory configured for the similarity index")
+
+        items = json.loads((source / self.ITEMS_FILE).read_text())
+        if items["n_features"] != self.n_features:
+            raise ValueError(
+                f"Snapshot has {items['n_features']} features, index expects {self.n_features}"
+            )
+        matrix = np.load(source / self.MATRIX_FILE, mmap_mode="c")
+        built_at = (source / self.MATRIX_FILE).stat().st_mtime
+
+        self._reset(capacity=0)
+        self._matrix = matrix
+        self._keys = [tuple(key) for key in items["keys"]]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._groups = np.array([self._group_code(g) for g in items["groups"]], dtype=np.int32)
+        self._kinds = np.array([_KIND_CODES[kind] for kind, _ in self._keys], dtype=np.int8)
+        self._count = len(self._keys)
+        self._built_at = built_at
+        self._loaded = True
+        return self._count
+
+    async def _initial_load(self) -> None:
+        """Prefer a fresh on-disk snapshot over a full rebuild."""
+        if self._storage_dir is not None and self._snapshot_is_fresh():
+            try:
+                count = self.load()
+                logger.info(f"Similarity index loaded from {self._storage_dir}: {count} items")
+                return
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not load similarity snapshot, rebuilding: {e}")
+        await self.refresh()
+
+    def _snapshot_is_fresh(self) -> bool:
+        """Whether a persisted snapshot exists and is recent enough to serve."""
+        matrix_path = self._storage_dir / self.MATRIX_FILE
+        if not matrix_path.exists() or not (self._storage_dir / self.ITEMS_FILE).exists():
+            return False
+        return time.time() - matrix_path.stat().st_mtime <= self._max_snapshot_age_seconds
+
+    def _reset(self, capacity: int) -> None:
+        """Drop all items."""
+        self._matrix = np.zeros((capacity, self.n_features), dtype=np.float32)
+        self._groups = np.zeros(capacity, dtype=np.int32)
+        self._kinds = np.zeros(capacity, dtype=np.int8)
+        self._keys: List[Tuple[str, str]] = []
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self._group_ids: Dict[str, int] = {}
+        self._count = 0
+
+    def _adopt(self, other: "SimilarityIndex") -> None:
+        """Swap in another index's contents."""
+        self._matrix = other._matrix
+        self._groups = other._groups
+        self._kinds = other._kinds
+        self._keys = other._keys
+        self._rows = other._rows
+        self._group_ids = other._group_ids
+        self._count = other._count
+
+    def _group_code(self, group_id: str) -> int:
+        """Small integer code for a group_id."""
+        return self._group_ids.setdefault(group_id, len(self._group_ids))
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """Grow the row arrays geometrically so adds are amortized O(1)."""
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+
+        capacity = max(needed, capacity * 2, 64)
+        matrix = np.zeros((capacity, self.n_features), dtype=np.float32)
+        matrix[:self._count] = self._matrix[:self._count]
+        groups = np.zeros(capacity, dtype=np.int32)
+        groups[:self._count] = self._groups[:self._count]
+        kinds = np.zeros(capacity, dtype=np.int8)
+        kinds[:self._count] = self._kinds[:self._count]
+
+        self._matrix, self._groups, self._kinds = matrix, groups, kinds
+
+
+# Singleton instance
+_similarity_index: Optional[SimilarityIndex] = None
+
+
+def get_similarity_index(client: Neo4jAsyncClient) -> SimilarityIndex:
+    """Get or create the global similarity index instance."""
+    global _similarity_index
+    if _similarity_index is None:
+        _similarity_index = SimilarityIndex(
+            client,
+            storage_dir=os.getenv("SIMILARITY_INDEX_DIR") or None
+        )
+    return _similarity_index
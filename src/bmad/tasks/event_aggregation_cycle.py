@@ -2,9 +2,10 @@
 Event Aggregation Cycle Task
 
 This module provides scheduled weekly task for event aggregation.
+- Rolls new events up into EventSummary trend buckets every hour
 - Runs weekly on Sunday at 3:00 AM
 - Aggregates events older than 30 days
-- Archives original events to CSV
+- Archives original events to cold storage
 
 Author: Brooks (BMAD Dev Agent)
 Created: 2026-01-26
@@ -35,8 +36,9 @@ class EventAggregationCycle:
 
     Features:
     - Weekly scheduled execution via APScheduler
+    - Hourly rollups so trend dashboards stay current
     - Multi-group processing
-    - CSV archival of old events
+    - Cold-storage archival of old events
     - Metrics collection and logging
     """
 
@@ -67,7 +69,8 @@ class EventAggregationCycle:
         """
         Start the scheduled weekly aggregation.
 
-        Scheduled to run weekly on Sunday at 3:00 AM.
+        Scheduled to run weekly on Sunday at 3:00 AM, with event rollups
+        every hour on the hour.
         """
         # Schedule weekly run on Sunday at 3 AM
         trigger = CronTrigger(day_of_week='sun', hour=3, minute=0)
@@ -78,9 +81,16 @@ class EventAggregationCycle:
             name='Weekly Event Aggregation',
             replace_existing=True
         )
+        self.scheduler.add_job(
+            self.run_rollup,
+            trigger=CronTrigger(minute=0),
+            id='event_rollup',
+            name='Hourly Event Rollup',
+            replace_existing=True
+        )
 
         self.scheduler.start()
-        logger.info("Event aggregation cycle scheduled (runs Sunday at 3 AM)")
+        logger.info("Event aggregation cycle scheduled (runs Sunday at 3 AM, rollups hourly)")
 
     async def run_cycle(
         self,
@@ -136,6 +146,28 @@ class EventAggregationCycle:
             await self._notify_error(str(e))
             raise
 
+    async def run_rollup(self, group_id: Optional[str] = None) -> int:
+        """
+        Roll new events up into EventSummary buckets.
+
+        Args:
+            group_id: Optional specific group to process (None for all)
+
+        Returns:
+            Number of bucket increments written
+        """
+        if not self._service:
+            await self.initialize()
+
+        try:
+            summaries = await self._service.rollup_events(group_id)
+        except Exception as e:
+            logger.error(f"Event rollup error: {e}")
+            await self._notify_error(str(e))
+            raise
+
+        return len(summaries)
+
     async def run_manual(
         self,
         group_id: Optional[str] = None,
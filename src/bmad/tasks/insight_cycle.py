@@ -102,21 +102,16 @@ class InsightCycleTask:
 
         for group_id in groups:
             try:
-                # Get unprocessed outcomes for this group
-                outcomes = await self._generator.get_unprocessed_outcomes(
+                # Process outcomes after this group's cursor
+                result = await self._generator.process_new_outcomes(
                     group_id=group_id,
                     hours_back=24
                 )
 
-                if not outcomes:
+                if not result.processed_count and not result.errors:
                     logger.debug(f"No new outcomes for group {group_id}")
                     continue
 
-                logger.info(f"Processing {len(outcomes)} outcomes for group {group_id}")
-
-                # Process batch
-                result = await self._generator.process_outcomes_batch(outcomes)
-
                 # Aggregate results
                 total_result.processed_count += result.processed_count
                 total_result.insights_generated += result.insights_generated
@@ -128,7 +123,8 @@ class InsightCycleTask:
                 logger.info(
                     f"Group {group_id}: {result.insights_generated} insights, "
                     f"{result.patterns_updated} patterns updated, "
-                    f"{result.avg_time_per_outcome_ms:.2f}ms avg per outcome"
+                    f"{result.avg_time_per_outcome_ms:.2f}ms avg per outcome, "
+                    f"{result.outcomes_per_second:.1f} outcomes/sec"
                 )
 
             except Exception as e:
@@ -141,13 +137,18 @@ class InsightCycleTask:
             total_result.avg_time_per_outcome_ms = (
                 total_result.total_time_ms / total_result.processed_count
             )
+        if total_result.total_time_ms > 0:
+            total_result.outcomes_per_second = (
+                total_result.processed_count / (total_result.total_time_ms / 1000)
+            )
 
         # Log final metrics
         logger.info(
             f"Insight cycle complete: {total_result.processed_count} outcomes processed, "
             f"{total_result.insights_generated} insights generated, "
             f"{total_result.patterns_updated} patterns updated, "
-            f"avg {total_result.avg_time_per_outcome_ms:.2f}ms per outcome"
+            f"avg {total_result.avg_time_per_outcome_ms:.2f}ms per outcome, "
+            f"{total_result.outcomes_per_second:.1f} outcomes/sec"
         )
 
         if all_errors:
@@ -176,7 +177,7 @@ class InsightCycleTask:
 
         Args:
             group_id: Specific group to process (None for all groups)
-            hours_back: How many hours back to look
+            hours_back: Look-back window for a group without a processing cursor
 
         Returns:
             BatchGenerationResult with processing summary
@@ -188,12 +189,10 @@ class InsightCycleTask:
 
         if group_id:
             # Process specific group
-            outcomes = await self._generator.get_unprocessed_outcomes(
+            return await self._generator.process_new_outcomes(
                 group_id=group_id,
                 hours_back=hours_back
             )
-            result = await self._generator.process_outcomes_batch(outcomes)
-            return result
         else:
             # Run full cycle
             return await self.run_cycle()
@@ -227,6 +226,7 @@ async def main():
     print(f"  Patterns updated: {result.patterns_updated}")
     print(f"  Total time: {result.total_time_ms:.2f}ms")
     print(f"  Avg per outcome: {result.avg_time_per_outcome_ms:.2f}ms")
+    print(f"  Throughput: {result.outcomes_per_second:.1f} outcomes/sec")
 
     if result.errors:
         print(f"\n  Errors ({len(result.errors)}):")
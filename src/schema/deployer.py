@@ -231,6 +231,38 @@ class SchemaDeployer:
             'group_details': groups
         }
 
+    def verify_fulltext_indexes(self) -> Dict[str, Any]:
+        """Verify the fulltext search indexes exist and are online.
+
+        Returns:
+            Dictionary with verification results
+        """
+        expected_indexes = ['pattern_fulltext']
+
+        with self.driver.session() as session:
+            result = session.run(
+                """
+                SHOW FULLTEXT INDEXES
+                YIELD name, state, labelsOrTypes, properties
+                RETURN name, state, labelsOrTypes as labels, properties
+                """
+            )
+            indexes = {
+                r['name']: {'state': r['state'], 'labels': r['labels'], 'properties': r['properties']}
+                for r in result
+            }
+
+        missing = [i for i in expected_indexes if i not in indexes]
+        not_online = [i for i in expected_indexes if i in indexes and indexes[i]['state'] != 'ONLINE']
+
+        return {
+            'all_present': len(missing) == 0,
+            'all_online': len(missing) == 0 and len(not_online) == 0,
+            'missing': missing,
+            'not_online': not_online,
+            'indexes': indexes
+        }
+
     def full_deployment(self) -> Dict[str, Any]:
         """Run complete BMAD schema and agent deployment.
 
@@ -242,6 +274,7 @@ class SchemaDeployer:
             'agent_initialization': None,
             'agents_verified': None,
             'groups_verified': None,
+            'fulltext_verified': None,
             'total_duration': 0
         }
 
@@ -256,6 +289,7 @@ class SchemaDeployer:
         # Verify
         results['agents_verified'] = self.verify_all_agents()
         results['groups_verified'] = self.verify_project_groups()
+        results['fulltext_verified'] = self.verify_fulltext_indexes()
 
         results['total_duration'] = time.time() - start_total
 
@@ -264,7 +298,8 @@ class SchemaDeployer:
             results['schema_deployment']['success'] and
             results['agent_initialization']['success'] and
             results['agents_verified']['all_present'] and
-            results['groups_verified']['all_present']
+            results['groups_verified']['all_present'] and
+            results['fulltext_verified']['all_present']
         )
 
         return results
\ No newline at end of file
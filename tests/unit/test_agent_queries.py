@@ -221,6 +221,225 @@ class TestQueryWorkHistory:
         assert params['limit'] == 200  # Capped to max
 
 
+class TestHistoryCursorPagination:
+    """Test keyset pagination of work history."""
+
+    @staticmethod
+    def records(*event_ids):
+        return [
+            {
+                'e': {'event_id': eid, 'timestamp': datetime(2026, 1, 26, 12, i, tzinfo=timezone.utc)},
+                'o': {'outcome_id': f'o-{eid}', 'status': 'Success'},
+                'patterns': [],
+                'insights': []
+            }
+            for i, eid in enumerate(event_ids)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_extra_row_yields_next_cursor(self):
+        """A full page should return a cursor for the last returned event."""
+        from src.bmad.services.agent_queries import decode_history_cursor
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self.records('e1', 'e2', 'e3'))
+
+        service = AgentQueryService(mock_client)
+        result = await service.query_work_history("Brooks", "test", page_size=2)
+
+        assert [e.event.event_id for e in result.entries] == ['e1', 'e2']
+        assert decode_history_cursor(result.next_cursor) == (
+            datetime(2026, 1, 26, 12, 1, tzinfo=timezone.utc), 'e2', 'o-e2'
+        )
+        assert result.total_count is None
+
+        # The page is cut before patterns and insights are joined
+        query = mock_client.execute_query.call_args[0][0]
+        assert query.index("LIMIT $limit + 1") < query.index("OPTIONAL MATCH")
+
+    @pytest.mark.asyncio
+    async def test_cursor_replaces_skip(self):
+        """With a cursor the query seeks by (timestamp, event_id, outcome_id) and skips nothing."""
+        from src.bmad.services.agent_queries import encode_history_cursor
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self.records('e3'))
+        ts = datetime(2026, 1, 26, 12, 1, tzinfo=timezone.utc)
+        cursor = encode_history_cursor(WorkHistoryEntry(
+            event=WorkEvent(
+                event_id='e2', event_type='', timestamp=ts, group_id='test', description=''
+            ),
+            outcome=WorkOutcome(outcome_id='o-e2', status='Success', result_summary='')
+        ))
+
+        service = AgentQueryService(mock_client)
+        result = await service.query_work_history("Brooks", "test", page=5, page_size=2, cursor=cursor)
+
+        query, params = mock_client.execute_query.call_args[0]
+        assert "e.timestamp < $after_timestamp" in query
+        assert params['after_timestamp'] == ts
+        assert params['after_event_id'] == 'e2'
+        assert params['after_outcome_id'] == 'o-e2'
+        assert params['skip'] == 0
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_event_outcomes_split_across_pages(self):
+        """A page ending between two outcomes of one event should resume at the sibling."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        ts = datetime(2026, 1, 26, 12, 0, tzinfo=timezone.utc)
+        rows = [
+            {
+                'e': {'event_id': eid, 'timestamp': ts},
+                'o': {'outcome_id': oid, 'status': 'Success'},
+                'patterns': [],
+                'insights': []
+            }
+            for eid, oid in [('e2', 'o-b'), ('e2', 'o-a'), ('e1', 'o-c')]
+        ]
+
+        async def execute_query(query, params):
+            # Apply the keyset the way the query does, in its ORDER BY order
+            keyed = rows
+            if 'after_timestamp' in params:
+                after = (params['after_timestamp'], params['after_event_id'], params['after_outcome_id'])
+                keyed = [
+                    r for r in rows
+                    if (r['e']['timestamp'], r['e']['event_id'], r['o']['outcome_id']) < after
+                ]
+            return keyed[:params['limit'] + 1]
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=execute_query)
+        service = AgentQueryService(mock_client)
+
+        seen = []
+        cursor = None
+        for _ in range(len(rows)):
+            result = await service.query_work_history("Brooks", "test", page_size=1, cursor=cursor)
+            seen += [(e.event.event_id, e.outcome.outcome_id) for e in result.entries]
+            cursor = result.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == [('e2', 'o-b'), ('e2', 'o-a'), ('e1', 'o-c')]
+
+        query = mock_client.execute_query.call_args[0][0]
+        assert "o.outcome_id < $after_outcome_id" in query
+        assert "ORDER BY e.timestamp DESC, e.event_id DESC, o.outcome_id DESC" in query
+
+    @pytest.mark.asyncio
+    async def test_total_count_is_optional_and_cached(self):
+        """include_total should run one count query per filter combination."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        async def execute_query(query, params=None):
+            if "count(*)" in query:
+                return [{'total': 7}]
+            return []
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=execute_query)
+        service = AgentQueryService(mock_client)
+
+        for _ in range(2):
+            result = await service.query_work_history(
+                "Brooks", "count-test", days_back=3, include_total=True
+            )
+            assert result.total_count == 7
+
+        count_calls = [c for c in mock_client.execute_query.call_args_list if "count(*)" in c[0][0]]
+        assert len(count_calls) == 1
+
+
+class TestColdTierHistory:
+    """Test archived events merged into history beyond the hot window."""
+
+    @staticmethod
+    def archived(*pairs):
+        return [
+            {
+                'event_id': eid,
+                'event_type': 'code_review',
+                'timestamp': f'2025-12-{day:02d}T12:00:00Z',
+                'group_id': 'test',
+                'archived_outcome': {'outcome_id': f'o-{eid}', 'status': 'Success'},
+                'archived_patterns': [{'pattern_id': 'p-1', 'name': 'Review', 'category': 'review'}]
+            }
+            for eid, day in pairs
+        ]
+
+    @staticmethod
+    def service(hot_records, archived):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+        from src.bmad.services.cold_tier import ColdTierService
+
+        async def execute_query(query, params=None):
+            if "$outcome_ids" in query:
+                return [{'outcome_id': 'o-c1', 'insights': [{'insight_id': 'i-1', 'rule': 'Archived rule'}]}]
+            if "count(*)" in query:
+                return [{'total': len(hot_records)}]
+            return hot_records
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=execute_query)
+        cold_tier = MagicMock(spec=ColdTierService)
+        cold_tier.query_events = AsyncMock(return_value=archived)
+        cold_tier.count_events = AsyncMock(return_value=len(archived))
+        return AgentQueryService(mock_client, cold_tier=cold_tier), mock_client, cold_tier
+
+    @pytest.mark.asyncio
+    async def test_hot_window_does_not_touch_archive(self):
+        service, _, cold_tier = self.service([], self.archived(('c1', 1)))
+
+        await service.query_work_history("Brooks", "test", days_back=30)
+
+        cold_tier.query_events.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_archived_events_merged_in_order(self):
+        hot = TestHistoryCursorPagination.records('h1')
+        service, mock_client, cold_tier = self.service(
+            hot, self.archived(('c1', 20), ('c2', 10), ('c3', 5))
+        )
+
+        result = await service.query_work_history(
+            "Brooks", "test", days_back=365, page=2, page_size=2, include_total=True
+        )
+
+        # Hot rows are fetched from the start so the merged offset is exact
+        params = mock_client.execute_query.call_args_list[0][0][1]
+        assert params['skip'] == 0 and params['limit'] == 4
+        assert cold_tier.query_events.call_args.kwargs['limit'] == 5
+        assert cold_tier.query_events.call_args.kwargs['with_outcome'] is True
+
+        assert [e.event.event_id for e in result.entries] == ['c2', 'c3']
+        assert result.entries[0].outcome.outcome_id == 'o-c2'
+        assert result.entries[0].patterns[0].pattern_id == 'p-1'
+        assert result.next_cursor is None
+        assert result.total_count == 4
+
+    @pytest.mark.asyncio
+    async def test_archived_events_get_graph_insights(self):
+        service, _, _ = self.service([], self.archived(('c1', 20)))
+
+        result = await service.query_work_history("Brooks", "test", days_back=90)
+
+        assert result.entries[0].insights[0].insight_id == 'i-1'
+
+    @pytest.mark.asyncio
+    async def test_restored_event_not_duplicated(self):
+        hot = TestHistoryCursorPagination.records('c1')
+        service, _, _ = self.service(hot, self.archived(('c1', 20), ('c2', 10)))
+
+        result = await service.query_work_history("Brooks", "test", days_back=90)
+
+        assert [e.event.event_id for e in result.entries] == ['c1', 'c2']
+
+
 class TestQueryFailures:
     """Test failure query functionality."""
 
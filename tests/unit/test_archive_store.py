@@ -0,0 +1,139 @@
+"""Unit tests for the cold-storage archive store.
+
+Tests cover:
+- Partitioned, block-compressed archive files
+- Indexed lookup and restore of single records
+- Partition listing and aborted writes
+"""
+
+import gzip
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.archive_store import ArchiveReader, ArchiveWriter, partition_date
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+
+def write_events(root, count, block_records=4, group_id='faith-meats'):
+    with ArchiveWriter(str(root), 'events', block_records=block_records) as writer:
+        for n in range(count):
+            writer.write(f'e{n}', group_id, f'2025-01-0{n % 3 + 1}T10:00:00Z', {
+                'event_id': f'e{n}',
+                'group_id': group_id,
+                'description': f'event {n}',
+                'archived_at': datetime(2025, 2, 1, tzinfo=timezone.utc)
+            })
+    return writer
+
+
+class TestArchiveWriter:
+    """Test archive file layout."""
+
+    def test_partitions_by_group_and_date(self, tmp_path):
+        writer = write_events(tmp_path, 9)
+
+        assert writer.record_count == 9
+        days = sorted(p.name for p in (tmp_path / 'events' / 'group_id=faith-meats').iterdir())
+        assert days == ['date=2025-01-01', 'date=2025-01-02', 'date=2025-01-03']
+        assert (tmp_path / 'events' / 'index.sqlite').exists()
+
+    def test_files_are_plain_multi_member_gzip(self, tmp_path):
+        writer = write_events(tmp_path, 30, block_records=2)
+
+        lines = []
+        for path in writer.files:
+            with gzip.open(path, 'rt') as f:
+                lines.extend(json.loads(line)['event_id'] for line in f)
+        assert sorted(lines) == sorted(f'e{n}' for n in range(30))
+
+    def test_abort_discards_run(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(str(tmp_path), 'events', block_records=1) as writer:
+                writer.write('e1', 'faith-meats', '2025-01-01', {'event_id': 'e1'})
+                raise RuntimeError('graph write failed')
+
+        assert list(tmp_path.rglob('*.jsonl.gz')) == []
+        assert ArchiveReader(str(tmp_path), 'events').get('e1') is None
+
+    def test_unknown_kind_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            ArchiveWriter(str(tmp_path), 'patterns')
+
+    def test_partition_date(self):
+        assert partition_date('2025-01-02T10:00:00Z') == '2025-01-02'
+        assert partition_date(datetime(2025, 1, 2, 23, 0)) == '2025-01-02'
+
+
+class TestArchiveReader:
+    """Test indexed lookup, listing and restore."""
+
+    def test_get_reads_one_record(self, tmp_path):
+        write_events(tmp_path, 25)
+        reader = ArchiveReader(str(tmp_path), 'events')
+
+        record = reader.get('e17')
+        assert record['description'] == 'event 17'
+        assert record['archived_at'] == datetime(2025, 2, 1, tzinfo=timezone.utc)
+        assert reader.locate('e17').partition_date == '2025-01-03'
+
+        assert reader.get('missing') is None
+        assert reader.get('e17', group_id='other-group') is None
+
+    def test_get_many(self, tmp_path):
+        write_events(tmp_path, 25)
+        reader = ArchiveReader(str(tmp_path), 'events')
+
+        records = reader.get_many(['e1', 'e2', 'e20', 'missing'])
+        assert sorted(records) == ['e1', 'e2', 'e20']
+        assert records['e20']['description'] == 'event 20'
+
+    def test_rearchived_record_points_to_latest(self, tmp_path):
+        write_events(tmp_path, 3)
+        with ArchiveWriter(str(tmp_path), 'events') as writer:
+            writer.write('e1', 'faith-meats', '2025-01-05', {'event_id': 'e1', 'description': 'again'})
+
+        assert ArchiveReader(str(tmp_path), 'events').get('e1')['description'] == 'again'
+
+    def test_partitions_filtered_by_group_and_date(self, tmp_path):
+        write_events(tmp_path, 9)
+        write_events(tmp_path, 3, group_id='diff-driven-saas')
+        reader = ArchiveReader(str(tmp_path), 'events')
+
+        partitions = reader.partitions(group_id='faith-meats', start_date='2025-01-02')
+        assert [(g, d) for g, d, _ in partitions] == [
+            ('faith-meats', '2025-01-02'), ('faith-meats', '2025-01-03')
+        ]
+        records = [r for r in reader.iter_file(partitions[0][2][0])]
+        assert {r['event_id'] for r in records} == {'e1', 'e4', 'e7'}
+
+    def test_empty_archive(self, tmp_path):
+        reader = ArchiveReader(str(tmp_path), 'insights')
+
+        assert reader.get('i1') is None
+        assert reader.partitions() == []
+
+    @pytest.mark.asyncio
+    async def test_restore_merges_properties(self, tmp_path):
+        write_events(tmp_path, 3)
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write = AsyncMock(return_value=[])
+        reader = ArchiveReader(str(tmp_path), 'events')
+
+        assert await reader.restore('e2', mock_client, group_id='faith-meats') is True
+
+        query, params = mock_client.execute_write.call_args.args
+        assert "MERGE (n:Event {event_id: $record_id})" in query
+        assert params['group_id'] == 'faith-meats'
+        assert params['properties']['description'] == 'event 2'
+        assert 'archived_at' not in params['properties']
+
+        assert await reader.restore('e2', mock_client, group_id='other-group') is False
+        assert mock_client.execute_write.call_count == 1
@@ -185,6 +185,61 @@ class TestSchemaIndexesExist:
         assert "CREATE INDEX pattern_category" in content
         assert "CREATE INDEX insight_confidence" in content
 
+    def test_schema_file_defines_pattern_fulltext_index(self):
+        """Schema file should define the pattern fulltext search index."""
+        schema_path = project_root / "scripts" / "schema" / "bmad_schema.cypher"
+        content = schema_path.read_text()
+
+        assert "CREATE FULLTEXT INDEX pattern_fulltext" in content
+        assert "ON EACH [p.name, p.description, p.tags]" in content
+
+    def test_pattern_composite_indexes_are_deployed(self):
+        """Composite (group_id, ...) pattern indexes should survive comment filtering."""
+        mock_driver = MagicMock()
+        session = mock_driver.session.return_value.__enter__.return_value
+
+        SchemaDeployer(mock_driver).deploy_from_file()
+
+        statements = [c.args[0] for c in session.run.call_args_list]
+        assert any("ON (p.group_id, p.category)" in s for s in statements)
+        assert any("ON (p.group_id, p.success_rate)" in s for s in statements)
+
+    def test_outcome_watermark_schema_is_deployed(self):
+        """The (group_id, timestamp) outcome index and cursor constraint should be deployed."""
+        mock_driver = MagicMock()
+        session = mock_driver.session.return_value.__enter__.return_value
+
+        SchemaDeployer(mock_driver).deploy_from_file()
+
+        statements = [c.args[0] for c in session.run.call_args_list]
+        assert any("ON (o.group_id, o.timestamp)" in s for s in statements)
+        assert any("REQUIRE c.cursor_key IS UNIQUE" in s for s in statements)
+
+    def test_fulltext_index_statement_is_deployed(self):
+        """The fulltext index statement should survive comment filtering."""
+        mock_driver = MagicMock()
+        session = mock_driver.session.return_value.__enter__.return_value
+
+        SchemaDeployer(mock_driver).deploy_from_file()
+
+        statements = [c.args[0] for c in session.run.call_args_list]
+        assert any(s.startswith("CREATE FULLTEXT INDEX pattern_fulltext") for s in statements)
+
+    def test_verify_fulltext_indexes_reports_state(self):
+        """verify_fulltext_indexes should flag missing or populating indexes."""
+        mock_driver = MagicMock()
+        session = mock_driver.session.return_value.__enter__.return_value
+        session.run.return_value = [
+            {'name': 'pattern_fulltext', 'state': 'POPULATING',
+             'labels': ['Pattern'], 'properties': ['name', 'description', 'tags']}
+        ]
+
+        result = SchemaDeployer(mock_driver).verify_fulltext_indexes()
+
+        assert result['all_present']
+        assert not result['all_online']
+        assert result['not_online'] == ['pattern_fulltext']
+
 
 class TestSchemaDeployment:
     """Test schema deployment functionality."""
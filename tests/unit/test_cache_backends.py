@@ -0,0 +1,194 @@
+"""Unit tests for shared cache backends (Story 3-4).
+
+Tests cover:
+- JSON serialization of registered dataclasses
+- Two cache managers sharing one Redis backend
+- Tag invalidation through Redis sets
+- Redis errors degrading to cache misses
+"""
+
+import pytest
+from datetime import datetime, timezone
+from typing import Any, Dict, Set
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.cache_backends import (
+    RedisCacheBackend,
+    serialize_value,
+    deserialize_value
+)
+from src.bmad.core.cache_manager import AsyncCacheManager
+from src.bmad.services.pattern_matcher import Pattern
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.values: Dict[str, bytes] = {}
+        self.sets: Dict[str, Set[bytes]] = {}
+        self.expiries: Dict[str, int] = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key: str):
+        self._check()
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int = None):
+        self._check()
+        self.values[key] = value.encode("utf-8")
+        self.expiries[key] = ex
+
+    async def delete(self, *keys: str) -> int:
+        self._check()
+        removed = 0
+        for key in keys:
+            if self.values.pop(key, None) is not None or self.sets.pop(key, None) is not None:
+                removed += 1
+        return removed
+
+    async def sadd(self, key: str, member: str) -> int:
+        self._check()
+        self.sets.setdefault(key, set()).add(member.encode("utf-8"))
+        return 1
+
+    async def smembers(self, key: str):
+        self._check()
+        return set(self.sets.get(key, set()))
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self._check()
+        self.expiries[key] = seconds
+        return True
+
+    async def scan_iter(self, match: str):
+        self._check()
+        prefix = match.rstrip("*")
+        for key in list(self.values) + list(self.sets):
+            if key.startswith(prefix):
+                yield key
+
+
+def make_pattern(pattern_id: str = "p1", group_id: str = "test-group") -> Pattern:
+    return Pattern(
+        pattern_id=pattern_id,
+        name="Retry with backoff",
+        description="Retry transient failures",
+        category="reliability",
+        tags=["retry"],
+        success_rate=0.9,
+        times_used=3,
+        group_id=group_id,
+        created_at=datetime(2026, 1, 26, tzinfo=timezone.utc),
+        metadata={"source": "test"}
+    )
+
+
+class TestSerialization:
+    """Test JSON serialization of cache values."""
+
+    def test_pattern_round_trip(self):
+        patterns = [make_pattern("p1"), make_pattern("p2")]
+
+        restored = deserialize_value(serialize_value(patterns))
+
+        assert restored == patterns
+        assert isinstance(restored[0].created_at, datetime)
+
+    def test_unregistered_dataclass_rejected(self):
+        from dataclasses import dataclass
+
+        @dataclass
+        class Unregistered:
+            x: int
+
+        with pytest.raises(TypeError):
+            serialize_value(Unregistered(1))
+
+
+class TestRedisCacheBackend:
+    """Test the Redis-backed cache."""
+
+    @pytest.mark.asyncio
+    async def test_workers_share_entries(self):
+        redis = FakeRedis()
+        worker_a = AsyncCacheManager(backend=RedisCacheBackend(redis, namespace="t"))
+        worker_b = AsyncCacheManager(backend=RedisCacheBackend(redis, namespace="t"))
+
+        await worker_a.set("k", [make_pattern()])
+        value = await worker_b.get("k")
+
+        assert value == [make_pattern()]
+        assert redis.expiries["t:entry:k"] == 3600
+        assert worker_b.stats_snapshot().hits == 1
+        assert worker_b.stats_snapshot().backend == "redis"
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_populates_shared_cache(self):
+        redis = FakeRedis()
+        worker_a = AsyncCacheManager(backend=RedisCacheBackend(redis))
+        worker_b = AsyncCacheManager(backend=RedisCacheBackend(redis))
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            return [make_pattern()]
+
+        await worker_a.get_or_compute("k", factory)
+        await worker_b.get_or_compute("k", factory)
+
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags(self):
+        redis = FakeRedis()
+        cache = AsyncCacheManager(backend=RedisCacheBackend(redis))
+        await cache.set("a", 1, tags=["pattern:p1", "group:g1"])
+        await cache.set("b", 2, tags=["group:g2"])
+
+        removed = await cache.invalidate_tags(["pattern:p1"])
+
+        assert removed == 1
+        assert await cache.get("a") is None
+        assert await cache.get("b") == 2
+        assert cache.stats_snapshot().invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_clear_only_touches_namespace(self):
+        redis = FakeRedis()
+        redis.values["other:key"] = b"1"
+        cache = AsyncCacheManager(backend=RedisCacheBackend(redis, namespace="t"))
+        await cache.set("a", 1, tags=["group:g1"])
+
+        await cache.clear()
+
+        assert list(redis.values) == ["other:key"]
+        assert redis.sets == {}
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self):
+        redis = FakeRedis()
+        cache = AsyncCacheManager(backend=RedisCacheBackend(redis))
+        redis.fail = True
+
+        await cache.set("a", 1)
+        value = await cache.get("a")
+
+        stats = cache.stats_snapshot()
+        assert value is None
+        assert stats.misses == 1
+        assert stats.errors == 2
+
+    def test_soft_ttl_cannot_exceed_hard_ttl(self):
+        with pytest.raises(ValueError):
+            RedisCacheBackend(FakeRedis(), ttl_seconds=10, soft_ttl_seconds=20)
@@ -0,0 +1,141 @@
+"""Unit tests for the cold tier query service.
+
+Tests cover:
+- Filtering archived events by group, type, agent, status and time
+- Keyset pagination over archived events
+- Archived insight queries
+"""
+
+import pytest
+from datetime import datetime, timezone
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.archive_store import ArchiveWriter
+from src.bmad.services.cold_tier import ColdTierService
+
+
+def archive_events(root, events):
+    with ArchiveWriter(str(root), 'events', block_records=3) as writer:
+        for e in events:
+            writer.write(
+                e['event_id'], e['group_id'], e['timestamp'], e,
+                record_type=e['event_type'],
+                agent_name=e.get('archived_agent'),
+                status=(e.get('archived_outcome') or {}).get('status')
+            )
+
+
+@pytest.fixture
+def cold_tier(tmp_path):
+    events = [
+        {
+            'event_id': f'e{n:02d}',
+            'group_id': 'faith-meats' if n % 4 else 'diff-driven-saas',
+            'event_type': 'code_review' if n % 2 else 'deployment',
+            'timestamp': f'2025-01-{n % 10 + 1:02d}T12:00:00Z',
+            'archived_agent': 'Brooks' if n % 3 else 'Winston',
+            'archived_outcome': {'outcome_id': f'o{n}', 'status': 'Failed' if n % 5 == 0 else 'Success'}
+        }
+        for n in range(1, 31)
+    ]
+    events.append({
+        'event_id': 'no-outcome', 'group_id': 'faith-meats', 'event_type': 'deployment',
+        'timestamp': '2025-01-05T00:00:00Z'
+    })
+    archive_events(tmp_path / 'events-root', events)
+
+    with ArchiveWriter(str(tmp_path / 'insights-root'), 'insights') as writer:
+        for n, category in enumerate(['testing', 'testing', 'review']):
+            writer.write(
+                f'i{n}', 'faith-meats', datetime(2025, 2, n + 1, tzinfo=timezone.utc),
+                {'insight_id': f'i{n}', 'category': category, 'rule': f'rule {n}'},
+                record_type=category
+            )
+
+    return ColdTierService(
+        insight_archive_dir=str(tmp_path / 'insights-root'),
+        event_archive_dir=str(tmp_path / 'events-root')
+    )
+
+
+class TestEventQueries:
+    """Test archived event filtering."""
+
+    @pytest.mark.asyncio
+    async def test_filters_are_scoped_to_group(self, cold_tier):
+        events = await cold_tier.query_events('faith-meats', event_type='code_review')
+
+        assert events
+        assert all(e['group_id'] == 'faith-meats' for e in events)
+        assert all(e['event_type'] == 'code_review' for e in events)
+        assert await cold_tier.count_events('faith-meats', event_type='code_review') == len(events)
+
+    @pytest.mark.asyncio
+    async def test_agent_status_and_time_range(self, cold_tier):
+        events = await cold_tier.query_events(
+            'faith-meats',
+            agent_name='Brooks',
+            outcome_status='Success',
+            start='2025-01-03T00:00:00Z',
+            end=datetime(2025, 1, 6, tzinfo=timezone.utc)
+        )
+
+        days = {e['timestamp'][:10] for e in events}
+        assert days <= {'2025-01-03', '2025-01-04', '2025-01-05'}
+        assert all(e['archived_agent'] == 'Brooks' for e in events)
+        assert all(e['archived_outcome']['status'] == 'Success' for e in events)
+
+    @pytest.mark.asyncio
+    async def test_with_outcome_skips_events_without_one(self, cold_tier):
+        events = await cold_tier.query_events('faith-meats', event_type='deployment')
+        with_outcome = await cold_tier.query_events(
+            'faith-meats', event_type='deployment', with_outcome=True
+        )
+
+        assert 'no-outcome' in {e['event_id'] for e in events}
+        assert 'no-outcome' not in {e['event_id'] for e in with_outcome}
+        assert len(with_outcome) == len(events) - 1
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_newest_first(self, cold_tier):
+        everything = await cold_tier.query_events('faith-meats')
+        keys = [(e['timestamp'], e['event_id']) for e in everything]
+        assert keys == sorted(keys, reverse=True)
+
+        pages, before = [], None
+        while True:
+            page = await cold_tier.query_events('faith-meats', before=before, limit=4)
+            if not page:
+                break
+            pages.extend(page)
+            before = (page[-1]['timestamp'], page[-1]['event_id'])
+
+        assert [e['event_id'] for e in pages] == [e['event_id'] for e in everything]
+
+    @pytest.mark.asyncio
+    async def test_missing_archive_is_empty(self, tmp_path):
+        cold_tier = ColdTierService(
+            insight_archive_dir=str(tmp_path), event_archive_dir=str(tmp_path)
+        )
+
+        assert await cold_tier.query_events('faith-meats') == []
+        assert await cold_tier.count_events('faith-meats') == 0
+
+
+class TestInsightQueries:
+    """Test archived insight filtering."""
+
+    @pytest.mark.asyncio
+    async def test_by_category_and_created_at(self, cold_tier):
+        testing = await cold_tier.query_insights('faith-meats', category='testing')
+        assert [i['insight_id'] for i in testing] == ['i1', 'i0']
+
+        recent = await cold_tier.query_insights('faith-meats', start='2025-02-02')
+        assert {i['insight_id'] for i in recent} == {'i1', 'i2'}
+
+        assert await cold_tier.query_insights('diff-driven-saas') == []
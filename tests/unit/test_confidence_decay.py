@@ -1,8 +1,7 @@
 """Unit tests for Confidence Decay Service (Story 4-1).
 
 Tests cover:
-- Stale insight detection
-- Confidence decay application
+- Set-based confidence decay in server-side batches
 - Insight archival to CSV
 - Scheduled task execution
 """
@@ -21,6 +20,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.bmad.core.archive_store import ArchiveReader
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
 from src.bmad.services.confidence_decay import (
     ConfidenceDecayService,
@@ -28,6 +28,14 @@ from src.bmad.services.confidence_decay import (
 )
 
 
+def stream_of(records):
+    """Side effect making a mocked stream_query yield the given records."""
+    async def _stream(*args, **kwargs):
+        for record in records:
+            yield record
+    return _stream
+
+
 class TestConfidenceDecayServiceInit:
     """Test ConfidenceDecayService initialization."""
 
@@ -68,184 +76,150 @@ class TestDecayMetrics:
         assert metrics.insights_archived == 2
 
 
-class TestStaleInsightDetection:
-    """Test stale insight detection."""
-
-    @pytest.mark.asyncio
-    async def test_find_stale_insights_with_group(self):
-        """Should find stale insights for specific group."""
-        mock_records = [
-            {
-                'insight_id': 'i1',
-                'rule': 'Test rule',
-                'category': 'testing',
-                'confidence_score': 0.5,
-                'group_id': 'test-group',
-                'created_at': '2024-01-01T00:00:00Z',
-                'last_applied': '2024-09-01T00:00:00Z'
-            }
-        ]
-
-        mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=mock_records)
-
-        service = ConfidenceDecayService(mock_client)
-        results = await service._find_stale_insights('test-group', 90)
-
-        assert len(results) == 1
-        assert results[0]['insight_id'] == 'i1'
-
-    @pytest.mark.asyncio
-    async def test_find_stale_insights_all_groups(self):
-        """Should find stale insights across all groups."""
-        mock_records = [
-            {'insight_id': 'i1', 'group_id': 'group1', 'confidence_score': 0.5},
-            {'insight_id': 'i2', 'group_id': 'group2', 'confidence_score': 0.6}
-        ]
-
-        mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=mock_records)
-
-        service = ConfidenceDecayService(mock_client)
-        results = await service._find_stale_insights(None, 90)
-
-        assert len(results) == 2
+class TestSetBasedDecay:
+    """Test server-side, batched decay."""
 
     @pytest.mark.asyncio
-    async def test_no_stale_insights(self):
-        """Should return empty list when no stale insights."""
+    async def test_decay_runs_in_server_side_batches(self):
+        """One auto-commit statement per group should decay and aggregate."""
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=[])
+        mock_client.execute_auto_commit = AsyncMock(return_value=[
+            {'decayed': 2, 'avg_confidence': 0.54}
+        ])
+        mock_client.stream_query = MagicMock(side_effect=stream_of([]))
 
         service = ConfidenceDecayService(mock_client)
-        results = await service._find_stale_insights('test-group', 90)
-
-        assert len(results) == 0
+        metrics = await service.apply_decay(group_id='test-group')
 
+        mock_client.execute_auto_commit.assert_awaited_once()
+        query, params = mock_client.execute_auto_commit.call_args.args
+        assert "IN TRANSACTIONS OF $batch_size ROWS" in query
+        assert "i.group_id = $group_id" in query
+        assert "count(new_confidence) as decayed" in query
+        assert params['group_id'] == 'test-group'
+        assert params['retain'] == pytest.approx(0.9)
+        assert params['batch_size'] == service.DECAY_BATCH_SIZE
 
-class TestConfidenceDecay:
-    """Test confidence decay application."""
+        assert metrics.insights_decayed == 2
+        assert metrics.avg_new_confidence == 0.54
+        assert metrics.group_id == 'test-group'
+        assert metrics.processing_time_ms >= 0
 
     @pytest.mark.asyncio
-    async def test_decay_applies_correctly(self):
-        """Should apply 10% decay to confidence score."""
-        insight = {
-            'insight_id': 'i1',
-            'confidence_score': 0.5,
-            'group_id': 'test-group'
-        }
-
+    async def test_all_groups_decayed_one_group_at_a_time(self):
+        """Without a group, each group with insights gets its own statement."""
         mock_client = MagicMock(spec=Neo4jAsyncClient)
         mock_client.execute_query = AsyncMock(return_value=[
-            {'new_confidence': 0.45}
+            {'group_id': 'group1'}, {'group_id': 'group2'}
         ])
+        mock_client.execute_auto_commit = AsyncMock(side_effect=[
+            [{'decayed': 3, 'avg_confidence': 0.5}],
+            [{'decayed': 1, 'avg_confidence': 0.9}]
+        ])
+        mock_client.stream_query = MagicMock(side_effect=stream_of([]))
 
         service = ConfidenceDecayService(mock_client)
-        result = await service._decay_insight(insight)
+        metrics = await service.apply_decay()
 
-        assert result == 0.45
+        groups = [c.args[1]['group_id'] for c in mock_client.execute_auto_commit.call_args_list]
+        assert groups == ['group1', 'group2']
+        assert metrics.insights_decayed == 4
+        assert metrics.avg_new_confidence == 0.6  # weighted by group size
+        assert metrics.group_id == 'all'
 
     @pytest.mark.asyncio
     async def test_dry_run_does_not_modify(self):
-        """Dry run should query but not apply changes."""
-        mock_records = [
-            {
-                'insight_id': 'i1',
-                'rule': 'Test rule',
-                'category': 'testing',
-                'confidence_score': 0.5,
-                'group_id': 'test-group',
-                'created_at': '2024-01-01T00:00:00Z',
-                'last_applied': '2024-09-01T00:00:00Z'
-            }
-        ]
-
+        """Dry run should aggregate with a read and write nothing."""
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=mock_records)
+        mock_client.execute_query = AsyncMock(return_value=[
+            {'decayed': 1, 'avg_confidence': 0.45}
+        ])
+        mock_client.execute_auto_commit = AsyncMock()
+        mock_client.stream_query = MagicMock(side_effect=stream_of([]))
 
         service = ConfidenceDecayService(mock_client)
         metrics = await service.apply_decay(group_id='test-group', dry_run=True)
 
-        # Should query for stale insights but not apply decay
-        assert mock_client.execute_query.call_count == 1  # Only find_stale_insights
-        assert metrics.insights_decayed == 1  # Calculated from mock
+        mock_client.execute_auto_commit.assert_not_called()
+        mock_client.stream_query.assert_not_called()
+        assert "SET" not in mock_client.execute_query.call_args.args[0]
+        assert metrics.insights_decayed == 1
         assert metrics.avg_new_confidence == 0.45  # 0.5 * 0.9
 
     @pytest.mark.asyncio
-    async def test_decay_metrics_recorded(self):
-        """Should record decay metrics correctly."""
-        mock_records = [
-            {
-                'insight_id': 'i1',
-                'rule': 'Test rule',
-                'category': 'testing',
-                'confidence_score': 0.5,
-                'group_id': 'test-group',
-                'created_at': '2024-01-01T00:00:00Z',
-                'last_applied': '2024-09-01T00:00:00Z'
-            },
-            {
-                'insight_id': 'i2',
-                'rule': 'Another rule',
-                'category': 'testing',
-                'confidence_score': 0.7,
-                'group_id': 'test-group',
-                'created_at': '2024-01-01T00:00:00Z',
-                'last_applied': '2024-09-01T00:00:00Z'
-            }
-        ]
-
+    async def test_archival_skips_insights_decayed_this_run(self):
+        """Insights decayed by this run should not be archived by it."""
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=mock_records)
+        mock_client.execute_auto_commit = AsyncMock(return_value=[
+            {'decayed': 0, 'avg_confidence': None}
+        ])
+        mock_client.stream_query = MagicMock(side_effect=stream_of([]))
 
         service = ConfidenceDecayService(mock_client)
-        metrics = await service.apply_decay(group_id='test-group', dry_run=False)
+        await service.apply_decay(group_id='test-group')
 
-        assert metrics.insights_decayed == 2
-        assert metrics.group_id == 'test-group'
-        assert metrics.processing_time_ms >= 0
+        decay_params = mock_client.execute_auto_commit.call_args.args[1]
+        query, params = mock_client.stream_query.call_args.args
+        assert "<> $decay_stamp" in query
+        assert params['decay_stamp'] == decay_params['decay_stamp']
 
 
 class TestInsightArchival:
     """Test insight archival to cold storage."""
 
     @pytest.mark.asyncio
-    async def test_archive_low_confidence_insights(self):
+    async def test_archive_low_confidence_insights(self, tmp_path):
         """Should archive insights with confidence < 0.1."""
         mock_records = [
             {
-                'insight_id': 'i1',
-                'rule': 'Stale rule',
-                'category': 'archival',
-                'confidence_score': 0.05,
-                'group_id': 'test-group',
-                'created_at': '2024-01-01T00:00:00Z',
-                'last_applied': '2024-09-01T00:00:00Z'
+                'properties': {
+                    'insight_id': 'i1',
+                    'rule': 'Stale rule',
+                    'category': 'archival',
+                    'confidence_score': 0.05,
+                    'group_id': 'test-group',
+                    'created_at': '2024-01-01T00:00:00Z',
+                    'last_applied': '2024-09-01T00:00:00Z'
+                },
+                'confidence_score': 0.05
             }
         ]
 
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=mock_records)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        mock_client.stream_query = MagicMock(side_effect=stream_of(mock_records))
 
-        service = ConfidenceDecayService(mock_client)
+        service = ConfidenceDecayService(mock_client, archive_dir=str(tmp_path))
         count, archive_path = await service._archive_low_confidence_insights(
-            'test-group', []
+            'test-group'
         )
 
         assert count == 1
-        assert archive_path is not None
-        assert archive_path.name.startswith('archived_insights_')
-        assert archive_path.name.endswith('.csv')
+        assert archive_path == tmp_path / 'insights'
+        assert list(archive_path.glob('group_id=test-group/date=*/part-*.jsonl.gz'))
+
+        # Full properties are archived and retrievable by ID
+        archived = ArchiveReader(str(tmp_path), 'insights').get('i1')
+        assert archived['rule'] == 'Stale rule'
+        assert archived['archived_confidence'] == 0.05
+        assert archived['archive_reason'] == 'confidence_below_0.1'
+
+        # Archived insights are deleted after the archive is written
+        mock_client.execute_query.assert_called_once()
+        assert mock_client.execute_query.call_args.args[1] == {
+            "ids": ["i1"], "group_id": "test-group"
+        }
 
     @pytest.mark.asyncio
     async def test_no_insights_to_archive(self):
         """Should return 0 when no insights to archive."""
         mock_client = MagicMock(spec=Neo4jAsyncClient)
         mock_client.execute_query = AsyncMock(return_value=[])
+        mock_client.stream_query = MagicMock(side_effect=stream_of([]))
 
         service = ConfidenceDecayService(mock_client)
         count, archive_path = await service._archive_low_confidence_insights(
-            'test-group', []
+            'test-group'
         )
 
         assert count == 0
@@ -262,9 +236,12 @@ class TestInsightDeletion:
         mock_client.execute_query = AsyncMock(return_value=[{'deleted': True}])
 
         service = ConfidenceDecayService(mock_client)
-        count = await service._delete_insights(['i1', 'i2'])
+        count = await service._delete_insights(['i1', 'i2'], 'test-group')
 
         assert count == 2
+        query, params = mock_client.execute_query.call_args.args
+        assert params == {"ids": ["i1", "i2"], "group_id": "test-group"}
+        assert "i.group_id = $group_id" in query
 
     @pytest.mark.asyncio
     async def test_delete_empty_list(self):
@@ -273,7 +250,7 @@ class TestInsightDeletion:
         mock_client.execute_query = AsyncMock()
 
         service = ConfidenceDecayService(mock_client)
-        count = await service._delete_insights([])
+        count = await service._delete_insights([], 'test-group')
 
         assert count == 0
         mock_client.execute_query.assert_not_called()
@@ -2,7 +2,7 @@
 
 Tests cover:
 - Event aggregation logic
-- Event archival to CSV
+- Event archival to cold storage
 - Scheduled task execution
 """
 
@@ -19,6 +19,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.bmad.core.archive_store import ArchiveReader
 from src.bmad.core.neo4j_client import Neo4jAsyncClient
 from src.bmad.services.event_aggregation import (
     EventAggregationService,
@@ -28,6 +29,14 @@ from src.bmad.services.event_aggregation import (
 )
 
 
+def stream_of(records):
+    """Side effect making a mocked stream_query yield the given records."""
+    async def _stream(*args, **kwargs):
+        for record in records:
+            yield record
+    return _stream
+
+
 class TestEventAggregationServiceInit:
     """Test EventAggregationService initialization."""
 
@@ -55,13 +64,17 @@ class TestEventSummary:
             event_type="code_review",
             group_id="test-group",
             count=100,
-            period="archived",
+            period="weekly",
             first_event=datetime(2024, 1, 1, tzinfo=timezone.utc),
-            last_event=datetime(2024, 1, 15, tzinfo=timezone.utc)
+            last_event=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            bucket_start="2024-01-01",
+            success_count=90,
+            failure_count=10
         )
 
         assert summary.event_type == "code_review"
         assert summary.count == 100
+        assert summary.bucket_start == "2024-01-01"
 
 
 class TestAggregationMetrics:
@@ -164,53 +177,114 @@ class TestOldEventDetection:
         assert len(results) == 0
 
 
-class TestSummaryCreation:
-    """Test EventSummary creation."""
+class TestEventRollups:
+    """Test time-bucketed EventSummary rollups."""
+
+    daily = [
+        {
+            'event_type': 'code_review', 'day': '2024-09-01', 'count': 3,
+            'success_count': 2, 'failure_count': 1,
+            'first_event': '2024-09-01T08:00:00Z', 'last_event': '2024-09-01T17:00:00Z'
+        },
+        {
+            'event_type': 'code_review', 'day': '2024-09-03', 'count': 2,
+            'success_count': 2, 'failure_count': 0,
+            'first_event': '2024-09-03T09:00:00Z', 'last_event': '2024-09-03T10:00:00Z'
+        }
+    ]
+
+    def test_bucket_start(self):
+        from datetime import date
+        from src.bmad.services.event_aggregation import bucket_start
+
+        day = date(2024, 9, 5)  # Thursday
+        assert bucket_start(day, 'daily') == day
+        assert bucket_start(day, 'weekly') == date(2024, 9, 2)
+        assert bucket_start(day, 'monthly') == date(2024, 9, 1)
 
     @pytest.mark.asyncio
-    async def test_create_summaries(self):
-        """Should create summaries from event groups."""
-        event_groups = [
-            {
-                'event_type': 'code_review',
-                'group_id': 'test-group',
-                'count': 50,
-                'first_event': '2024-09-01T00:00:00Z',
-                'last_event': '2024-09-15T00:00:00Z'
-            }
+    async def test_rollup_writes_buckets_with_cursor(self):
+        """Daily counts fold into weekly/monthly buckets, written in one transaction."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self.daily)
+        mock_client.execute_write_transaction = AsyncMock(return_value=[[], []])
+
+        service = EventAggregationService(mock_client)
+        summaries = await service.rollup_events('test-group')
+
+        buckets = {(s.period, s.bucket_start): s for s in summaries}
+        assert sorted(buckets) == [
+            ('daily', '2024-09-01'), ('daily', '2024-09-03'),
+            ('monthly', '2024-09-01'),
+            ('weekly', '2024-08-26'), ('weekly', '2024-09-02')
         ]
+        monthly = buckets[('monthly', '2024-09-01')]
+        assert (monthly.count, monthly.success_count, monthly.failure_count) == (5, 4, 1)
+        assert monthly.first_event == '2024-09-01T08:00:00Z'
+        assert monthly.last_event == '2024-09-03T10:00:00Z'
+
+        (upsert, upsert_params), (advance, advance_params) = (
+            mock_client.execute_write_transaction.call_args.args[0]
+        )
+        assert upsert.lstrip().startswith("UNWIND $rows AS row")
+        assert len(upsert_params['rows']) == 5
+        assert "ProcessingCursor" in advance
+        assert advance_params['cursor_key'] == 'event_rollup|test-group'
+
+        read_params = mock_client.execute_query.call_args.args[1]
+        assert read_params['until'] == advance_params['until']
 
+    @pytest.mark.asyncio
+    async def test_rollup_dry_run_writes_nothing(self):
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock()
+        mock_client.execute_query = AsyncMock(return_value=self.daily)
+        mock_client.execute_write_transaction = AsyncMock()
 
         service = EventAggregationService(mock_client)
-        summaries = await service._create_summaries(event_groups, dry_run=False)
+        summaries = await service.rollup_events('test-group', dry_run=True)
 
-        assert len(summaries) == 1
-        assert summaries[0].event_type == 'code_review'
-        assert summaries[0].count == 50
+        assert len(summaries) == 5
+        mock_client.execute_write_transaction.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_dry_run_no_queries(self):
-        """Dry run should not create summaries."""
-        event_groups = [
-            {
-                'event_type': 'code_review',
-                'group_id': 'test-group',
-                'count': 50,
-                'first_event': '2024-09-01T00:00:00Z',
-                'last_event': '2024-09-15T00:00:00Z'
-            }
-        ]
+    async def test_rollup_without_events_advances_cursor(self):
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        mock_client.execute_write_transaction = AsyncMock(return_value=[[]])
+
+        service = EventAggregationService(mock_client)
+        assert await service.rollup_events('test-group') == []
+
+        statements = mock_client.execute_write_transaction.call_args.args[0]
+        assert len(statements) == 1
+        assert "ProcessingCursor" in statements[0][0]
+
+    @pytest.mark.asyncio
+    async def test_event_trends_read_buckets(self):
+        from datetime import date
 
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock()
+        mock_client.execute_query = AsyncMock(return_value=[{
+            'event_type': 'code_review', 'bucket_start': '2024-09-02', 'count': 2,
+            'success_count': 2, 'failure_count': 0,
+            'first_event': '2024-09-03T09:00:00Z', 'last_event': '2024-09-03T10:00:00Z'
+        }])
 
         service = EventAggregationService(mock_client)
-        summaries = await service._create_summaries(event_groups, dry_run=True)
+        trends = await service.get_event_trends(
+            'test-group', period='weekly', start=date(2024, 9, 1)
+        )
 
-        assert len(summaries) == 1
-        mock_client.execute_query.assert_not_called()
+        assert trends[0].bucket_start == '2024-09-02'
+        assert trends[0].period == 'weekly'
+        query, params = mock_client.execute_query.call_args.args
+        assert "MATCH (s:EventSummary)" in query
+        assert ":Event)" not in query
+        assert params['start'] == '2024-09-01'
+        assert params['period'] == 'weekly'
+
+        with pytest.raises(ValueError):
+            await service.get_event_trends('test-group', period='archived')
 
 
 class TestEventDeletion:
@@ -223,9 +297,36 @@ class TestEventDeletion:
         mock_client.execute_query = AsyncMock()
 
         service = EventAggregationService(mock_client)
-        count = await service._delete_events(['e1', 'e2', 'e3'])
+        count = await service._delete_events(['e1', 'e2', 'e3'], 'test-group')
+
+        assert count == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_events_scoped_to_group(self):
+        """Deletes should carry and filter on the events' group_id."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock()
+
+        service = EventAggregationService(mock_client)
+        await service._delete_events(['e1'], 'test-group')
+
+        query, params = mock_client.execute_query.call_args.args
+        assert params == {"group_id": "test-group", "event_ids": ["e1"]}
+        assert "e.group_id = $group_id" in query
+
+    @pytest.mark.asyncio
+    async def test_delete_events_in_chunks(self):
+        """Large deletes should be split into bounded chunks."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock()
+
+        service = EventAggregationService(mock_client)
+        service.DELETE_BATCH_SIZE = 2
+        count = await service._delete_events(['e1', 'e2', 'e3'], 'test-group')
 
         assert count == 3
+        chunks = [c.args[1]['event_ids'] for c in mock_client.execute_query.call_args_list]
+        assert chunks == [['e1', 'e2'], ['e3']]
 
     @pytest.mark.asyncio
     async def test_delete_empty_list(self):
@@ -234,27 +335,29 @@ class TestEventDeletion:
         mock_client.execute_query = AsyncMock()
 
         service = EventAggregationService(mock_client)
-        count = await service._delete_events([])
+        count = await service._delete_events([], 'test-group')
 
         assert count == 0
         mock_client.execute_query.assert_not_called()
 
 
-class TestCSVArchival:
-    """Test event archival to CSV."""
+class TestEventArchival:
+    """Test event archival to cold storage."""
 
     @pytest.mark.asyncio
-    async def test_archive_to_csv(self):
-        """Should archive events to CSV file."""
+    async def test_archive_events(self):
+        """Should archive full events, retrievable by ID."""
+        description = 'Review completed. ' * 100
         events = [
             ArchivedEvent(
                 event_id='e1',
                 event_type='code_review',
                 timestamp='2024-09-01T00:00:00Z',
                 group_id='test-group',
-                description='Review completed',
+                description=description,
                 archived_at='2024-10-28T00:00:00Z',
-                archive_reason='event_aggregation'
+                archive_reason='event_aggregation',
+                properties={'event_id': 'e1', 'outcome': 'approved'}
             )
         ]
 
@@ -264,18 +367,20 @@ class TestCSVArchival:
         import tempfile
         with tempfile.TemporaryDirectory() as tmpdir:
             service = EventAggregationService(mock_client, archive_dir=tmpdir)
-            archive_path = await service._archive_to_csv(events, 'test-group')
+            archive_path, event_ids = await service._archive_events(
+                stream_of(events)(), 'test-group'
+            )
 
-            assert archive_path.endswith('.csv')
-            assert 'archived_events' in archive_path
+            assert event_ids == {'test-group': ['e1']}
+            assert archive_path == str(Path(tmpdir) / 'events')
+            assert (
+                Path(archive_path) / 'group_id=test-group' / 'date=2024-09-01'
+            ).is_dir()
 
-            # Verify file contents
-            import csv
-            with open(archive_path, 'r') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                assert len(rows) == 1
-                assert rows[0]['event_id'] == 'e1'
+            # Descriptions are no longer truncated; extra properties are kept
+            archived = ArchiveReader(tmpdir, 'events').get('e1', group_id='test-group')
+            assert archived['description'] == description
+            assert archived['outcome'] == 'approved'
 
     @pytest.mark.asyncio
     async def test_archive_empty_list(self):
@@ -285,9 +390,13 @@ class TestCSVArchival:
         import tempfile
         with tempfile.TemporaryDirectory() as tmpdir:
             service = EventAggregationService(mock_client, archive_dir=tmpdir)
-            archive_path = await service._archive_to_csv([], 'test-group')
+            archive_path, event_ids = await service._archive_events(
+                stream_of([])(), 'test-group'
+            )
 
             assert archive_path == ""
+            assert event_ids == {}
+            assert list(Path(tmpdir).rglob('*.jsonl.gz')) == []
 
 
 class TestEventAggregation:
@@ -307,18 +416,24 @@ class TestEventAggregation:
         ]
 
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=event_groups)
+        mock_client.execute_query = AsyncMock(side_effect=[
+            event_groups,                   # _find_old_events (stats)
+            TestEventRollups.daily[:1],     # rollup_events (daily counts)
+        ])
+        mock_client.execute_write_transaction = AsyncMock()
 
         service = EventAggregationService(mock_client)
         metrics = await service.aggregate_events(group_id='test-group', dry_run=True)
 
         assert metrics.events_aggregated == 1
+        assert metrics.summaries_created == 3
         assert metrics.events_archived == 0
         assert metrics.group_id == 'test-group'
+        mock_client.execute_write_transaction.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_aggregate_events_with_archival(self):
-        """Should aggregate events and archive to CSV."""
+        """Should roll up, archive and then delete old events."""
         # _find_old_events returns aggregated data (no event_id)
         aggregated_data = [
             {
@@ -330,7 +445,7 @@ class TestEventAggregation:
             }
         ]
 
-        # _fetch_events_for_archival returns actual events (with event_id)
+        # _stream_old_events yields actual events (with event_id)
         event_details = [
             {
                 'event_id': 'e1',
@@ -341,18 +456,14 @@ class TestEventAggregation:
             }
         ]
 
-        event_ids_result = [
-            {'event_id': 'e1'}
-        ]
-
         mock_client = MagicMock(spec=Neo4jAsyncClient)
         mock_client.execute_query = AsyncMock(side_effect=[
-            aggregated_data,  # _find_old_events (stats)
-            event_ids_result, # _find_event_ids (new query)
-            event_details,    # _fetch_events_for_archival (by event_ids)
-            [],               # _upsert_summary
-            [],               # _delete_events
+            aggregated_data,            # _find_old_events (stats)
+            TestEventRollups.daily,     # rollup_events (daily counts)
+            [],                         # _delete_events
         ])
+        mock_client.stream_query = MagicMock(side_effect=stream_of(event_details))  # _stream_old_events
+        mock_client.execute_write_transaction = AsyncMock(return_value=[[], []])  # rollup upsert
 
         import tempfile
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -367,6 +478,45 @@ class TestEventAggregation:
             # Processing time is calculated dynamically, just check it's present
             assert metrics.processing_time_ms >= 0
 
+            # Events are deleted only after being archived
+            delete_call = mock_client.execute_query.call_args_list[-1]
+            assert delete_call.args[1] == {"group_id": "test-group", "event_ids": ["e1"]}
+
+    @pytest.mark.asyncio
+    async def test_aggregate_all_groups_deletes_per_group(self):
+        """Without a group_id, deletes should be split by each event's group."""
+        aggregated_data = [
+            {'event_type': 'code_review', 'group_id': 'group-a', 'count': 1,
+             'first_event': '2024-09-01T00:00:00Z', 'last_event': '2024-09-01T00:00:00Z'},
+            {'event_type': 'code_review', 'group_id': 'group-b', 'count': 1,
+             'first_event': '2024-09-01T00:00:00Z', 'last_event': '2024-09-01T00:00:00Z'}
+        ]
+        event_details = [
+            {'event_id': 'e1', 'event_type': 'code_review',
+             'timestamp': '2024-09-01T00:00:00Z', 'group_id': 'group-a'},
+            {'event_id': 'e2', 'event_type': 'code_review',
+             'timestamp': '2024-09-01T00:00:00Z', 'group_id': 'group-b'}
+        ]
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        mock_client.stream_query = MagicMock(side_effect=stream_of(event_details))
+        service = EventAggregationService(mock_client)
+        service._find_old_events = AsyncMock(return_value=aggregated_data)
+        service.rollup_events = AsyncMock(return_value=[])
+
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service._archive_dir = Path(tmpdir)
+            metrics = await service.aggregate_events(dry_run=False)
+
+        assert metrics.events_archived == 2
+        deletes = [c.args[1] for c in mock_client.execute_query.call_args_list]
+        assert deletes == [
+            {"group_id": "group-a", "event_ids": ["e1"]},
+            {"group_id": "group-b", "event_ids": ["e2"]}
+        ]
+
 
 class TestEventCounts:
     """Test event counting functionality."""
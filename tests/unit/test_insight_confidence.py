@@ -0,0 +1,133 @@
+"""Unit tests for the effective insight confidence model.
+
+Tests cover:
+- Closed-form decay and expiry times
+- Eager vs lazy Cypher expressions
+- Services reading confidence through the shared helper
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.insight_confidence import (
+    ARCHIVE_THRESHOLD,
+    compute_effective_confidence,
+    compute_expires_at,
+    decay_periods,
+    effective_confidence,
+    expires_at_expr,
+    insight_confidence
+)
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def lazy(monkeypatch):
+    monkeypatch.setenv("CONFIDENCE_DECAY_MODE", "lazy")
+
+
+class TestClosedForm:
+    """Test the decay model in Python."""
+
+    def test_no_decay_before_stale(self):
+        assert decay_periods(NOW - timedelta(days=89), NOW) == 0
+        assert compute_effective_confidence(0.8, NOW - timedelta(days=89), NOW) == 0.8
+
+    def test_one_step_per_day_once_stale(self):
+        """Matches one 10% step per nightly run from day 90 on."""
+        assert decay_periods(NOW - timedelta(days=90), NOW) == 1
+        assert decay_periods(NOW - timedelta(days=92), NOW) == 3
+        assert compute_effective_confidence(0.8, NOW - timedelta(days=92), NOW) == pytest.approx(0.8 * 0.9 ** 3)
+
+    def test_missing_reference_never_decays(self):
+        assert compute_effective_confidence(0.8, None, NOW) == 0.8
+        assert compute_expires_at(0.8, None) is None
+
+    def test_expires_when_effective_drops_below_threshold(self):
+        expires = compute_expires_at(0.3, NOW)
+
+        reference_age = expires - NOW
+        before = NOW - reference_age + timedelta(days=1)
+        assert compute_effective_confidence(0.3, NOW - reference_age, NOW) < ARCHIVE_THRESHOLD
+        assert compute_effective_confidence(0.3, before, NOW) >= ARCHIVE_THRESHOLD
+
+    def test_insight_confidence_follows_mode(self, monkeypatch):
+        node = {"confidence_score": 0.8, "created_at": NOW - timedelta(days=91)}
+
+        monkeypatch.delenv("CONFIDENCE_DECAY_MODE", raising=False)
+        assert insight_confidence(node, NOW) == 0.8
+
+        monkeypatch.setenv("CONFIDENCE_DECAY_MODE", "lazy")
+        assert insight_confidence(node, NOW) == pytest.approx(0.648)
+
+
+class TestCypherExpressions:
+    """Test generated Cypher."""
+
+    def test_eager_reads_stored_value(self, monkeypatch):
+        monkeypatch.delenv("CONFIDENCE_DECAY_MODE", raising=False)
+
+        assert effective_confidence("i") == "i.confidence_score"
+
+    def test_lazy_decays_from_last_applied(self, lazy):
+        expr = effective_confidence("i")
+
+        assert "coalesce(i.last_applied, i.created_at)" in expr
+        assert "0.9 ^" in expr
+        assert "duration.inDays" in expr
+
+    def test_expires_at_expression(self):
+        expr = expires_at_expr("i")
+
+        assert "duration({days: 90 + toInteger(floor(log(0.1 / i.confidence_score)" in expr
+
+
+class TestReaders:
+    """Test that readers use the effective confidence."""
+
+    @pytest.mark.asyncio
+    async def test_knowledge_transfer_thresholds_use_effective_confidence(self, lazy):
+        from src.bmad.services.knowledge_transfer import KnowledgeTransferService
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+
+        await KnowledgeTransferService(mock_client).get_insights_to_share("faith-meats")
+
+        cypher = mock_client.execute_query.call_args[0][0]
+        assert f"AND {effective_confidence('i')} >= $threshold" in cypher
+        assert f"{effective_confidence('i')} as confidence_score" in cypher
+
+    @pytest.mark.asyncio
+    async def test_lazy_sweep_archives_by_expires_at_without_decay_writes(self, lazy, tmp_path):
+        from src.bmad.services.confidence_decay import ConfidenceDecayService
+
+        async def no_records(*args, **kwargs):
+            return
+            yield
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[{"decayed": 4, "avg_confidence": 0.5}])
+        mock_client.execute_auto_commit = AsyncMock(return_value=[])
+        mock_client.stream_query = MagicMock(side_effect=no_records)
+
+        service = ConfidenceDecayService(mock_client, archive_dir=str(tmp_path), similarity=MagicMock())
+        metrics = await service.apply_decay(group_id="faith-meats")
+
+        assert metrics.insights_decayed == 4
+        # The only write refreshes expires_at; confidence_score is never set
+        writes = [c.args[0] for c in mock_client.execute_auto_commit.call_args_list]
+        assert len(writes) == 1
+        assert "SET i.expires_at" in writes[0]
+        assert "confidence_score =" not in writes[0]
+        archive_query = mock_client.stream_query.call_args[0][0]
+        assert "i.expires_at <= datetime()" in archive_query
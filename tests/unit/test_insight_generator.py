@@ -115,6 +115,68 @@ class TestErrorPatternExtractor:
         assert "TypeError" in rule or "type" in rule.lower()
 
 
+class TestErrorRuleTable:
+    """Test the compiled, configurable rule table."""
+
+    @pytest.fixture(autouse=True)
+    def restore_rules(self):
+        rules = ErrorPatternExtractor.ERROR_PATTERNS
+        window = ErrorPatternExtractor.SCAN_WINDOW_CHARS
+        yield
+        ErrorPatternExtractor.configure(rules=rules, scan_window_chars=window)
+
+    def test_table_order_wins_over_log_position(self):
+        """Earlier rules take priority, as when each rule searched the log."""
+        error_type, fix = ErrorPatternExtractor.extract("KeyError: 'a'\nTypeError: bad operand")
+
+        assert error_type == "TypeError"
+        assert fix == "Fix type mismatch: bad operand"
+
+    def test_only_the_tail_is_scanned(self):
+        ErrorPatternExtractor.configure(scan_window_chars=100)
+        log = "KeyError: 'early'\n" + "x" * 200 + "\nValueError: late"
+
+        assert ErrorPatternExtractor.extract(log) == ("ValueError", "Validate input: late")
+        assert ErrorPatternExtractor.extract("KeyError: 'early'\n" + "x" * 200)[0] == "Error"
+
+    def test_match_is_case_insensitive(self):
+        error_type, _ = ErrorPatternExtractor.extract("keyerror: 'name'")
+
+        assert error_type == "keyerror"
+
+    def test_rules_load_from_yaml(self, tmp_path):
+        from src.bmad.services.insight_generator import ErrorRule
+
+        path = tmp_path / "error_rules.yaml"
+        path.write_text(
+            "- error_types: [AssertionError]\n"
+            "  pattern: '(AssertionError):\\s*(.+)'\n"
+            "  fix: 'Check the expectation: {2}'\n"
+        )
+
+        rules = ErrorPatternExtractor.load_rules(str(path))
+        ErrorPatternExtractor.configure(rules=rules)
+
+        assert rules == [ErrorRule(("AssertionError",), r"(AssertionError):\s*(.+)", "Check the expectation: {2}")]
+        assert ErrorPatternExtractor.extract("AssertionError: 3 != 2") == (
+            "AssertionError", "Check the expectation: 3 != 2"
+        )
+        assert ErrorPatternExtractor.extract("KeyError: 'a'")[0] == "Error"
+
+    def test_invalid_rules_are_skipped(self):
+        from src.bmad.services.insight_generator import ErrorRule
+
+        ErrorPatternExtractor.configure(rules=[
+            ErrorRule(("KeyError",), r"(KeyError):\s*(.+)", "Missing group: {3}"),
+            ErrorRule(("KeyError",), r"(KeyError):\s*(.+)", "Bad spec: {2:z}"),
+            ErrorRule(("KeyError",), r"(KeyError", "Unbalanced: {1}"),
+            ErrorRule(("KeyError",), r"(KeyError):\s*(.+)", "Add key {2}"),
+        ])
+
+        assert len(ErrorPatternExtractor._compiled) == 1
+        assert ErrorPatternExtractor.extract("KeyError: 'a'") == ("KeyError", "Add key 'a'")
+
+
 class TestConfidenceScorer:
     """Test confidence scoring functionality."""
 
@@ -394,16 +456,320 @@ class TestProcessOutcomesBatch:
 
         mock_client = MagicMock(spec=Neo4jAsyncClient)
         mock_client.execute_query = AsyncMock(return_value=[
-            {"confidence_score": 0.5, "success_rate": 0.8, "times_used": 5}
+            {"pattern_id": "p1", "group_id": "test", "confidence_score": 0.5,
+             "success_rate": 0.8, "times_used": 5}
         ])
-        mock_client.execute_write = AsyncMock(return_value=[])
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
 
-        generator = InsightGenerator(mock_client)
+        generator = InsightGenerator(mock_client, similarity=MagicMock())
 
         result = await generator.process_outcomes_batch(outcomes)
 
         assert result.processed_count == 2
         assert result.insights_generated == 1  # Only failed generates insight
+        assert result.patterns_updated == 1
+        assert result.outcomes_per_second > 0
+
+
+def make_outcome(outcome_id: str, status: str = "Failed", pattern_id: str = None,
+                 group_id: str = "test") -> ProcessedOutcome:
+    return ProcessedOutcome(
+        outcome_id=outcome_id,
+        status=status,
+        result_summary=status,
+        error_log="KeyError: 'name'" if status == "Failed" else None,
+        event_type="test",
+        group_id=group_id,
+        agent_name="Brooks",
+        timestamp=datetime.now(timezone.utc),
+        used_pattern_id=pattern_id
+    )
+
+
+class TestBatchedGeneration:
+    """Test chunked, concurrent batch writes."""
+
+    def make_generator(self, mock_client):
+        similarity = MagicMock()
+        similarity.is_loaded = True
+        return InsightGenerator(mock_client, similarity=similarity), similarity
+
+    @pytest.mark.asyncio
+    async def test_insights_written_per_chunk_with_generated_edges(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        generator, similarity = self.make_generator(mock_client)
+
+        outcomes = [make_outcome(f"f{i}") for i in range(5)]
+        result = await generator.process_outcomes_batch(outcomes, chunk_size=2)
+
+        assert result.insights_generated == 5
+        assert mock_client.execute_write_batch.await_count == 3
+        query, rows = mock_client.execute_write_batch.call_args_list[0][0][:2]
+        assert "UNWIND" not in query  # added by execute_write_batch
+        assert "[:GENERATED]" in query
+        assert [r["learned_from"] for r in rows] == ["f0", "f1"]
+        assert rows[0]["rule"] == "[test] Avoid KeyError: Add key 'name' to dictionary or check for case sensitivity"
+        assert similarity.add_many.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        in_flight = 0
+        peak = 0
+
+        async def write(query, rows, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(side_effect=write)
+        generator, _ = self.make_generator(mock_client)
+
+        outcomes = [make_outcome(f"f{i}") for i in range(10)]
+        result = await generator.process_outcomes_batch(outcomes, chunk_size=1, max_concurrency=3)
+
+        assert result.insights_generated == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_repeated_successes_fold_into_one_write(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[
+            {"pattern_id": "p1", "group_id": "global-coding-skills", "confidence_score": 0.5,
+             "success_rate": 0.9, "times_used": 2}
+        ])
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        generator, _ = self.make_generator(mock_client)
+
+        outcomes = [make_outcome(f"s{i}", status="Success", pattern_id="p1") for i in range(3)]
+        result = await generator.process_outcomes_batch(outcomes)
+
+        assert result.patterns_updated == 3
+        mock_client.execute_query.assert_awaited_once()
+        query, rows = mock_client.execute_write_batch.call_args[0][:2]
+        assert len(rows) == 1
+        assert len(rows[0]["outcomes"]) == 3
+        # Counters are incremented server-side, never written back absolutely
+        assert "times_used" not in rows[0] and "success_rate" not in rows[0]
+        assert "p.times_used = coalesce(p.times_used, 0) + size(row.outcomes)" in query
+        assert rows[0]["confidence_score"] == pytest.approx(0.8)  # three learning increments
+
+    @pytest.mark.asyncio
+    async def test_other_groups_patterns_are_not_reinforced(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[
+            {"pattern_id": "p1", "group_id": "other", "confidence_score": 0.5,
+             "success_rate": 0.9, "times_used": 2}
+        ])
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        generator, _ = self.make_generator(mock_client)
+
+        result = await generator.process_outcomes_batch(
+            [make_outcome("s1", status="Success", pattern_id="p1")]
+        )
+
+        assert result.patterns_updated == 0
+        mock_client.execute_write_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_only_fails_its_outcomes(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        async def write(query, rows, **kwargs):
+            if rows[0]["learned_from"] == "f2":
+                raise RuntimeError("deadlock")
+            return []
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(side_effect=write)
+        generator, _ = self.make_generator(mock_client)
+
+        outcomes = [make_outcome(f"f{i}") for i in range(4)]
+        result = await generator.process_outcomes_batch(outcomes, chunk_size=2)
+
+        assert result.insights_generated == 2
+        assert result.errors == ["Outcome f2: deadlock", "Outcome f3: deadlock"]
+
+
+class TestProcessingCursor:
+    """Test watermark-based discovery and cursor advance."""
+
+    def make_generator(self, mock_client):
+        similarity = MagicMock()
+        similarity.is_loaded = False
+        return InsightGenerator(mock_client, similarity=similarity)
+
+    @pytest.mark.asyncio
+    async def test_discovery_reads_after_cursor_in_order(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        generator = self.make_generator(mock_client)
+
+        await generator.get_unprocessed_outcomes("faith-meats", limit=100)
+
+        query, params = mock_client.execute_query.call_args[0]
+        assert "ProcessingCursor {cursor_key: $cursor_key}" in query
+        assert "o.timestamp >= since" in query
+        assert "NOT exists" not in query
+        assert "o.insights_processed_at IS NULL" in query
+        assert "ORDER BY o.timestamp, o.outcome_id" in query
+        assert query.rstrip().endswith("LIMIT $limit")
+        assert params["cursor_key"] == "insight_generation|faith-meats"
+        assert params["limit"] == 100
+
+    @pytest.mark.asyncio
+    async def test_discovery_returns_one_entry_per_outcome(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[{
+            "outcome_id": "s1", "status": "Success", "result_summary": "ok",
+            "event_type": "test", "group_id": "faith-meats", "agent_name": "Brooks",
+            "timestamp": datetime.now(timezone.utc), "pattern_ids": ["p1", "p2"]
+        }])
+        generator = self.make_generator(mock_client)
+
+        outcomes = await generator.get_unprocessed_outcomes("faith-meats", limit=1)
+
+        # Patterns are collected per outcome before the page is cut
+        query = mock_client.execute_query.call_args[0][0]
+        assert query.index("collect(DISTINCT p.pattern_id)") < query.index("ORDER BY")
+        assert [o.outcome_id for o in outcomes] == ["s1"]
+        assert outcomes[0].pattern_ids == ["p1", "p2"]
+
+        # Both patterns are reinforced by the one outcome
+        _, successes = generator._partition(outcomes)
+        assert {pid: [o.outcome_id for o in out] for pid, out in successes.items()} == {
+            "p1": ["s1"], "p2": ["s1"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_page_runs_through_batch_path_then_moves_cursor(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[
+            {"pattern_id": "p1", "group_id": "test", "confidence_score": 0.5,
+             "success_rate": 0.9, "times_used": 2}
+        ])
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        mock_client.execute_write = AsyncMock(return_value=[])
+        generator = self.make_generator(mock_client)
+        page = [make_outcome("f1"), make_outcome("s1", status="Success", pattern_id="p1")]
+        generator.get_unprocessed_outcomes = AsyncMock(side_effect=[page, []])
+
+        result = await generator.process_new_outcomes("test", page_size=2)
+
+        assert (result.processed_count, result.insights_generated, result.patterns_updated) == (2, 1, 1)
+        writes = {c[0][0]: c[0][1] for c in mock_client.execute_write_batch.call_args_list}
+        insight_query = next(q for q in writes if "[:GENERATED]" in q)
+        pattern_query = next(q for q in writes if "SET p.confidence_score" in q)
+        assert "o.insights_processed_at" in insight_query
+        assert "o.insights_processed_at" in pattern_query
+        assert writes[pattern_query][0]["outcomes"] == [{"outcome_id": "s1", "group_id": "test"}]
+
+        query, params = mock_client.execute_write.call_args[0]
+        assert "MERGE (c:ProcessingCursor" in query
+        assert params["last_outcome_id"] == "s1"
+        assert params["last_timestamp"] == page[-1].timestamp
+
+    @pytest.mark.asyncio
+    async def test_pages_use_concurrent_chunks(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        mock_client.execute_write = AsyncMock(return_value=[])
+        generator = self.make_generator(mock_client)
+        generator.BATCH_CHUNK_SIZE = 2
+        generator.get_unprocessed_outcomes = AsyncMock(
+            return_value=[make_outcome(f"f{i}") for i in range(5)]
+        )
+
+        result = await generator.process_new_outcomes("test")
+
+        assert result.processed_count == 5
+        generator.get_unprocessed_outcomes.assert_awaited_once()
+        assert generator.get_unprocessed_outcomes.call_args.kwargs["limit"] == (
+            2 * generator.MAX_CONCURRENT_CHUNKS
+        )
+        assert mock_client.execute_write_batch.await_count == 3
+        mock_client.execute_write.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_short_page_ends_the_run(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        mock_client.execute_write = AsyncMock(return_value=[])
+        generator = self.make_generator(mock_client)
+        generator.get_unprocessed_outcomes = AsyncMock(side_effect=[
+            [make_outcome("f1"), make_outcome("f2")],
+            [make_outcome("f3")],
+        ])
+
+        result = await generator.process_new_outcomes("test", page_size=2)
+
+        assert result.processed_count == 3
+        assert generator.get_unprocessed_outcomes.await_count == 2
+        assert mock_client.execute_write.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cursor_stops_before_first_failed_outcome(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        async def write(query, rows, **kwargs):
+            if rows[0]["learned_from"] == "f2":
+                raise RuntimeError("deadlock")
+            return []
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(side_effect=write)
+        mock_client.execute_write = AsyncMock(return_value=[])
+        generator = self.make_generator(mock_client)
+        generator.BATCH_CHUNK_SIZE = 2
+        generator.get_unprocessed_outcomes = AsyncMock(
+            return_value=[make_outcome(f"f{i}") for i in range(6)]
+        )
+
+        result = await generator.process_new_outcomes("test", page_size=6)
+
+        assert result.processed_count == 4
+        assert result.failed_outcome_ids == ["f2", "f3"]
+        assert result.errors == ["Outcome f2: deadlock", "Outcome f3: deadlock"]
+        assert mock_client.execute_write.call_args[0][1]["last_outcome_id"] == "f1"
+        generator.get_unprocessed_outcomes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_on_first_outcome_leaves_cursor(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(side_effect=RuntimeError("deadlock"))
+        mock_client.execute_write = AsyncMock(return_value=[])
+        generator = self.make_generator(mock_client)
+        generator.get_unprocessed_outcomes = AsyncMock(return_value=[make_outcome("f1")])
+
+        result = await generator.process_new_outcomes("test", page_size=1)
+
+        assert result.processed_count == 0
+        assert result.errors == ["Outcome f1: deadlock"]
+        mock_client.execute_write.assert_not_awaited()
 
 
 class TestInsightGeneratorIntegration:
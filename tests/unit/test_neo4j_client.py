@@ -225,13 +225,20 @@ class TestQueryExecution:
         """execute_query should return results from Neo4j."""
         from src.bmad.core.neo4j_client import Neo4jAsyncClient
 
-        # Create mock driver and session
-        mock_session = AsyncMock()
+        # Create mock driver and session; execute_read runs the work function
         mock_result = AsyncMock()
         mock_result.data = AsyncMock(return_value=[{'name': 'Brooks'}, {'name': 'Winston'}])
+        mock_tx = AsyncMock()
+        mock_tx.run = AsyncMock(return_value=mock_result)
+
+        mock_session = AsyncMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
-        mock_session.run = AsyncMock(return_value=mock_result)
+
+        async def run_work(work):
+            return await work(mock_tx)
+
+        mock_session.execute_read = AsyncMock(side_effect=run_work)
 
         mock_driver = MagicMock()
         mock_driver.session = MagicMock(return_value=mock_session)
@@ -253,26 +260,30 @@ class TestQueryExecution:
         assert result[0]['name'] == 'Brooks'
         assert result[1]['name'] == 'Winston'
 
+        # Reads are routed to readers
+        from neo4j import READ_ACCESS
+        mock_driver.session.assert_called_once_with(default_access_mode=READ_ACCESS)
+        mock_session.execute_read.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_execute_write_uses_transaction(self):
-        """execute_write should use explicit transaction and commit."""
+        """execute_write should run in a managed write transaction."""
         from src.bmad.core.neo4j_client import Neo4jAsyncClient
+        from neo4j import WRITE_ACCESS
 
-        # Create mock session with transaction (neo4j 6.x: begin_transaction is awaitable)
+        mock_result = AsyncMock()
+        mock_result.data = AsyncMock(return_value=[{'nodes_created': 1}])
         mock_tx = AsyncMock()
-        mock_tx.run = AsyncMock()
-        mock_tx.commit = AsyncMock()
-        mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
-        mock_tx.__aexit__ = AsyncMock(return_value=None)
+        mock_tx.run = AsyncMock(return_value=mock_result)
 
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.data = AsyncMock(return_value=[{'nodes_created': 1}])
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
-        # begin_transaction returns a coroutine that needs to be awaited
-        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
-        mock_session.run = AsyncMock(return_value=mock_result)
+
+        async def run_work(work):
+            return await work(mock_tx)
+
+        mock_session.execute_write = AsyncMock(side_effect=run_work)
 
         mock_driver = MagicMock()
         mock_driver.session = MagicMock(return_value=mock_session)
@@ -285,14 +296,312 @@ class TestQueryExecution:
         client._driver = mock_driver
         client._initialized = True
 
-        await client.execute_write(
+        result = await client.execute_write(
             "CREATE (a:AIAgent {name: $name})",
             {"name": "TestAgent", "group_id": "test"}
         )
 
-        # Verify transaction was created and committed
-        mock_session.begin_transaction.assert_called_once()
-        mock_tx.commit.assert_called_once()
+        # Verify the managed write transaction ran the query
+        assert result == [{'nodes_created': 1}]
+        mock_driver.session.assert_called_once_with(default_access_mode=WRITE_ACCESS)
+        mock_session.execute_write.assert_called_once()
+        mock_tx.run.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_query_with_write_clause_uses_writer(self):
+        """Writes sent through execute_query must not be routed to readers."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.execute_write = AsyncMock(return_value=[])
+
+        mock_driver = MagicMock()
+        mock_driver.session = MagicMock(return_value=mock_session)
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass'
+        )
+        client._driver = mock_driver
+        client._initialized = True
+
+        await client.execute_query(
+            "MATCH (i:Insight {group_id: $group_id}) SET i.confidence_score = 0.5",
+            {"group_id": "test"}
+        )
+
+        mock_session.execute_write.assert_called_once()
+        mock_session.execute_read.assert_not_called()
+
+    def test_is_write_query(self):
+        """Write clause detection should ignore property names."""
+        from src.bmad.core.neo4j_client import is_write_query
+
+        assert is_write_query("MERGE (s:EventSummary {group_id: $group_id})")
+        assert is_write_query("MATCH (e) DETACH DELETE e")
+        assert not is_write_query("MATCH (p) WHERE p.created_at > $since RETURN p.offset")
+
+
+class TestWriteBatch:
+    """Test UNWIND-based batched writes."""
+
+    def _client(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass'
+        )
+        client._driver = MagicMock()
+        client._initialized = True
+        client._execute_with_retry = AsyncMock(side_effect=lambda q, p, read_only: [
+            {"id": row["id"]} for row in p["rows"]
+        ])
+        return client
+
+    @pytest.mark.asyncio
+    async def test_rows_chunked_one_transaction_per_chunk(self):
+        """Rows should be split into batch_size chunks, each one write call."""
+        client = self._client()
+        rows = [{"id": i, "group_id": "test"} for i in range(5)]
+
+        records = await client.execute_write_batch(
+            "MERGE (n:Node {id: row.id, group_id: row.group_id})",
+            rows,
+            batch_size=2,
+            parameters={"now": "2026-01-26"}
+        )
+
+        assert records == [{"id": i} for i in range(5)]
+        calls = client._execute_with_retry.call_args_list
+        assert [len(c.args[1]["rows"]) for c in calls] == [2, 2, 1]
+        assert all(c.args[0].startswith("UNWIND $rows AS row") for c in calls)
+        assert all(c.args[1]["now"] == "2026-01-26" for c in calls)
+        assert all(c.kwargs["read_only"] is False for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_row_without_group_id_raises_security_error(self):
+        """Every row must carry group_id before anything is written."""
+        from src.bmad.core.neo4j_client import SecurityError
+
+        client = self._client()
+        rows = [{"id": 1, "group_id": "test"}, {"id": 2}]
+
+        with pytest.raises(SecurityError):
+            await client.execute_write_batch("MERGE (n:Node {id: row.id})", rows)
+
+        client._execute_with_retry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_rows_skip_database(self):
+        """No rows should mean no round trips."""
+        client = self._client()
+
+        assert await client.execute_write_batch("MERGE (n:Node {id: row.id})", []) == []
+        client._execute_with_retry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rows_parameter_is_reserved(self):
+        """Shared parameters must not shadow the batch rows."""
+        client = self._client()
+
+        with pytest.raises(ValueError):
+            await client.execute_write_batch(
+                "MERGE (n:Node {id: row.id})",
+                [{"id": 1, "group_id": "test"}],
+                parameters={"rows": []}
+            )
+
+
+class TestWriteTransaction:
+    """Test multi-statement write transactions."""
+
+    def _client(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass'
+        )
+        client._driver = MagicMock()
+        client._initialized = True
+        return client
+
+    @pytest.mark.asyncio
+    async def test_statements_run_in_one_transaction(self):
+        """All statements should run through a single managed transaction."""
+        client = self._client()
+        tx = AsyncMock()
+        tx.run = AsyncMock(side_effect=lambda q, p: AsyncMock(data=AsyncMock(return_value=[{"q": q}])))
+
+        async def execute_write(work):
+            return await work(tx)
+
+        mock_session = AsyncMock()
+        mock_session.execute_write = AsyncMock(side_effect=execute_write)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        client._driver.session = MagicMock(return_value=mock_session)
+
+        results = await client.execute_write_transaction([
+            ("CREATE (a:A {group_id: $group_id})", {"group_id": "test"}),
+            ("CREATE (b:B {group_id: $group_id})", {"group_id": "test"}),
+        ])
+
+        mock_session.execute_write.assert_awaited_once()
+        assert [c.args[0] for c in tx.run.call_args_list] == [
+            "CREATE (a:A {group_id: $group_id})",
+            "CREATE (b:B {group_id: $group_id})",
+        ]
+        assert results == [
+            [{"q": "CREATE (a:A {group_id: $group_id})"}],
+            [{"q": "CREATE (b:B {group_id: $group_id})"}],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_statement_without_group_id_raises_security_error(self):
+        """Nothing should run if any statement lacks group_id."""
+        from src.bmad.core.neo4j_client import SecurityError
+
+        client = self._client()
+        client._execute_with_retry = AsyncMock()
+
+        with pytest.raises(SecurityError):
+            await client.execute_write_transaction([
+                ("CREATE (a:A {group_id: $group_id})", {"group_id": "test"}),
+                ("MATCH (b:B) DELETE b", {}),
+            ])
+
+        client._execute_with_retry.assert_not_called()
+
+
+class TestAutoCommit:
+    """Test auto-commit execution for CALL { ... } IN TRANSACTIONS."""
+
+    @pytest.mark.asyncio
+    async def test_runs_outside_managed_transaction(self):
+        """The query should go through session.run, not execute_write."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        result = AsyncMock()
+        result.data = AsyncMock(return_value=[{"decayed": 3}])
+        mock_session = AsyncMock()
+        mock_session.run = AsyncMock(return_value=result)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        client = Neo4jAsyncClient(uri='bolt://localhost:7687', user='neo4j', password='testpass')
+        client._driver = MagicMock()
+        client._driver.session = MagicMock(return_value=mock_session)
+        client._initialized = True
+
+        records = await client.execute_auto_commit(
+            "MATCH (i:Insight) WHERE i.group_id = $group_id "
+            "CALL { WITH i SET i.x = 1 } IN TRANSACTIONS OF 100 ROWS",
+            {"group_id": "test"}
+        )
+
+        assert records == [{"decayed": 3}]
+        mock_session.run.assert_awaited_once()
+        mock_session.execute_write.assert_not_called()
+
+
+class TestStreaming:
+    """Test streaming result iteration."""
+
+    def _client(self, records):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        class FakeRecord:
+            def __init__(self, data):
+                self._data = data
+
+            def data(self):
+                return self._data
+
+        class FakeResult:
+            def __init__(self):
+                self.pulled = 0
+
+            def __aiter__(self):
+                return self._iter()
+
+            async def _iter(self):
+                for record in records:
+                    self.pulled += 1
+                    yield FakeRecord(record)
+
+        result = FakeResult()
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.run = AsyncMock(return_value=result)
+
+        mock_driver = MagicMock()
+        mock_driver.session = MagicMock(return_value=mock_session)
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass'
+        )
+        client._driver = mock_driver
+        client._initialized = True
+        return client, result
+
+    @pytest.mark.asyncio
+    async def test_stream_query_yields_records_lazily(self):
+        """Records should be pulled only as the caller iterates."""
+        from neo4j import READ_ACCESS
+
+        records = [{'event_id': f'e{i}'} for i in range(5)]
+        client, result = self._client(records)
+
+        stream = client.stream_query(
+            "MATCH (e:Event) WHERE e.group_id = $group_id RETURN e.event_id as event_id",
+            {"group_id": "test"},
+            fetch_size=2
+        )
+        first = await stream.__anext__()
+
+        assert first == {'event_id': 'e0'}
+        assert result.pulled == 1
+        assert [r async for r in stream] == records[1:]
+        client._driver.session.assert_called_once_with(
+            default_access_mode=READ_ACCESS, fetch_size=2
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_query_validates_group_id(self):
+        """Streaming must enforce tenant isolation like execute_query."""
+        from src.bmad.core.neo4j_client import SecurityError
+
+        client, _ = self._client([])
+
+        with pytest.raises(SecurityError):
+            async for _ in client.stream_query("MATCH (e:Event) RETURN e"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_stream_query_batches(self):
+        """Batches should hold at most batch_size records."""
+        records = [{'id': i} for i in range(5)]
+        client, _ = self._client(records)
+
+        batches = [
+            batch async for batch in client.stream_query_batches(
+                "MATCH (n) WHERE n.group_id = $group_id RETURN n.id as id",
+                {"group_id": "test"},
+                batch_size=2
+            )
+        ]
+
+        assert batches == [records[0:2], records[2:4], records[4:5]]
 
 
 class TestReconnection:
@@ -305,13 +614,11 @@ class TestReconnection:
         from neo4j.exceptions import ServiceUnavailable
 
         mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_session.run = AsyncMock(side_effect=[
+        mock_session.execute_read = AsyncMock(side_effect=[
             ServiceUnavailable("Connection lost"),
             ServiceUnavailable("Connection lost"),
-            mock_result  # Success on third attempt
+            [{'result': 'success'}]  # Success on third attempt
         ])
-        mock_result.data = AsyncMock(return_value=[{'result': 'success'}])
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
 
@@ -333,8 +640,8 @@ class TestReconnection:
             {"group_id": "global-coding-skills"}
         )
 
-        # Should have called session.run 3 times (2 failures + 1 success)
-        assert mock_session.run.call_count == 3
+        # Should have run the transaction 3 times (2 failures + 1 success)
+        assert mock_session.execute_read.call_count == 3
         assert len(result) == 1
 
     @pytest.mark.asyncio
@@ -344,7 +651,7 @@ class TestReconnection:
         from neo4j.exceptions import ServiceUnavailable
 
         mock_session = AsyncMock()
-        mock_session.run = AsyncMock(side_effect=ServiceUnavailable("Always failing"))
+        mock_session.execute_read = AsyncMock(side_effect=ServiceUnavailable("Always failing"))
         mock_session.__aenter__ = AsyncMock(return_value=mock_session)
         mock_session.__aexit__ = AsyncMock(return_value=None)
 
@@ -367,8 +674,75 @@ class TestReconnection:
                 {"group_id": "global-coding-skills"}
             )
 
-        # Should have called session.run 3 times
-        assert mock_session.run.call_count == 3
+        # Should have run the transaction 3 times
+        assert mock_session.execute_read.call_count == 3
+
+
+    @pytest.mark.asyncio
+    async def test_failures_inside_transaction_not_retried_again(self):
+        """Errors the driver already retried should not be retried by the client."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+        from neo4j.exceptions import ServiceUnavailable, TransientError
+
+        for error in (TransientError("Deadlock detected"), ServiceUnavailable("Leader lost")):
+            async def execute_write(work):
+                await work(AsyncMock())
+                raise error
+
+            mock_session = AsyncMock()
+            mock_session.execute_write = AsyncMock(side_effect=execute_write)
+            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_session.__aexit__ = AsyncMock(return_value=None)
+
+            mock_driver = MagicMock()
+            mock_driver.session = MagicMock(return_value=mock_session)
+
+            client = Neo4jAsyncClient(
+                uri='bolt://localhost:7687',
+                user='neo4j',
+                password='testpass',
+                retry_delay=0.01
+            )
+            client._driver = mock_driver
+            client._initialized = True
+
+            with pytest.raises(type(error)):
+                await client.execute_write(
+                    "MERGE (a:AIAgent {name: $name})",
+                    {"name": "Brooks", "group_id": "test"}
+                )
+
+            assert mock_session.execute_write.call_count == 1
+
+    def test_driver_retry_window_matches_client_budget(self):
+        """The driver's transaction retry time should equal the backoff budget."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass',
+            max_retries=3,
+            retry_delay=1.0
+        )
+
+        assert client.transaction_retry_time == 7.0
+
+    def test_backoff_is_jittered_and_bounded(self):
+        """Retry delays should be randomized within the exponential bound."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass',
+            retry_delay=1.0
+        )
+
+        delays = [client._retry_backoff(2) for _ in range(50)]
+
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
 
 
 class TestAsyncContextManager:
@@ -438,6 +812,63 @@ class TestClose:
         assert client._initialized is False
 
 
+class TestSharedClient:
+    """Test the process-wide shared client registry."""
+
+    @pytest.mark.asyncio
+    async def test_shared_client_initialized_once(self):
+        """get_shared_client() should reuse one initialized client."""
+        from src.bmad.core import neo4j_client
+        from src.bmad.core.neo4j_client import (
+            Neo4jAsyncClient,
+            get_shared_client,
+            close_shared_client
+        )
+
+        mock_driver = MagicMock()
+        mock_driver.close = AsyncMock()
+
+        with patch.dict('os.environ', {'NEO4J_PASSWORD': 'testpass'}):
+            with patch.object(neo4j_client.AsyncGraphDatabase, 'driver', return_value=mock_driver) as mock_factory:
+                with patch.object(Neo4jAsyncClient, 'health_check', new_callable=AsyncMock) as mock_hc:
+                    first, second = await asyncio.gather(
+                        get_shared_client(), get_shared_client()
+                    )
+
+                    assert first is second
+                    assert first._initialized is True
+                    mock_factory.assert_called_once()
+                    mock_hc.assert_called_once()
+
+                    await close_shared_client()
+
+        mock_driver.close.assert_called_once()
+        assert neo4j_client._shared_client is None
+
+    @pytest.mark.asyncio
+    async def test_set_shared_client_overrides_registry(self):
+        """set_shared_client() should register an existing client."""
+        from src.bmad.core.neo4j_client import (
+            Neo4jAsyncClient,
+            get_shared_client,
+            set_shared_client
+        )
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass'
+        )
+        client._driver = MagicMock()
+        client._initialized = True
+
+        set_shared_client(client)
+        try:
+            assert await get_shared_client() is client
+        finally:
+            set_shared_client(None)
+
+
 class TestQueryLatency:
     """Test NFR1: Query latency under 100ms."""
 
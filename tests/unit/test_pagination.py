@@ -0,0 +1,40 @@
+"""Unit tests for keyset pagination cursors.
+
+Tests cover:
+- Cursor round trip including datetimes
+- Rejection of malformed and foreign cursors
+"""
+
+import pytest
+from datetime import datetime, timezone
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        ts = datetime(2026, 1, 26, 12, 30, tzinfo=timezone.utc)
+
+        cursor = encode_cursor("work_history", [ts, "evt-1"])
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, "work_history") == [ts, "evt-1"]
+
+    def test_other_kind_rejected(self):
+        cursor = encode_cursor("patterns", [0.9, 3, "p1"])
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "work_history")
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor!", "e30", ""])
+    def test_malformed_rejected(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "patterns")
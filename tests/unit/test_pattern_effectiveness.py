@@ -332,6 +332,38 @@ class TestEffectivenessUpdate:
         assert report.patterns_updated == 2
         assert report.patterns_with_alerts == 1
 
+    @pytest.mark.asyncio
+    async def test_update_invalidates_updated_patterns_and_groups(self):
+        """Should evict result sets for updated patterns and their groups."""
+        from src.bmad.core.cache_manager import AsyncCacheManager
+
+        update_records = [
+            {
+                'pattern_id': 'p1',
+                'pattern_name': 'Pattern 1',
+                'success_rate': 0.8,
+                'times_used': 50,
+                'group_id': 'global-coding-skills',
+                'category': 'testing'
+            }
+        ]
+
+        cache = AsyncCacheManager()
+        await cache.set("contains-p1", [], tags=["pattern:p1", "group:global-coding-skills"])
+        await cache.set("contains-p9", [], tags=["pattern:p9", "group:global-coding-skills"])
+        await cache.set("other-group", [], tags=["pattern:p9", "group:diff-driven-saas"])
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=[update_records, []])
+
+        service = PatternEffectivenessService(mock_client, cache=cache)
+        await service.update_effectiveness()
+
+        # A global pattern's success rate moved: every group's filters may change
+        assert await cache.get("contains-p1") is None
+        assert await cache.get("contains-p9") is None
+        assert await cache.get("other-group") == []
+
 
 class TestEffectivenessSummary:
     """Test effectiveness summary functionality."""
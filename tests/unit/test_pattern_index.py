@@ -0,0 +1,209 @@
+"""Unit tests for the in-memory pattern index (Story 3-4).
+
+Tests cover:
+- Filtering by group, category, tags and success rate
+- Ranking and pagination matching the Cypher queries
+- Cold/invalidated fallback and refresh
+- PatternMatcher serving queries from a warm index
+"""
+
+import pytest
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.services.pattern_index import PatternIndex
+from src.bmad.services.pattern_matcher import PatternMatcher, PatternQuery
+
+
+def node(pattern_id, group_id="test-group", category="testing", tags=None,
+         success_rate=0.5, times_used=1, name=None, description=""):
+    return {'p': {
+        'pattern_id': pattern_id,
+        'name': name or pattern_id,
+        'description': description,
+        'category': category,
+        'tags': tags or [],
+        'success_rate': success_rate,
+        'times_used': times_used,
+        'group_id': group_id
+    }}
+
+
+LIBRARY = [
+    node('p1', success_rate=0.9, times_used=5, tags=['retry']),
+    node('p2', success_rate=0.9, times_used=8, tags=['cache']),
+    node('p3', success_rate=0.4, category='architecture', tags=['retry']),
+    node('g1', group_id='global-coding-skills', success_rate=0.95, tags=['retry'],
+         name='Exponential backoff', description='Retry transient errors'),
+    node('g2', group_id='global-coding-skills', success_rate=0.2),
+    node('x1', group_id='other-group', success_rate=1.0, tags=['retry']),
+]
+
+
+async def warm_index(records=LIBRARY):
+    mock_client = MagicMock(spec=Neo4jAsyncClient)
+    mock_client.execute_query = AsyncMock(return_value=records)
+    index = PatternIndex(mock_client)
+    await index.refresh()
+    return index, mock_client
+
+
+def ids(patterns):
+    return [p.pattern_id for p in patterns]
+
+
+class TestPatternIndexQuery:
+    """Test answering PatternQuery filters from memory."""
+
+    @pytest.mark.asyncio
+    async def test_group_and_global_ranked(self):
+        index, _ = await warm_index()
+
+        result = index.query(PatternQuery(group_id='test-group'))
+
+        # Ranked by success_rate then times_used; other groups excluded
+        assert ids(result) == ['g1', 'p2', 'p1', 'p3', 'g2']
+
+    @pytest.mark.asyncio
+    async def test_category_and_min_success_rate(self):
+        index, _ = await warm_index()
+
+        result = index.query(PatternQuery(
+            group_id='test-group', category='testing', min_success_rate=0.5
+        ))
+
+        assert ids(result) == ['g1', 'p2', 'p1']
+
+    @pytest.mark.asyncio
+    async def test_any_tag_filter(self):
+        index, _ = await warm_index()
+
+        result = index.query(PatternQuery(group_id='test-group', tags=['retry', 'missing']))
+
+        assert ids(result) == ['g1', 'p1', 'p3']
+        assert index.query(PatternQuery(group_id='test-group', tags=['missing'])) == []
+
+    @pytest.mark.asyncio
+    async def test_search_text_left_to_fulltext_and_pagination(self):
+        index, _ = await warm_index()
+
+        assert index.query(PatternQuery(group_id='test-group', search_text='TRANSIENT')) is None
+        assert ids(index.query(PatternQuery(group_id='test-group', limit=2, offset=1))) == ['p2', 'p1']
+
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_full_listing(self):
+        from src.bmad.services.pattern_matcher import encode_pattern_cursor
+
+        index, _ = await warm_index()
+        full = ids(index.query(PatternQuery(group_id='test-group')))
+
+        pages, cursor = [], None
+        while True:
+            page = index.query(PatternQuery(group_id='test-group', limit=2, cursor=cursor))
+            if not page:
+                break
+            pages.extend(ids(page))
+            cursor = encode_pattern_cursor(page[-1])
+
+        assert pages == full
+
+
+class TestPatternIndexLifecycle:
+    """Test cold fallback, invalidation and refresh."""
+
+    def test_cold_index_returns_none(self):
+        index = PatternIndex(MagicMock(spec=Neo4jAsyncClient))
+
+        assert not index.is_warm
+        assert index.query(PatternQuery(group_id='test-group')) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_falls_back_until_refreshed(self):
+        index, mock_client = await warm_index()
+        mock_client.execute_query = AsyncMock(return_value=LIBRARY + [
+            node('p4', success_rate=0.99)
+        ])
+
+        index.invalidate()
+        assert index.query(PatternQuery(group_id='test-group')) is None
+
+        await asyncio.sleep(0)  # background refresh
+        await index._refresh_task
+
+        assert index.is_warm
+        assert ids(index.query(PatternQuery(group_id='test-group', limit=1))) == ['p4']
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_load(self):
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=LIBRARY)
+        index = PatternIndex(mock_client)
+
+        counts = await asyncio.gather(index.refresh(), index.refresh())
+
+        assert counts == [len(LIBRARY), len(LIBRARY)]
+        mock_client.execute_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_usage_updates_resort_without_reload(self):
+        index, mock_client = await warm_index()
+
+        applied = index.update_patterns([{
+            'pattern_id': 'p3', 'group_id': 'test-group', 'category': 'architecture',
+            'success_rate': 0.99, 'times_used': 12
+        }])
+
+        assert applied == 1
+        assert index.is_warm
+        assert ids(index.query(PatternQuery(group_id='test-group'))) == [
+            'p3', 'g1', 'p2', 'p1', 'g2'
+        ]
+        assert ids(index.query(PatternQuery(group_id='test-group', category='architecture'))) == [
+            'p3'
+        ]
+        mock_client.execute_query.assert_called_once()  # the initial load only
+
+    @pytest.mark.asyncio
+    async def test_usage_update_for_unindexed_pattern_invalidates(self):
+        index, _ = await warm_index()
+
+        index.update_patterns([{
+            'pattern_id': 'new', 'group_id': 'test-group', 'success_rate': 1.0, 'times_used': 1
+        }])
+
+        assert not index.is_warm
+
+
+class TestPatternMatcherUsesIndex:
+    """Test PatternMatcher integration."""
+
+    @pytest.mark.asyncio
+    async def test_warm_index_skips_neo4j(self):
+        index, _ = await warm_index()
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock()
+
+        matcher = PatternMatcher(mock_client, index=index)
+        result = await matcher.query_patterns(PatternQuery(group_id='test-group', limit=2))
+
+        assert ids(result.patterns) == ['g1', 'p2']
+        mock_client.execute_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cold_index_falls_back_to_cypher(self):
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[node('p1')])
+
+        matcher = PatternMatcher(mock_client, index=PatternIndex(mock_client))
+        result = await matcher.query_patterns(PatternQuery(group_id='test-group'))
+
+        assert ids(result.patterns) == ['p1']
+        mock_client.execute_query.assert_called_once()
@@ -192,6 +192,104 @@ class TestPatternQuery:
         assert params['limit'] == 50  # Max limit
 
 
+class TestCursorPagination:
+    """Test keyset pagination of pattern queries."""
+
+    @staticmethod
+    def records(*specs):
+        return [
+            {'p': {'pattern_id': pid, 'name': pid, 'success_rate': rate, 'times_used': used}}
+            for pid, rate, used in specs
+        ]
+
+    @pytest.mark.asyncio
+    async def test_extra_row_yields_next_cursor(self):
+        """A full page should return a cursor positioned after its last row."""
+        from src.bmad.services.pattern_matcher import decode_pattern_cursor
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self.records(
+            ('p1', 0.9, 5), ('p2', 0.8, 2), ('p3', 0.7, 1)
+        ))
+
+        matcher = PatternMatcher(mock_client)
+        result = await matcher.query_patterns(PatternQuery(group_id="faith-meats", limit=2))
+
+        assert [p.pattern_id for p in result.patterns] == ['p1', 'p2']
+        assert decode_pattern_cursor(result.next_cursor) == (0.8, 2, 'p2')
+        assert result.total_count is None
+
+        cypher = mock_client.execute_query.call_args[0][0]
+        assert "LIMIT $limit + 1" in cypher
+
+    @pytest.mark.asyncio
+    async def test_cursor_becomes_keyset_predicate(self):
+        """The next page should seek past the cursor instead of skipping rows."""
+        from src.bmad.services.pattern_matcher import encode_pattern_cursor
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self.records(('p3', 0.7, 1)))
+        cursor = encode_pattern_cursor(Pattern(
+            pattern_id='p2', name='p2', description='', category='', success_rate=0.8, times_used=2
+        ))
+
+        matcher = PatternMatcher(mock_client)
+        result = await matcher.query_patterns(
+            PatternQuery(group_id="faith-meats", limit=2, cursor=cursor)
+        )
+
+        cypher, params = mock_client.execute_query.call_args[0]
+        assert "p.success_rate < $after_success_rate" in cypher
+        assert params['after_success_rate'] == 0.8
+        assert params['after_times_used'] == 2
+        assert params['after_pattern_id'] == 'p2'
+        assert params['offset'] == 0
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_and_text_search_cursor_rejected(self):
+        """Malformed cursors and cursors on relevance-ranked search are errors."""
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+        from src.bmad.core.pagination import InvalidCursorError
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        matcher = PatternMatcher(mock_client)
+
+        with pytest.raises(InvalidCursorError):
+            await matcher.query_patterns(PatternQuery(group_id="faith-meats", cursor="bogus"))
+        with pytest.raises(ValueError):
+            await matcher.query_patterns(
+                PatternQuery(group_id="faith-meats", cursor="bogus", search_text="retry")
+            )
+
+    @pytest.mark.asyncio
+    async def test_total_count_is_optional_and_cached(self):
+        """include_total should count once and serve later pages from cache."""
+        from src.bmad.core.cache_manager import AsyncCacheManager
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        async def execute_query(query, params=None):
+            if "count(p)" in query:
+                return [{'total': 42}]
+            return self.records(('p1', 0.9, 5))
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=execute_query)
+        matcher = PatternMatcher(mock_client, cache=AsyncCacheManager(name="test"))
+
+        for _ in range(2):
+            result = await matcher.query_patterns(
+                PatternQuery(group_id="faith-meats", include_total=True)
+            )
+            assert result.total_count == 42
+
+        count_calls = [c for c in mock_client.execute_query.call_args_list if "count(p)" in c[0][0]]
+        assert len(count_calls) == 1
+
+
 class TestGetPatternById:
     """Test getting pattern by ID."""
 
@@ -301,6 +399,60 @@ class TestSearchPatterns:
 
         assert 'repository' in params.get('search_text', '').lower()
 
+    @pytest.mark.asyncio
+    async def test_search_uses_fulltext_index_with_blended_rank(self):
+        """Search should query the fulltext index, not scan with CONTAINS."""
+        from src.bmad.services.pattern_matcher import PatternMatcher
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+
+        matcher = PatternMatcher(mock_client)
+
+        await matcher.search_patterns("faith-meats", "retry", limit=5)
+
+        cypher, params = mock_client.execute_query.call_args[0]
+        assert "db.index.fulltext.queryNodes('pattern_fulltext', $search_text)" in cypher
+        assert "CONTAINS" not in cypher
+        assert "score" in cypher and "p.success_rate" in cypher
+        assert params['relevance_weight'] == PatternMatcher.SEARCH_RELEVANCE_WEIGHT
+
+    def test_fulltext_query_prefix_and_fuzzy_terms(self):
+        """Each term should match exactly, as a prefix, or fuzzily."""
+        from src.bmad.services.pattern_matcher import build_fulltext_query
+
+        assert build_fulltext_query("Retry DB") == (
+            "(retry^2 OR retry* OR retry~1) AND (db^2 OR db*)"
+        )
+
+    def test_fulltext_query_drops_lucene_syntax(self):
+        """Lucene operators in user input should not reach the index."""
+        from src.bmad.services.pattern_matcher import build_fulltext_query
+
+        assert build_fulltext_query('name:"x"') == "(name^2 OR name* OR name~1) AND (x^2 OR x*)"
+        assert build_fulltext_query("*?~") is None
+
+    @pytest.mark.asyncio
+    async def test_punctuation_only_search_matches_nothing(self):
+        """Text without searchable terms should return no patterns, not all of them."""
+        from src.bmad.services.pattern_matcher import PatternMatcher, PatternQuery
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[{'p': {'pattern_id': 'p1'}}])
+
+        matcher = PatternMatcher(mock_client)
+
+        for text in ("!!!", "--"):
+            assert await matcher.search_patterns("faith-meats", text) == []
+            result = await matcher.query_patterns(
+                PatternQuery(group_id="faith-meats", search_text=text, include_total=True)
+            )
+            assert result.patterns == [] and result.total_count == 0
+
+        mock_client.execute_query.assert_not_called()
+
 
 class TestPatternPromotion:
     """Test pattern promotion to global scope."""
@@ -416,19 +568,79 @@ class TestRecordPatternUse:
 
     @pytest.mark.asyncio
     async def test_record_pattern_use(self):
-        """record_pattern_use should update statistics."""
+        """record_pattern_use should tally the use and write it on flush."""
         from src.bmad.services.pattern_matcher import PatternMatcher
+        from src.bmad.services.pattern_usage import PatternUsageAccumulator
         from src.bmad.core.neo4j_client import Neo4jAsyncClient
 
         mock_client = MagicMock(spec=Neo4jAsyncClient)
-        mock_client.execute_query = AsyncMock(return_value=[])
         mock_client.execute_write = AsyncMock(return_value=[])
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        usage = PatternUsageAccumulator(mock_client, index=MagicMock(), rankings=MagicMock())
 
-        matcher = PatternMatcher(mock_client)
+        matcher = PatternMatcher(mock_client, usage=usage)
 
         await matcher.record_pattern_use("pattern-1", "faith-meats", successful=True)
 
-        mock_client.execute_write.assert_called_once()
+        mock_client.execute_write.assert_not_called()
+        assert usage.pending_events == 1
+
+        await usage.flush()
+
+        mock_client.execute_write_batch.assert_called_once()
+        rows = mock_client.execute_write_batch.call_args[0][1]
+        assert rows[0]['pattern_id'] == 'pattern-1'
+        assert rows[0]['successes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_record_pattern_use_invalidates_affected_cache_entries(self):
+        """Flushing recorded uses should evict result sets for the pattern and its group."""
+        from src.bmad.services.pattern_matcher import PatternMatcher
+        from src.bmad.services.pattern_usage import PatternUsageAccumulator
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+        from src.bmad.core.cache_manager import AsyncCacheManager
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(return_value=[
+            {'pattern_id': 'pattern-1', 'group_id': 'faith-meats'}
+        ])
+
+        cache = AsyncCacheManager()
+        await cache.set("contains-p1", [], tags=["pattern:pattern-1"])
+        await cache.set("faith-meats-query", [], tags=["group:faith-meats"])
+        await cache.set("other-group-query", [], tags=["group:diff-driven-saas"])
+
+        usage = PatternUsageAccumulator(
+            mock_client, cache=cache, index=MagicMock(),
+            rankings=MagicMock(update_patterns=AsyncMock(return_value=1))
+        )
+        matcher = PatternMatcher(mock_client, cache=cache, usage=usage)
+        await matcher.record_pattern_use("pattern-1", "faith-meats", successful=True)
+        await usage.flush()
+
+        assert await cache.get("contains-p1") is None
+        assert await cache.get("faith-meats-query") is None
+        assert await cache.get("other-group-query") == []
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_uses(self):
+        """close() should write uses recorded without a running flush loop."""
+        from src.bmad.services.pattern_matcher import PatternMatcher
+        from src.bmad.services.pattern_usage import PatternUsageAccumulator
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_write_batch = AsyncMock(return_value=[])
+        usage = PatternUsageAccumulator(mock_client, index=MagicMock(), rankings=MagicMock())
+
+        matcher = PatternMatcher(mock_client, usage=usage)
+        await matcher.record_pattern_use("pattern-1", "faith-meats", successful=False)
+        await matcher.close()
+
+        rows = mock_client.execute_write_batch.call_args[0][1]
+        assert rows[0]['pattern_id'] == 'pattern-1'
+        assert rows[0]['failures'] == 1
+        assert usage.pending_events == 0
 
 
 class TestPatternDataClass:
@@ -256,6 +256,71 @@ class TestPerformanceCompliance:
         assert "threshold_ms" in compliance
 
 
+class TestSingleFlight:
+    """Test request coalescing on cache misses."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_run_one_query(self):
+        """Concurrent lookups for one key should share a single query."""
+        async def slow_query(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return [{'p': {'pattern_id': 'p1', 'name': 'Shared'}}]
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=slow_query)
+        cache = AsyncCacheManager()
+
+        engine = PatternQueryEngine(mock_client, cache=cache)
+
+        results = await asyncio.gather(*[
+            engine.fast_pattern_lookup("global-coding-skills", category="testing")
+            for _ in range(10)
+        ])
+
+        mock_client.execute_query.assert_called_once()
+        assert all(r[0].name == "Shared" for r in results)
+        assert cache.inflight_count() == 0
+
+        with engine._history_lock:
+            assert sum(not m.cache_hit for m in engine._query_history) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_load_propagates_and_is_not_cached(self):
+        """A failing load should reach every waiter and not be cached."""
+        cache = AsyncCacheManager()
+        factory = AsyncMock(side_effect=RuntimeError("neo4j down"))
+
+        results = await asyncio.gather(
+            cache.get_or_compute("k", factory),
+            cache.get_or_compute("k", factory),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        factory.assert_called_once()
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_load(self):
+        """Cancelling one waiter should not cancel the shared load."""
+        cache = AsyncCacheManager()
+        release = asyncio.Event()
+
+        async def factory():
+            await release.wait()
+            return "value"
+
+        first = asyncio.ensure_future(cache.get_or_compute("k", factory))
+        second = asyncio.ensure_future(cache.get_or_compute("k", factory))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+        assert await cache.get("k") == "value"
+
+
 class TestCacheInvalidation:
     """Test cache invalidation."""
 
@@ -278,6 +343,169 @@ class TestCacheInvalidation:
             assert len(engine._query_history) == 0
 
 
+class TestStaleWhileRevalidate:
+    """Test soft-TTL serving with background refresh."""
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        """Past the soft TTL the stale value is returned and refreshed once."""
+        cache = AsyncCacheManager(ttl_seconds=60, soft_ttl_seconds=0)
+        await cache.set("k", "old")
+        await asyncio.sleep(0.001)
+
+        release = asyncio.Event()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "new"
+
+        first = await cache.get_or_compute("k", factory)
+        second = await cache.get_or_compute("k", factory)
+
+        assert first == "old"
+        assert second == "old"
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert calls == 1
+        assert (await cache.get_stats()).refreshes == 1
+        assert await cache.get("k") == "new"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self):
+        """A failed background refresh should keep serving the stale value."""
+        cache = AsyncCacheManager(ttl_seconds=60, soft_ttl_seconds=0)
+        await cache.set("k", "old")
+        await asyncio.sleep(0.001)
+
+        factory = AsyncMock(side_effect=RuntimeError("neo4j down"))
+
+        assert await cache.get_or_compute("k", factory) == "old"
+        await asyncio.sleep(0.01)
+
+        assert await cache.get_or_compute("k", factory) == "old"
+        assert cache.inflight_count() <= 1
+
+    @pytest.mark.asyncio
+    async def test_stale_lookup_counts_as_cache_hit(self):
+        """Engine lookups served from a stale entry should record a cache hit."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        cache = AsyncCacheManager(ttl_seconds=60, soft_ttl_seconds=0)
+        engine = PatternQueryEngine(mock_client, cache=cache)
+
+        await engine.fast_pattern_lookup("global-coding-skills")
+        await asyncio.sleep(0.001)
+        await engine.fast_pattern_lookup("global-coding-skills")
+        await asyncio.sleep(0.01)
+
+        with engine._history_lock:
+            assert [m.cache_hit for m in engine._query_history] == [False, True]
+        assert mock_client.execute_query.call_count == 2
+
+    def test_soft_ttl_cannot_exceed_hard_ttl(self):
+        """Soft TTL longer than the hard TTL should be rejected."""
+        with pytest.raises(ValueError):
+            CacheManager[str](ttl_seconds=10, soft_ttl_seconds=20)
+
+
+class TestTargetedInvalidation:
+    """Test invalidation by pattern_id and group_id."""
+
+    def _records(self, *pattern_ids, group_id='global-coding-skills'):
+        return [
+            {'p': {'pattern_id': pid, 'name': pid, 'group_id': group_id}}
+            for pid in pattern_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_pattern_evicts_only_containing_results(self):
+        """Only result sets containing the pattern should be evicted."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(side_effect=[
+            self._records('p1', 'p2'),
+            self._records('p3'),
+        ])
+        cache = AsyncCacheManager()
+        engine = PatternQueryEngine(mock_client, cache=cache)
+
+        await engine.fast_pattern_lookup("faith-meats", category="testing")
+        await engine.fast_pattern_lookup("faith-meats", category="architectural")
+
+        removed = await engine.invalidate_cache(pattern_id="p1")
+
+        assert removed == 1
+        assert (await cache.get_stats()).size == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_group_leaves_other_groups(self):
+        """Group invalidation should not evict other groups' results."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self._records('p1'))
+        cache = AsyncCacheManager()
+        engine = PatternQueryEngine(mock_client, cache=cache)
+
+        await engine.fast_pattern_lookup("faith-meats")
+        await engine.fast_pattern_lookup("diff-driven-saas")
+
+        removed = await engine.invalidate_cache(group_id="faith-meats")
+
+        assert removed == 1
+        mock_client.execute_query.reset_mock()
+        await engine.fast_pattern_lookup("diff-driven-saas")
+        mock_client.execute_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_global_group_evicts_every_group(self):
+        """Naming the global group should evict every result set reading it."""
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=self._records('p1'))
+        cache = AsyncCacheManager()
+        engine = PatternQueryEngine(mock_client, cache=cache)
+
+        await engine.fast_pattern_lookup("faith-meats")
+        await engine.fast_pattern_lookup("diff-driven-saas")
+
+        removed = await engine.invalidate_cache(group_id="global-coding-skills")
+
+        assert removed == 2
+        assert (await cache.get_stats()).size == 0
+
+    def test_tag_index_cleaned_on_eviction(self):
+        """Evicted entries should leave no reverse-index references."""
+        cache = CacheManager[str](max_size=1, ttl_seconds=60)
+
+        cache.set("key1", "value1", tags=["pattern:p1"])
+        cache.set("key2", "value2", tags=["pattern:p2"])
+
+        assert cache.invalidate_tags(["pattern:p1"]) == 0
+        assert cache.invalidate_tags(["pattern:p2"]) == 1
+        assert cache._tag_index == {}
+
+    @pytest.mark.asyncio
+    async def test_load_in_flight_during_invalidation_is_not_cached(self):
+        """A load that started before an invalidation should not be cached."""
+        cache = AsyncCacheManager()
+        release = asyncio.Event()
+
+        async def factory():
+            await release.wait()
+            return "stale"
+
+        pending = asyncio.ensure_future(cache.get_or_compute("k", factory))
+        await asyncio.sleep(0)
+
+        await cache.invalidate_tags(["pattern:p1"])
+        release.set()
+
+        assert await pending == "stale"
+        assert await cache.get("k") is None
+
+
 class TestCacheManager:
     """Test the underlying cache manager."""
 
@@ -321,6 +549,36 @@ class TestCacheManager:
 
         assert cache.get("key1") is None  # Expired
 
+    def test_set_existing_key_refreshes_recency(self):
+        """Overwriting a key should make it most recently used."""
+        cache = CacheManager[str](max_size=2, ttl_seconds=60)
+
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key1", "updated")
+        cache.set("key3", "value3")  # Should evict key2
+
+        assert cache.get("key1") == "updated"
+        assert cache.get("key2") is None
+        assert cache.get_stats().evictions == 1
+
+    def test_eviction_cost_is_flat(self):
+        """Insert-with-eviction cost should not grow with cache size."""
+        def per_op_seconds(size: int, ops: int = 2000) -> float:
+            cache = CacheManager[int](max_size=size, ttl_seconds=60)
+            for i in range(size):
+                cache.set(f"k{i}", i)
+            start = time.perf_counter()
+            for i in range(ops):
+                cache.set(f"n{i}", i)
+            return (time.perf_counter() - start) / ops
+
+        small = per_op_seconds(100)
+        large = per_op_seconds(50_000)
+
+        # The old min()-scan was ~500x slower at 50k entries
+        assert large < small * 10
+
     def test_hit_rate_calculation(self):
         """Should calculate hit rate correctly."""
         cache = CacheManager[str](max_size=10, ttl_seconds=60)
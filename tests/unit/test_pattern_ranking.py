@@ -0,0 +1,263 @@
+"""Unit tests for materialized pattern rankings (Story 4-2).
+
+Tests cover:
+- Full rebuild into per-group and per-category rankings
+- Incremental updates, including recomputing uncertain rankings
+- Keyed top-pattern lookup and PatternMatcher.get_top_patterns fallbacks
+- Rebuild after the effectiveness update
+"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.services.pattern_ranking import (
+    PatternRankings,
+    RankingEntry,
+    ranking_key
+)
+
+
+def batches_of(*batches):
+    async def stream(*args, **kwargs):
+        for batch in batches:
+            yield batch
+    return stream
+
+
+def record(pattern_id, success_rate, times_used, group_id='test-group', category='testing'):
+    return {
+        'pattern_id': pattern_id,
+        'group_id': group_id,
+        'category': category,
+        'success_rate': success_rate,
+        'times_used': times_used
+    }
+
+
+def stored(key, *entries, group_id='test-group', category='testing'):
+    return {
+        'ranking_key': key,
+        'group_id': group_id,
+        'category': category,
+        'pattern_ids': [e[0] for e in entries],
+        'success_rates': [e[1] for e in entries],
+        'times_used': [e[2] for e in entries]
+    }
+
+
+def make_client():
+    mock_client = MagicMock(spec=Neo4jAsyncClient)
+    mock_client.execute_query = AsyncMock(return_value=[])
+    mock_client.execute_write = AsyncMock(return_value=[])
+    mock_client.execute_write_batch = AsyncMock(return_value=[])
+    return mock_client
+
+
+def written(mock_client):
+    return {
+        row['ranking_key']: row['pattern_ids']
+        for call in mock_client.execute_write_batch.call_args_list
+        for row in call[0][1]
+    }
+
+
+class TestRankingEntry:
+    """Test ranking keys and order."""
+
+    def test_keys_and_rank(self):
+        entry = RankingEntry.from_record(record('p1', 0.9, 10))
+
+        assert ranking_key('test-group') == 'test-group|*'
+        assert entry.ranking_keys == ['test-group|*', 'test-group|testing']
+        assert RankingEntry.from_record(record('p2', None, None, category=None)).ranking_keys == [
+            'test-group|*'
+        ]
+        assert entry.rank < RankingEntry.from_record(record('p0', 0.9, 5)).rank
+
+
+class TestRebuild:
+    """Test full rebuilds."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_keeps_top_k_per_group_and_category(self):
+        mock_client = make_client()
+        mock_client.stream_query_batches = MagicMock(side_effect=batches_of(
+            [record('p1', 0.5, 10), record('p2', 0.9, 3)],
+            [record('p3', 0.9, 8, category='security'), record('g1', 0.7, 1, 'global-coding-skills')],
+        ))
+        rankings = PatternRankings(mock_client, ranking_size=2)
+
+        assert await rankings.rebuild() == 5
+
+        assert written(mock_client) == {
+            'test-group|*': ['p3', 'p2'],
+            'test-group|testing': ['p2', 'p1'],
+            'test-group|security': ['p3'],
+            'global-coding-skills|*': ['g1'],
+            'global-coding-skills|testing': ['g1'],
+        }
+        params = mock_client.execute_write.call_args[0][1]
+        assert params['group_id'] is None
+        assert sorted(params['ranking_keys']) == sorted(written(mock_client))
+
+    @pytest.mark.asyncio
+    async def test_rebuild_one_group(self):
+        mock_client = make_client()
+        mock_client.stream_query_batches = MagicMock(side_effect=batches_of([record('p1', 0.5, 10)]))
+
+        await PatternRankings(mock_client).rebuild('test-group')
+
+        query, params = mock_client.stream_query_batches.call_args[0][:2]
+        assert 'p.group_id = $group_id' in query
+        assert params == {'group_id': 'test-group'}
+        assert mock_client.execute_write.call_args[0][1]['group_id'] == 'test-group'
+
+
+class TestIncrementalUpdates:
+    """Test single-pattern updates."""
+
+    @pytest.mark.asyncio
+    async def test_update_reorders_ranking_that_is_not_full(self):
+        mock_client = make_client()
+        mock_client.execute_query.return_value = [
+            stored('test-group|*', ('p1', 0.9, 10), ('p2', 0.8, 4), category=None),
+            stored('test-group|testing', ('p1', 0.9, 10)),
+        ]
+        rankings = PatternRankings(mock_client, ranking_size=3)
+
+        await rankings.update_patterns([RankingEntry.from_record(record('p2', 1.0, 5))])
+
+        assert written(mock_client) == {
+            'test-group|*': ['p2', 'p1'],
+            'test-group|testing': ['p2', 'p1'],
+        }
+        mock_client.execute_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_full_ranking_accepts_certain_changes(self):
+        mock_client = make_client()
+        mock_client.execute_query.return_value = [
+            stored('test-group|*', ('p1', 0.9, 10), ('p2', 0.8, 4), category=None),
+        ]
+        rankings = PatternRankings(mock_client, ranking_size=2)
+
+        # Outranks the last entry, which drops out
+        await rankings.update_patterns([RankingEntry.from_record(record('p9', 0.85, 1, category=None))])
+
+        assert written(mock_client) == {'test-group|*': ['p1', 'p9']}
+
+    @pytest.mark.asyncio
+    async def test_full_ranking_recomputed_when_tail_is_uncertain(self):
+        mock_client = make_client()
+        mock_client.execute_query.side_effect = [
+            [stored('test-group|*', ('p1', 0.9, 10), ('p2', 0.8, 4), category=None)],
+            [record('p2', 0.8, 4), record('p5', 0.7, 2)],
+        ]
+        rankings = PatternRankings(mock_client, ranking_size=2)
+
+        # p1 drops below p2; an unranked pattern may now be second
+        await rankings.update_patterns([RankingEntry.from_record(record('p1', 0.1, 11, category=None))])
+
+        assert written(mock_client) == {'test-group|*': ['p2', 'p5']}
+        query, params = mock_client.execute_query.call_args[0][:2]
+        assert params == {'group_id': 'test-group', 'limit': 2}
+        assert 'LIMIT $limit' in query
+
+    @pytest.mark.asyncio
+    async def test_missing_ranking_is_computed_and_promotion_moves_entry(self):
+        mock_client = make_client()
+        mock_client.execute_query.side_effect = [
+            [stored('test-group|*', ('p1', 0.9, 10), ('p2', 0.8, 4), category=None)],
+            [record('p1', 0.9, 10, 'global-coding-skills', None), record('g1', 0.6, 2, 'global-coding-skills', None)],
+        ]
+        rankings = PatternRankings(mock_client, ranking_size=5)
+
+        before = record('p1', 0.9, 10, category=None)
+        await rankings.update_patterns(
+            [RankingEntry.from_record({**before, 'group_id': 'global-coding-skills'})],
+            removed=[RankingEntry.from_record(before)]
+        )
+
+        assert written(mock_client) == {
+            'test-group|*': ['p2'],
+            'global-coding-skills|*': ['p1', 'g1'],
+        }
+
+
+class TestTopPatterns:
+    """Test keyed top-pattern lookup."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_reads_group_and_global_rankings(self):
+        mock_client = make_client()
+        mock_client.execute_query.return_value = [
+            {'p': {'pattern_id': 'p1', 'name': 'P1', 'group_id': 'test-group'}}
+        ]
+        rankings = PatternRankings(mock_client)
+
+        patterns = await rankings.top_patterns('test-group', category='testing', min_success_rate=0.5)
+
+        assert [p.pattern_id for p in patterns] == ['p1']
+        params = mock_client.execute_query.call_args[0][1]
+        assert params['ranking_keys'] == ['test-group|testing', 'global-coding-skills|testing']
+        assert params['group_id'] == 'test-group'
+
+    @pytest.mark.asyncio
+    async def test_missing_rankings_or_large_limit_return_none(self):
+        mock_client = make_client()
+        rankings = PatternRankings(mock_client, ranking_size=5)
+
+        assert await rankings.top_patterns('test-group', limit=5) is None
+        assert await rankings.top_patterns('test-group', limit=6) is None
+        mock_client.execute_query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_top_patterns_uses_rankings_while_index_is_cold(self):
+        from src.bmad.services.pattern_matcher import Pattern, PatternMatcher
+
+        index = MagicMock()
+        index.query.return_value = None
+        rankings = MagicMock(spec=PatternRankings)
+        rankings.top_patterns = AsyncMock(return_value=[
+            Pattern(pattern_id='p1', name='P1', description='', category='testing')
+        ])
+        mock_client = make_client()
+
+        matcher = PatternMatcher(mock_client, index=index, rankings=rankings)
+        patterns = await matcher.get_top_patterns('test-group', category='testing', limit=5)
+
+        assert [p.pattern_id for p in patterns] == ['p1']
+        rankings.top_patterns.assert_awaited_once_with(
+            'test-group', category='testing', min_success_rate=0.5, limit=5
+        )
+        mock_client.execute_query.assert_not_called()
+
+        # Not materialized: the ranking query runs instead
+        rankings.top_patterns.return_value = None
+        await matcher.get_top_patterns('test-group', limit=5)
+        assert 'ORDER BY p.success_rate DESC' in mock_client.execute_query.call_args[0][0]
+
+
+class TestEffectivenessRebuild:
+    """Test rebuild after the daily effectiveness update."""
+
+    @pytest.mark.asyncio
+    async def test_update_effectiveness_rebuilds_rankings(self):
+        from src.bmad.services.pattern_effectiveness import PatternEffectivenessService
+
+        mock_client = make_client()
+        mock_client.execute_query.side_effect = [[{**record('p1', 0.8, 5), 'pattern_name': 'P1'}], []]
+        rankings = MagicMock(spec=PatternRankings)
+        rankings.rebuild = AsyncMock(return_value=2)
+
+        service = PatternEffectivenessService(mock_client, index=MagicMock(), rankings=rankings)
+        await service.update_effectiveness('test-group')
+
+        rankings.rebuild.assert_awaited_once_with('test-group')
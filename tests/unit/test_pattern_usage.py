@@ -0,0 +1,250 @@
+"""Unit tests for write-behind pattern usage counters (Story 2-2).
+
+Tests cover:
+- Coalescing uses per pattern into one UNWIND write
+- Early flush on pending-event threshold and periodic flush
+- Retry of failed flushes without double counting
+- Draining and spilling on shutdown
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.cache_manager import AsyncCacheManager
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.services.pattern_usage import PatternUsageAccumulator
+
+
+def make_accumulator(**kwargs):
+    mock_client = MagicMock(spec=Neo4jAsyncClient)
+    mock_client.execute_write_batch = AsyncMock(return_value=[])
+    kwargs.setdefault('cache', AsyncCacheManager())
+    kwargs.setdefault('index', MagicMock())
+    kwargs.setdefault('rankings', MagicMock(update_patterns=AsyncMock(return_value=0)))
+    return PatternUsageAccumulator(mock_client, **kwargs), mock_client
+
+
+def written_rows(mock_client):
+    return [
+        row
+        for call in mock_client.execute_write_batch.call_args_list
+        for row in call[0][1]
+    ]
+
+
+class TestCoalescing:
+    """Test per-pattern tallies."""
+
+    @pytest.mark.asyncio
+    async def test_uses_coalesce_into_one_write(self):
+        usage, mock_client = make_accumulator()
+
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p1', 'faith-meats', successful=False)
+        usage.record('p2', 'faith-meats', successful=True)
+
+        assert usage.pending_events == 4
+        assert await usage.flush() == 2
+
+        mock_client.execute_write_batch.assert_called_once()
+        rows = {r['pattern_id']: r for r in written_rows(mock_client)}
+        assert rows['p1']['uses'] == 3
+        assert rows['p1']['successes'] == 2
+        assert rows['p1']['failures'] == 1
+        assert rows['p2']['uses'] == 1
+        assert usage.pending_events == 0
+
+        # Nothing pending: no write
+        assert await usage.flush() == 0
+        mock_client.execute_write_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_leaves_success_rate_to_effectiveness_job(self):
+        usage, mock_client = make_accumulator()
+
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p1', 'faith-meats', successful=False)
+        await usage.flush()
+
+        call = mock_client.execute_write_batch.call_args
+        assert 'success_rate' not in call.kwargs
+        rows = written_rows(mock_client)
+        assert len(rows) == 1
+        assert 'success_rate' not in rows[0]
+        assert (rows[0]['uses'], rows[0]['successes'], rows[0]['failures']) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_flush_updates_written_patterns(self):
+        cache = AsyncCacheManager()
+        index = MagicMock()
+        usage, mock_client = make_accumulator(cache=cache, index=index)
+        mock_client.execute_write_batch.return_value = [{
+            'pattern_id': 'g1', 'group_id': 'global-coding-skills', 'category': 'testing',
+            'success_rate': 1.0, 'times_used': 4
+        }]
+        await cache.set('contains-g1', [], tags=['pattern:g1'])
+        await cache.set('other-query', [], tags=['group:diff-driven-saas', 'group:global-coding-skills'])
+
+        usage.record('g1', 'faith-meats', successful=True)
+        await usage.flush()
+
+        # Usage changes are applied to the index in place, not reloaded
+        index.update_patterns.assert_called_once_with(mock_client.execute_write_batch.return_value)
+        index.invalidate.assert_not_called()
+        assert await cache.get('contains-g1') is None
+        assert await cache.get('other-query') == []
+
+        entries = list(usage._rankings.update_patterns.call_args[0][0])
+        assert [(e.pattern_id, e.group_id, e.times_used) for e in entries] == [
+            ('g1', 'global-coding-skills', 4)
+        ]
+
+
+class TestFlushTriggers:
+    """Test when flushes happen."""
+
+    @pytest.mark.asyncio
+    async def test_pending_threshold_triggers_flush(self):
+        usage, mock_client = make_accumulator(max_pending_events=3)
+
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p2', 'faith-meats', successful=True)
+        await asyncio.sleep(0)
+        mock_client.execute_write_batch.assert_not_called()
+
+        usage.record('p3', 'faith-meats', successful=True)
+        await asyncio.sleep(0)
+
+        assert len(written_rows(mock_client)) == 3
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush(self):
+        usage, mock_client = make_accumulator(flush_interval_seconds=0.01)
+        await usage.start()
+        try:
+            usage.record('p1', 'faith-meats', successful=True)
+            await asyncio.sleep(0.05)
+            assert written_rows(mock_client)[0]['pattern_id'] == 'p1'
+        finally:
+            await usage.stop()
+        assert not usage.is_running
+
+
+class TestFailures:
+    """Test failed flushes and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_retried_without_double_counting(self):
+        usage, mock_client = make_accumulator()
+        usage.FLUSH_BATCH_SIZE = 1
+        mock_client.execute_write_batch.side_effect = [[], ConnectionError('down')]
+
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p2', 'faith-meats', successful=True)
+        usage.record('p2', 'faith-meats', successful=False)
+
+        with pytest.raises(ConnectionError):
+            await usage.flush()
+
+        # p1 was committed; only p2 is pending again
+        assert usage.pending_events == 2
+        usage.record('p2', 'faith-meats', successful=True)
+
+        mock_client.execute_write_batch.side_effect = None
+        mock_client.execute_write_batch.reset_mock()
+        await usage.flush()
+
+        rows = written_rows(mock_client)
+        assert [r['pattern_id'] for r in rows] == ['p2']
+        assert rows[0]['uses'] == 3
+        assert rows[0]['successes'] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_pending_uses(self):
+        usage, mock_client = make_accumulator()
+        await usage.start()
+
+        usage.record('p1', 'faith-meats', successful=True)
+        await usage.stop()
+
+        assert written_rows(mock_client)[0]['pattern_id'] == 'p1'
+        assert usage.pending_events == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_blocked_flush(self):
+        usage, mock_client = make_accumulator(flush_interval_seconds=0.01)
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def blocked_write(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return []
+
+        mock_client.execute_write_batch.side_effect = blocked_write
+        await usage.start()
+        usage.record('p1', 'faith-meats', successful=True)
+        await started.wait()
+
+        stopping = asyncio.ensure_future(usage.stop())
+        await asyncio.sleep(0.02)
+        assert not stopping.done()
+
+        release.set()
+        await stopping
+
+        # The in-flight write completed once; nothing was dropped or re-sent
+        assert [r['pattern_id'] for r in written_rows(mock_client)] == ['p1']
+        assert usage.pending_events == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_restores_tallies(self):
+        usage, mock_client = make_accumulator()
+        started = asyncio.Event()
+
+        async def blocked_write(*args, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_client.execute_write_batch.side_effect = blocked_write
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p1', 'faith-meats', successful=False)
+
+        flushing = asyncio.ensure_future(usage.flush())
+        await started.wait()
+        flushing.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flushing
+
+        assert usage.pending_events == 2
+
+    @pytest.mark.asyncio
+    async def test_undrained_uses_spill_and_recover(self, tmp_path):
+        spill_path = tmp_path / 'usage_spill.json'
+        usage, mock_client = make_accumulator(spill_path=str(spill_path))
+        mock_client.execute_write_batch.side_effect = ConnectionError('down')
+
+        usage.record('p1', 'faith-meats', successful=True)
+        usage.record('p1', 'faith-meats', successful=False)
+        await usage.stop()
+
+        assert json.loads(spill_path.read_text())[0]['uses'] == 2
+
+        restarted, restarted_client = make_accumulator(spill_path=str(spill_path))
+        await restarted.start()
+        assert restarted.pending_events == 2
+        assert not spill_path.exists()
+
+        await restarted.stop()
+        rows = written_rows(restarted_client)
+        assert rows[0]['pattern_id'] == 'p1'
+        assert rows[0]['failures'] == 1
+        assert rows[0]['last_used'] is not None
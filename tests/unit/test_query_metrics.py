@@ -0,0 +1,119 @@
+"""Unit tests for Neo4j query metrics (Story 1-2).
+
+Tests cover:
+- Query fingerprint normalization
+- Slow-query ring buffer
+- Client instrumentation of executed queries
+"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from prometheus_client import REGISTRY
+
+from src.bmad.core.query_metrics import (
+    SlowQueryLog,
+    fingerprint_query,
+    get_slow_query_log
+)
+
+
+class TestFingerprint:
+    """Test query fingerprinting."""
+
+    def test_literals_and_whitespace_normalized(self):
+        """Queries differing only in literals and layout share a fingerprint."""
+        a, normalized = fingerprint_query(
+            "MATCH (p:Pattern)\n  WHERE p.name = 'retry' RETURN p LIMIT 10"
+        )
+        b, _ = fingerprint_query("MATCH (p:Pattern) WHERE p.name = \"backoff\" RETURN p LIMIT 25")
+
+        assert a == b
+        assert normalized == "MATCH (p:Pattern) WHERE p.name = ? RETURN p LIMIT ?"
+
+    def test_identifiers_with_digits_preserved(self):
+        """Digits inside identifiers are not literals."""
+        a, _ = fingerprint_query("MATCH (p1:Pattern) RETURN p1")
+        b, _ = fingerprint_query("MATCH (p2:Pattern) RETURN p2")
+
+        assert a != b
+
+
+class TestSlowQueryLog:
+    """Test the slow-query ring buffer."""
+
+    def test_only_slow_queries_recorded(self):
+        log = SlowQueryLog(capacity=10, threshold_ms=50)
+
+        assert log.record("MATCH (n) RETURN n", 10.0) is None
+        entry = log.record("MATCH (n) RETURN n", 75.0, rows=3)
+
+        assert entry.rows == 3
+        assert log.recent() == [entry]
+
+    def test_bounded_and_newest_first(self):
+        log = SlowQueryLog(capacity=3, threshold_ms=0)
+
+        for i in range(5):
+            log.record(f"MATCH (n) RETURN n // {i}", float(i))
+
+        durations = [q.duration_ms for q in log.recent()]
+        assert durations == [4.0, 3.0, 2.0]
+        assert [q.duration_ms for q in log.recent(limit=1)] == [4.0]
+
+
+class TestClientInstrumentation:
+    """Test that Neo4jAsyncClient records every query."""
+
+    @pytest.mark.asyncio
+    async def test_execute_query_records_metrics(self):
+        from src.bmad.core.neo4j_client import Neo4jAsyncClient
+
+        query = "MATCH (a:AIAgent) WHERE a.group_id = $group_id RETURN a.name as name"
+        fingerprint, _ = fingerprint_query(query)
+
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.execute_read = AsyncMock(return_value=[{'name': 'Brooks'}, {'name': 'Winston'}])
+
+        mock_driver = MagicMock()
+        mock_driver.session = MagicMock(return_value=mock_session)
+
+        client = Neo4jAsyncClient(
+            uri='bolt://localhost:7687',
+            user='neo4j',
+            password='testpass'
+        )
+        client._driver = mock_driver
+        client._initialized = True
+
+        slow_log = get_slow_query_log()
+        previous_threshold = slow_log.threshold_ms
+        slow_log.threshold_ms = 0
+        rows_before = REGISTRY.get_sample_value(
+            'bmad_neo4j_query_rows_total', {'fingerprint': fingerprint}
+        ) or 0
+
+        try:
+            await client.execute_query(query, {"group_id": "faith-meats"})
+        finally:
+            slow_log.threshold_ms = previous_threshold
+
+        rows_after = REGISTRY.get_sample_value(
+            'bmad_neo4j_query_rows_total', {'fingerprint': fingerprint}
+        )
+        count = REGISTRY.get_sample_value(
+            'bmad_neo4j_query_duration_seconds_count',
+            {'fingerprint': fingerprint, 'mode': 'read'}
+        )
+
+        assert rows_after - rows_before == 2
+        assert count >= 1
+        assert slow_log.recent(limit=1)[0].fingerprint == fingerprint
@@ -0,0 +1,271 @@
+"""Unit tests for the local similarity index (Story 3-4).
+
+Tests cover:
+- Hashed n-gram vectorization
+- Cosine top-k with group and kind filtering
+- Incremental add/remove/regroup
+- Memory-mapped persistence and rebuild from Neo4j
+- PatternMatcher.find_similar_patterns
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.services.similarity_index import (
+    INSIGHT_KIND,
+    PATTERN_KIND,
+    HashedNGramVectorizer,
+    SimilarityIndex
+)
+
+
+GROUPS = ['test-group', 'global-coding-skills']
+
+
+def batches_of(*batches):
+    async def stream(*args, **kwargs):
+        for batch in batches:
+            yield batch
+    return stream
+
+
+def make_index(**kwargs):
+    index = SimilarityIndex(MagicMock(spec=Neo4jAsyncClient), **kwargs)
+    index.add_many([
+        ('p1', 'Retry transient database errors with exponential backoff', 'test-group'),
+        ('p2', 'Cache expensive query results in memory', 'test-group'),
+        ('g1', 'Retry HTTP requests after connection timeouts', 'global-coding-skills'),
+        ('x1', 'Retry transient database errors with exponential backoff', 'other-group'),
+    ])
+    index.add('i1', 'Add retries around flaky database calls', 'test-group', kind=INSIGHT_KIND)
+    return index
+
+
+def ids(hits):
+    return [item_id for item_id, _ in hits]
+
+
+class TestVectorizer:
+    """Test hashed n-gram vectors."""
+
+    def test_rows_are_unit_length_and_deterministic(self):
+        vectorizer = HashedNGramVectorizer(n_features=256)
+
+        a = vectorizer.transform(['Retry with backoff', ''])
+        b = vectorizer.transform(['retry WITH backoff'])
+
+        assert a.dtype == np.float32
+        assert np.isclose(np.linalg.norm(a[0]), 1.0)
+        assert not a[1].any()
+        np.testing.assert_array_equal(a[0], b[0])
+
+    def test_shared_ngrams_score_higher(self):
+        vectorizer = HashedNGramVectorizer()
+        query, close, far = vectorizer.transform([
+            'retrying timeouts', 'retry on timeout', 'render the dashboard'
+        ])
+
+        assert query @ close > query @ far
+
+
+class TestSimilaritySearch:
+    """Test cosine top-k search."""
+
+    def test_ranked_and_group_filtered(self):
+        index = make_index()
+
+        hits = index.search('database retry backoff', GROUPS, k=3, kind=PATTERN_KIND)
+
+        assert ids(hits)[0] == 'p1'
+        assert 'x1' not in ids(hits)
+        assert [s for _, s in hits] == sorted([s for _, s in hits], reverse=True)
+
+    def test_kind_filter(self):
+        index = make_index()
+
+        assert ids(index.search('flaky database', GROUPS, k=1, kind=INSIGHT_KIND)) == ['i1']
+        assert 'i1' not in ids(index.search('flaky database', GROUPS, k=5, kind=PATTERN_KIND))
+
+    def test_batch_matches_single_queries_across_blocks(self):
+        index = make_index()
+        index.SEARCH_BLOCK_ROWS = 2
+        texts = ['retry timeouts', 'cache query results']
+
+        batched = index.search_batch(texts, GROUPS, k=2)
+
+        assert batched == [index.search(t, GROUPS, k=2) for t in texts]
+        assert ids(batched[1])[0] == 'p2'
+
+    def test_unknown_group_and_empty_text_return_nothing(self):
+        index = make_index()
+
+        assert index.search('retry', ['unknown-group']) == []
+        assert index.search('!!!', GROUPS) == []
+
+
+class TestIncrementalUpdates:
+    """Test add/remove/regroup without rebuilding."""
+
+    def test_remove_keeps_other_rows_searchable(self):
+        index = make_index()
+
+        assert index.remove('p1')
+        assert not index.remove('p1')
+
+        assert len(index) == 4
+        hits = index.search('exponential backoff', GROUPS, k=5)
+        assert 'p1' not in ids(hits)
+        assert ids(index.search('flaky database calls', GROUPS, k=1)) == ['i1']
+
+    def test_add_replaces_existing_item(self):
+        index = make_index()
+
+        index.add('p2', 'Exponential backoff for transient errors', 'test-group')
+
+        assert len(index) == 5
+        assert 'p2' in ids(index.search('exponential backoff', GROUPS, k=3))
+
+    def test_set_group_moves_item(self):
+        index = make_index()
+
+        index.set_group('x1', 'global-coding-skills')
+
+        assert 'x1' in ids(index.search('exponential backoff', GROUPS, k=5))
+
+
+class TestPersistence:
+    """Test save/load and rebuild."""
+
+    def test_save_and_memory_mapped_load(self, tmp_path):
+        index = make_index()
+        expected = index.search('retry database', GROUPS, k=5)
+        index.save(str(tmp_path))
+
+        loaded = SimilarityIndex(MagicMock(spec=Neo4jAsyncClient), storage_dir=str(tmp_path))
+        assert loaded.load() == 5
+
+        assert isinstance(loaded._matrix, np.memmap)
+        assert loaded.search('retry database', GROUPS, k=5) == expected
+
+        # Copy-on-write: updates after load leave the file untouched
+        loaded.remove('p1')
+        loaded.add('p3', 'Paginate large result sets', 'test-group')
+        assert SimilarityIndex(MagicMock(spec=Neo4jAsyncClient)).load(str(tmp_path)) == 5
+
+    def test_load_rejects_other_dimensionality(self, tmp_path):
+        make_index().save(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            SimilarityIndex(MagicMock(spec=Neo4jAsyncClient), n_features=64).load(str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_rebuilds_and_persists(self, tmp_path):
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.stream_query_batches = MagicMock(side_effect=[
+            batches_of([{'id': 'p1', 'group_id': 'test-group', 'text': 'Retry with backoff'}])(),
+            batches_of([{'id': 'i1', 'group_id': 'test-group', 'text': 'Add retries'}])(),
+        ])
+        index = SimilarityIndex(mock_client, storage_dir=str(tmp_path))
+
+        await index.ensure_loaded()
+        await index.ensure_loaded()
+
+        assert index.is_loaded
+        assert len(index) == 2
+        assert mock_client.stream_query_batches.call_count == 2
+        assert (tmp_path / SimilarityIndex.MATRIX_FILE).exists()
+
+        # A fresh snapshot on disk is used instead of querying Neo4j
+        restarted = SimilarityIndex(MagicMock(spec=Neo4jAsyncClient), storage_dir=str(tmp_path))
+        await restarted.ensure_loaded()
+        assert ids(restarted.search('retry', ['test-group'], kind=PATTERN_KIND)) == ['p1']
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_refreshes_in_background(self):
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        index = SimilarityIndex(mock_client, max_snapshot_age_seconds=60)
+        index.add('p1', 'Retry with backoff', 'test-group')
+        index._loaded = True
+        index._built_at = 0.0  # long expired
+
+        mock_client.stream_query_batches = MagicMock(side_effect=[
+            batches_of([
+                {'id': 'p1', 'group_id': 'test-group', 'text': 'Retry with backoff'},
+                {'id': 'p2', 'group_id': 'test-group', 'text': 'Renamed: paginate results'}
+            ])(),
+            batches_of()(),
+        ])
+
+        # The old snapshot keeps serving while the rebuild runs
+        await index.ensure_loaded()
+        assert len(index) == 1
+        await index._refresh_task
+
+        assert ids(index.search('paginate', ['test-group'])) == ['p2']
+        mock_client.stream_query_batches.reset_mock()
+        await index.ensure_loaded()
+        assert index._refresh_task.done()
+        mock_client.stream_query_batches.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_updates_during_refresh_are_kept(self):
+        index = SimilarityIndex(MagicMock(spec=Neo4jAsyncClient))
+
+        async def stream(*args, **kwargs):
+            # Written while the rebuild streams, after its read
+            index.add('i9', 'New insight about retries', 'test-group', kind=INSIGHT_KIND)
+            index.remove('p2')
+            yield [{'id': 'p2', 'group_id': 'test-group', 'text': 'Cache query results'}]
+
+        index._client.stream_query_batches = MagicMock(side_effect=[stream(), batches_of()()])
+
+        assert await index.refresh() == 1
+        assert ids(index.search('retries', ['test-group'], kind=INSIGHT_KIND)) == ['i9']
+        assert ids(index.search('cache', ['test-group'])) == []
+
+
+class TestFindSimilarPatterns:
+    """Test PatternMatcher.find_similar_patterns."""
+
+    @pytest.mark.asyncio
+    async def test_returns_patterns_in_similarity_order(self):
+        from src.bmad.services.pattern_matcher import PatternMatcher
+
+        index = make_index()
+        index._loaded = True
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[
+            {'p': {'pattern_id': 'g1', 'name': 'HTTP retry', 'group_id': 'global-coding-skills'}},
+            {'p': {'pattern_id': 'p1', 'name': 'DB retry', 'group_id': 'test-group'}},
+        ])
+
+        matcher = PatternMatcher(mock_client, similarity=index)
+        result = await matcher.find_similar_patterns('retry transient errors', 'test-group', k=2)
+
+        assert [r.pattern.pattern_id for r in result] == ['p1', 'g1']
+        assert result[0].similarity > result[1].similarity
+        params = mock_client.execute_query.call_args[0][1]
+        assert params['pattern_ids'] == ['p1', 'g1']
+        assert params['group_id'] == 'test-group'
+
+    @pytest.mark.asyncio
+    async def test_no_hits_skips_neo4j(self):
+        from src.bmad.services.pattern_matcher import PatternMatcher
+
+        index = make_index()
+        index._loaded = True
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock()
+
+        matcher = PatternMatcher(mock_client, similarity=index)
+
+        assert await matcher.find_similar_patterns('!!!', 'test-group') == []
+        mock_client.execute_query.assert_not_called()
@@ -0,0 +1,66 @@
+"""Unit tests for tenant filter builders.
+
+Tests cover:
+- IN-list group-plus-global predicates
+- Services using the shared filter
+"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bmad.core.neo4j_client import Neo4jAsyncClient
+from src.bmad.core.tenant_filter import tenant_filter, visible_groups
+
+
+class TestTenantFilter:
+    """Test predicate builders."""
+
+    def test_group_plus_global_is_an_in_list(self):
+        assert tenant_filter("p") == "(p.group_id IN [$group_id, 'global-coding-skills'])"
+        assert tenant_filter("p", group_expr="row.group_id") == (
+            "(p.group_id IN [row.group_id, 'global-coding-skills'])"
+        )
+        assert tenant_filter("e", include_global=False) == "(e.group_id = $group_id)"
+
+    def test_visible_groups(self):
+        assert visible_groups("faith-meats") == ["faith-meats", "global-coding-skills"]
+        assert visible_groups("global-coding-skills") == ["global-coding-skills"]
+
+
+class TestServicesUseSharedFilter:
+    """Test that group-plus-global reads no longer OR the two groups."""
+
+    @pytest.mark.asyncio
+    async def test_knowledge_items_filter_keeps_category(self):
+        from src.bmad.services.notion_sync import NotionSyncService
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+
+        await NotionSyncService(mock_client).query_knowledge_items("faith-meats", category="Requirements")
+
+        cypher = mock_client.execute_query.call_args[0][0]
+        assert "(k.group_id IN [$group_id, 'global-coding-skills']) AND k.category = $category" in cypher
+        assert " OR " not in cypher
+
+    @pytest.mark.asyncio
+    async def test_pattern_query_uses_in_list(self):
+        from src.bmad.services.pattern_matcher import PatternMatcher, PatternQuery
+
+        mock_client = MagicMock(spec=Neo4jAsyncClient)
+        mock_client.execute_query = AsyncMock(return_value=[])
+        index = MagicMock()
+        index.query.return_value = None
+
+        matcher = PatternMatcher(mock_client, index=index)
+        await matcher.query_patterns(PatternQuery(group_id="faith-meats", category="testing"))
+
+        cypher = mock_client.execute_query.call_args[0][0]
+        assert "p.group_id IN [$group_id, 'global-coding-skills']" in cypher
+        assert "OR p.group_id" not in cypher